@@ -37,9 +37,11 @@ from .model import (
     LoadOptions,
     License,
     Metered,
+    extract_text,
+    scan_metadata,
 )
 
-from .saving import HtmlSaveOptions, ImageSaveOptions, OneSaveOptions, PdfSaveOptions, SaveOptions
+from .saving import HtmlSaveOptions, ImageSaveOptions, JsonSaveOptions, OneSaveOptions, PdfSaveOptions, SaveOptions
 
 __all__ = [
     "SaveFormat",
@@ -71,9 +73,12 @@ __all__ = [
     "LoadOptions",
     "License",
     "Metered",
+    "extract_text",
+    "scan_metadata",
     "SaveOptions",
     "OneSaveOptions",
     "PdfSaveOptions",
     "HtmlSaveOptions",
+    "JsonSaveOptions",
     "ImageSaveOptions",
 ]
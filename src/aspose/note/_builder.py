@@ -0,0 +1,464 @@
+"""Build the Aspose-like DOM (`aspose.note.model`) directly from ms_one entities.
+
+The ms_one reader produces an immutable entity tree; this module maps it onto model
+nodes without first copying it into `onenote.elements`. Conversions match the onenote
+layer (see `onenote.parser`) so both expose the same document:
+
+- page/outline layout: inches -> points (x72); image size: half-inches -> points (x36)
+- table column widths: half-points -> points
+- page level: 1-based in the file, 0-based in the DOM
+- lists: the first jcidNumberListNode of an OutlineElement
+- image bytes: FileDataStore references, then the aspect-ratio fallback for images
+  whose references cannot be resolved
+
+Nodes are built lazily: a composite node holds a `LazyChildren` and builds its children
+on first access (see `model.CompositeNode._nodes`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from ._internal.ms_one.entities import structure as ms
+from ._internal.ms_one.entities.base import BaseNode as MsBaseNode
+from ._internal.ms_one.entities.parsers import DEFAULT_CONTENT_OPTIONS, ContentOptions
+from ._internal.ms_one.reader import PageDirectory
+from ._internal.onenote import parser as onenote_parser
+from ._internal.onenote.document import Document as OneNoteDocument
+from ._internal.onenote.elements import Page as OneNotePage
+from ._internal.onestore.parse_context import ParseContext
+from .model import (
+    AttachedFile,
+    Image,
+    Node,
+    NoteTag,
+    NumberList,
+    Outline,
+    OutlineElement,
+    Page,
+    RichText,
+    Table,
+    TableCell,
+    TableRow,
+    TextRun,
+    TextStyle,
+    Title,
+)
+
+
+@dataclass(slots=True)
+class SectionSource:
+    """A section's page directory plus the state needed to parse pages and resolve their data.
+
+    Only the root object space is read up front; each page object space is parsed the
+    first time one of its pages is needed, so converting a page range parses just those
+    pages. Page indices count every page of every directory entry; an entry that has not
+    been parsed yet counts as one page, which is what page object spaces normally hold.
+    """
+
+    data: bytes | bytearray | memoryview
+    directory: PageDirectory
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS
+    metadata_only: bool = False
+    fds_ctx: ParseContext = field(default_factory=lambda: ParseContext(strict=False), repr=False)
+    _pages: dict[int, list[ms.Page]] = field(default_factory=dict, repr=False)
+    _page_counts: dict[int, int] = field(default_factory=dict, repr=False)
+    _image_blobs: list[bytes] | None = field(default=None, repr=False)
+    _fallback_images: dict[bytes, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(
+        cls,
+        data: bytes | bytearray | memoryview,
+        *,
+        strict: bool = False,
+        metadata_only: bool = False,
+        options: ContentOptions | None = None,
+    ) -> "SectionSource":
+        if options is None:
+            options = DEFAULT_CONTENT_OPTIONS
+        return cls(
+            data=data,
+            directory=PageDirectory.build(data, strict=strict, options=options),
+            options=options,
+            metadata_only=metadata_only,
+            fds_ctx=ParseContext(strict=False, file_size=len(data)),
+        )
+
+    @property
+    def display_name(self) -> str | None:
+        return self.directory.section.display_name
+
+    @property
+    def page_count(self) -> int:
+        return len(self.directory) + sum(n - 1 for n in self._page_counts.values())
+
+    @property
+    def file_data_store_index(self) -> dict:
+        return self.directory.file_data_store_index
+
+    def entry_pages(self, index: int, *, cache: bool = True) -> list[ms.Page]:
+        """The ms_one pages of directory entry `index`, parsed on first use (its metadata leaf when metadata_only).
+
+        Streaming conversions pass `cache=False` so only the entry being converted is held.
+        """
+        if self.metadata_only:
+            return [self.directory.metadata_page(index)]
+        pages = self._pages.get(index)
+        if pages is None:
+            pages = self.directory.load_pages(index)
+            self._page_counts[index] = len(pages)
+            if self.options.load_images:
+                for page in pages:
+                    self._add_fallback_images(page)
+            if cache:
+                self._pages[index] = pages
+        return pages
+
+    def iter_pages(self) -> Iterator[ms.Page]:
+        for i in range(len(self.directory)):
+            yield from self.entry_pages(i)
+
+    def _iter_pages_in_range(self, page_range: range | None) -> Iterator[ms.Page]:
+        # Entries are parsed only when their (assumed or known) page indices overlap the range.
+        if page_range is None:
+            for i in range(len(self.directory)):
+                yield from self.entry_pages(i, cache=False)
+            return
+        position = 0
+        for i in range(len(self.directory)):
+            if position >= page_range.stop:
+                break
+            count = self._page_counts.get(i, 1)
+            if position + count > page_range.start:
+                pages = self.entry_pages(i, cache=False)
+                count = len(pages)
+                for offset, page in enumerate(pages):
+                    if position + offset in page_range:
+                        yield page
+            position += count
+
+    def onenote_document(self, page_range: range | None = None) -> OneNoteDocument:
+        """Convert the section to the onenote element model (used by the PDF exporter).
+
+        With `page_range`, only the entries holding those pages are parsed and converted.
+        """
+        if self.metadata_only:
+            return onenote_parser.document_from_directory(self.directory, indices=page_range)
+        return OneNoteDocument(pages=list(self.iter_onenote_pages(page_range)), display_name=self.display_name)
+
+    def iter_onenote_pages(self, page_range: range | None = None) -> Iterator[OneNotePage]:
+        """Convert pages to the onenote element model one at a time (used by the HTML exporter).
+
+        Only the directory entry being yielded is parsed (unless already cached) and its
+        pages converted one at a time, so streaming exporters keep one page alive at a time.
+        """
+        if self.metadata_only:
+            yield from self.onenote_document(page_range).pages
+            return
+
+        for ms_page in self._iter_pages_in_range(page_range):
+            page = onenote_parser._convert_page(
+                ms_page,
+                source_data=self.data,
+                file_data_store_index=self.file_data_store_index,
+                fds_ctx=self.fds_ctx,
+                options=self.options,
+            )
+            if self.options.load_images:
+                onenote_parser._fill_missing_image_data(page.iter_images(), self._fallback_images)
+            yield page
+
+    def image_bytes(self, img: ms.Image) -> bytes:
+        data = bytes(img.data or b"")
+        if data or not self.options.load_images:
+            return data
+        data = self._resolve_image(img)
+        if data:
+            return data
+        return self._fallback_images.get(_oid(img), b"")
+
+    def attachment_bytes(self, f: ms.EmbeddedFile) -> bytes:
+        data = bytes(f.data or b"")
+        if data or not self.options.load_attachments:
+            return data
+        return onenote_parser._resolve_attachment_data(
+            f,
+            source_data=self.data,
+            file_data_store_index=self.file_data_store_index,
+            fds_ctx=self.fds_ctx,
+        )
+
+    def _resolve_image(self, img: ms.Image) -> bytes:
+        return onenote_parser._resolve_image_data(
+            img,
+            source_data=self.data,
+            file_data_store_index=self.file_data_store_index,
+            fds_ctx=self.fds_ctx,
+        )
+
+    def _add_fallback_images(self, page: ms.Page) -> None:
+        # FileDataStore blobs for the unresolved images of a newly parsed page (see
+        # onenote.parser._fallback_image_blobs). An object id keeps the blob chosen for
+        # its first unresolved image among the pages parsed so far, which in a full
+        # conversion is its first one in the section.
+        aspect_by_oid: dict[bytes, float | None] = {}
+        for img in _iter_page_images(page):
+            key = _oid(img)
+            if key in self._fallback_images or key in aspect_by_oid or img.data or self._resolve_image(img):
+                continue
+            aspect_ratio = None
+            if img.picture_width and img.picture_height:
+                aspect_ratio = float(img.picture_width) / float(img.picture_height)
+            aspect_by_oid[key] = aspect_ratio
+        if not aspect_by_oid:
+            return
+
+        if self._image_blobs is None:
+            self._image_blobs = onenote_parser._file_data_store_image_blobs(
+                self.data, self.file_data_store_index, self.fds_ctx
+            )
+        self._fallback_images.update(onenote_parser._fallback_image_blobs(aspect_by_oid, self._image_blobs))
+
+
+class LazyChildren:
+    """Deferred children of a model node: built from `entity` on first access."""
+
+    __slots__ = ("source", "entity")
+
+    def __init__(self, source: SectionSource, entity: object) -> None:
+        self.source = source
+        self.entity = entity
+
+    def build(self) -> list[Node]:
+        return _CHILD_BUILDERS[type(self.entity)](self.source, self.entity)
+
+
+def build_document_pages(source: SectionSource) -> LazyChildren:
+    """Return the deferred page list of a Document loaded from `source`."""
+    return LazyChildren(source, source)
+
+
+def _iter_page_images(page: ms.Page) -> Iterator[ms.Image]:
+    # The images the onenote layer exposes via Page.iter_images(), in the same order.
+    stack: list[MsBaseNode] = [c for c in reversed(page.children) if not isinstance(c, ms.Title)]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ms.Image):
+            yield node
+        elif isinstance(node, ms.OutlineElement):
+            nested = [c for c in node.children if isinstance(c, ms.OutlineElement)]
+            contents = [c for c in node.children if not isinstance(c, ms.OutlineElement)]
+            stack.extend(reversed([*nested, *contents, *node.content_children]))
+        elif isinstance(node, ms.Table):
+            rows = [c for c in node.children if isinstance(c, ms.TableRow)]
+            stack.extend(reversed([c for row in rows for c in row.children if isinstance(c, ms.TableCell)]))
+        elif isinstance(node, (ms.Outline, ms.Title, ms.TableCell)):
+            stack.extend(reversed(node.children))
+
+
+def _oid(entity: MsBaseNode) -> bytes:
+    return entity.oid.guid if entity.oid else b""
+
+
+def _lazy(source: SectionSource, entity: MsBaseNode, *groups: tuple) -> LazyChildren | None:
+    return LazyChildren(source, entity) if any(groups) else None
+
+
+def _tags(tags: tuple[ms.NoteTag, ...]) -> list[NoteTag]:
+    return [
+        NoteTag(
+            shape=t.shape,
+            label=t.label,
+            text_color=t.text_color,
+            highlight_color=t.highlight_color,
+            created=t.created,
+            completed=t.completed,
+        )
+        for t in tags
+    ]
+
+
+def _build_page(source: SectionSource, page: ms.Page) -> Page:
+    title_rich = RichText(Text=page.title or "")
+    title = Title(TitleText=title_rich)
+    title.AppendChildLast(title_rich)
+
+    node = Page(
+        Title=title,
+        CreationTime=onenote_parser._filetime_to_datetime(page.creation_time),
+        Level=max(int(page.level) - 1, 0) if page.level is not None else 0,
+    )
+
+    # In Aspose.Note for .NET, Title is a real node in the Page subtree.
+    # Keep it accessible both as a property and via traversal/GetChildNodes().
+    node.AppendChildFirst(title)
+    node._pending = _lazy(source, page, page.children)
+    return node
+
+
+def _build_node(source: SectionSource, entity: MsBaseNode) -> Node | None:
+    """Build the model node for a content entity (None for entities the DOM skips)."""
+    builder = _NODE_BUILDERS.get(type(entity))
+    return builder(source, entity) if builder is not None else None
+
+
+def _build_outline(source: SectionSource, outline: ms.Outline) -> Outline:
+    return Outline(
+        X=outline.offset_horizontal * 72.0 if outline.offset_horizontal is not None else None,
+        Y=outline.offset_vertical * 72.0 if outline.offset_vertical is not None else None,
+        Width=outline.layout_max_width * 72.0 if outline.layout_max_width is not None else None,
+        _pending=_lazy(source, outline, outline.children),
+    )
+
+
+def _build_outline_element(source: SectionSource, elem: ms.OutlineElement) -> OutlineElement:
+    number_list = None
+    # Use the first list marker when multiple are present.
+    if elem.list_nodes:
+        ln = elem.list_nodes[0]
+        if ln.number_list_format is not None or ln.restart is not None or ln.is_numbered:
+            number_list = NumberList(Format=ln.number_list_format, Restart=ln.restart, IsNumbered=ln.is_numbered)
+
+    return OutlineElement(
+        Tags=_tags(elem.tags),
+        NumberList=number_list,
+        _pending=_lazy(source, elem, elem.children, elem.content_children),
+    )
+
+
+def _build_rich_text(source: SectionSource, rt: ms.RichText) -> RichText:
+    text = rt.text or ""
+    runs: list[TextRun] = []
+    for r in rt.runs:
+        start = int(r.start or 0)
+        end = int(r.end or 0)
+        s = r.style
+        runs.append(
+            TextRun(
+                Text=text[start:end] if 0 <= start <= end <= len(text) else "",
+                Style=TextStyle(
+                    Bold=bool(s.bold),
+                    Italic=bool(s.italic),
+                    Underline=bool(s.underline),
+                    Strikethrough=bool(s.strikethrough),
+                    Superscript=bool(s.superscript),
+                    Subscript=bool(s.subscript),
+                    FontName=s.font_name,
+                    FontSize=s.font_size_pt,
+                    FontColor=s.font_color,
+                    HighlightColor=s.highlight_color,
+                    LanguageId=s.language_id,
+                    HyperlinkAddress=s.hyperlink,
+                    IsHyperlink=bool(s.hyperlink),
+                ),
+                Start=start,
+                End=end,
+            )
+        )
+
+    return RichText(Text=text, Runs=runs, FontSize=rt.font_size_pt, Tags=_tags(rt.tags))
+
+
+def _build_image(source: SectionSource, img: ms.Image) -> Image:
+    return Image(
+        FileName=img.original_filename,
+        Bytes=source.image_bytes(img),
+        Width=img.picture_width * 36.0 if img.picture_width is not None else None,
+        Height=img.picture_height * 36.0 if img.picture_height is not None else None,
+        AlternativeTextDescription=img.alt_text,
+        HyperlinkUrl=img.hyperlink,
+        Tags=_tags(img.tags),
+    )
+
+
+def _build_attached_file(source: SectionSource, f: ms.EmbeddedFile) -> AttachedFile:
+    return AttachedFile(
+        FileName=f.original_filename or "",
+        Bytes=source.attachment_bytes(f),
+        Tags=_tags(f.tags),
+    )
+
+
+def _build_table(source: SectionSource, table: ms.Table) -> Table:
+    return Table(
+        Tags=_tags(table.tags),
+        ColumnWidths=[w / 2.0 for w in table.column_widths],
+        BordersVisible=bool(table.borders_visible if table.borders_visible is not None else True),
+        _pending=_lazy(source, table, table.children),
+    )
+
+
+def _build_table_cell(source: SectionSource, cell: ms.TableCell) -> TableCell:
+    return TableCell(_pending=_lazy(source, cell, cell.children))
+
+
+def _build_nodes(source: SectionSource, entities: tuple[MsBaseNode, ...]) -> list[Node]:
+    out: list[Node] = []
+    for entity in entities:
+        node = _build_node(source, entity)
+        if node is not None:
+            out.append(node)
+    return out
+
+
+def _outline_children(source: SectionSource, outline: ms.Outline) -> list[Node]:
+    out: list[Node] = []
+    for child in outline.children:
+        if isinstance(child, ms.OutlineElement):
+            out.append(_build_outline_element(source, child))
+        elif type(child) in _NODE_BUILDERS or isinstance(child, ms.Title):
+            # Some files place content nodes directly under an Outline; wrap them into a
+            # synthetic OutlineElement (a Title yields an empty one, as in the onenote layer).
+            wrapper = OutlineElement()
+            node = _build_node(source, child)
+            if node is not None:
+                wrapper.AppendChildLast(node)
+            out.append(wrapper)
+    return out
+
+
+def _outline_element_children(source: SectionSource, elem: ms.OutlineElement) -> list[Node]:
+    # Content first (including content nodes found under ElementChildNodes), then
+    # nested OutlineElements.
+    contents = [c for c in elem.children if not isinstance(c, ms.OutlineElement)]
+    nested = [c for c in elem.children if isinstance(c, ms.OutlineElement)]
+    return _build_nodes(source, (*contents, *elem.content_children, *nested))
+
+
+def _table_children(source: SectionSource, table: ms.Table) -> list[Node]:
+    return [
+        TableRow(_pending=_lazy(source, row, row.children))
+        for row in table.children
+        if isinstance(row, ms.TableRow)
+    ]
+
+
+def _table_row_children(source: SectionSource, row: ms.TableRow) -> list[Node]:
+    return [_build_table_cell(source, cell) for cell in row.children if isinstance(cell, ms.TableCell)]
+
+
+def _document_children(source: SectionSource, _: SectionSource) -> list[Node]:
+    return [_build_page(source, page) for page in source.iter_pages()]
+
+
+_NODE_BUILDERS: dict[type, Callable[[SectionSource, object], Node]] = {
+    ms.Outline: _build_outline,
+    ms.OutlineElement: _build_outline_element,
+    ms.RichText: _build_rich_text,
+    ms.Image: _build_image,
+    ms.EmbeddedFile: _build_attached_file,
+    ms.Table: _build_table,
+    ms.TableCell: _build_table_cell,
+}
+
+_CHILD_BUILDERS: dict[type, Callable[[SectionSource, object], list[Node]]] = {
+    SectionSource: _document_children,
+    ms.Page: lambda source, page: _build_nodes(source, page.children),
+    ms.Outline: _outline_children,
+    ms.OutlineElement: _outline_element_children,
+    ms.Table: _table_children,
+    ms.TableRow: _table_row_children,
+    ms.TableCell: lambda source, cell: _build_nodes(source, cell.children),
+}
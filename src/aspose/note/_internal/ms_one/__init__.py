@@ -1,10 +1,14 @@
 """MS-ONE entity reader built on top of the MS-ONESTORE container reader."""
 
+from .entities.parsers import ContentOptions
 from .errors import MSOneFormatError
-from .reader import parse_section_file, parse_section_file_with_page_history
+from .reader import PageDirectory, PageDirectoryEntry, parse_section_file, parse_section_file_with_page_history
 
 __all__ = [
+    "ContentOptions",
     "MSOneFormatError",
+    "PageDirectory",
+    "PageDirectoryEntry",
     "parse_section_file",
     "parse_section_file_with_page_history",
 ]
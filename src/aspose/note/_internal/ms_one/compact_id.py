@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Mapping
 
 from ..onestore.common_types import CompactID, ExtendedGUID
 from ..onestore.errors import OneStoreFormatError
@@ -9,14 +10,28 @@ from ..onestore.parse_context import ParseContext
 
 @dataclass(frozen=True, slots=True)
 class EffectiveGidTable:
-    """Convenience wrapper around a revision's effective GID table."""
+    """Convenience wrapper around a revision's effective GID table.
 
-    by_index: dict[int, bytes]
+    `by_index` is treated as read-only: tables are shared across revisions and
+    object index builds rather than copied.
+    """
+
+    by_index: Mapping[int, bytes]
 
     @classmethod
     def from_sorted_items(cls, items: tuple[tuple[int, bytes], ...]) -> "EffectiveGidTable":
         return cls(by_index={int(k): bytes(v) for k, v in items})
 
+    @classmethod
+    def from_revision(cls, rev) -> "EffectiveGidTable":
+        """Wrap a resolved revision's (shared) GID table without copying it."""
+
+        table = rev.gid_table
+        if len(table) != len(rev.effective_gid_table):
+            # Summary built without the shared mapping; fall back to its sorted items.
+            return cls.from_sorted_items(rev.effective_gid_table)
+        return cls(by_index=table)
+
 
 def resolve_compact_id(
     compact_id: CompactID,
@@ -3,14 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ...onestore.common_types import ExtendedGUID
-from ...onestore.object_data import DecodedPropertySet
+from ...onestore.object_data import ColumnarPropertySet, DecodedPropertySet
 
 
 @dataclass(frozen=True, slots=True)
 class BaseNode:
     oid: ExtendedGUID
     jcid_index: int
-    raw_properties: DecodedPropertySet | None
+    # Entities built by parse_node retain the compact columnar form.
+    raw_properties: DecodedPropertySet | ColumnarPropertySet | None
 
 
 @dataclass(frozen=True, slots=True)
@@ -8,13 +8,14 @@ from typing import cast
 
 from ...onestore.common_types import CompactID, ExtendedGUID
 from ...onestore.file_data import parse_file_data_reference
+from ...onestore.object_data import ColumnarPropertySet
 from ...onestore.parse_context import ParseContext
 from ...onestore.chunk_refs import FileNodeChunkReference
 
 from ..compact_id import EffectiveGidTable, resolve_compact_id_array
 from ..compact_id import resolve_compact_id
 from ..object_index import ObjectIndex, ObjectRecord
-from ..property_access import get_bytes, get_oid, get_oid_array, get_prop
+from ..property_access import get_bytes, get_oid, get_oid_array, get_prop, get_u16, get_u32, get_u64
 from ..spec_ids import (
     JCID_EMBEDDED_FILE_NODE_INDEX,
     JCID_IMAGE_NODE_INDEX,
@@ -52,11 +53,13 @@ from ..spec_ids import (
     PID_PAGE_SERIES_CHILD_NODES,
     PID_RICH_EDIT_TEXT_UNICODE,
     PID_NUMBER_LIST_FORMAT,
+    PID_PAGE_LEVEL,
     PID_SECTION_DISPLAY_NAME,
     PID_TEXT_RUN_INDEX,
     PID_TEXT_EXTENDED_ASCII,
     PID_TEXT_RUN_DATA_OBJECT,
     PID_TEXT_RUN_FORMATTING,
+    PID_TOPOLOGY_CREATION_TIME_STAMP,
     PID_BOLD,
     PID_ITALIC,
     PID_UNDERLINE,
@@ -109,6 +112,10 @@ from .structure import (
 
 
 _IFNDF_GUID_RE = re.compile(r"<ifndf>\{(?P<guid>[0-9a-fA-F\-]{36})\}</ifndf>")
+# Marker searches over raw property values. Blob values are memoryviews into rgData,
+# which `re` scans in place (the `in` operator does not work on memoryviews).
+_IFNDF_ASCII_MARKER_RE = re.compile(re.escape(b"<ifndf>"))
+_IFNDF_UTF16_MARKER_RE = re.compile(re.escape("<ifndf".encode("utf-16le")))
 
 
 def _u16_from_bytes(b: bytes | None) -> int | None:
@@ -134,6 +141,12 @@ def _float_from_bytes(b: bytes | None) -> float | None:
         return None
 
 
+def _layout_float(rec: ObjectRecord, pid_raw: int, state: "ParseState") -> float | None:
+    if rec.properties is None or not state.options.load_layout:
+        return None
+    return _float_from_bytes(get_bytes(rec.properties, pid_raw))
+
+
 def _bool_from_prop(props, pid_raw: int) -> bool | None:
     """Extract a boolean property."""
     if props is None:
@@ -171,7 +184,7 @@ def _first_font_size_pt_from_text_run_formatting(rec: ObjectRecord, *, state: "P
     Uses TextRunFormatting -> ParagraphStyleObject(s) -> FontSize (half-points).
     """
 
-    if rec.properties is None:
+    if rec.properties is None or not state.options.load_formatting:
         return None
 
     refs = get_oid_array(rec.properties, PID_TEXT_RUN_FORMATTING)
@@ -184,7 +197,7 @@ def _first_font_size_pt_from_text_run_formatting(rec: ObjectRecord, *, state: "P
         style_rec = state.index.get(oid)
         if style_rec is None or style_rec.properties is None:
             continue
-        half_points = _u16_from_bytes(get_bytes(style_rec.properties, PID_FONT_SIZE))
+        half_points = get_u16(style_rec.properties, PID_FONT_SIZE)
         if half_points is None:
             continue
         return float(half_points) / 2.0
@@ -225,7 +238,7 @@ def _style_from_formatting_oid(oid: ExtendedGUID, *, state: "ParseState") -> Tex
             return None
         return bool(p.value)
 
-    half_points = _u16_from_bytes(get_bytes(props, PID_FONT_SIZE)) if props is not None else None
+    half_points = get_u16(props, PID_FONT_SIZE) if props is not None else None
     font_size_pt = None if half_points is None else (float(half_points) / 2.0)
 
     font_name = _wz_from_props(props, PID_FONT, state=state)
@@ -244,8 +257,8 @@ def _style_from_formatting_oid(oid: ExtendedGUID, *, state: "ParseState") -> Tex
         subscript=_bool(PID_SUBSCRIPT),
         font_name=font_name,
         font_size_pt=font_size_pt,
-        font_color=_u32_from_bytes(get_bytes(props, PID_FONT_COLOR)) if props is not None else None,
-        highlight_color=_u32_from_bytes(get_bytes(props, PID_HIGHLIGHT)) if props is not None else None,
+        font_color=get_u32(props, PID_FONT_COLOR) if props is not None else None,
+        highlight_color=get_u32(props, PID_HIGHLIGHT) if props is not None else None,
         hyperlink=hyperlink_url,
     )
 
@@ -300,7 +313,7 @@ def _infer_hyperlink_spans_from_text(text: str) -> list[tuple[int, int, str]]:
 
 
 def _extract_text_runs(rec: ObjectRecord, text: str | None, *, state: "ParseState") -> tuple[TextRun, ...]:
-    if rec.properties is None:
+    if rec.properties is None or not state.options.load_formatting:
         return ()
     if not text:
         return ()
@@ -371,6 +384,8 @@ def _extract_note_tags(rec: ObjectRecord, *, state: "ParseState") -> tuple[NoteT
 
 
 def _extract_note_tags_from_properties(props, *, state: "ParseState") -> tuple[NoteTag, ...]:
+    if not state.options.load_tags:
+        return ()
     if props is None:
         return ()
 
@@ -546,14 +561,14 @@ def _extract_embedded_objects_from_richtext(rt: RichText, *, state: "ParseState"
     return tuple(out)
 
 
-def _iter_property_bytes(value) -> "list[bytes]":
-    out: list[bytes] = []
+def _iter_property_bytes(value) -> "list[bytes | memoryview]":
+    out: list[bytes | memoryview] = []
     stack = [value]
     while stack:
         cur = stack.pop()
         if cur is None:
             continue
-        if isinstance(cur, bytes):
+        if isinstance(cur, (bytes, memoryview)):
             out.append(cur)
             continue
         if isinstance(cur, tuple):
@@ -595,9 +610,9 @@ def _extract_ifndf_guids_from_properties(props) -> tuple[str, ...]:
     found: set[str] = set()
     for b in _iter_property_bytes(props):
         # ASCII scan
-        if b"<ifndf>" in b:
+        if _IFNDF_ASCII_MARKER_RE.search(b):
             try:
-                s = b.decode("ascii", errors="ignore")
+                s = str(b, "ascii", "ignore")
             except Exception:
                 s = ""
             for m in _IFNDF_GUID_RE.finditer(s):
@@ -607,8 +622,8 @@ def _extract_ifndf_guids_from_properties(props) -> tuple[str, ...]:
                     continue
 
         # UTF-16LE scan
-        if b"<\x00i\x00f\x00n\x00d\x00f\x00" in b:
-            s = b.decode("utf-16le", errors="ignore")
+        if _IFNDF_UTF16_MARKER_RE.search(b):
+            s = str(b, "utf-16le", "ignore")
             for m in _IFNDF_GUID_RE.finditer(s):
                 try:
                     found.add(str(uuid.UUID(m.group("guid"))))
@@ -727,6 +742,8 @@ def _resolve_file_data_store_guids_via_references(
 
 _FILE_REF_ASCII_RE = re.compile(rb"<file>[^<\r\n]{1,4096}")
 _FILE_REF_TEXT_RE = re.compile(r"<file>[^<\r\n]{1,4096}")
+_FILE_ASCII_MARKER_RE = re.compile(re.escape(b"<file>"))
+_FILE_UTF16_MARKER_RE = re.compile(re.escape("<file>".encode("utf-16le")))
 _IMAGE_FILENAME_TEXT_RE = re.compile(r"(?i)(?:^|[^A-Za-z0-9_.-])(?P<name>[A-Za-z0-9][A-Za-z0-9 _()\-\.]{0,254}\.(?:png|jpe?g|gif|bmp|tiff?))(?:$|[^A-Za-z0-9_.-])")
 
 
@@ -742,7 +759,7 @@ def _extract_file_names_from_properties(props) -> tuple[str, ...]:
     found: set[str] = set()
     for b in _iter_property_bytes(props):
         # ASCII/UTF-8 scan
-        if b"<file>" in b:
+        if _FILE_ASCII_MARKER_RE.search(b):
             for m in _FILE_REF_ASCII_RE.finditer(b):
                 try:
                     s = m.group(0).decode("utf-8", errors="ignore")
@@ -753,19 +770,19 @@ def _extract_file_names_from_properties(props) -> tuple[str, ...]:
                     found.add(parsed.file_name.strip())
 
         # UTF-16LE scan
-        if b"<\x00f\x00i\x00l\x00e\x00>\x00" in b:
-            s = b.decode("utf-16le", errors="ignore")
+        if _FILE_UTF16_MARKER_RE.search(b):
+            s = str(b, "utf-16le", "ignore")
             for m in _FILE_REF_TEXT_RE.finditer(s):
                 parsed = parse_file_data_reference(m.group(0))
                 if parsed.kind == "file" and parsed.file_name:
                     found.add(parsed.file_name.strip())
 
         # Standalone filename scan (common for embedded images like 'Tulips.jpg').
-        s16 = b.decode("utf-16le", errors="ignore")
+        s16 = str(b, "utf-16le", "ignore")
         for m in _IMAGE_FILENAME_TEXT_RE.finditer(s16):
             found.add(m.group("name").strip())
 
-        s8 = b.decode("utf-8", errors="ignore")
+        s8 = str(b, "utf-8", "ignore")
         for m in _IMAGE_FILENAME_TEXT_RE.finditer(s8):
             found.add(m.group("name").strip())
 
@@ -830,53 +847,118 @@ def _resolve_file_names_via_references(
 
 _PNG_SIG = b"\x89PNG\r\n\x1a\n"
 
+# Signatures we recognize inside PictureContainer payloads. A single compiled
+# alternation finds the earliest match in one pass and works directly on any
+# buffer (bytes or memoryview), so the caller's blob is never copied.
+_IMAGE_SIG_RE = re.compile(
+    re.escape(_PNG_SIG)
+    + rb"|\xff\xd8\xff"
+    + rb"|GIF8[79]a"
+    + rb"|BM"
+    + rb"|II\*\x00|MM\x00\*"
+)
 
-def _extract_image_bytes_from_blob(blob: bytes) -> bytes:
-    """Best-effort extract of image bytes from a container blob.
 
-    PictureContainer payloads frequently include small headers before the actual
-    image bytes. We scan for common image signatures and return the slice starting
-    at the first match.
+def _png_end(view: memoryview) -> int | None:
+    """Return the end offset of a PNG stream (after the IEND chunk CRC)."""
+
+    n = len(view)
+    pos = len(_PNG_SIG)
+    while pos + 8 <= n:
+        length = int.from_bytes(view[pos : pos + 4], "big")
+        end = pos + 12 + length
+        if end > n:
+            return None
+        if view[pos + 4 : pos + 8] == b"IEND":
+            return end
+        pos = end
+    return None
+
+
+def _jpeg_end(view: memoryview) -> int | None:
+    """Return the end offset of a JPEG stream (after the EOI marker).
+
+    Marker segments are skipped by their declared length so embedded thumbnails
+    (e.g. EXIF APP1) do not terminate the scan early. Entropy-coded data after SOS
+    is scanned for the next marker that is neither a stuffed 0xFF00 nor RSTn.
     """
 
-    if not blob:
-        return b""
+    n = len(view)
+    pos = 2
+    while pos + 2 <= n:
+        if view[pos] != 0xFF:
+            return None
+        marker = view[pos + 1]
+        if marker == 0xFF:
+            # Fill byte.
+            pos += 1
+            continue
+        if marker == 0xD9:
+            return pos + 2
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            pos += 2
+            continue
+        if pos + 4 > n:
+            return None
+        seg_len = int.from_bytes(view[pos + 2 : pos + 4], "big")
+        if seg_len < 2:
+            return None
+        pos += 2 + seg_len
+        if marker != 0xDA:
+            continue
+        # Entropy-coded segment.
+        while pos + 1 < n:
+            if view[pos] == 0xFF:
+                nxt = view[pos + 1]
+                if nxt != 0x00 and not (0xD0 <= nxt <= 0xD7):
+                    break
+                pos += 2
+                continue
+            pos += 1
+        else:
+            return None
+    return None
+
+
+def _bmp_end(view: memoryview) -> int | None:
+    """Return the end offset of a BMP stream using BITMAPFILEHEADER.bfSize."""
 
-    candidates: list[tuple[int, bytes]] = []
+    if len(view) < 14:
+        return None
+    size = int.from_bytes(view[2:6], "little")
+    if size < 14 or size > len(view):
+        return None
+    return size
 
-    # PNG
-    i = blob.find(_PNG_SIG)
-    if i >= 0:
-        candidates.append((i, blob[i:]))
 
-    # JPEG
-    i = blob.find(b"\xff\xd8\xff")
-    if i >= 0:
-        candidates.append((i, blob[i:]))
+def _extract_image_bytes_from_blob(blob: bytes | memoryview) -> memoryview:
+    """Best-effort extract of image bytes from a container blob.
 
-    # GIF
-    for sig in (b"GIF87a", b"GIF89a"):
-        i = blob.find(sig)
-        if i >= 0:
-            candidates.append((i, blob[i:]))
+    PictureContainer payloads frequently include small headers before the actual
+    image bytes. We scan for common image signatures and return a zero-copy view
+    starting at the first match. For PNG, JPEG and BMP the view is trimmed at the
+    end of the image stream so trailing container bytes are not kept; other
+    formats (or truncated streams) keep the remainder of the blob.
+    """
 
-    # BMP
-    i = blob.find(b"BM")
-    if i >= 0:
-        candidates.append((i, blob[i:]))
+    view = memoryview(blob)
+    m = _IMAGE_SIG_RE.search(view)
+    if m is None:
+        return view[:0]
 
-    # TIFF
-    for sig in (b"II*\x00", b"MM\x00*"):
-        i = blob.find(sig)
-        if i >= 0:
-            candidates.append((i, blob[i:]))
+    start = m.start()
+    sig = m.group()
+    image = view[start:]
 
-    if not candidates:
-        return b""
+    end: int | None = None
+    if sig == _PNG_SIG:
+        end = _png_end(image)
+    elif sig == b"\xff\xd8\xff":
+        end = _jpeg_end(image)
+    elif sig == b"BM":
+        end = _bmp_end(image)
 
-    # Prefer earliest signature; if equal, prefer larger remainder.
-    candidates.sort(key=lambda x: (x[0], -len(x[1])))
-    return candidates[0][1]
+    return image if end is None else image[:end]
 
 
 def _resolve_picture_container_payload(
@@ -906,7 +988,7 @@ def _resolve_picture_container_payload(
     visited: set[ExtendedGUID] = set()
     queue: list[tuple[ExtendedGUID, int]] = [(root, 1)]
 
-    best = b""
+    best: memoryview | None = None
     steps = 0
     while queue and steps < max_nodes:
         steps += 1
@@ -920,8 +1002,8 @@ def _resolve_picture_container_payload(
             continue
 
         for b in _iter_property_bytes(rec.properties):
-            extracted = _extract_image_bytes_from_blob(bytes(b))
-            if extracted and len(extracted) > len(best):
+            extracted = _extract_image_bytes_from_blob(b)
+            if len(extracted) and (best is None or len(extracted) > len(best)):
                 best = extracted
 
         if depth >= max_depth:
@@ -935,7 +1017,33 @@ def _resolve_picture_container_payload(
                 if eg not in visited:
                     queue.append((eg, depth + 1))
 
-    return best
+    return bytes(best) if best is not None else b""
+
+
+@dataclass(frozen=True, slots=True)
+class ContentOptions:
+    """Selects which optional content is decoded into entities.
+
+    Disabling a feature leaves the corresponding entity fields at their defaults:
+    - `load_images` / `load_attachments`: no embedded blob resolution (data, file_data_guids)
+    - `load_formatting`: no per-run styles or paragraph font size
+    - `load_tags`: no note tags; tagged images, tables and files that no page references
+      are not recovered either
+    - `load_layout`: no offsets, sizes or column widths
+    """
+
+    load_images: bool = True
+    load_attachments: bool = True
+    load_formatting: bool = True
+    load_tags: bool = True
+    load_layout: bool = True
+
+    @property
+    def needs_file_data(self) -> bool:
+        return self.load_images or self.load_attachments
+
+
+DEFAULT_CONTENT_OPTIONS = ContentOptions()
 
 
 @dataclass(frozen=True, slots=True)
@@ -944,6 +1052,7 @@ class ParseState:
     gid_table: EffectiveGidTable | None
     ctx: ParseContext
     file_data_store_index: dict[bytes, FileNodeChunkReference] | None = None
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS
 
 
 def _children_from_pid(record: ObjectRecord, pid_raw: int, state: ParseState) -> tuple[BaseNode, ...]:
@@ -978,16 +1087,18 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         return UnknownNode(oid=oid, jcid_index=-1, raw_properties=None)
 
     jidx = int(rec.jcid.index)
+    # Entities outlive the object index: keep only the compact columnar form.
+    raw = None if rec.properties is None else ColumnarPropertySet.from_decoded(rec.properties)
 
     # Structural nodes (tree)
     if jidx == JCID_SECTION_NODE_INDEX:
         children = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
         display = _wz_prop(rec, PID_SECTION_DISPLAY_NAME, state)
-        return Section(oid=oid, jcid_index=jidx, raw_properties=rec.properties, display_name=display, children=children)
+        return Section(oid=oid, jcid_index=jidx, raw_properties=raw, display_name=display, children=children)
 
     if jidx == JCID_PAGE_SERIES_NODE_INDEX:
         children = _children_from_pid(rec, PID_PAGE_SERIES_CHILD_NODES, state)
-        return PageSeries(oid=oid, jcid_index=jidx, raw_properties=rec.properties, children=children)
+        return PageSeries(oid=oid, jcid_index=jidx, raw_properties=raw, children=children)
 
     if jidx == JCID_PAGE_NODE_INDEX:
         children_a = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
@@ -1005,12 +1116,12 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
             children = children_a
         title = _wz_prop(rec, PID_CACHED_TITLE_STRING, state) or _wz_prop(rec, PID_CACHED_TITLE_STRING_FROM_PAGE, state)
         # Layout properties
-        page_width = _float_from_bytes(get_bytes(rec.properties, PID_PAGE_WIDTH)) if rec.properties else None
-        page_height = _float_from_bytes(get_bytes(rec.properties, PID_PAGE_HEIGHT)) if rec.properties else None
+        page_width = _layout_float(rec, PID_PAGE_WIDTH, state)
+        page_height = _layout_float(rec, PID_PAGE_HEIGHT, state)
         return Page(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             title=title,
             children=children,
             page_width=page_width,
@@ -1021,11 +1132,21 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
     # For v1 extraction, treat PageMetaData as a Page leaf (title only).
     if jidx == JCID_PAGE_METADATA_INDEX:
         title = _wz_prop(rec, PID_CACHED_TITLE_STRING, state) or _wz_prop(rec, PID_CACHED_TITLE_STRING_FROM_PAGE, state)
-        return Page(oid=oid, jcid_index=jidx, raw_properties=rec.properties, title=title, children=())
+        level = get_u32(rec.properties, PID_PAGE_LEVEL) if rec.properties else None
+        created = get_u64(rec.properties, PID_TOPOLOGY_CREATION_TIME_STAMP) if rec.properties else None
+        return Page(
+            oid=oid,
+            jcid_index=jidx,
+            raw_properties=raw,
+            title=title,
+            children=(),
+            level=level,
+            creation_time=created,
+        )
 
     if jidx == JCID_TITLE_NODE_INDEX:
         children = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
-        return Title(oid=oid, jcid_index=jidx, raw_properties=rec.properties, children=children)
+        return Title(oid=oid, jcid_index=jidx, raw_properties=raw, children=children)
 
     if jidx == JCID_OUTLINE_NODE_INDEX:
         children_a = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
@@ -1056,8 +1177,7 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
                 hits = 0
                 new_hits = 0
                 for x in v:
-                    rr = state.index.get(x)
-                    if rr is not None and rr.jcid is not None and int(rr.jcid.index) == JCID_OUTLINE_ELEMENT_NODE_INDEX:
+                    if state.index.has_jcid(x, JCID_OUTLINE_ELEMENT_NODE_INDEX):
                         hits += 1
                         if x not in existing_oe_oids:
                             new_hits += 1
@@ -1088,11 +1208,7 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
                         ch.raw_properties, PID_CONTENT_CHILD_NODES
                     )
                     if oids:
-                        hits = 0
-                        for x in oids:
-                            rr = state.index.get(x)
-                            if rr is not None and rr.jcid is not None and int(rr.jcid.index) == JCID_OUTLINE_ELEMENT_NODE_INDEX:
-                                hits += 1
+                        hits = sum(1 for x in oids if state.index.has_jcid(x, JCID_OUTLINE_ELEMENT_NODE_INDEX))
 
                         # Only expand when the referenced list mostly points at OutlineElement.
                         if hits >= 2 and hits * 2 >= len(oids):
@@ -1112,14 +1228,14 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
             children = tuple(expanded)
 
         # Layout properties
-        offset_h = _float_from_bytes(get_bytes(rec.properties, PID_OFFSET_FROM_PARENT_HORIZ)) if rec.properties else None
-        offset_v = _float_from_bytes(get_bytes(rec.properties, PID_OFFSET_FROM_PARENT_VERT)) if rec.properties else None
-        layout_max_w = _float_from_bytes(get_bytes(rec.properties, PID_LAYOUT_MAX_WIDTH)) if rec.properties else None
+        offset_h = _layout_float(rec, PID_OFFSET_FROM_PARENT_HORIZ, state)
+        offset_v = _layout_float(rec, PID_OFFSET_FROM_PARENT_VERT, state)
+        layout_max_w = _layout_float(rec, PID_LAYOUT_MAX_WIDTH, state)
 
         return Outline(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             children=children,
             offset_horizontal=offset_h,
             offset_vertical=offset_v,
@@ -1171,7 +1287,7 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         return OutlineElement(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             children=children,
             content_children=content_children,
             list_nodes=list_nodes,
@@ -1183,13 +1299,13 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         restart = None
         msaa_index = None
         if rec.properties is not None:
-            restart = _u32_from_bytes(get_bytes(rec.properties, PID_LIST_RESTART))
-            msaa_index = _u16_from_bytes(get_bytes(rec.properties, PID_LIST_MSAA_INDEX))
+            restart = get_u32(rec.properties, PID_LIST_RESTART)
+            msaa_index = get_u16(rec.properties, PID_LIST_MSAA_INDEX)
 
         return ListNode(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             number_list_format=number_list_format,
             restart=restart,
             msaa_index=msaa_index,
@@ -1201,7 +1317,7 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         return PageManifest(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             children=children,
             content_children=content_children,
         )
@@ -1218,7 +1334,7 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         return RichText(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             text=text,
             font_size_pt=font_size_pt,
             runs=runs,
@@ -1227,22 +1343,25 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
 
     if jidx == JCID_IMAGE_NODE_INDEX:
         # Alt text PID_IMAGE_ALT_TEXT exists in spec but not added to spec_ids v1.
-        file_data_guids = _resolve_file_data_store_guids_via_references(rec, state=state)
+        file_data_guids: tuple[str, ...] = ()
+        embedded_data = b""
+        if state.options.load_images:
+            file_data_guids = _resolve_file_data_store_guids_via_references(rec, state=state)
+            embedded_data = _resolve_picture_container_payload(rec, state=state)
         file_names = _resolve_file_names_via_references(rec, state=state)
-        embedded_data = _resolve_picture_container_payload(rec, state=state)
         tags = _extract_note_tags_from_properties(rec.properties, state=state)
         # Layout properties
-        offset_h = _float_from_bytes(get_bytes(rec.properties, PID_OFFSET_FROM_PARENT_HORIZ)) if rec.properties else None
-        offset_v = _float_from_bytes(get_bytes(rec.properties, PID_OFFSET_FROM_PARENT_VERT)) if rec.properties else None
-        layout_max_w = _float_from_bytes(get_bytes(rec.properties, PID_LAYOUT_MAX_WIDTH)) if rec.properties else None
-        layout_max_h = _float_from_bytes(get_bytes(rec.properties, PID_LAYOUT_MAX_HEIGHT)) if rec.properties else None
-        pic_w = _float_from_bytes(get_bytes(rec.properties, PID_PICTURE_WIDTH)) if rec.properties else None
-        pic_h = _float_from_bytes(get_bytes(rec.properties, PID_PICTURE_HEIGHT)) if rec.properties else None
+        offset_h = _layout_float(rec, PID_OFFSET_FROM_PARENT_HORIZ, state)
+        offset_v = _layout_float(rec, PID_OFFSET_FROM_PARENT_VERT, state)
+        layout_max_w = _layout_float(rec, PID_LAYOUT_MAX_WIDTH, state)
+        layout_max_h = _layout_float(rec, PID_LAYOUT_MAX_HEIGHT, state)
+        pic_w = _layout_float(rec, PID_PICTURE_WIDTH, state)
+        pic_h = _layout_float(rec, PID_PICTURE_HEIGHT, state)
         hyperlink = _wz_prop(rec, PID_WZ_HYPERLINK_URL, state)
         return Image(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             alt_text=None,
             original_filename=file_names[0] if file_names else None,
             file_data_guids=file_data_guids,
@@ -1258,14 +1377,17 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         )
 
     if jidx == JCID_EMBEDDED_FILE_NODE_INDEX:
-        file_data_guids = _resolve_file_data_store_guids_via_references(rec, state=state)
+        file_data_guids = ()
+        embedded_data = b""
+        if state.options.load_attachments:
+            file_data_guids = _resolve_file_data_store_guids_via_references(rec, state=state)
+            embedded_data = _resolve_picture_container_payload(rec, state=state)
         file_names = _resolve_file_names_via_references(rec, state=state)
-        embedded_data = _resolve_picture_container_payload(rec, state=state)
         tags = _extract_note_tags_from_properties(rec.properties, state=state)
         return EmbeddedFile(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             original_filename=file_names[0] if file_names else None,
             file_data_guids=file_data_guids,
             data=embedded_data,
@@ -1276,14 +1398,18 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
         children = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
         tags = _extract_note_tags_from_properties(rec.properties, state=state)
         # Table layout properties
-        row_count = _u32_from_bytes(get_bytes(rec.properties, PID_ROW_COUNT)) if rec.properties else None
-        col_count = _u32_from_bytes(get_bytes(rec.properties, PID_COLUMN_COUNT)) if rec.properties else None
-        col_widths = _decode_table_column_widths(get_bytes(rec.properties, PID_TABLE_COLUMN_WIDTHS)) if rec.properties else ()
+        row_count = get_u32(rec.properties, PID_ROW_COUNT) if rec.properties else None
+        col_count = get_u32(rec.properties, PID_COLUMN_COUNT) if rec.properties else None
+        col_widths = (
+            _decode_table_column_widths(get_bytes(rec.properties, PID_TABLE_COLUMN_WIDTHS))
+            if rec.properties and state.options.load_layout
+            else ()
+        )
         borders_visible = _bool_from_prop(rec.properties, PID_TABLE_BORDERS_VISIBLE)
         return Table(
             oid=oid,
             jcid_index=jidx,
-            raw_properties=rec.properties,
+            raw_properties=raw,
             children=children,
             tags=tags,
             row_count=row_count,
@@ -1294,13 +1420,13 @@ def parse_node(oid: ExtendedGUID, state: ParseState) -> BaseNode:
 
     if jidx == JCID_TABLE_ROW_NODE_INDEX:
         children = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
-        return TableRow(oid=oid, jcid_index=jidx, raw_properties=rec.properties, children=children)
+        return TableRow(oid=oid, jcid_index=jidx, raw_properties=raw, children=children)
 
     if jidx == JCID_TABLE_CELL_NODE_INDEX:
         children = _children_from_pid(rec, PID_ELEMENT_CHILD_NODES, state)
-        return TableCell(oid=oid, jcid_index=jidx, raw_properties=rec.properties, children=children)
+        return TableCell(oid=oid, jcid_index=jidx, raw_properties=raw, children=children)
 
     if jidx == JCID_SECTION_METADATA_INDEX:
-        return SectionMetaData(oid=oid, jcid_index=jidx, raw_properties=rec.properties, raw=rec.properties)
+        return SectionMetaData(oid=oid, jcid_index=jidx, raw_properties=raw, raw=raw)
 
-    return UnknownNode(oid=oid, jcid_index=jidx, raw_properties=rec.properties)
+    return UnknownNode(oid=oid, jcid_index=jidx, raw_properties=raw)
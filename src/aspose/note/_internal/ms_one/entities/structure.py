@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ...onestore.common_types import ExtendedGUID
-from ...onestore.object_data import DecodedPropertySet
+from ...onestore.object_data import ColumnarPropertySet, DecodedPropertySet
 
 from .base import BaseNode
 
@@ -29,6 +29,9 @@ class Page(BaseNode):
     # Layout properties (float inches)
     page_width: float | None = None
     page_height: float | None = None
+    # PageMetaData properties (set on metadata-only Page leaves)
+    level: int | None = None
+    creation_time: int | None = None  # FILETIME
 
 
 @dataclass(frozen=True, slots=True)
@@ -190,12 +193,12 @@ class TableCell(BaseNode):
 
 @dataclass(frozen=True, slots=True)
 class SectionMetaData(BaseNode):
-    raw: DecodedPropertySet | None
+    raw: DecodedPropertySet | ColumnarPropertySet | None
 
 
 @dataclass(frozen=True, slots=True)
 class PageMetaData(BaseNode):
-    raw: DecodedPropertySet | None
+    raw: DecodedPropertySet | ColumnarPropertySet | None
 
 
 @dataclass(frozen=True, slots=True)
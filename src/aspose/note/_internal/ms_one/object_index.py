@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Mapping
 
 from ..onestore.common_types import CompactID, ExtendedGUID, JCID
 from ..onestore.errors import OneStoreFormatError
@@ -19,79 +20,39 @@ from ..onestore.file_node_types import (
     ReadOnlyObjectDeclaration2LargeRefCountFND,
     ReadOnlyObjectDeclaration2RefCountFND,
 )
-from ..onestore.object_data import DecodedPropertySet, parse_object_space_object_prop_set_from_ref
+from ..onestore.object_data import (
+    CompactIdResolver,
+    DecodedPropertySet,
+    parse_object_space_object_prop_set_from_ref,
+)
 from ..onestore.parse_context import ParseContext
 
 from ..onestore import object_space as _os
 
 from .compact_id import EffectiveGidTable, resolve_compact_id
+from .spec_ids import PID_NOTE_TAG_STATES, PID_NOTE_TAG_STATES_ALT
 
 
-def _resolve_reference_values(
-    props: DecodedPropertySet,
-    gid_table: dict[int, bytes] | None,
+def _compact_id_resolver(
+    gid_table: Mapping[int, bytes] | None,
     *,
     ctx: ParseContext,
-) -> DecodedPropertySet:
-    """Resolve OID/OID-array property values to ExtendedGUIDs using the provided table.
+) -> CompactIdResolver | None:
+    """Return a decoder resolver mapping CompactIDs to ExtendedGUIDs via `gid_table`.
 
-    ObjectSpaceObjectPropSet decodes reference values as CompactIDs from its internal
+    ObjectSpaceObjectPropSet reference values are CompactIDs from its internal
     streams. Those CompactIDs are only meaningful relative to the Global ID Table that
     is in-scope at the point where the object group list entry was emitted, which can
     differ from the revision's effective table due to in-list table sequences.
     """
 
     if gid_table is None:
-        return props
-
-    # DecodedPropertySet is frozen; rebuild deterministically.
-    from ..onestore.object_data import DecodedProperty, DecodedPropertySet as _DPS
-
-    def _resolve_value(v):
-        t2 = type(v)
-
-        # Direct reference values.
-        if isinstance(v, CompactID):
-            return _os._resolve_compact_id_to_extended_guid(v, gid_table, ctx=ctx, offset=None)
-
-        # Reference arrays.
-        if isinstance(v, tuple) and v and isinstance(v[0], CompactID):
-            return tuple(_os._resolve_compact_id_to_extended_guid(x, gid_table, ctx=ctx, offset=None) for x in v)
-
-        # Nested PropertySet.
-        if isinstance(v, _DPS):
-            return _resolve_reference_values(v, gid_table, ctx=ctx)
-
-        # Array of nested PropertySet(s).
-        if isinstance(v, tuple) and v and isinstance(v[0], _DPS):
-            return tuple(_resolve_reference_values(x, gid_table, ctx=ctx) for x in v)
-
-        return v
+        return None
 
-    out: list[DecodedProperty] = []
-    for p in props.properties:
-        t = int(p.prid.prop_type)
-        v = p.value
-        # Fast-path common cases to keep behavior stable.
-        if t == 0x09 and isinstance(v, tuple) and not v:
-            out.append(DecodedProperty(prid=p.prid, value=tuple(), rgdata_offset=p.rgdata_offset, rgdata_length=p.rgdata_length))
-            continue
-        if t in (0x0B, 0x0D) and isinstance(v, tuple) and not v:
-            out.append(DecodedProperty(prid=p.prid, value=tuple(), rgdata_offset=p.rgdata_offset, rgdata_length=p.rgdata_length))
-            continue
-
-        v2 = _resolve_value(v)
-        if v2 is not v:
-            out.append(DecodedProperty(prid=p.prid, value=v2, rgdata_offset=p.rgdata_offset, rgdata_length=p.rgdata_length))
-        else:
-            out.append(p)
+    def _resolve(cid: CompactID) -> ExtendedGUID:
+        return _os._resolve_compact_id_to_extended_guid(cid, gid_table, ctx=ctx, offset=None)
 
-    return DecodedPropertySet(
-        c_properties=props.c_properties,
-        properties=tuple(out),
-        rgdata_size=props.rgdata_size,
-        encoded_size=props.encoded_size,
-    )
+    return _resolve
 
 
 @dataclass(frozen=True, slots=True)
@@ -105,11 +66,78 @@ class ObjectRecord:
 
 @dataclass(frozen=True, slots=True)
 class ObjectIndex:
+    """Effective objects of an object space, keyed by OID.
+
+    Secondary indexes are maintained alongside `objects_by_oid`:
+    - `oids_by_jcid`: JCID index -> OIDs (insertion-ordered, dict used as ordered set)
+    - `tagged_oids`: OIDs whose property set carries NoteTagStates (ordered set)
+
+    They let callers look up objects of a given type in O(matches) instead of
+    scanning every object in the space.
+    """
+
     objects_by_oid: dict[ExtendedGUID, ObjectRecord]
+    oids_by_jcid: dict[int, dict[ExtendedGUID, None]] = field(default_factory=dict)
+    tagged_oids: dict[ExtendedGUID, None] = field(default_factory=dict)
+
+    @classmethod
+    def from_objects(cls, objects: dict[ExtendedGUID, ObjectRecord]) -> "ObjectIndex":
+        """Build an index (including secondary indexes) from a plain objects dict."""
+
+        oids_by_jcid: dict[int, dict[ExtendedGUID, None]] = {}
+        tagged_oids: dict[ExtendedGUID, None] = {}
+        for rec in objects.values():
+            _update_secondary_indexes(None, rec, oids_by_jcid=oids_by_jcid, tagged_oids=tagged_oids)
+        return cls(objects_by_oid=objects, oids_by_jcid=oids_by_jcid, tagged_oids=tagged_oids)
 
     def get(self, oid: ExtendedGUID) -> ObjectRecord | None:
         return self.objects_by_oid.get(oid)
 
+    def oids_with_jcid(self, jcid_index: int) -> tuple[ExtendedGUID, ...]:
+        """Return OIDs of objects with the given JCID index, in insertion order."""
+
+        bucket = self.oids_by_jcid.get(int(jcid_index))
+        return tuple(bucket) if bucket else ()
+
+    def has_jcid(self, oid: ExtendedGUID, jcid_index: int) -> bool:
+        bucket = self.oids_by_jcid.get(int(jcid_index))
+        return bucket is not None and oid in bucket
+
+
+def _has_note_tag_states(props: DecodedPropertySet | None) -> bool:
+    if props is None:
+        return False
+    for p in props.properties:
+        if int(p.prid.raw) in (PID_NOTE_TAG_STATES, PID_NOTE_TAG_STATES_ALT):
+            return True
+    return False
+
+
+def _update_secondary_indexes(
+    prior: ObjectRecord | None,
+    rec: ObjectRecord,
+    *,
+    oids_by_jcid: dict[int, dict[ExtendedGUID, None]] | None,
+    tagged_oids: dict[ExtendedGUID, None] | None,
+) -> None:
+    """Keep ObjectIndex secondary indexes in sync when `rec` replaces `prior`."""
+
+    if oids_by_jcid is not None:
+        prior_jidx = None if prior is None or prior.jcid is None else int(prior.jcid.index)
+        jidx = None if rec.jcid is None else int(rec.jcid.index)
+        if prior_jidx is not None and prior_jidx != jidx:
+            bucket = oids_by_jcid.get(prior_jidx)
+            if bucket is not None:
+                bucket.pop(rec.oid, None)
+        if jidx is not None:
+            oids_by_jcid.setdefault(jidx, {})[rec.oid] = None
+
+    if tagged_oids is not None:
+        if _has_note_tag_states(rec.properties):
+            tagged_oids[rec.oid] = None
+        else:
+            tagged_oids.pop(rec.oid, None)
+
 
 def _is_prop_set_jcid(jcid: JCID | None) -> bool:
     return bool(jcid is not None and jcid.is_property_set)
@@ -130,6 +158,8 @@ def build_object_index_from_object_groups(
     """
 
     objects: dict[ExtendedGUID, ObjectRecord] = {}
+    oids_by_jcid: dict[int, dict[ExtendedGUID, None]] = {}
+    tagged_oids: dict[ExtendedGUID, None] = {}
     apply_object_groups(
         objects,
         data,
@@ -137,8 +167,10 @@ def build_object_index_from_object_groups(
         effective_gid_table=effective_gid_table,
         last_count_by_list_id=last_count_by_list_id,
         ctx=ctx,
+        oids_by_jcid=oids_by_jcid,
+        tagged_oids=tagged_oids,
     )
-    return ObjectIndex(objects_by_oid=objects)
+    return ObjectIndex(objects_by_oid=objects, oids_by_jcid=oids_by_jcid, tagged_oids=tagged_oids)
 
 
 def apply_object_groups(
@@ -149,14 +181,20 @@ def apply_object_groups(
     effective_gid_table: EffectiveGidTable | None,
     last_count_by_list_id: dict[int, int],
     ctx: ParseContext,
+    oids_by_jcid: dict[int, dict[ExtendedGUID, None]] | None = None,
+    tagged_oids: dict[ExtendedGUID, None] | None = None,
 ) -> None:
     """Apply object group list changes into an existing objects dict.
 
     This is used to build the effective object state for a target revision by
     replaying changes across the ridDependent chain.
+
+    When `oids_by_jcid` / `tagged_oids` are provided they are updated in place to
+    mirror `objects` (see ObjectIndex).
     """
 
-    initial_table = None if effective_gid_table is None else dict(effective_gid_table.by_index)
+    # GID tables are read-only and shared across revisions; no need to copy.
+    initial_table = None if effective_gid_table is None else effective_gid_table.by_index
 
     # object_groups is expected to contain onestore.object_space.ObjectGroupSummary.
     for grp in object_groups:
@@ -173,7 +211,8 @@ def apply_object_groups(
             ctx=ctx,
         )
 
-        current_table: dict[int, bytes] | None = initial_table
+        current_table: Mapping[int, bytes] | None = initial_table
+        resolve = _compact_id_resolver(current_table, ctx=ctx)
 
         i = 0
         while i < len(group_list.nodes):
@@ -190,6 +229,7 @@ def apply_object_groups(
                     ctx=ctx,
                     offset=group_list.nodes[i].node.header.offset,
                 )
+                resolve = _compact_id_resolver(current_table, ctx=ctx)
                 i = new_i
                 continue
 
@@ -247,18 +287,20 @@ def apply_object_groups(
                             cb=ref_cb,
                             ctx=ctx,
                         )
-                        props = _resolve_reference_values(ps.decode_property_set(ctx=ctx), current_table, ctx=ctx)
+                        props = ps.decode_property_set(ctx=ctx, resolve=resolve)
                     except OneStoreFormatError:
                         ctx.warn("Failed to decode ObjectSpaceObjectPropSet for object revision", offset=ref_stp)
                         props = None
 
-                objects[oid] = ObjectRecord(
+                rec = ObjectRecord(
                     oid=oid,
                     jcid=prior_jcid,
                     properties=props if props is not None else (None if prior is None else prior.properties),
                     ref_stp=ref_stp,
                     ref_cb=ref_cb,
                 )
+                objects[oid] = rec
+                _update_secondary_indexes(prior, rec, oids_by_jcid=oids_by_jcid, tagged_oids=tagged_oids)
                 i += 1
                 continue
 
@@ -278,18 +320,20 @@ def apply_object_groups(
                         cb=ref_cb,
                         ctx=ctx,
                     )
-                    props = _resolve_reference_values(ps.decode_property_set(ctx=ctx), current_table, ctx=ctx)
+                    props = ps.decode_property_set(ctx=ctx, resolve=resolve)
                 except OneStoreFormatError:
                     ctx.warn("Failed to decode ObjectSpaceObjectPropSet for object", offset=ref_stp)
                     props = None
 
-            objects[oid] = ObjectRecord(
+            rec = ObjectRecord(
                 oid=oid,
                 jcid=jcid,
                 properties=props,
                 ref_stp=ref_stp,
                 ref_cb=ref_cb,
             )
+            _update_secondary_indexes(objects.get(oid), rec, oids_by_jcid=oids_by_jcid, tagged_oids=tagged_oids)
+            objects[oid] = rec
 
             i += 1
             continue
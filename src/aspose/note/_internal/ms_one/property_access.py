@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Iterable
 
 from ..onestore.common_types import CompactID, ExtendedGUID
-from ..onestore.object_data import DecodedProperty, DecodedPropertySet
+from ..onestore.object_data import ColumnarPropertySet, DecodedProperty, DecodedPropertySet
 
 from .errors import MSOneFormatError
 
@@ -12,12 +12,8 @@ def iter_props(pset: DecodedPropertySet) -> Iterable[DecodedProperty]:
     return pset.properties
 
 
-def get_prop(pset: DecodedPropertySet, property_id_raw: int) -> DecodedProperty | None:
-    pid = int(property_id_raw) & 0xFFFFFFFF
-    for p in pset.properties:
-        if int(p.prid.raw) == pid:
-            return p
-    return None
+def get_prop(pset: DecodedPropertySet | ColumnarPropertySet, property_id_raw: int) -> DecodedProperty | None:
+    return pset.get(property_id_raw)
 
 
 def require_prop(pset: DecodedPropertySet, property_id_raw: int, *, msg: str) -> DecodedProperty:
@@ -47,11 +43,37 @@ def get_bytes(pset: DecodedPropertySet, property_id_raw: int) -> bytes | None:
     return None
 
 
-def get_u32_from_bytes(pset: DecodedPropertySet, property_id_raw: int) -> int | None:
-    b = get_bytes(pset, property_id_raw)
-    if b is None or len(b) < 4:
+def _get_uint(pset: DecodedPropertySet, property_id_raw: int, size: int) -> int | None:
+    # Decode straight from the raw value: no intermediate bytes copy.
+    p = get_prop(pset, property_id_raw)
+    if p is None:
+        return None
+    v = p.value
+    if not isinstance(v, (bytes, bytearray, memoryview)) or len(v) < size:
         return None
-    return int.from_bytes(b[:4], "little", signed=False)
+    return int.from_bytes(v[:size], "little", signed=False)
+
+
+def get_u16(pset: DecodedPropertySet, property_id_raw: int) -> int | None:
+    """Return the first 2 bytes of a fixed-size/blob property as a little-endian unsigned int."""
+
+    return _get_uint(pset, property_id_raw, 2)
+
+
+def get_u32(pset: DecodedPropertySet, property_id_raw: int) -> int | None:
+    """Return the first 4 bytes of a fixed-size/blob property as a little-endian unsigned int."""
+
+    return _get_uint(pset, property_id_raw, 4)
+
+
+def get_u64(pset: DecodedPropertySet, property_id_raw: int) -> int | None:
+    """Return the first 8 bytes of a fixed-size/blob property as a little-endian unsigned int."""
+
+    return _get_uint(pset, property_id_raw, 8)
+
+
+def get_u32_from_bytes(pset: DecodedPropertySet, property_id_raw: int) -> int | None:
+    return get_u32(pset, property_id_raw)
 
 
 def get_oid(pset: DecodedPropertySet, property_id_raw: int) -> CompactID | ExtendedGUID | None:
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field, replace
+
 from ..onestore.common_types import CompactID, ExtendedGUID
-from ..onestore.header import Header
-from ..onestore.io import BinaryReader
-from ..onestore.file_node_types import DEFAULT_CONTEXT_GCTXID
 from ..onestore.file_data import parse_file_data_store_index
-from ..onestore.object_space import parse_object_spaces_with_resolved_ids, parse_object_spaces_with_revisions
+from ..onestore.object_space import (
+    OneStoreFileBootstrap,
+    _resolve_object_space_ids,
+    parse_file_bootstrap,
+    parse_object_spaces_with_revisions,
+)
 from ..onestore.parse_context import ParseContext
-from ..onestore.txn_log import parse_transaction_log
 
 from .compact_id import EffectiveGidTable
 from .errors import MSOneFormatError
 from .object_index import ObjectIndex, ObjectRecord, apply_object_groups
 from .property_access import get_oid_array
+from .revision_graph import RevisionGraph
 from .spec_ids import (
     JCID_PAGE_MANIFEST_NODE_INDEX,
     JCID_PAGE_NODE_INDEX,
@@ -20,115 +24,15 @@ from .spec_ids import (
     JCID_TABLE_NODE_INDEX,
     JCID_EMBEDDED_FILE_NODE_INDEX,
     JCID_SECTION_NODE_INDEX,
+    JCID_PAGE_METADATA_INDEX,
     PID_CHILD_GRAPH_SPACE_ELEMENT_NODES,
-    PID_NOTE_TAG_STATES,
-    PID_NOTE_TAG_STATES_ALT,
 )
-from .entities.parsers import ParseState, parse_node
+from .entities.parsers import DEFAULT_CONTENT_OPTIONS, ContentOptions, ParseState, parse_node
 from .entities.base import BaseNode
 from .entities.structure import Page, PageManifest, PageSeries, RichText, Section
 from typing import cast
 
 
-def _pick_default_revision_index(step10_os) -> int:
-    """Pick the revision that represents the default (current) view for an object space."""
-
-    if not step10_os.revisions:
-        raise MSOneFormatError("No revisions found in object space")
-
-    last_index = len(step10_os.revisions) - 1
-    index_by_rid = {rev.rid: i for i, rev in enumerate(step10_os.revisions)}
-
-    def _advance_contiguous_descendants_matching_pair(
-        start_index: int,
-        *,
-        gctxid: ExtendedGUID,
-        revision_role: int,
-    ) -> int:
-        """Advance along a contiguous ridDependent chain to the newest matching revision.
-
-        Some files contain RevisionRoleContextPair assignments that point to a revision whose
-        own (gctxid, revision_role) metadata does not match the assignment key, yet the file
-        appends a *contiguous* sequence of dependent revisions (in revision-list order) that
-        does match. We only follow such linear, in-order chains; this avoids jumping across
-        interleaved revisions from other contexts/roles.
-        """
-
-        best_match: int | None = None
-        cur = int(start_index)
-
-        while cur < len(step10_os.revisions):
-            rev = step10_os.revisions[cur]
-            if rev.gctxid == gctxid and int(rev.revision_role) == int(revision_role):
-                best_match = cur
-
-            nxt = cur + 1
-            if nxt >= len(step10_os.revisions):
-                break
-
-            nxt_rev = step10_os.revisions[nxt]
-            if nxt_rev.rid_dependent != rev.rid:
-                break
-
-            cur = nxt
-
-        return int(best_match if best_match is not None else start_index)
-
-    # Standard: select via RevisionRoleContextPair assignments.
-    # Prefer the highest revision_role assignment in DEFAULT_CONTEXT.
-    candidates: list[tuple[int, int]] = []  # (revision_role, revision_index)
-    for pair, rid in getattr(step10_os, "role_assignments", ()):
-        if pair.gctxid != DEFAULT_CONTEXT_GCTXID:
-            continue
-        idx = index_by_rid.get(rid)
-        if idx is None:
-            continue
-        candidates.append((int(pair.revision_role), int(idx)))
-
-    if candidates:
-        # Highest role wins; if equal role, pick the newest revision index.
-        role, idx = max(candidates, key=lambda x: (x[0], x[1]))
-
-        assigned_rev = step10_os.revisions[int(idx)]
-        if assigned_rev.gctxid == DEFAULT_CONTEXT_GCTXID and int(assigned_rev.revision_role) == int(role):
-            return int(idx)
-
-        # If the assignment points at a revision with mismatching metadata, try to recover by
-        # walking only a contiguous in-order dependency chain.
-        return _advance_contiguous_descendants_matching_pair(
-            int(idx),
-            gctxid=DEFAULT_CONTEXT_GCTXID,
-            revision_role=int(role),
-        )
-
-    return last_index
-
-
-def _build_dependency_chain_indices(step10_os, start_index: int) -> list[int]:
-    """Return revision indices from oldest to newest for the dependency chain ending at start_index."""
-
-    chain: list[int] = []
-    cur = start_index
-    seen: set[int] = set()
-    while 0 <= cur < len(step10_os.revisions) and cur not in seen:
-        seen.add(cur)
-        chain.append(cur)
-        dep = step10_os.revisions[cur].rid_dependent
-        if dep.is_zero():
-            break
-        dep_index = None
-        for j, r in enumerate(step10_os.revisions):
-            if r.rid == dep:
-                dep_index = j
-                break
-        if dep_index is None:
-            break
-        cur = dep_index
-
-    chain.reverse()
-    return chain
-
-
 def _iter_entity_nodes(root: object):
     stack = [root]
     while stack:
@@ -160,41 +64,6 @@ def _pick_root_object_space(step10, step11):
     return 0
 
 
-def _build_effective_root_objects(
-    step10_os,
-    step11_os,
-    rev_index: int,
-) -> tuple[tuple[int, ExtendedGUID], ...]:
-    """Some files omit root refs in later dependent revisions; inherit from dependencies."""
-
-    visited: set[int] = set()
-    i = rev_index
-    while 0 <= i < len(step11_os.revisions):
-        if i in visited:
-            break
-        visited.add(i)
-
-        roots = step11_os.revisions[i].resolved_root_objects
-        if roots:
-            return roots
-
-        dep = step10_os.revisions[i].rid_dependent
-        if dep.is_zero():
-            break
-
-        # Find dependency by rid (same order in step10 and step11).
-        dep_index = None
-        for j, r in enumerate(step10_os.revisions):
-            if r.rid == dep:
-                dep_index = j
-                break
-        if dep_index is None:
-            break
-        i = dep_index
-
-    return ()
-
-
 def _build_effective_object_index_for_object_space(
     data: bytes | bytearray | memoryview,
     *,
@@ -203,6 +72,7 @@ def _build_effective_object_index_for_object_space(
     last_count_by_list_id: dict[int, int],
     ctx: ParseContext,
     rev_index: int | None = None,
+    graph: RevisionGraph | None = None,
 ) -> tuple[ObjectIndex, EffectiveGidTable, tuple[tuple[int, ExtendedGUID], ...]]:
     """Build an ObjectIndex for a single object space at its latest revision.
 
@@ -210,23 +80,27 @@ def _build_effective_object_index_for_object_space(
     effective view of objects at the last revision.
     """
 
+    if graph is None:
+        graph = RevisionGraph.from_object_space(step10_os)
     if rev_index is None:
         # Prefer the revision assigned to the default context (common for .one).
-        rev_index = _pick_default_revision_index(step10_os)
+        rev_index = graph.default_revision_index()
     rev11 = step11_os.revisions[rev_index]
-    gid_table = EffectiveGidTable.from_sorted_items(rev11.effective_gid_table)
-    roots = _build_effective_root_objects(step10_os, step11_os, rev_index)
+    gid_table = EffectiveGidTable.from_revision(rev11)
+    roots = graph.effective_root_objects(step11_os, rev_index)
 
     objects: dict[ExtendedGUID, ObjectRecord] = {}
+    oids_by_jcid: dict[int, dict[ExtendedGUID, None]] = {}
+    tagged_oids: dict[ExtendedGUID, None] = {}
 
-    chain = _build_dependency_chain_indices(step10_os, rev_index)
+    chain = graph.chain(rev_index)
 
     for i in chain:
         r10 = step10_os.revisions[i]
         r11 = step11_os.revisions[i]
         if r10.manifest is None:
             continue
-        table_i = EffectiveGidTable.from_sorted_items(r11.effective_gid_table)
+        table_i = EffectiveGidTable.from_revision(r11)
         apply_object_groups(
             objects,
             data,
@@ -234,9 +108,12 @@ def _build_effective_object_index_for_object_space(
             effective_gid_table=table_i,
             last_count_by_list_id=last_count_by_list_id,
             ctx=ctx,
+            oids_by_jcid=oids_by_jcid,
+            tagged_oids=tagged_oids,
         )
 
-    return ObjectIndex(objects_by_oid=objects), gid_table, roots
+    idx = ObjectIndex(objects_by_oid=objects, oids_by_jcid=oids_by_jcid, tagged_oids=tagged_oids)
+    return idx, gid_table, roots
 
 
 def _extract_pages_from_page_object_space(
@@ -248,8 +125,12 @@ def _extract_pages_from_page_object_space(
     ctx: ParseContext,
     file_data_store_index=None,
     rev_index: int | None = None,
-
+    graph: RevisionGraph | None = None,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> list[Page]:
+    if graph is None:
+        graph = RevisionGraph.from_object_space(step10_os)
+
     def _extract_pages_for_revision(ri: int | None) -> list[Page]:
         idx, gid_table, roots = _build_effective_object_index_for_object_space(
             data,
@@ -258,23 +139,22 @@ def _extract_pages_from_page_object_space(
             last_count_by_list_id=last_count_by_list_id,
             ctx=ctx,
             rev_index=ri,
+            graph=graph,
         )
 
-        state = ParseState(index=idx, gid_table=gid_table, ctx=ctx, file_data_store_index=file_data_store_index)
+        state = ParseState(
+            index=idx,
+            gid_table=gid_table,
+            ctx=ctx,
+            file_data_store_index=file_data_store_index,
+            options=options,
+        )
 
         # Many files do not expose PageManifest/PageNode as roots of the page object space.
         # Instead of relying on roots (which may be other container types), scan the object
         # index for the actual content-bearing nodes.
-        manifest_oids: list[ExtendedGUID] = []
-        page_oids: list[ExtendedGUID] = []
-        for oid, rec in idx.objects_by_oid.items():
-            if rec.jcid is None:
-                continue
-            jidx = int(rec.jcid.index)
-            if jidx == JCID_PAGE_MANIFEST_NODE_INDEX:
-                manifest_oids.append(oid)
-            elif jidx == JCID_PAGE_NODE_INDEX:
-                page_oids.append(oid)
+        manifest_oids = idx.oids_with_jcid(JCID_PAGE_MANIFEST_NODE_INDEX)
+        page_oids = idx.oids_with_jcid(JCID_PAGE_NODE_INDEX)
 
         # Collect pages from PageManifest roots when present.
         pages: list[Page] = []
@@ -313,8 +193,9 @@ def _extract_pages_from_page_object_space(
 
         # Best-effort: some files contain tagged objects that exist in the effective
         # object index but are not reachable from any parsed page roots.
-        # Expose them by attaching to the first page.
-        if out:
+        # Expose them by attaching to the first page. Only tags make them interesting,
+        # so the scan is skipped when tags are not loaded.
+        if out and options.load_tags:
             reachable: set[ExtendedGUID] = set()
             for page in out:
                 for n in _iter_entity_nodes(page):
@@ -322,19 +203,16 @@ def _extract_pages_from_page_object_space(
                         reachable.add(n.oid)
 
             orphan_tagged: list[BaseNode] = []
-            for oid, rec in idx.objects_by_oid.items():
-                if oid in reachable or rec.jcid is None or rec.properties is None:
+            for oid in idx.tagged_oids:
+                if oid in reachable:
                     continue
 
-                jidx = int(rec.jcid.index)
-                if jidx not in (JCID_IMAGE_NODE_INDEX, JCID_TABLE_NODE_INDEX, JCID_EMBEDDED_FILE_NODE_INDEX):
+                rec = idx.get(oid)
+                if rec is None or rec.jcid is None:
                     continue
 
-                has_tag = any(
-                    int(p.prid.raw) in (PID_NOTE_TAG_STATES, PID_NOTE_TAG_STATES_ALT)
-                    for p in rec.properties.properties
-                )
-                if not has_tag:
+                jidx = int(rec.jcid.index)
+                if jidx not in (JCID_IMAGE_NODE_INDEX, JCID_TABLE_NODE_INDEX, JCID_EMBEDDED_FILE_NODE_INDEX):
                     continue
 
                 orphan_tagged.append(parse_node(oid, state))
@@ -361,29 +239,25 @@ def _extract_pages_from_page_object_space(
     if not getattr(step10_os, "revisions", None):
         return _extract_pages_for_revision(None)
 
-    return _extract_pages_for_revision(_pick_default_revision_index(step10_os))
+    return _extract_pages_for_revision(graph.default_revision_index())
 
 
-def parse_section_file(
+def _parse_section_root(
     data: bytes | bytearray | memoryview,
     *,
-    strict: bool = True,
-    include_page_history: bool = False,
-) -> Section:
-    """Parse a .one section file into a minimal MS-ONE entity tree."""
-
-    ctx = ParseContext(strict=bool(strict), file_size=len(data))
+    ctx: ParseContext,
+    file_data_store_index,
+    root_only: bool,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
+):
+    """Parse the root (section) object space into a Section whose pages are metadata leaves.
 
-    # Best-effort FileDataStore index. Some fixtures violate MUST-level constraints in this area,
-    # so always parse it in non-strict mode and never let it break section parsing.
-    fds_ctx = ParseContext(strict=False, file_size=len(data))
-    try:
-        file_data_store_index = parse_file_data_store_index(data, ctx=fds_ctx)
-    except Exception:
-        file_data_store_index = {}
+    Returns (section, step10, step11, gid_table, bootstrap).
+    """
 
-    step10 = parse_object_spaces_with_revisions(data, ctx=ctx)
-    step11 = parse_object_spaces_with_resolved_ids(data, ctx=ctx)
+    bootstrap = parse_file_bootstrap(data, ctx=ctx)
+    step10 = parse_object_spaces_with_revisions(data, ctx=ctx, root_only=root_only, bootstrap=bootstrap)
+    step11 = _resolve_object_space_ids(data, step10, ctx=ctx, bootstrap=bootstrap)
 
     if not step10.object_spaces:
         raise MSOneFormatError("No object spaces found")
@@ -393,21 +267,22 @@ def parse_section_file(
     step11_os = step11.object_spaces[os_index]
 
     # Needed for parsing referenced file node lists (object group lists).
-    header = Header.parse(BinaryReader(data), ctx=ctx)
-    last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
+    last_count_by_list_id = bootstrap.last_count_by_list_id
 
     # Build index for the section/root object space.
+    section_graph = RevisionGraph.from_object_space(step10_os)
     obj_index, gid_table, roots = _build_effective_object_index_for_object_space(
         data,
         step10_os=step10_os,
         step11_os=step11_os,
         last_count_by_list_id=last_count_by_list_id,
         ctx=ctx,
+        graph=section_graph,
     )
 
     # Resolve roots for the section object space.
     rev_index = len(step10_os.revisions) - 1
-    roots = _build_effective_root_objects(step10_os, step11_os, rev_index) or roots
+    roots = section_graph.effective_root_objects(step11_os, rev_index) or roots
     if not roots:
         raise MSOneFormatError("No root objects found")
 
@@ -423,12 +298,91 @@ def parse_section_file(
         # Fallback: take the first root and try to parse it.
         section_oid = roots[0][1]
 
-    state = ParseState(index=obj_index, gid_table=gid_table, ctx=ctx, file_data_store_index=file_data_store_index)
+    state = ParseState(
+        index=obj_index,
+        gid_table=gid_table,
+        ctx=ctx,
+        file_data_store_index=file_data_store_index,
+        options=options,
+    )
     node = parse_node(section_oid, state)
 
     if not isinstance(node, Section):
         raise MSOneFormatError("Root object is not a Section", oid=section_oid)
 
+    return node, step10, step11, gid_table, bootstrap
+
+
+def _page_series_gosids(series: PageSeries, gid_table: EffectiveGidTable, ctx: ParseContext) -> tuple[ExtendedGUID, ...]:
+    """Return the page object space IDs (ChildGraphSpaceElementNodes) of a PageSeries."""
+
+    if series.raw_properties is None:
+        return ()
+
+    graph_ids = get_oid_array(series.raw_properties, PID_CHILD_GRAPH_SPACE_ELEMENT_NODES)
+    if not graph_ids:
+        return ()
+
+    # Resolve ObjectSpaceIDs (CompactID) to ExtendedGUID using the section GID table.
+    if isinstance(graph_ids[0], CompactID):
+        from .compact_id import resolve_compact_id_array
+
+        return resolve_compact_id_array(cast(tuple[CompactID, ...], graph_ids), gid_table, ctx=ctx)
+
+    # Some files may already store resolved ObjectSpaceIDs.
+    return cast(tuple[ExtendedGUID, ...], graph_ids)
+
+
+def _with_page_metadata(pages: list[Page], meta: Page | None) -> list[Page]:
+    # PageMetaData leaves parallel ChildGraphSpaceElementNodes (one per page space);
+    # they carry the page level and creation time that page spaces do not repeat.
+    if meta is None:
+        return pages
+    return [replace(p, level=meta.level, creation_time=meta.creation_time) for p in pages]
+
+
+def parse_section_file(
+    data: bytes | bytearray | memoryview,
+    *,
+    strict: bool = True,
+    include_page_history: bool = False,
+    metadata_only: bool = False,
+    options: ContentOptions | None = None,
+) -> Section:
+    """Parse a .one section file into a minimal MS-ONE entity tree.
+
+    With `metadata_only`, only the root (section) object space is read: page object
+    spaces are never parsed and PageSeries children stay metadata-only Page leaves
+    (title, level, creation time; no content).
+
+    `options` selects optional content (images, attachments, formatting, tags, layout);
+    see ContentOptions. Everything is decoded by default.
+    """
+
+    if options is None:
+        options = DEFAULT_CONTENT_OPTIONS
+
+    ctx = ParseContext(strict=bool(strict), file_size=len(data))
+
+    # Best-effort FileDataStore index. Some fixtures violate MUST-level constraints in this area,
+    # so always parse it in non-strict mode and never let it break section parsing.
+    file_data_store_index = None
+    if not metadata_only and options.needs_file_data:
+        file_data_store_index = _parse_file_data_store_index_best_effort(data)
+
+    node, step10, step11, gid_table, bootstrap = _parse_section_root(
+        data,
+        ctx=ctx,
+        file_data_store_index=file_data_store_index,
+        root_only=metadata_only,
+        options=options,
+    )
+
+    if metadata_only:
+        return node
+
+    last_count_by_list_id = bootstrap.last_count_by_list_id
+
     # Upgrade PageSeries children from metadata-only pages to actual Page nodes by
     # following ChildGraphSpaceElementNodes (page object spaces) and parsing their
     # PageManifest/Page roots.
@@ -444,33 +398,23 @@ def parse_section_file(
             continue
 
         # ChildGraphSpaceElementNodes lives on the PageSeries node.
-        if ch.raw_properties is None:
+        resolved_gosids = _page_series_gosids(ch, gid_table, ctx)
+        if not resolved_gosids:
             upgraded_children.append(ch)
             continue
 
-        graph_ids = get_oid_array(ch.raw_properties, PID_CHILD_GRAPH_SPACE_ELEMENT_NODES)
-        if not graph_ids:
-            upgraded_children.append(ch)
-            continue
-
-        # Resolve ObjectSpaceIDs (CompactID) to ExtendedGUID using the section GID table.
-        if graph_ids and isinstance(graph_ids[0], CompactID):
-            from .compact_id import resolve_compact_id_array
-
-            resolved_gosids = resolve_compact_id_array(cast(tuple[CompactID, ...], graph_ids), gid_table, ctx=ctx)
-        else:
-            # Some files may already store resolved ObjectSpaceIDs.
-            resolved_gosids = cast(tuple[ExtendedGUID, ...], graph_ids)
+        metadata_pages = [m for m in ch.children if isinstance(m, Page)]
 
         pages: list[Page] = []
         page_space_history_by_oid: dict[ExtendedGUID, tuple[Page, ...]] = {}
-        for gosid in resolved_gosids:
+        for space_i, gosid in enumerate(resolved_gosids):
             os_i = gosid_to_os_index.get(gosid)
             if os_i is None:
                 continue
 
             step10_page_os = step10.object_spaces[os_i]
             step11_page_os = step11.object_spaces[os_i]
+            page_graph = RevisionGraph.from_object_space(step10_page_os)
 
             latest_pages = _extract_pages_from_page_object_space(
                 data=data,
@@ -479,11 +423,16 @@ def parse_section_file(
                 last_count_by_list_id=last_count_by_list_id,
                 ctx=ctx,
                 file_data_store_index=file_data_store_index,
+                graph=page_graph,
+                options=options,
+            )
+            latest_pages = _with_page_metadata(
+                latest_pages, metadata_pages[space_i] if space_i < len(metadata_pages) else None
             )
             pages.extend(latest_pages)
 
             if include_page_history and step10_page_os.revisions:
-                latest_rev_index = _pick_default_revision_index(step10_page_os)
+                latest_rev_index = page_graph.default_revision_index()
 
                 # Many real-world .one files do not link revisions via ridDependent.
                 # For history, build snapshots across revisions in list order up to the
@@ -499,6 +448,8 @@ def parse_section_file(
                             ctx=ctx,
                             file_data_store_index=file_data_store_index,
                             rev_index=ri,
+                            graph=page_graph,
+                            options=options,
                         )
                     )
 
@@ -549,6 +500,8 @@ def parse_section_file(
                         title=p.title,
                         children=p.children,
                         history=hist,
+                        level=p.level,
+                        creation_time=p.creation_time,
                     )
                 )
             pages = enriched
@@ -574,6 +527,149 @@ def parse_section_file(
     )
 
 
+def _parse_file_data_store_index_best_effort(data: bytes | bytearray | memoryview) -> dict:
+    fds_ctx = ParseContext(strict=False, file_size=len(data))
+    try:
+        return parse_file_data_store_index(data, ctx=fds_ctx)
+    except Exception:
+        return {}
+
+
+@dataclass(frozen=True, slots=True)
+class PageDirectoryEntry:
+    """One page object space of a section, in PageSeries order.
+
+    `gosid` is the page object space (see parse_section_file) and `metadata` the
+    PageMetaData leaf at the same position (title, level, creation time), None when the
+    series lists fewer leaves than spaces. A PageSeries without
+    ChildGraphSpaceElementNodes contributes one entry per metadata leaf, with no gosid.
+    """
+
+    index: int
+    metadata: Page | None
+    gosid: ExtendedGUID | None
+
+
+@dataclass(slots=True)
+class PageDirectory:
+    """Random-access page loader for a section file.
+
+    Built from the root object space only (PageSeries metadata plus
+    ChildGraphSpaceElementNodes), with one entry per page object space present in the
+    file, like parse_section_file. The header, transaction log and root file node list
+    are parsed once; `load_pages()` then parses just the object space of the requested
+    entry. Pages are not cached here: callers that keep pages (onenote.Document.load_page)
+    hold the converted page, and streaming callers hold one entry at a time.
+    """
+
+    data: bytes | bytearray | memoryview
+    section: Section
+    entries: tuple[PageDirectoryEntry, ...]
+    ctx: ParseContext
+    _bootstrap: OneStoreFileBootstrap = field(repr=False)
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS
+    _file_data_store_index: dict | None = field(default=None, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        data: bytes | bytearray | memoryview,
+        *,
+        strict: bool = True,
+        options: ContentOptions | None = None,
+    ) -> "PageDirectory":
+        ctx = ParseContext(strict=bool(strict), file_size=len(data))
+        section, _, _, gid_table, bootstrap = _parse_section_root(
+            data,
+            ctx=ctx,
+            file_data_store_index=None,
+            root_only=True,
+        )
+
+        present = {ref.gosid for ref in bootstrap.manifests.object_space_refs}
+        entries: list[PageDirectoryEntry] = []
+        for ch in section.children:
+            if not isinstance(ch, PageSeries):
+                continue
+            gosids = _page_series_gosids(ch, gid_table, ctx)
+            metadata_pages = [m for m in ch.children if isinstance(m, Page)]
+            if not gosids:
+                # No page spaces referenced: the metadata leaves are the pages.
+                for meta in metadata_pages:
+                    entries.append(PageDirectoryEntry(index=len(entries), metadata=meta, gosid=None))
+                continue
+            for i, gosid in enumerate(gosids):
+                if gosid not in present:
+                    continue
+                meta = metadata_pages[i] if i < len(metadata_pages) else None
+                entries.append(PageDirectoryEntry(index=len(entries), metadata=meta, gosid=gosid))
+
+        return cls(
+            data=data,
+            section=section,
+            entries=tuple(entries),
+            ctx=ctx,
+            _bootstrap=bootstrap,
+            options=options if options is not None else DEFAULT_CONTENT_OPTIONS,
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def file_data_store_index(self) -> dict:
+        """Best-effort FileDataStore index, parsed on first use (empty when no blobs are loaded)."""
+
+        if self._file_data_store_index is None:
+            self._file_data_store_index = (
+                _parse_file_data_store_index_best_effort(self.data) if self.options.needs_file_data else {}
+            )
+        return self._file_data_store_index
+
+    def metadata_page(self, index: int) -> Page:
+        """Metadata-only Page leaf of entry `index` (an untitled leaf when the series lists none)."""
+
+        entry = self.entries[index]
+        if entry.metadata is not None:
+            return entry.metadata
+        return Page(
+            oid=entry.gosid,
+            jcid_index=JCID_PAGE_METADATA_INDEX,
+            raw_properties=None,
+            title=None,
+            children=(),
+        )
+
+    def load_pages(self, index: int) -> list[Page]:
+        """Parse and return the full entity trees of every page in entry `index`.
+
+        Usually one page; a page object space may hold several Page roots. Empty when the
+        object space cannot be parsed, as parse_section_file skips it too.
+        """
+
+        entry = self.entries[index]
+        if entry.gosid is None:
+            return [self.metadata_page(index)]
+        step10 = parse_object_spaces_with_revisions(
+            self.data, ctx=self.ctx, gosids=(entry.gosid,), bootstrap=self._bootstrap
+        )
+        step11 = _resolve_object_space_ids(self.data, step10, ctx=self.ctx, bootstrap=self._bootstrap)
+        if not step10.object_spaces or not step11.object_spaces:
+            return []
+        step10_os = step10.object_spaces[0]
+        pages = _extract_pages_from_page_object_space(
+            data=self.data,
+            step10_os=step10_os,
+            step11_os=step11.object_spaces[0],
+            last_count_by_list_id=self._bootstrap.last_count_by_list_id,
+            ctx=self.ctx,
+            file_data_store_index=self.file_data_store_index,
+            graph=RevisionGraph.from_object_space(step10_os),
+            options=self.options,
+        )
+        return _with_page_metadata(pages, entry.metadata)
+
+
 def parse_section_file_with_page_history(
     data: bytes | bytearray | memoryview,
     *,
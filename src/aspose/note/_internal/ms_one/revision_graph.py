@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from ..onestore.common_types import ExtendedGUID
+from ..onestore.file_node_types import DEFAULT_CONTEXT_GCTXID
+from ..onestore.object_space import ObjectSpaceRevisionsSummary, RevisionRoleContextPair, RevisionSummary
+
+from .errors import MSOneFormatError
+
+
+@dataclass(slots=True)
+class RevisionGraph:
+    """Revision dependency graph of a single object space.
+
+    Built once per object space from the revision manifest list summary:
+    - `index_by_rid`: rid -> revision index (O(1) lookup)
+    - `parent_index`: ridDependent of each revision resolved to an index (None at a root
+      or when the dependency is missing from the list)
+    - `index_by_pair`: RevisionRoleContextPair assignments resolved to revision indices
+      (the newest revision when a pair is assigned more than once)
+
+    Dependency chains are walked along the resolved parent links, so a chain costs
+    O(depth) and nothing is retained per revision between calls.
+    """
+
+    revisions: tuple[RevisionSummary, ...]
+    index_by_rid: dict[ExtendedGUID, int]
+    parent_index: tuple[int | None, ...]
+    index_by_pair: dict[RevisionRoleContextPair, int]
+    _default_index: int | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_object_space(cls, step10_os: ObjectSpaceRevisionsSummary) -> "RevisionGraph":
+        revisions = tuple(step10_os.revisions)
+
+        index_by_rid: dict[ExtendedGUID, int] = {}
+        for i, rev in enumerate(revisions):
+            # Keep the first occurrence, matching a front-to-back scan of the list.
+            index_by_rid.setdefault(rev.rid, i)
+
+        parents: list[int | None] = []
+        for rev in revisions:
+            dep = rev.rid_dependent
+            parents.append(None if dep.is_zero() else index_by_rid.get(dep))
+
+        index_by_pair: dict[RevisionRoleContextPair, int] = {}
+        for pair, rid in getattr(step10_os, "role_assignments", ()):
+            i = index_by_rid.get(rid)
+            if i is not None and i >= index_by_pair.get(pair, -1):
+                index_by_pair[pair] = i
+
+        return cls(
+            revisions=revisions,
+            index_by_rid=index_by_rid,
+            parent_index=tuple(parents),
+            index_by_pair=index_by_pair,
+        )
+
+    def __len__(self) -> int:
+        return len(self.revisions)
+
+    def index_of(self, rid: ExtendedGUID) -> int | None:
+        return self.index_by_rid.get(rid)
+
+    def parent(self, index: int) -> int | None:
+        if not (0 <= index < len(self.parent_index)):
+            return None
+        return self.parent_index[index]
+
+    def chain(self, index: int) -> tuple[int, ...]:
+        """Return revision indices from oldest to newest for the dependency chain ending at `index`."""
+
+        if not (0 <= index < len(self.revisions)):
+            return ()
+
+        # Walk up to a root, stopping at a cycle.
+        path: list[int] = []
+        on_path: set[int] = set()
+        cur: int | None = index
+        while cur is not None and cur not in on_path:
+            path.append(cur)
+            on_path.add(cur)
+            cur = self.parent_index[cur]
+        path.reverse()
+        return tuple(path)
+
+    def assigned_index(self, gctxid: ExtendedGUID, revision_role: int) -> int | None:
+        """Return the revision index assigned to (gctxid, revision_role), if any."""
+
+        return self.index_by_pair.get(RevisionRoleContextPair(gctxid=gctxid, revision_role=int(revision_role)))
+
+    def assignments_in_context(self, gctxid: ExtendedGUID) -> list[tuple[int, int]]:
+        """Return (revision_role, revision_index) assignments for a context."""
+
+        return [(int(pair.revision_role), i) for pair, i in self.index_by_pair.items() if pair.gctxid == gctxid]
+
+    def effective_root_objects(self, step11_os, index: int) -> tuple[tuple[int, ExtendedGUID], ...]:
+        """Return root objects of `index`, inheriting from dependencies when a revision omits them."""
+
+        visited: set[int] = set()
+        cur: int | None = index
+        while cur is not None and 0 <= cur < len(step11_os.revisions):
+            if cur in visited:
+                break
+            visited.add(cur)
+
+            roots = step11_os.revisions[cur].resolved_root_objects
+            if roots:
+                return roots
+
+            cur = self.parent(cur)
+
+        return ()
+
+    def default_revision_index(self) -> int:
+        """Pick the revision that represents the default (current) view for the object space."""
+
+        if self._default_index is None:
+            self._default_index = self._pick_default_revision_index()
+        return self._default_index
+
+    def _pick_default_revision_index(self) -> int:
+        if not self.revisions:
+            raise MSOneFormatError("No revisions found in object space")
+
+        # Standard: select via RevisionRoleContextPair assignments.
+        # Prefer the highest revision_role assignment in DEFAULT_CONTEXT.
+        candidates = self.assignments_in_context(DEFAULT_CONTEXT_GCTXID)
+        if not candidates:
+            return len(self.revisions) - 1
+
+        # Highest role wins; if equal role, pick the newest revision index.
+        role, idx = max(candidates, key=lambda x: (x[0], x[1]))
+
+        assigned_rev = self.revisions[idx]
+        if assigned_rev.gctxid == DEFAULT_CONTEXT_GCTXID and int(assigned_rev.revision_role) == role:
+            return idx
+
+        # If the assignment points at a revision with mismatching metadata, try to recover by
+        # walking only a contiguous in-order dependency chain.
+        return self._advance_contiguous_descendants_matching_pair(
+            idx,
+            gctxid=DEFAULT_CONTEXT_GCTXID,
+            revision_role=role,
+        )
+
+    def _advance_contiguous_descendants_matching_pair(
+        self,
+        start_index: int,
+        *,
+        gctxid: ExtendedGUID,
+        revision_role: int,
+    ) -> int:
+        """Advance along a contiguous ridDependent chain to the newest matching revision.
+
+        Some files contain RevisionRoleContextPair assignments that point to a revision whose
+        own (gctxid, revision_role) metadata does not match the assignment key, yet the file
+        appends a *contiguous* sequence of dependent revisions (in revision-list order) that
+        does match. We only follow such linear, in-order chains; this avoids jumping across
+        interleaved revisions from other contexts/roles.
+        """
+
+        best_match: int | None = None
+        cur = int(start_index)
+
+        while cur < len(self.revisions):
+            rev = self.revisions[cur]
+            if rev.gctxid == gctxid and int(rev.revision_role) == int(revision_role):
+                best_match = cur
+
+            nxt = cur + 1
+            if nxt >= len(self.revisions):
+                break
+
+            if self.revisions[nxt].rid_dependent != rev.rid:
+                break
+
+            cur = nxt
+
+        return int(best_match if best_match is not None else start_index)
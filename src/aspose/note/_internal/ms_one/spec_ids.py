@@ -42,6 +42,10 @@ PID_SECTION_DISPLAY_NAME = 0x1C00349B  # prtFourBytesOfLengthFollowedByData -> W
 PID_CACHED_TITLE_STRING = 0x1C001CF3  # WzInAtom
 PID_CACHED_TITLE_STRING_FROM_PAGE = 0x1C001D3C  # WzInAtom
 
+# PageMetaData properties
+PID_PAGE_LEVEL = 0x14001DFF  # PageLevel (i32, 1 = top-level page)
+PID_TOPOLOGY_CREATION_TIME_STAMP = 0x18001C65  # TopologyCreationTimeStamp (FILETIME, u64)
+
 PID_RICH_EDIT_TEXT_UNICODE = 0x1C001C22  # RichEditTextUnicode -> WzInAtom
 
 # Lists
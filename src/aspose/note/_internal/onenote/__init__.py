@@ -65,6 +65,7 @@ Example: Extract All Text
         print()
 """
 
+from ..ms_one.entities.parsers import ContentOptions
 from .document import Document
 from .elements import (
     Element,
@@ -82,9 +83,13 @@ from .elements import (
     TableCell,
     AttachedFile,
 )
+from .html_export import HtmlExporter, HtmlExportOptions, export_html
+from .json_export import JsonExporter, JsonExportOptions, export_ndjson
 from .pdf_export import PdfExporter, PdfExportOptions, export_pdf
+from .text_extract import iter_page_texts
 
 __all__ = [
+    "ContentOptions",
     "Document",
     "Element",
     "NoteTag",
@@ -100,9 +105,16 @@ __all__ = [
     "TableRow",
     "TableCell",
     "AttachedFile",
+    "HtmlExporter",
+    "HtmlExportOptions",
+    "export_html",
+    "JsonExporter",
+    "JsonExportOptions",
+    "export_ndjson",
     "PdfExporter",
     "PdfExportOptions",
     "export_pdf",
+    "iter_page_texts",
 ]
 
 __version__ = "0.1.0"
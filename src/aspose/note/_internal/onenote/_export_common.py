@@ -0,0 +1,198 @@
+"""Helpers shared by the PDF, HTML and NDJSON exporters.
+
+List numbering, note tag styles, colour conversion and text output handling, so
+that every export format renders lists, tags and colours the same way.
+"""
+
+from __future__ import annotations
+
+import io
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, TextIO
+
+if TYPE_CHECKING:
+    from .elements import OutlineElement
+
+
+def _number_to_alpha(n: int, *, upper: bool) -> str:
+    if n <= 0:
+        return ""
+    chars: list[str] = []
+    while n > 0:
+        n -= 1
+        chars.append(chr((n % 26) + (ord('A') if upper else ord('a'))))
+        n //= 26
+    return "".join(reversed(chars))
+
+
+def _number_to_roman(n: int, *, upper: bool) -> str:
+    if n <= 0:
+        return ""
+    # Best-effort; OneNote lists rarely exceed this.
+    n = min(n, 3999)
+    parts: list[str] = []
+    mapping = (
+        (1000, "M"),
+        (900, "CM"),
+        (500, "D"),
+        (400, "CD"),
+        (100, "C"),
+        (90, "XC"),
+        (50, "L"),
+        (40, "XL"),
+        (10, "X"),
+        (9, "IX"),
+        (5, "V"),
+        (4, "IV"),
+        (1, "I"),
+    )
+    for value, token in mapping:
+        while n >= value:
+            parts.append(token)
+            n -= value
+    s = "".join(parts)
+    return s if upper else s.lower()
+
+
+def _parse_ms_one_number_list_format(fmt: str | None) -> tuple[int | None, str, str]:
+    """Parse MS-ONE NumberListFormat into (style_code, prefix, suffix).
+
+    Observed formats often include control bytes (e.g. '\x03', '\x00') around
+    the U+FFFD placeholder; ReportLab will render those as black squares.
+    """
+    if not fmt:
+        return None, "", "."
+
+    placeholder = "\uFFFD"
+    idx = fmt.find(placeholder)
+    if idx < 0:
+        # Not a numbered format; return printable content only.
+        printable = "".join(ch for ch in fmt if ord(ch) >= 32)
+        return None, printable, ""
+
+    prefix = "".join(ch for ch in fmt[:idx] if ord(ch) >= 32)
+
+    style_code: int | None = None
+    if idx + 1 < len(fmt) and ord(fmt[idx + 1]) < 32:
+        style_code = ord(fmt[idx + 1])
+
+    suffix = "".join(ch for ch in fmt[idx + 1 :] if ord(ch) >= 32 and ch != placeholder)
+    if not suffix:
+        suffix = "."
+
+    return style_code, prefix, suffix
+
+
+def _format_list_number(n: int, style_code: int | None) -> str:
+    """Format list item number based on observed MS-ONE style codes."""
+    # Observed in fixtures:
+    # - 0x00: decimal
+    # - 0x04: lower alpha
+    # - 0x02: lower roman
+    if style_code == 0x04:
+        return _number_to_alpha(n, upper=False)
+    if style_code == 0x03:
+        return _number_to_alpha(n, upper=True)
+    if style_code == 0x02:
+        return _number_to_roman(n, upper=False)
+    if style_code == 0x01:
+        return _number_to_roman(n, upper=True)
+    return str(n)
+
+
+def _compute_list_marker(fmt: str | None, n: int) -> str:
+    style_code, prefix, suffix = _parse_ms_one_number_list_format(fmt)
+    return f"{prefix}{_format_list_number(n, style_code)}{suffix}".strip()
+
+
+@dataclass
+class _ListState:
+    """Tracks list numbering across nested OutlineElements during export."""
+
+    counters: dict[int, int] = field(default_factory=dict)
+    formats: dict[int, str] = field(default_factory=dict)
+
+    def reset_from_level(self, indent_level: int) -> None:
+        for level in list(self.counters.keys()):
+            if level >= indent_level:
+                self.counters.pop(level, None)
+                self.formats.pop(level, None)
+
+    def next_bullet(self, elem: "OutlineElement", indent_level: int) -> str | None:
+        """Return bullet text for this element, or None if not a list item."""
+        fmt = elem.list_format
+        if not fmt:
+            # Breaks the list chain at this indent level.
+            self.reset_from_level(indent_level)
+            return None
+
+        # Bulleted lists: render a simple bullet.
+        if not elem.is_numbered:
+            # Reset deeper levels when continuing at this level.
+            self.reset_from_level(indent_level + 1)
+            return "•"
+
+        # Numbered lists.
+        # If format changes at this level, restart numbering.
+        fmt_key = "".join(ch for ch in fmt if ord(ch) >= 32 or ch == "\uFFFD")
+        if self.formats.get(indent_level) != fmt_key:
+            self.counters[indent_level] = 0
+            self.formats[indent_level] = fmt_key
+
+        # Apply restart override if present.
+        if elem.list_restart is not None:
+            self.counters[indent_level] = elem.list_restart
+        else:
+            self.counters[indent_level] = self.counters.get(indent_level, 0) + 1
+
+        # Reset deeper nested counters when we emit a marker at this level.
+        self.reset_from_level(indent_level + 1)
+        marker = _compute_list_marker(fmt, self.counters[indent_level])
+
+        return marker
+
+
+# Known note tag shapes: shape id -> (kind, color_hex). Other shapes are "unknown".
+_TAG_STYLES: dict[int, tuple[str, str]] = {
+    13: ("star", "#f39c12"),
+    15: ("question", "#8e44ad"),
+    3: ("todo", "#2980b9"),
+    12: ("calendar", "#16a085"),
+    118: ("contact", "#2980b9"),
+    121: ("music", "#7f8c8d"),
+}
+
+
+def _tag_style(shape: int | None) -> tuple[str, str]:
+    """(kind, color_hex) for a note tag shape."""
+    return _TAG_STYLES.get(shape, ("unknown", "#7f8c8d")) if shape is not None else ("unknown", "#7f8c8d")
+
+
+def _css_color(color: int | None) -> str | None:
+    """CSS color for a COLORREF (0x00BBGGRR); None when unset or automatic."""
+    if color is None or color >> 24:
+        return None
+    return f"#{color & 0xFF:02x}{(color >> 8) & 0xFF:02x}{(color >> 16) & 0xFF:02x}"
+
+
+@contextmanager
+def _text_output(output: str | Path | BinaryIO | TextIO) -> Iterator[TextIO]:
+    """UTF-8 text stream writing to a path, a binary stream or a text stream.
+
+    A file opened for a path is closed afterwards; a binary stream is flushed and
+    left open.
+    """
+    if isinstance(output, (str, Path)):
+        with open(output, "w", encoding="utf-8", newline="\n") as f:
+            yield f
+    elif isinstance(output, io.TextIOBase):
+        yield output
+    else:
+        wrapper = io.TextIOWrapper(output, encoding="utf-8", newline="\n", write_through=True)
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
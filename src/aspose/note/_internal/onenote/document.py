@@ -9,6 +9,10 @@ from typing import Iterator, BinaryIO, TYPE_CHECKING
 from .elements import Page, Element
 
 if TYPE_CHECKING:
+    from ..ms_one.entities.parsers import ContentOptions
+    from ..ms_one.reader import PageDirectory
+    from .html_export import HtmlExportOptions
+    from .json_export import JsonExportOptions
     from .pdf_export import PdfExportOptions
 
 
@@ -45,14 +49,34 @@ class Document:
     _source_path: Path | None = field(default=None, repr=False)
     """Original file path (for reference)."""
 
+    _page_directory: "PageDirectory | None" = field(default=None, repr=False)
+    """Page directory of a metadata-only document (enables load_page())."""
+
+    _loaded_pages: dict[int, Page] = field(default_factory=dict, repr=False)
+    """Pages loaded on demand by load_page(), keyed by page index."""
+
     @classmethod
-    def open(cls, path: str | Path, *, strict: bool = False) -> "Document":
+    def open(
+        cls,
+        path: str | Path,
+        *,
+        strict: bool = False,
+        metadata_only: bool = False,
+        options: "ContentOptions | None" = None,
+    ) -> "Document":
         """Open and parse a OneNote section file (.one).
 
         Args:
             path: Path to the .one file.
             strict: If True, raise errors on format violations.
                    If False (default), try to recover from minor issues.
+            metadata_only: If True, read only the section name and page titles,
+                   levels and creation times; pages have no content. Much faster
+                   than a full load since page object spaces are not parsed.
+                   Individual pages can then be loaded with load_page().
+            options: ContentOptions selecting optional content (images,
+                   attachments, formatting, tags, layout). Disabling what a
+                   caller does not need (e.g. text indexing) speeds up loading.
 
         Returns:
             Parsed Document instance.
@@ -72,37 +96,55 @@ class Document:
             raise FileNotFoundError(f"File not found: {path}")
 
         data = p.read_bytes()
-        doc = cls.from_bytes(data, strict=strict)
+        doc = cls.from_bytes(data, strict=strict, metadata_only=metadata_only, options=options)
         doc._source_path = p
         return doc
 
     @classmethod
-    def from_bytes(cls, data: bytes | bytearray | memoryview, *, strict: bool = False) -> "Document":
+    def from_bytes(
+        cls,
+        data: bytes | bytearray | memoryview,
+        *,
+        strict: bool = False,
+        metadata_only: bool = False,
+        options: "ContentOptions | None" = None,
+    ) -> "Document":
         """Parse a OneNote document from raw bytes.
 
         Args:
             data: Raw bytes of a .one file.
             strict: If True, raise errors on format violations.
+            metadata_only: If True, read only section/page metadata (see open()).
+            options: Optional content selection (see open()).
 
         Returns:
             Parsed Document instance.
         """
         from .parser import parse_document
-        return parse_document(data, strict=strict)
+        return parse_document(data, strict=strict, metadata_only=metadata_only, options=options)
 
     @classmethod
-    def from_stream(cls, stream: BinaryIO, *, strict: bool = False) -> "Document":
+    def from_stream(
+        cls,
+        stream: BinaryIO,
+        *,
+        strict: bool = False,
+        metadata_only: bool = False,
+        options: "ContentOptions | None" = None,
+    ) -> "Document":
         """Parse a OneNote document from a binary stream.
 
         Args:
             stream: Binary stream containing .one file data.
             strict: If True, raise errors on format violations.
+            metadata_only: If True, read only section/page metadata (see open()).
+            options: Optional content selection (see open()).
 
         Returns:
             Parsed Document instance.
         """
         data = stream.read()
-        return cls.from_bytes(data, strict=strict)
+        return cls.from_bytes(data, strict=strict, metadata_only=metadata_only, options=options)
 
     def __len__(self) -> int:
         """Number of pages in the document."""
@@ -144,6 +186,59 @@ class Document:
                 results.append(page)
         return results
 
+    def load_page(self, index: int | None = None, *, title: str | None = None, case_sensitive: bool = False) -> Page:
+        """Load a single page with its full content.
+
+        On a document opened with ``metadata_only=True`` only the object space of the
+        requested page is parsed; the result is cached for subsequent calls. On a fully
+        loaded document this simply returns the already parsed page.
+
+        Args:
+            index: Page index (as in ``pages``).
+            title: Exact page title to look up instead of an index.
+            case_sensitive: Whether the title lookup is case-sensitive.
+
+        Returns:
+            The fully loaded page.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            KeyError: If no page has the given ``title``.
+
+        Example::
+
+            doc = Document.open("Big.one", metadata_only=True)
+            page = doc.load_page(title="Meeting notes")
+        """
+        if (index is None) == (title is None):
+            raise TypeError("load_page() takes exactly one of index or title")
+
+        if title is not None:
+            search = title if case_sensitive else title.lower()
+            for i, page in enumerate(self.pages):
+                if (page.title if case_sensitive else page.title.lower()) == search:
+                    index = i
+                    break
+            else:
+                raise KeyError(title)
+
+        assert index is not None
+        if index < 0:
+            index += len(self.pages)
+        if not 0 <= index < len(self.pages):
+            raise IndexError("page index out of range")
+
+        if self._page_directory is None:
+            return self.pages[index]
+
+        page = self._loaded_pages.get(index)
+        if page is None:
+            from .parser import load_directory_page
+
+            page = load_directory_page(self._page_directory, index)
+            self._loaded_pages[index] = page
+        return page
+
     @property
     def page_count(self) -> int:
         """Number of pages in the document."""
@@ -158,7 +253,8 @@ class Document:
         self, 
         output: str | Path | BinaryIO,
         *,
-        options: "PdfExportOptions | None" = None
+        options: "PdfExportOptions | None" = None,
+        workers: int | None = None,
     ) -> None:
         """Export the document to PDF format.
 
@@ -168,6 +264,8 @@ class Document:
             output: Output file path or file-like object.
             options: Export options (page size, margins, fonts, etc.).
                     If None, uses default options.
+            workers: Render page ranges in this many processes and merge the
+                    results (useful for large sections).
 
         Raises:
             ImportError: If reportlab is not installed.
@@ -185,9 +283,67 @@ class Document:
                 default_font_size=12,
             )
             doc.export_pdf("output.pdf", options=options)
+
+            # Large section on a multi-core machine
+            doc.export_pdf("output.pdf", workers=8)
         """
         from .pdf_export import export_pdf
-        export_pdf(self, output, options)
+        export_pdf(self, output, options, workers=workers)
+
+    def export_html(
+        self,
+        output: str | Path | BinaryIO,
+        *,
+        options: "HtmlExportOptions | None" = None,
+    ) -> None:
+        """Export the document to HTML, one page at a time.
+
+        Images and attachments are written once each to a resource directory next to
+        the output file (``<stem>_files``), or inlined as ``data:`` URIs when writing to
+        a stream (see HtmlExportOptions).
+
+        Args:
+            output: Output file path or file-like object.
+            options: Export options. If None, uses default options.
+
+        Example::
+
+            doc = Document.open("notes.one")
+            doc.export_html("output.html")
+
+            # Single self-contained file
+            from onenote.html_export import HtmlExportOptions
+            doc.export_html("output.html", options=HtmlExportOptions(embed_resources=True))
+        """
+        from .html_export import export_html
+        export_html(self, output, options)
+
+    def export_ndjson(
+        self,
+        output: str | Path | BinaryIO,
+        *,
+        options: "JsonExportOptions | None" = None,
+    ) -> None:
+        """Export the document as newline-delimited JSON (one object per page).
+
+        Records carry text, runs with style offsets, tags, list markers, table cells and
+        image/attachment metadata with SHA-256 digests (see onenote.json_export).
+
+        Args:
+            output: Output file path or file-like object.
+            options: Export options. If None, uses default options.
+
+        Example::
+
+            doc = Document.open("notes.one")
+            doc.export_ndjson("notes.ndjson")
+
+            # One line per outline element
+            from onenote.json_export import JsonExportOptions
+            doc.export_ndjson("notes.ndjson", options=JsonExportOptions(per_element=True))
+        """
+        from .json_export import export_ndjson
+        export_ndjson(self, output, options)
 
     def __repr__(self) -> str:
         name = self.display_name or (self._source_path.name if self._source_path else "Document")
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from .document import Document
 
 
-@dataclass
+@dataclass(slots=True)
 class Element:
     """Base class for all OneNote document elements."""
 
@@ -35,7 +35,7 @@ class Element:
         return iter(())
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteTag:
     """A note tag associated with a paragraph or embedded object.
 
@@ -62,7 +62,7 @@ class NoteTag:
     """Completion timestamp as raw 32-bit value (MS-ONE NoteTagCompleted/Time32)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TextStyle:
     """Best-effort style information for a rich-text run."""
 
@@ -83,7 +83,7 @@ class TextStyle:
     """Hyperlink URL associated with this run (MS-ONE WzHyperlinkUrl)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TextRun:
     """A contiguous styled segment of a RichText string.
 
@@ -102,7 +102,7 @@ def _walk_elements(root: "Element") -> Iterator["Element"]:
         yield from _walk_elements(child)
 
 
-@dataclass
+@dataclass(slots=True)
 class RichText(Element):
     """A rich text element containing formatted text content."""
 
@@ -122,7 +122,7 @@ class RichText(Element):
         return self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(Element):
     """An embedded image element."""
 
@@ -157,7 +157,7 @@ class Image(Element):
     """Y offset from parent in points (when image is directly on page)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class AttachedFile(Element):
     """An attached file (embedded file object)."""
 
@@ -179,7 +179,7 @@ class AttachedFile(Element):
         return len(self.data)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell(Element):
     """A single cell in a table."""
 
@@ -203,7 +203,7 @@ class TableCell(Element):
         return iter(self.children)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow(Element):
     """A row in a table."""
 
@@ -223,7 +223,7 @@ class TableRow(Element):
         return iter(self.cells)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(Element):
     """A table element with rows and cells."""
 
@@ -266,7 +266,7 @@ class Table(Element):
         return iter(self.rows)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutlineElement(Element):
     """A single element within an outline (paragraph-like container).
 
@@ -323,7 +323,7 @@ class OutlineElement(Element):
         return iter([*self.children, *self.contents])
 
 
-@dataclass
+@dataclass(slots=True)
 class Outline(Element):
     """An outline container (a content block on a page).
 
@@ -362,7 +362,7 @@ class Outline(Element):
         return iter(self.children)
 
 
-@dataclass
+@dataclass(slots=True)
 class Title(Element):
     """Page title element."""
 
@@ -387,7 +387,7 @@ class Title(Element):
         return iter(self.children)
 
 
-@dataclass
+@dataclass(slots=True)
 class Page(Element):
     """A page in a OneNote document."""
 
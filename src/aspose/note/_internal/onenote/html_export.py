@@ -0,0 +1,457 @@
+"""HTML export for OneNote documents.
+
+Pages are written to the output one at a time, so memory stays bounded by the
+largest page. Images and attachments are written as separate files next to the
+HTML (each distinct blob once) or inlined as ``data:`` URIs.
+
+Example usage::
+
+    from onenote import Document
+
+    doc = Document.open("notes.one")
+    doc.export_html("output.html")  # resources go to output_files/
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import re
+from dataclasses import dataclass
+from html import escape
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, TextIO
+
+from ._export_common import _css_color, _ListState, _tag_style, _text_output
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .elements import AttachedFile, Image, NoteTag, Outline, OutlineElement, Page, RichText, Table, TextStyle
+
+
+@dataclass
+class HtmlExportOptions:
+    """Options for HTML export."""
+
+    embed_resources: bool | None = None
+    """Inline images and attachments as ``data:`` URIs instead of writing files.
+
+    None (default) embeds only when writing to a stream without `resource_dir`.
+    """
+
+    resource_dir: str | Path | None = None
+    """Directory for image/attachment files (default: ``<output stem>_files`` next to the output)."""
+
+    resource_url: str | None = None
+    """URL prefix for resources in the HTML (default: the resource directory's name)."""
+
+    include_tags: bool = True
+    """Whether to render note tags."""
+
+    include_images: bool = True
+    """Whether to include images."""
+
+    include_attachments: bool = True
+    """Whether to include attached file contents (the attachment name is always listed)."""
+
+    title: str | None = None
+    """HTML document title (default: the section's display name)."""
+
+
+# Text glyphs for tag kinds (see _export_common._TAG_STYLES).
+_TAG_GLYPHS = {
+    "star": "★",
+    "question": "?",
+    "todo": "☐",
+    "calendar": "\U0001f4c5",
+    "contact": "@",
+    "music": "♪",
+    "unknown": "■",
+}
+
+_IMAGE_TYPES = {
+    "png": ("image/png", ".png"),
+    "jpeg": ("image/jpeg", ".jpg"),
+    "jpg": ("image/jpeg", ".jpg"),
+    "gif": ("image/gif", ".gif"),
+    "bmp": ("image/bmp", ".bmp"),
+    "tiff": ("image/tiff", ".tif"),
+    "emf": ("image/emf", ".emf"),
+    "wmf": ("image/wmf", ".wmf"),
+}
+
+_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8", "jpeg"),
+    (b"GIF8", "gif"),
+    (b"BM", "bmp"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+)
+
+_LINE_BREAK_RE = re.compile(r"\r\n|[\r\n\x0b]")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.\-]+")
+# Characters that could end the quoted font-family value or the style attribute.
+_UNSAFE_FONT_NAME_RE = re.compile(r"['\"\\;{}<>]+")
+_URL_IGNORED_RE = re.compile(r"[\t\n\r]")
+_URL_STRIPPED = "".join(map(chr, range(0x21)))  # C0 controls and space
+_URL_SCHEME_RE = re.compile(r"([A-Za-z][A-Za-z0-9+.\-]*):")
+_LINK_SCHEMES = frozenset({"http", "https", "mailto", "onenote", "file"})
+
+_STYLESHEET = """\
+body { font-family: Calibri, Helvetica, Arial, sans-serif; font-size: 11pt; }
+.page { margin-bottom: 2em; }
+.page-title { font-size: 18pt; margin: 0 0 12pt; }
+.outline { margin-bottom: 6pt; }
+.oe-children { margin-left: 20pt; }
+p { margin: 0 0 6pt; }
+.marker { display: inline-block; min-width: 1.5em; }
+.tag { font-weight: bold; margin-right: 2pt; }
+img { max-width: 100%; height: auto; }
+table { border-collapse: collapse; margin-bottom: 12pt; }
+td { padding: 4pt; vertical-align: top; }
+table.grid td { border: 0.5pt solid #000; }
+"""
+
+
+def _image_type(img: "Image") -> tuple[str, str]:
+    """(mime type, file extension) of an image, from its format or data."""
+    fmt = (img.format or "").lower()
+    if fmt not in _IMAGE_TYPES:
+        fmt = next((name for sig, name in _IMAGE_SIGNATURES if img.data.startswith(sig)), "")
+    return _IMAGE_TYPES.get(fmt, ("application/octet-stream", ".bin"))
+
+
+def _safe_href(url: str) -> str | None:
+    """`url` when it is relative or uses an allowed scheme; None for anything else (javascript:, data:, ...)."""
+    # Browsers ignore surrounding whitespace/control characters and tabs or newlines inside a URL.
+    m = _URL_SCHEME_RE.match(_URL_IGNORED_RE.sub("", url).strip(_URL_STRIPPED))
+    if m is not None and m.group(1).lower() not in _LINK_SCHEMES:
+        return None
+    return url
+
+
+class _Resources:
+    """Writes images/attachments once per distinct content and returns their URLs."""
+
+    def __init__(self, directory: Path | None, url: str) -> None:
+        self.directory = directory
+        self.url = url
+        self._written: dict[bytes, str] = {}
+
+    def link(self, data: bytes, suffix: str, mime: str) -> str:
+        if self.directory is None:
+            return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+        digest = hashlib.sha1(data).digest()
+        name = self._written.get(digest)
+        if name is None:
+            name = f"{digest.hex()[:16]}{suffix}"
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / name).write_bytes(data)
+            self._written[digest] = name
+        return self.url + name
+
+
+class HtmlExporter:
+    """Export OneNote documents to HTML."""
+
+    def __init__(self, options: HtmlExportOptions | None = None):
+        """Initialize exporter with options.
+
+        Args:
+            options: Export options. If None, uses defaults.
+        """
+        self.options = options or HtmlExportOptions()
+
+    def export(self, document: "Document", output: str | Path | BinaryIO | TextIO) -> None:
+        """Export document to HTML.
+
+        Args:
+            document: OneNote document to export.
+            output: Output path or file-like object (binary or text).
+        """
+        self.export_pages(document.pages, output, title=document.display_name)
+
+    def export_pages(
+        self,
+        pages: Iterable["Page"],
+        output: str | Path | BinaryIO | TextIO,
+        *,
+        title: str | None = None,
+    ) -> None:
+        """Export pages to HTML, writing each page as soon as it is rendered.
+
+        `pages` may be a generator that produces pages on demand; only one page is
+        referenced by the exporter at a time.
+        """
+        resources = self._resources(output)
+        with _text_output(output) as out:
+            doc_title = self.options.title or title or "OneNote"
+            out.write(
+                "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+                f"<title>{escape(doc_title)}</title>\n<style>\n{_STYLESHEET}</style>\n</head>\n<body>\n"
+            )
+            for number, page in enumerate(pages, 1):
+                parts: list[str] = []
+                self._render_page(page, number, parts, resources)
+                out.write("".join(parts))
+            out.write("</body>\n</html>\n")
+
+    def _resources(self, output) -> _Resources:
+        embed = self.options.embed_resources
+        directory = Path(self.options.resource_dir) if self.options.resource_dir is not None else None
+        if directory is None and isinstance(output, (str, Path)):
+            path = Path(output)
+            directory = path.with_name(f"{path.stem}_files")
+        if embed is None:
+            embed = directory is None
+        if embed or directory is None:
+            return _Resources(None, "")
+        url = self.options.resource_url
+        if url is None:
+            url = f"{directory.name}/"
+        return _Resources(directory, url)
+
+    # -- pages and elements ------------------------------------------------------------------
+
+    def _render_page(self, page: "Page", number: int, parts: list[str], resources: _Resources) -> None:
+        from .elements import Outline
+
+        parts.append(f'<div class="page" id="page-{number}">\n')
+        if page.title:
+            parts.append(f'<h1 class="page-title">{escape(page.title)}</h1>\n')
+
+        # Same reading order as the PDF export: outlines by position, then other content.
+        outlines = [ch for ch in page.children if isinstance(ch, Outline)]
+        other = [ch for ch in page.children if not isinstance(ch, Outline)]
+        outlines.sort(key=lambda o: (o.y if o.y is not None else 1e18, o.x if o.x is not None else 1e18))
+        for child in outlines + other:
+            self._render_element(child, parts, resources, list_state=None)
+        parts.append("</div>\n")
+
+    def _render_element(self, element, parts: list[str], resources: _Resources, *, list_state, level: int = 0) -> None:
+        from .elements import AttachedFile, Image, Outline, OutlineElement, RichText, Table
+
+        if isinstance(element, Outline):
+            self._render_outline(element, parts, resources)
+        elif isinstance(element, OutlineElement):
+            self._render_outline_element(element, parts, resources, list_state=list_state, level=level)
+        elif isinstance(element, RichText):
+            self._render_paragraph(element, parts, tags=element.tags)
+        elif isinstance(element, Image):
+            self._render_image(element, parts, resources)
+        elif isinstance(element, Table):
+            self._render_table(element, parts, resources)
+        elif isinstance(element, AttachedFile):
+            self._render_attached_file(element, parts, resources)
+
+    def _render_outline(self, outline: "Outline", parts: list[str], resources: _Resources) -> None:
+        style = ""
+        if outline.width:
+            style = f' style="max-width: {outline.width:g}pt"'
+        parts.append(f'<div class="outline"{style}>\n')
+        list_state = _ListState()
+        for child in outline.children:
+            self._render_element(child, parts, resources, list_state=list_state, level=0)
+        parts.append("</div>\n")
+
+    def _render_outline_element(
+        self,
+        elem: "OutlineElement",
+        parts: list[str],
+        resources: _Resources,
+        *,
+        list_state: "_ListState | None",
+        level: int,
+    ) -> None:
+        from .elements import RichText
+
+        bullet = list_state.next_bullet(elem, level) if list_state is not None else None
+        # As in the PDF export, a list item's tags precede its marker on the first paragraph.
+        prefix_tags: list["NoteTag"] = []
+        if bullet:
+            prefix_tags.extend(elem.tags)
+            for rt in elem.iter_text():
+                if rt.tags:
+                    prefix_tags.extend(rt.tags)
+                    break
+
+        parts.append('<div class="oe">\n')
+        bullet_used = False
+        for content in elem.contents:
+            if isinstance(content, RichText):
+                if bullet and not bullet_used:
+                    bullet_used = self._render_paragraph(content, parts, tags=prefix_tags, marker=bullet)
+                else:
+                    self._render_paragraph(content, parts, tags=None if bullet else content.tags)
+            else:
+                self._render_element(content, parts, resources, list_state=list_state, level=level)
+        if elem.children:
+            parts.append('<div class="oe-children">\n')
+            for child in elem.children:
+                self._render_element(child, parts, resources, list_state=list_state, level=level + 1)
+            parts.append("</div>\n")
+        parts.append("</div>\n")
+
+    def _render_paragraph(
+        self,
+        rt: "RichText",
+        parts: list[str],
+        *,
+        tags: list["NoteTag"] | None = None,
+        marker: str | None = None,
+    ) -> bool:
+        """Render a RichText as a paragraph; returns False when it has no visible text."""
+        if not (rt.text or "").strip():
+            return False
+        parts.append("<p>")
+        if self.options.include_tags and tags:
+            parts.append(self._format_tags(tags))
+        if marker:
+            parts.append(f'<span class="marker">{escape(marker)}</span>')
+        parts.append(self._format_rich_text(rt))
+        parts.append("</p>\n")
+        return True
+
+    def _render_image(self, img: "Image", parts: list[str], resources: _Resources) -> None:
+        if not self.options.include_images:
+            return
+        if self.options.include_tags and img.tags:
+            parts.append(f"<div>{self._format_tags(img.tags)}</div>\n")
+        alt = escape(img.alt_text or img.filename or "")
+        if not img.data:
+            parts.append(f'<p class="image-missing">[Image{": " + alt if alt else ""}]</p>\n')
+            return
+        mime, suffix = _image_type(img)
+        # Height follows from the width (see the stylesheet), so scaled-down images keep their aspect.
+        size = f' style="width: {img.width:g}pt"' if img.width else ""
+        tag = f'<img src="{escape(resources.link(img.data, suffix, mime))}" alt="{alt}"{size}>'
+        href = _safe_href(img.hyperlink) if img.hyperlink else None
+        if href:
+            tag = f'<a href="{escape(href)}">{tag}</a>'
+        parts.append(f'<div class="image">{tag}</div>\n')
+
+    def _render_table(self, table: "Table", parts: list[str], resources: _Resources) -> None:
+        if not table.rows:
+            return
+        if self.options.include_tags and table.tags:
+            parts.append(f"<div>{self._format_tags(table.tags)}</div>\n")
+        parts.append(f'<table class="{"grid" if table.borders_visible else "plain"}">\n')
+        widths = [w for w in table.column_widths if w and w > 1.0]
+        if widths and len(widths) == len(table.column_widths):
+            parts.append("<colgroup>" + "".join(f'<col style="width: {w:g}pt">' for w in widths) + "</colgroup>\n")
+        for row in table.rows:
+            parts.append("<tr>")
+            for cell in row.cells:
+                parts.append("<td>")
+                list_state = _ListState()
+                for child in cell.children:
+                    self._render_element(child, parts, resources, list_state=list_state, level=0)
+                parts.append("</td>")
+            parts.append("</tr>\n")
+        parts.append("</table>\n")
+
+    def _render_attached_file(self, attachment: "AttachedFile", parts: list[str], resources: _Resources) -> None:
+        if self.options.include_tags and attachment.tags:
+            parts.append(f"<div>{self._format_tags(attachment.tags)}</div>\n")
+        filename = attachment.filename or "unknown"
+        size_kb = attachment.size / 1024 if attachment.size else 0
+        label = f"<b>Attachment:</b> {escape(filename)} ({size_kb:.1f} KB)"
+        if self.options.include_attachments and attachment.data:
+            safe = _UNSAFE_FILENAME_RE.sub("_", filename).strip("._") or "attachment"
+            url = resources.link(attachment.data, f"_{safe}", "application/octet-stream")
+            label = f'<a href="{escape(url)}" download="{escape(filename)}">{label}</a>'
+        parts.append(f'<p class="attachment">{label}</p>\n')
+
+    # -- text --------------------------------------------------------------------------------
+
+    def _format_tags(self, tags: list["NoteTag"]) -> str:
+        out: list[str] = []
+        seen: set[tuple[int | None, str | None]] = set()
+        for tag in tags:
+            key = (tag.shape, tag.label)
+            if key in seen:
+                continue
+            seen.add(key)
+            kind, color = _tag_style(tag.shape)
+            glyph = "☑" if kind == "todo" and tag.completed else _TAG_GLYPHS[kind]
+            title = f' title="{escape(tag.label)}"' if tag.label else ""
+            out.append(f'<span class="tag tag-{kind}" style="color: {color}"{title}>{glyph}</span>')
+        return "".join(out)
+
+    def _format_rich_text(self, rt: "RichText") -> str:
+        text = rt.text or ""
+        out: list[str] = []
+        last = 0
+        for run in rt.runs:
+            if run.start > last:
+                out.append(_format_text(text[last : run.start]))
+            out.append(self._format_text_run(text[run.start : run.end], run.style))
+            last = max(last, run.end)
+        if last < len(text):
+            out.append(_format_text(text[last:]))
+        return "".join(out)
+
+    def _format_text_run(self, text: str, style: "TextStyle") -> str:
+        if not text:
+            return ""
+        result = _format_text(text)
+        css: list[str] = []
+        if style.bold:
+            css.append("font-weight: bold")
+        if style.italic:
+            css.append("font-style: italic")
+        decorations = [name for flag, name in ((style.underline, "underline"), (style.strikethrough, "line-through")) if flag]
+        if decorations:
+            css.append(f"text-decoration: {' '.join(decorations)}")
+        font_name = _UNSAFE_FONT_NAME_RE.sub("", style.font_name or "").strip()
+        if font_name:
+            css.append(f"font-family: '{escape(font_name)}'")
+        if style.font_size_pt:
+            css.append(f"font-size: {style.font_size_pt:g}pt")
+        color = _css_color(style.font_color)
+        if color:
+            css.append(f"color: {color}")
+        highlight = _css_color(style.highlight_color)
+        if highlight:
+            css.append(f"background-color: {highlight}")
+
+        if css:
+            result = f'<span style="{"; ".join(css)}">{result}</span>'
+        if style.superscript:
+            result = f"<sup>{result}</sup>"
+        elif style.subscript:
+            result = f"<sub>{result}</sub>"
+        href = _safe_href(style.hyperlink) if style.hyperlink else None
+        if href:
+            result = f'<a href="{escape(href)}">{result}</a>'
+        return result
+
+
+def _format_text(text: str) -> str:
+    return "<br>".join(escape(line, quote=False) for line in _LINE_BREAK_RE.split(text))
+
+
+def export_html(
+    document: "Document",
+    output: str | Path | BinaryIO | TextIO,
+    options: HtmlExportOptions | None = None,
+) -> None:
+    """Export a OneNote document to HTML.
+
+    This is a convenience function. For more control, use HtmlExporter directly.
+
+    Args:
+        document: OneNote document to export.
+        output: Output file path or file-like object.
+        options: Export options.
+
+    Example::
+
+        from onenote import Document
+        from onenote.html_export import export_html
+
+        doc = Document.open("notes.one")
+        export_html(doc, "output.html")
+    """
+    HtmlExporter(options).export(document, output)
@@ -0,0 +1,294 @@
+"""Newline-delimited JSON (NDJSON) export for OneNote documents.
+
+Each line is one JSON object: one per page, or with ``per_element`` a page header
+followed by one object per outline element (and per element placed directly on
+the page). Records are encoded and written one at a time, so memory stays
+bounded by the largest page and nothing is built for the whole document.
+
+Example usage::
+
+    from onenote import Document
+
+    doc = Document.open("notes.one")
+    doc.export_ndjson("notes.ndjson")
+
+Page record::
+
+    {"type": "page", "page": 0, "title": "...", "level": 0, "created": "...",
+     "modified": "...", "author": null, "text": "...", "elements": [...]}
+
+Element records (``elements`` entries, or separate lines with ``page`` and
+``page_title`` added)::
+
+    {"type": "outline_element", "outline": 0, "level": 1,
+     "list": {"marker": "1.", "numbered": true}, "tags": [...], "text": "...",
+     "contents": [{"type": "text", "text": "...", "runs": [...]}, ...]}
+    {"type": "image", "filename": ..., "format": "png", "width": ..., "height": ...,
+     "size": 1234, "sha256": "...", "tags": [...]}
+    {"type": "attachment", "filename": ..., "extension": ..., "size": ..., "sha256": ...}
+    {"type": "table", "column_count": 2, "column_widths": [...] or null,
+     "borders_visible": true, "rows": [[{"text": "...", "elements": [...]}, ...], ...]}
+
+Runs carry character offsets into ``text`` and the non-empty style fields;
+colours are ``#rrggbb`` strings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, TextIO
+
+from ._export_common import _css_color, _ListState, _tag_style, _text_output
+
+if TYPE_CHECKING:
+    from .document import Document
+    from .elements import NoteTag, OutlineElement, Page, RichText, TextStyle
+
+
+@dataclass
+class JsonExportOptions:
+    """Options for NDJSON export."""
+
+    per_element: bool = False
+    """Write one line per outline element (after a page header line) instead of one per page."""
+
+    include_runs: bool = True
+    """Whether to include formatted runs of each text."""
+
+    include_digests: bool = True
+    """Whether to include SHA-256 digests of image and attachment data."""
+
+
+_STYLE_FIELDS = (
+    "bold",
+    "italic",
+    "underline",
+    "strikethrough",
+    "superscript",
+    "subscript",
+    "font_name",
+    "font_size_pt",
+    "language_id",
+    "hyperlink",
+)
+
+
+class JsonExporter:
+    """Export OneNote documents as newline-delimited JSON."""
+
+    def __init__(self, options: JsonExportOptions | None = None):
+        """Initialize exporter with options.
+
+        Args:
+            options: Export options. If None, uses defaults.
+        """
+        self.options = options or JsonExportOptions()
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def export(self, document: "Document", output: str | Path | BinaryIO | TextIO) -> None:
+        """Export document to NDJSON.
+
+        Args:
+            document: OneNote document to export.
+            output: Output path or file-like object (binary or text).
+        """
+        self.export_pages(document.pages, output)
+
+    def export_pages(self, pages: Iterable["Page"], output: str | Path | BinaryIO | TextIO) -> None:
+        """Export pages to NDJSON, writing each record as soon as it is built.
+
+        `pages` may be a generator that produces pages on demand.
+        """
+        encode = self._encode
+        with _text_output(output) as out:
+            write = out.write
+            for index, page in enumerate(pages):
+                for record in self._page_records(page, index):
+                    write(encode(record))
+                    write("\n")
+
+    def _page_records(self, page: "Page", index: int) -> Iterable[dict[str, Any]]:
+        from .elements import Outline
+
+        header: dict[str, Any] = {
+            "type": "page",
+            "page": index,
+            "title": page.title,
+            "level": page.level,
+            "created": page.created.isoformat() if page.created else None,
+            "modified": page.modified.isoformat() if page.modified else None,
+            "author": page.author,
+        }
+
+        # Same reading order as the PDF/HTML exports: outlines by position, then other content.
+        outlines = [ch for ch in page.children if isinstance(ch, Outline)]
+        other = [ch for ch in page.children if not isinstance(ch, Outline)]
+        outlines.sort(key=lambda o: (o.y if o.y is not None else 1e18, o.x if o.x is not None else 1e18))
+
+        def elements() -> Iterable[dict[str, Any]]:
+            for number, outline in enumerate(outlines):
+                list_state = _ListState()
+                for child in outline.children:
+                    yield from self._outline_element_records(child, list_state, level=0, outline=number)
+            for child in other:
+                record = self._element_record(child)
+                if record is not None:
+                    yield record
+
+        if not self.options.per_element:
+            header["text"] = page.text
+            header["elements"] = list(elements())
+            yield header
+            return
+
+        yield header
+        for record in elements():
+            record["page"] = index
+            record["page_title"] = page.title
+            yield record
+
+    def _outline_element_records(
+        self,
+        elem: "OutlineElement",
+        list_state: _ListState,
+        *,
+        level: int,
+        outline: int | None,
+    ) -> Iterable[dict[str, Any]]:
+        """Records for an OutlineElement and its nested elements (flattened, with `level`)."""
+        from .elements import OutlineElement
+
+        bullet = list_state.next_bullet(elem, level)
+        contents = [r for r in map(self._element_record, elem.contents) if r is not None]
+        yield {
+            "type": "outline_element",
+            "outline": outline,
+            "level": level,
+            "list": {"marker": bullet, "numbered": elem.is_numbered} if bullet else None,
+            "tags": self._tags(elem.tags),
+            "text": "\n".join(c["text"] for c in contents if c["type"] == "text"),
+            "contents": contents,
+        }
+        for child in elem.children:
+            if isinstance(child, OutlineElement):
+                yield from self._outline_element_records(child, list_state, level=level + 1, outline=outline)
+            else:
+                record = self._element_record(child)
+                if record is not None:
+                    yield record
+
+    def _element_record(self, element) -> dict[str, Any] | None:
+        from .elements import AttachedFile, Image, OutlineElement, RichText, Table
+
+        if isinstance(element, RichText):
+            return self._text_record(element)
+        if isinstance(element, Image):
+            return {
+                "type": "image",
+                "filename": element.filename,
+                "format": element.format,
+                "width": element.width,
+                "height": element.height,
+                "alt_text": element.alt_text,
+                "hyperlink": element.hyperlink,
+                "size": len(element.data),
+                "sha256": self._digest(element.data),
+                "tags": self._tags(element.tags),
+            }
+        if isinstance(element, AttachedFile):
+            return {
+                "type": "attachment",
+                "filename": element.filename,
+                "extension": element.extension,
+                "size": element.size,
+                "sha256": self._digest(element.data),
+                "tags": self._tags(element.tags),
+            }
+        if isinstance(element, Table):
+            rows = []
+            for row in element.rows:
+                cells = []
+                for cell in row.cells:
+                    list_state = _ListState()
+                    records: list[dict[str, Any]] = []
+                    for child in cell.children:
+                        if isinstance(child, OutlineElement):
+                            records.extend(self._outline_element_records(child, list_state, level=0, outline=None))
+                        else:
+                            record = self._element_record(child)
+                            if record is not None:
+                                records.append(record)
+                    cells.append({"text": cell.text, "elements": records})
+                rows.append(cells)
+            widths = [w for w in element.column_widths if w and w > 1.0]
+            return {
+                "type": "table",
+                "column_count": element.column_count,
+                "column_widths": widths if widths and len(widths) == len(element.column_widths) else None,
+                "borders_visible": element.borders_visible,
+                "tags": self._tags(element.tags),
+                "rows": rows,
+            }
+        return None
+
+    def _text_record(self, rt: "RichText") -> dict[str, Any]:
+        record: dict[str, Any] = {"type": "text", "text": rt.text, "tags": self._tags(rt.tags)}
+        if self.options.include_runs:
+            record["runs"] = [{"start": run.start, "end": run.end, **_style_fields(run.style)} for run in rt.runs]
+        return record
+
+    def _tags(self, tags: list["NoteTag"]) -> list[dict[str, Any]]:
+        return [
+            {
+                "shape": tag.shape,
+                "kind": _tag_style(tag.shape)[0],
+                "label": tag.label,
+                "completed": bool(tag.completed),
+            }
+            for tag in tags
+        ]
+
+    def _digest(self, data: bytes) -> str | None:
+        if not (self.options.include_digests and data):
+            return None
+        return hashlib.sha256(data).hexdigest()
+
+
+def _style_fields(style: "TextStyle") -> dict[str, Any]:
+    """Non-empty fields of a run style (colours as #rrggbb)."""
+    fields = {name: value for name in _STYLE_FIELDS if (value := getattr(style, name)) is not None}
+    color = _css_color(style.font_color)
+    if color:
+        fields["font_color"] = color
+    highlight = _css_color(style.highlight_color)
+    if highlight:
+        fields["highlight_color"] = highlight
+    return fields
+
+
+def export_ndjson(
+    document: "Document",
+    output: str | Path | BinaryIO | TextIO,
+    options: JsonExportOptions | None = None,
+) -> None:
+    """Export a OneNote document as newline-delimited JSON.
+
+    This is a convenience function. For more control, use JsonExporter directly.
+
+    Args:
+        document: OneNote document to export.
+        output: Output file path or file-like object.
+        options: Export options.
+
+    Example::
+
+        from onenote import Document
+        from onenote.json_export import export_ndjson
+
+        doc = Document.open("notes.one")
+        export_ndjson(doc, "notes.ndjson")
+    """
+    JsonExporter(options).export(document, output)
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import re
 import uuid
-from typing import TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable
 
-from ..ms_one.reader import parse_section_file
+from ..ms_one.entities.parsers import DEFAULT_CONTENT_OPTIONS, ContentOptions
+from ..ms_one.reader import PageDirectory, parse_section_file
 from ..ms_one.entities.base import BaseNode as MsBaseNode, UnknownNode as MsUnknownNode
 from ..ms_one.entities import structure as ms
 from ..onestore.chunk_refs import FileNodeChunkReference
@@ -37,6 +39,8 @@ from .elements import (
 
 
 _IFNDF_TEXT_RE = re.compile(r"<ifndf>\{(?P<guid>[0-9a-fA-F\-]{36})\}</ifndf>")
+_IFNDF_ASCII_MARKER_RE = re.compile(re.escape(b"<ifndf>"))
+_IFNDF_UTF16_MARKER_RE = re.compile(re.escape("<ifndf".encode("utf-16le")))
 
 
 if TYPE_CHECKING:
@@ -63,24 +67,26 @@ def _extract_file_data_store_guids_from_ms_one_properties(
     seen: set[str] = set()
 
     # Local import to avoid a hard dependency cycle at import time.
-    from ..onestore.object_data import DecodedPropertySet
+    from ..onestore.object_data import ColumnarPropertySet, DecodedPropertySet
     from ..onestore.common_types import ExtendedGUID
 
+    property_sets = (DecodedPropertySet, ColumnarPropertySet)
+
     def iter_property_bytes(pset: DecodedPropertySet):
         stack: list[DecodedPropertySet] = [pset]
         while stack:
             cur = stack.pop()
             for prop in cur.properties:
                 v = prop.value
-                if isinstance(v, bytes):
+                if isinstance(v, (bytes, memoryview)):
                     yield v
-                elif isinstance(v, DecodedPropertySet):
+                elif isinstance(v, property_sets):
                     stack.append(v)
                 elif isinstance(v, tuple):
                     for item in v:
-                        if isinstance(item, bytes):
+                        if isinstance(item, (bytes, memoryview)):
                             yield item
-                        elif isinstance(item, DecodedPropertySet):
+                        elif isinstance(item, property_sets):
                             stack.append(item)
 
     def iter_property_scalars(pset: DecodedPropertySet):
@@ -92,15 +98,15 @@ def _extract_file_data_store_guids_from_ms_one_properties(
             if isinstance(cur, tuple):
                 stack.extend(list(cur))
                 continue
-            if isinstance(cur, DecodedPropertySet):
+            if isinstance(cur, property_sets):
                 stack.extend([p.value for p in cur.properties])
                 continue
             yield cur
 
     # First pass: explicit textual `<ifndf>` references, in discovery order.
     for b in iter_property_bytes(props):
-        if b"<ifndf>" in b:
-            s = b.decode("ascii", errors="ignore")
+        if _IFNDF_ASCII_MARKER_RE.search(b):
+            s = str(b, "ascii", "ignore")
             for m in _IFNDF_TEXT_RE.finditer(s):
                 try:
                     g = str(uuid.UUID(m.group("guid")))
@@ -110,8 +116,8 @@ def _extract_file_data_store_guids_from_ms_one_properties(
                     seen.add(g)
                     ordered.append(g)
 
-        if b"<\x00i\x00f\x00n\x00d\x00f\x00" in b:
-            s = b.decode("utf-16le", errors="ignore")
+        if _IFNDF_UTF16_MARKER_RE.search(b):
+            s = str(b, "utf-16le", "ignore")
             for m in _IFNDF_TEXT_RE.finditer(s):
                 try:
                     g = str(uuid.UUID(m.group("guid")))
@@ -168,27 +174,131 @@ def _convert_note_tags(tags: tuple[ms.NoteTag, ...] | None) -> list[NoteTag]:
     ]
 
 
-def parse_document(data: bytes | bytearray | memoryview, *, strict: bool = False) -> Document:
+def parse_document(
+    data: bytes | bytearray | memoryview,
+    *,
+    strict: bool = False,
+    metadata_only: bool = False,
+    options: ContentOptions | None = None,
+) -> Document:
     """Parse raw .one file bytes into a Document.
 
     This is the main conversion function that bridges ms_one internal
     representation to the public onenote API.
+
+    With `metadata_only`, pages carry only title, level and creation time (no content);
+    page object spaces and the FileDataStore are not read. The returned document keeps
+    a PageDirectory so single pages can be loaded later (see load_directory_page).
+
+    `options` selects optional content (see ms_one ContentOptions); disabled features
+    are skipped both while reading entities and while converting them.
     """
-    section = parse_section_file(data, strict=strict)
+    if options is None:
+        options = DEFAULT_CONTENT_OPTIONS
+
+    if metadata_only:
+        return document_from_directory(PageDirectory.build(data, strict=strict, options=options))
+
+    section = parse_section_file(data, strict=strict, options=options)
+    return document_from_section(
+        section,
+        data,
+        file_data_store_index=load_file_data_store_index(data, options=options),
+        options=options,
+    )
 
-    # Best-effort FileDataStore index to resolve embedded blobs (images, attachments).
-    # Always parse it in non-strict mode; some fixtures violate MUST-level constraints.
-    fds_ctx = ParseContext(strict=False, file_size=len(data))
+
+def load_file_data_store_index(
+    data: bytes | bytearray | memoryview,
+    *,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
+) -> dict[bytes, FileNodeChunkReference]:
+    """Best-effort FileDataStore index to resolve embedded blobs (images, attachments).
+
+    Always parsed in non-strict mode; some fixtures violate MUST-level constraints.
+    Empty when `options` disable every feature that needs file data.
+    """
+    if not options.needs_file_data:
+        return {}
     try:
-        file_data_store_index = parse_file_data_store_index(data, ctx=fds_ctx)
+        return parse_file_data_store_index(data, ctx=ParseContext(strict=False, file_size=len(data)))
     except Exception:
-        file_data_store_index = {}
+        return {}
 
-    doc = _convert_section(section, source_data=data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
-    _populate_missing_image_data_from_file_data_store(doc, source_data=data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+
+def document_from_section(
+    section: ms.Section,
+    data: bytes | bytearray | memoryview,
+    *,
+    file_data_store_index: dict[bytes, FileNodeChunkReference],
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
+) -> Document:
+    """Convert an already parsed ms_one Section into a Document."""
+    fds_ctx = ParseContext(strict=False, file_size=len(data))
+    doc = _convert_section(
+        section,
+        source_data=data,
+        file_data_store_index=file_data_store_index,
+        fds_ctx=fds_ctx,
+        options=options,
+    )
+    if options.load_images:
+        _populate_missing_image_data_from_file_data_store(doc, source_data=data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
     return doc
 
 
+def document_from_directory(directory: PageDirectory, *, indices: Iterable[int] | None = None) -> Document:
+    """Build a metadata-only Document (pages without content) from a PageDirectory.
+
+    With `indices`, only those directory entries become pages.
+    """
+    fds_ctx = ParseContext(strict=False)
+    pages = [
+        _convert_page(directory.metadata_page(i), source_data=directory.data, file_data_store_index={}, fds_ctx=fds_ctx)
+        for i in (range(len(directory)) if indices is None else indices)
+    ]
+    return Document(pages=pages, display_name=directory.section.display_name, _page_directory=directory)
+
+
+def load_directory_page(directory: PageDirectory, index: int) -> Page:
+    """Parse and convert a single page of a section via its PageDirectory.
+
+    This is the first page of directory entry `index` (the metadata leaf when its object
+    space yields none).
+    """
+    fds_ctx = ParseContext(strict=False, file_size=len(directory.data))
+    file_data_store_index = directory.file_data_store_index
+    pages = directory.load_pages(index)
+    page = _convert_page(
+        pages[0] if pages else directory.metadata_page(index),
+        source_data=directory.data,
+        file_data_store_index=file_data_store_index,
+        fds_ctx=fds_ctx,
+        options=directory.options,
+    )
+    if directory.options.load_images:
+        _populate_missing_image_data_from_file_data_store(
+            Document(pages=[page]),
+            source_data=directory.data,
+            file_data_store_index=file_data_store_index,
+            fds_ctx=fds_ctx,
+        )
+    return page
+
+
+_FILETIME_EPOCH = datetime(1601, 1, 1, tzinfo=timezone.utc)
+
+
+def _filetime_to_datetime(value: int | None) -> datetime | None:
+    """Convert a FILETIME (100ns ticks since 1601-01-01 UTC) to an aware datetime."""
+    if not value:
+        return None
+    try:
+        return _FILETIME_EPOCH + timedelta(microseconds=value // 10)
+    except OverflowError:
+        return None
+
+
 _PNG_SIG = b"\x89PNG\r\n\x1a\n"
 
 
@@ -246,16 +356,52 @@ def _populate_missing_image_data_from_file_data_store(
     to Images with empty data using a simple aspect-ratio heuristic.
     """
 
-    missing: list[Image] = []
-    for page in doc.pages:
-        for img in page.iter_images():
-            if not img.data:
-                missing.append(img)
-
+    missing = [img for page in doc.pages for img in page.iter_images() if not img.data]
     if not missing:
         return
 
-    # Collect image-like blobs from the file data store.
+    aspect_by_oid: dict[bytes, float | None] = {}
+    for img in missing:
+        aspect_by_oid.setdefault(img._oid, _aspect_ratio_from_image(img))
+    blobs = _file_data_store_image_blobs(source_data, file_data_store_index, fds_ctx)
+    _fill_missing_image_data(missing, _fallback_image_blobs(aspect_by_oid, blobs))
+
+
+def _fallback_image_blobs(aspect_by_oid: dict[bytes, float | None], blobs: list[bytes]) -> dict[bytes, bytes]:
+    """Pick a FileDataStore blob for each unresolved image object id.
+
+    Some files (including fixtures) reuse the same Image object multiple times with
+    different layout; in that case we MUST assign identical bytes, so the blob is chosen
+    once per object id, scored by the aspect ratio of its first unresolved image.
+    """
+    out: dict[bytes, bytes] = {}
+    if not blobs:
+        return out
+    for oid, aspect_ratio in aspect_by_oid.items():
+        blob = _best_image_blob(aspect_ratio, blobs)
+        if blob is not None:
+            out[oid] = blob
+    return out
+
+
+def _fill_missing_image_data(images: Iterable[Image], blobs_by_oid: dict[bytes, bytes]) -> None:
+    """Set the data (and PNG format) of images without data from `blobs_by_oid`."""
+    for image in images:
+        if image.data:
+            continue
+        blob = blobs_by_oid.get(image._oid)
+        if blob:
+            image.data = blob
+            if blob.startswith(_PNG_SIG):
+                image.format = "png"
+
+
+def _file_data_store_image_blobs(
+    source_data: bytes | bytearray | memoryview,
+    file_data_store_index: dict[bytes, FileNodeChunkReference],
+    fds_ctx: ParseContext,
+) -> list[bytes]:
+    """Collect image-like blobs from the file data store."""
     blobs: list[bytes] = []
     for _guid, ref in (file_data_store_index or {}).items():
         try:
@@ -270,52 +416,30 @@ def _populate_missing_image_data_from_file_data_store(
         b = bytes(getattr(obj, "file_data", b""))
         if _looks_like_image_bytes(b):
             blobs.append(b)
+    return blobs
 
-    if not blobs:
-        return
 
-    # Group missing images by underlying MS-ONE object id.
-    # Some files (including fixtures) reuse the same Image object multiple times
-    # with different layout; in that case we MUST assign identical bytes.
-    by_oid: dict[bytes, list[Image]] = {}
-    for img in missing:
-        by_oid.setdefault(getattr(img, "_oid", b""), []).append(img)
+def _best_image_blob(aspect_ratio: float | None, blobs: list[bytes]) -> bytes | None:
+    """Pick the blob whose aspect ratio is closest to `aspect_ratio` (first blob wins ties).
 
-    def score(image: Image, blob: bytes) -> float:
-        ir = _aspect_ratio_from_image(image)
-        br = _aspect_ratio_from_bytes(blob)
-        if ir is None or br is None:
-            return 0.0
-        return abs(ir - br)
-
-    # For each OID group, pick a best-matching blob once and reuse it for the group.
-    # Do not "consume" blobs: different logical images may legitimately reuse bytes,
-    # and consuming can incorrectly mix historical blobs into current layout.
-    for _oid, images in by_oid.items():
-        if not images:
-            continue
-
-        best_blob: bytes | None = None
-        best_s = float("inf")
-
-        for blob in blobs:
-            # Skip non-image blobs defensively.
-            if not _looks_like_image_bytes(blob):
-                continue
-
-            # Score by the first image (layout-driven) as a stable heuristic.
-            s = score(images[0], blob)
-            if s < best_s:
-                best_s = s
-                best_blob = blob
+    Blobs are not "consumed": different logical images may legitimately reuse bytes,
+    and consuming can incorrectly mix historical blobs into current layout.
+    """
+    best_blob: bytes | None = None
+    best_s = float("inf")
 
-        if best_blob is None:
+    for blob in blobs:
+        # Skip non-image blobs defensively.
+        if not _looks_like_image_bytes(blob):
             continue
 
-        for image in images:
-            image.data = best_blob
-            if image.data.startswith(_PNG_SIG):
-                image.format = "png"
+        br = _aspect_ratio_from_bytes(blob)
+        s = abs(aspect_ratio - br) if aspect_ratio is not None and br is not None else 0.0
+        if s < best_s:
+            best_s = s
+            best_blob = blob
+
+    return best_blob
 
 
 def _resolve_embedded_data(
@@ -353,6 +477,7 @@ def _convert_section(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Document:
     """Convert ms_one Section to public Document."""
     pages: list[Page] = []
@@ -365,6 +490,7 @@ def _convert_section(
                     source_data=source_data,
                     file_data_store_index=file_data_store_index,
                     fds_ctx=fds_ctx,
+                    options=options,
                 )
             )
         elif isinstance(child, ms.Page):
@@ -374,6 +500,7 @@ def _convert_section(
                     source_data=source_data,
                     file_data_store_index=file_data_store_index,
                     fds_ctx=fds_ctx,
+                    options=options,
                 )
             )
         # PageMetaData entries are also converted as pages (observed in SimpleTable.one)
@@ -390,6 +517,7 @@ def _convert_page_series(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> list[Page]:
     """Convert PageSeries to list of Pages."""
     pages: list[Page] = []
@@ -401,6 +529,7 @@ def _convert_page_series(
                     source_data=source_data,
                     file_data_store_index=file_data_store_index,
                     fds_ctx=fds_ctx,
+                    options=options,
                 )
             )
         elif isinstance(child, ms.PageSeries):
@@ -411,6 +540,7 @@ def _convert_page_series(
                     source_data=source_data,
                     file_data_store_index=file_data_store_index,
                     fds_ctx=fds_ctx,
+                    options=options,
                 )
             )
     return pages
@@ -422,6 +552,7 @@ def _convert_page(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Page:
     """Convert ms_one Page to public Page."""
     children: list[Element] = []
@@ -433,6 +564,7 @@ def _convert_page(
             source_data=source_data,
             file_data_store_index=file_data_store_index,
             fds_ctx=fds_ctx,
+            options=options,
         )
         if converted is not None:
             if isinstance(converted, Title):
@@ -445,11 +577,16 @@ def _convert_page(
     page_width = page.page_width * 72.0 if page.page_width is not None else None
     page_height = page.page_height * 72.0 if page.page_height is not None else None
 
+    # PageLevel is 1-based in the file; the public level is 0 for top-level pages.
+    level = max(int(page.level) - 1, 0) if page.level is not None else 0
+
     return Page(
         _oid=page.oid.guid if page.oid else b"",
         title=page.title or "",
         title_element=title_element,
         children=children,
+        created=_filetime_to_datetime(page.creation_time),
+        level=level,
         width=page_width,
         height=page_height,
     )
@@ -461,29 +598,30 @@ def _convert_node(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Element | None:
     """Convert any ms_one node to appropriate public Element."""
     if isinstance(node, MsUnknownNode):
         return None
 
     if isinstance(node, ms.Title):
-        return _convert_title(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_title(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
     if isinstance(node, ms.Outline):
-        return _convert_outline(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_outline(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
     if isinstance(node, ms.OutlineElement):
-        return _convert_outline_element(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_outline_element(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
     if isinstance(node, ms.RichText):
         return _convert_rich_text(node)
     if isinstance(node, ms.Image):
-        return _convert_image(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_image(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
     if isinstance(node, ms.Table):
-        return _convert_table(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_table(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
         if isinstance(node, ms.TableRow):
-            return _convert_table_row(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+            return _convert_table_row(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
     if isinstance(node, ms.TableCell):
-        return _convert_table_cell(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_table_cell(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
     if isinstance(node, ms.EmbeddedFile):
-        return _convert_attached_file(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx)
+        return _convert_attached_file(node, source_data=source_data, file_data_store_index=file_data_store_index, fds_ctx=fds_ctx, options=options)
 
     # For other node types, return None (skip)
     return None
@@ -495,6 +633,7 @@ def _convert_title(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Title:
     """Convert ms_one Title to public Title."""
     children: list[Element] = []
@@ -504,6 +643,7 @@ def _convert_title(
             source_data=source_data,
             file_data_store_index=file_data_store_index,
             fds_ctx=fds_ctx,
+            options=options,
         )
         if converted is not None:
             children.append(converted)
@@ -520,6 +660,7 @@ def _convert_outline(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Outline:
     """Convert ms_one Outline to public Outline."""
     children: list[OutlineElement] = []
@@ -529,6 +670,7 @@ def _convert_outline(
             source_data=source_data,
             file_data_store_index=file_data_store_index,
             fds_ctx=fds_ctx,
+            options=options,
         )
         if converted is None:
             continue
@@ -569,6 +711,7 @@ def _convert_outline_element(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> OutlineElement:
     """Convert ms_one OutlineElement to public OutlineElement."""
     # children are nested OutlineElements (hierarchical structure)
@@ -580,6 +723,7 @@ def _convert_outline_element(
             source_data=source_data,
             file_data_store_index=file_data_store_index,
             fds_ctx=fds_ctx,
+            options=options,
         )
         if converted is None:
             continue
@@ -597,6 +741,7 @@ def _convert_outline_element(
             source_data=source_data,
             file_data_store_index=file_data_store_index,
             fds_ctx=fds_ctx,
+            options=options,
         )
         if converted is not None:
             contents.append(converted)
@@ -658,12 +803,75 @@ def _convert_rich_text(rt: ms.RichText) -> RichText:
     )
 
 
+def _resolve_image_data(
+    img: ms.Image,
+    *,
+    source_data: bytes | bytearray | memoryview,
+    file_data_store_index: dict[bytes, FileNodeChunkReference],
+    fds_ctx: ParseContext,
+) -> bytes:
+    """Resolve the bytes of an Image whose picture data is stored in the FileDataStore."""
+    # Prefer discovery-ordered GUIDs from raw_properties.
+    raw_guids = _extract_file_data_store_guids_from_ms_one_properties(
+        getattr(img, "raw_properties", None),
+        index_keys=set(file_data_store_index.keys()) if file_data_store_index else None,
+    )
+    ms_one_guids: tuple[str, ...] = getattr(img, "file_data_guids", None) or ()
+    if raw_guids:
+        seen = set(raw_guids)
+        guid_candidates = (*raw_guids, *(g for g in ms_one_guids if g and g not in seen))
+    else:
+        guid_candidates = ms_one_guids
+
+    # Resolve in candidate order and require the payload to look like an image.
+    for g in guid_candidates:
+        if not g:
+            continue
+        ref = f"<ifndf>{{{g}}}</ifndf>"
+        try:
+            blob = get_file_data_by_reference(
+                source_data,
+                ref,
+                ctx=fds_ctx,
+                index=file_data_store_index,
+            )
+        except Exception:
+            blob = None
+        if blob and _looks_like_image_bytes(bytes(blob)):
+            return bytes(blob)
+    return b""
+
+
+def _resolve_attachment_data(
+    f: ms.EmbeddedFile,
+    *,
+    source_data: bytes | bytearray | memoryview,
+    file_data_store_index: dict[bytes, FileNodeChunkReference],
+    fds_ctx: ParseContext,
+) -> bytes:
+    """Resolve the bytes of an EmbeddedFile stored in the FileDataStore."""
+    file_data_guids = getattr(f, "file_data_guids", None)
+    if not file_data_guids:
+        file_data_guids = _extract_file_data_store_guids_from_ms_one_properties(
+            getattr(f, "raw_properties", None),
+            index_keys=set(file_data_store_index.keys()) if file_data_store_index else None,
+        )
+
+    return _resolve_embedded_data(
+        source_data,
+        file_data_store_index,
+        fds_ctx,
+        file_data_guids,
+    )
+
+
 def _convert_image(
     img: ms.Image,
     *,
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Image:
     """Convert ms_one Image to public Image."""
     # Convert dimensions: PictureWidth/Height are in half-inch increments -> points (1 inch = 72 points)
@@ -676,36 +884,13 @@ def _convert_image(
     y = img.offset_vertical / 2.0 if img.offset_vertical is not None else None
 
     data = bytes(getattr(img, "data", b"") or b"")
-    if not data:
-        # Prefer discovery-ordered GUIDs from raw_properties.
-        raw_guids = _extract_file_data_store_guids_from_ms_one_properties(
-            getattr(img, "raw_properties", None),
-            index_keys=set(file_data_store_index.keys()) if file_data_store_index else None,
+    if not data and options.load_images:
+        data = _resolve_image_data(
+            img,
+            source_data=source_data,
+            file_data_store_index=file_data_store_index,
+            fds_ctx=fds_ctx,
         )
-        ms_one_guids: tuple[str, ...] = getattr(img, "file_data_guids", None) or ()
-        if raw_guids:
-            seen = set(raw_guids)
-            guid_candidates = (*raw_guids, *(g for g in ms_one_guids if g and g not in seen))
-        else:
-            guid_candidates = ms_one_guids
-
-        # Resolve in candidate order and require the payload to look like an image.
-        for g in guid_candidates:
-            if not g:
-                continue
-            ref = f"<ifndf>{{{g}}}</ifndf>"
-            try:
-                blob = get_file_data_by_reference(
-                    source_data,
-                    ref,
-                    ctx=fds_ctx,
-                    index=file_data_store_index,
-                )
-            except Exception:
-                blob = None
-            if blob and _looks_like_image_bytes(bytes(blob)):
-                data = bytes(blob)
-                break
 
     return Image(
         _oid=img.oid.guid if img.oid else b"",
@@ -727,6 +912,7 @@ def _convert_table(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> Table:
     """Convert ms_one Table to public Table."""
     rows: list[TableRow] = []
@@ -738,6 +924,7 @@ def _convert_table(
                     source_data=source_data,
                     file_data_store_index=file_data_store_index,
                     fds_ctx=fds_ctx,
+                    options=options,
                 )
             )
 
@@ -760,6 +947,7 @@ def _convert_table_row(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> TableRow:
     """Convert ms_one TableRow to public TableRow."""
     cells: list[TableCell] = []
@@ -771,6 +959,7 @@ def _convert_table_row(
                     source_data=source_data,
                     file_data_store_index=file_data_store_index,
                     fds_ctx=fds_ctx,
+                    options=options,
                 )
             )
 
@@ -786,6 +975,7 @@ def _convert_table_cell(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> TableCell:
     """Convert ms_one TableCell to public TableCell."""
     children: list[Element] = []
@@ -795,6 +985,7 @@ def _convert_table_cell(
             source_data=source_data,
             file_data_store_index=file_data_store_index,
             fds_ctx=fds_ctx,
+            options=options,
         )
         if converted is not None:
             children.append(converted)
@@ -811,21 +1002,15 @@ def _convert_attached_file(
     source_data: bytes | bytearray | memoryview,
     file_data_store_index: dict[bytes, FileNodeChunkReference],
     fds_ctx: ParseContext,
+    options: ContentOptions = DEFAULT_CONTENT_OPTIONS,
 ) -> AttachedFile:
     data = bytes(getattr(f, "data", b"") or b"")
-    if not data:
-        file_data_guids = getattr(f, "file_data_guids", None)
-        if not file_data_guids:
-            file_data_guids = _extract_file_data_store_guids_from_ms_one_properties(
-                getattr(f, "raw_properties", None),
-                index_keys=set(file_data_store_index.keys()) if file_data_store_index else None,
-            )
-
-        data = _resolve_embedded_data(
-            source_data,
-            file_data_store_index,
-            fds_ctx,
-            file_data_guids,
+    if not data and options.load_attachments:
+        data = _resolve_attachment_data(
+            f,
+            source_data=source_data,
+            file_data_store_index=file_data_store_index,
+            fds_ctx=fds_ctx,
         )
 
     return AttachedFile(
@@ -3,6 +3,9 @@
 This module provides PDF export using the ReportLab library.
 Install with: pip install reportlab
 
+A small built-in writer (``PdfExportOptions(backend="lite")``) covers text-first
+exports without ReportLab.
+
 Example usage::
 
     from onenote import Document
@@ -13,148 +16,21 @@ Example usage::
 
 from __future__ import annotations
 
+import hashlib
 import io
+import math
+import re
+import tempfile
+import warnings
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
-
-
-def _number_to_alpha(n: int, *, upper: bool) -> str:
-    if n <= 0:
-        return ""
-    chars: list[str] = []
-    while n > 0:
-        n -= 1
-        chars.append(chr((n % 26) + (ord('A') if upper else ord('a'))))
-        n //= 26
-    return "".join(reversed(chars))
-
-
-def _number_to_roman(n: int, *, upper: bool) -> str:
-    if n <= 0:
-        return ""
-    # Best-effort; OneNote lists rarely exceed this.
-    n = min(n, 3999)
-    parts: list[str] = []
-    mapping = (
-        (1000, "M"),
-        (900, "CM"),
-        (500, "D"),
-        (400, "CD"),
-        (100, "C"),
-        (90, "XC"),
-        (50, "L"),
-        (40, "XL"),
-        (10, "X"),
-        (9, "IX"),
-        (5, "V"),
-        (4, "IV"),
-        (1, "I"),
-    )
-    for value, token in mapping:
-        while n >= value:
-            parts.append(token)
-            n -= value
-    s = "".join(parts)
-    return s if upper else s.lower()
-
-
-def _parse_ms_one_number_list_format(fmt: str | None) -> tuple[int | None, str, str]:
-    """Parse MS-ONE NumberListFormat into (style_code, prefix, suffix).
-
-    Observed formats often include control bytes (e.g. '\x03', '\x00') around
-    the U+FFFD placeholder; ReportLab will render those as black squares.
-    """
-    if not fmt:
-        return None, "", "."
-
-    placeholder = "\uFFFD"
-    idx = fmt.find(placeholder)
-    if idx < 0:
-        # Not a numbered format; return printable content only.
-        printable = "".join(ch for ch in fmt if ord(ch) >= 32)
-        return None, printable, ""
-
-    prefix = "".join(ch for ch in fmt[:idx] if ord(ch) >= 32)
-
-    style_code: int | None = None
-    if idx + 1 < len(fmt) and ord(fmt[idx + 1]) < 32:
-        style_code = ord(fmt[idx + 1])
-
-    suffix = "".join(ch for ch in fmt[idx + 1 :] if ord(ch) >= 32 and ch != placeholder)
-    if not suffix:
-        suffix = "."
-
-    return style_code, prefix, suffix
-
-
-def _format_list_number(n: int, style_code: int | None) -> str:
-    """Format list item number based on observed MS-ONE style codes."""
-    # Observed in fixtures:
-    # - 0x00: decimal
-    # - 0x04: lower alpha
-    # - 0x02: lower roman
-    if style_code == 0x04:
-        return _number_to_alpha(n, upper=False)
-    if style_code == 0x03:
-        return _number_to_alpha(n, upper=True)
-    if style_code == 0x02:
-        return _number_to_roman(n, upper=False)
-    if style_code == 0x01:
-        return _number_to_roman(n, upper=True)
-    return str(n)
-
-
-def _compute_list_marker(fmt: str | None, n: int) -> str:
-    style_code, prefix, suffix = _parse_ms_one_number_list_format(fmt)
-    return f"{prefix}{_format_list_number(n, style_code)}{suffix}".strip()
-
-
-@dataclass
-class _ListState:
-    """Tracks list numbering across nested OutlineElements during PDF rendering."""
-
-    counters: dict[int, int] = field(default_factory=dict)
-    formats: dict[int, str] = field(default_factory=dict)
-
-    def reset_from_level(self, indent_level: int) -> None:
-        for level in list(self.counters.keys()):
-            if level >= indent_level:
-                self.counters.pop(level, None)
-                self.formats.pop(level, None)
-
-    def next_bullet(self, elem: "OutlineElement", indent_level: int) -> str | None:
-        """Return bullet text for this element, or None if not a list item."""
-        fmt = elem.list_format
-        if not fmt:
-            # Breaks the list chain at this indent level.
-            self.reset_from_level(indent_level)
-            return None
-
-        # Bulleted lists: render a simple bullet.
-        if not elem.is_numbered:
-            # Reset deeper levels when continuing at this level.
-            self.reset_from_level(indent_level + 1)
-            return "•"
-
-        # Numbered lists.
-        # If format changes at this level, restart numbering.
-        fmt_key = "".join(ch for ch in fmt if ord(ch) >= 32 or ch == "\uFFFD")
-        if self.formats.get(indent_level) != fmt_key:
-            self.counters[indent_level] = 0
-            self.formats[indent_level] = fmt_key
-
-        # Apply restart override if present.
-        if elem.list_restart is not None:
-            self.counters[indent_level] = elem.list_restart
-        else:
-            self.counters[indent_level] = self.counters.get(indent_level, 0) + 1
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator
 
-        # Reset deeper nested counters when we emit a marker at this level.
-        self.reset_from_level(indent_level + 1)
-        marker = _compute_list_marker(fmt, self.counters[indent_level])
-
-        return marker
+from . import pdf_fonts
+from ._export_common import _ListState, _tag_style
 
 if TYPE_CHECKING:
     from .document import Document
@@ -168,6 +44,10 @@ DEFAULT_PAGE_WIDTH = 612.0  # 8.5 inches
 DEFAULT_PAGE_HEIGHT = 792.0  # 11 inches
 DEFAULT_MARGIN = 72.0  # 1 inch
 
+# Decoded pixel data kept by one exporter's open images, in bytes. A drawn ImageReader
+# holds its PIL image and the RGB data ReportLab derives from it.
+_IMAGE_CACHE_BYTES = 64 * 1024 * 1024
+
 
 # Map Windows font names to ReportLab core fonts
 _FONT_MAP = {
@@ -251,6 +131,102 @@ class PdfExportOptions:
     image_max_height: float | None = 400.0
     """Maximum height for images."""
 
+    max_image_dpi: float | None = None
+    """Downsample images whose resolution at the rendered size exceeds this (None = keep).
+
+    Requires Pillow. Downsampled JPEGs are re-encoded as JPEG, other formats as PNG;
+    images within the limit are embedded unchanged (JPEG data passes through as-is).
+    """
+
+    jpeg_quality: int = 85
+    """JPEG quality used when a JPEG image is downsampled."""
+
+    backend: str = "reportlab"
+    """PDF backend: "reportlab" (full layout) or "lite".
+
+    The lite backend is a built-in writer that needs no third-party packages. It
+    writes text in the standard-14 fonts (basic styles, hyperlinks, list markers and
+    tag icons), embeds JPEG/PNG images and draws table grids, streaming each page to
+    the output as soon as it is laid out. Layout is simpler than ReportLab's: table
+    columns without stored widths share the available width equally and rows are
+    not split across pages. Text is limited to the Windows-1252 character set of
+    the standard fonts: other characters are written as "?" and a `UnicodeWarning`
+    is issued; use the ReportLab backend for documents in other scripts.
+    """
+
+
+class _PageStory(list):
+    """Flowable list for `SimpleDocTemplate.build`, refilled one page at a time.
+
+    ReportLab consumes the story from the front (`del flowables[0]`); whenever the
+    buffered flowables run out, the next page's flowables are pulled from `pages`.
+    Laid-out flowables are dropped as soon as ReportLab removes them.
+    """
+
+    def __init__(self, pages: Iterator[list]) -> None:
+        super().__init__()
+        self._pages = pages
+
+    def _fill(self, size: int) -> None:
+        while list.__len__(self) < size and self._pages is not None:
+            story = next(self._pages, None)
+            if story is None:
+                self._pages = None
+            else:
+                self.extend(story)
+
+    def __len__(self) -> int:
+        self._fill(1)
+        return list.__len__(self)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, int) and index >= 0:
+            self._fill(index + 1)
+        return list.__getitem__(self, index)
+
+
+def _target_pixels(width: float | None, height: float | None, dpi: float | None) -> tuple[int, int] | None:
+    """Pixel size of a `width` x `height` point box at `dpi`, or None when not capped."""
+    if dpi is None or not width or not height:
+        return None
+    return (max(1, math.ceil(width * dpi / 72.0)), max(1, math.ceil(height * dpi / 72.0)))
+
+
+def _downsample_image(data: bytes, target: tuple[int, int], jpeg_quality: int) -> bytes:
+    """Shrink an encoded image so that it still covers `target` pixels.
+
+    Returns `data` unchanged when it is already small enough, cannot be decoded or
+    Pillow is not installed.
+    """
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return data
+
+    try:
+        im = PILImage.open(io.BytesIO(data))
+        scale = max(target[0] / im.width, target[1] / im.height)
+        if scale >= 1.0:
+            return data
+
+        size = (max(1, round(im.width * scale)), max(1, round(im.height * scale)))
+        is_jpeg = im.format == "JPEG"
+        if im.mode not in ("1", "L", "RGB", "RGBA", "CMYK"):
+            im = im.convert("RGBA")
+        im = im.resize(size, PILImage.LANCZOS)
+
+        out = io.BytesIO()
+        if is_jpeg:
+            im.save(out, format="JPEG", quality=jpeg_quality, optimize=True)
+        else:
+            im.save(out, format="PNG", optimize=True)
+        return out.getvalue()
+    except Exception:
+        return data
+
 
 class PdfExporter:
     """Export OneNote documents to PDF format.
@@ -265,8 +241,13 @@ class PdfExporter:
             options: Export options. If None, uses defaults.
         """
         self.options = options or PdfExportOptions()
-        self._check_reportlab()
+        if self.options.backend not in ("reportlab", "lite"):
+            raise ValueError(f"Unknown PDF backend: {self.options.backend!r}")
+        if self.options.backend == "reportlab":
+            self._check_reportlab()
         self._tag_icon_image_cache: dict[str, object] = {}
+        self._image_cache: dict[tuple[bytes, tuple[int, int] | None], tuple[object, int]] = {}
+        self._image_cache_bytes = 0
     
     def _check_reportlab(self) -> None:
         """Check if reportlab is available."""
@@ -278,13 +259,78 @@ class PdfExporter:
                 "Install it with: pip install reportlab"
             )
     
-    def export(self, document: "Document", output: str | Path | BinaryIO) -> None:
+    def _page_size(self, document: "Document") -> tuple[float, float]:
+        """PDF page size for `document`: the configured size, grown to fit its pages."""
+        page_width = float(self.options.page_width)
+        page_height = float(self.options.page_height)
+
+        # If document provides page dimensions or layout coordinates exceed defaults,
+        # auto-expand the PDF page size so content is not clipped.
+        doc_page_width = 0.0
+        doc_page_height = 0.0
+        try:
+            for p in getattr(document, "pages", []) or []:
+                w = getattr(p, "width", None)
+                h = getattr(p, "height", None)
+                if w is not None:
+                    doc_page_width = max(doc_page_width, float(w))
+                if h is not None:
+                    doc_page_height = max(doc_page_height, float(h))
+        except Exception:
+            pass
+
+        required_width = 0.0
+        required_height = 0.0
+        try:
+            for p in getattr(document, "pages", []) or []:
+                # Outline extents
+                for o in getattr(p, "iter_outlines", lambda: [])() or []:
+                    ox = getattr(o, "x", None)
+                    ow = getattr(o, "width", None)
+                    oy = getattr(o, "y", None)
+                    if ox is not None and ow is not None:
+                        left = max(float(self.options.margin_left), float(ox))
+                        required_width = max(required_width, left + float(ow) + float(self.options.margin_right))
+                    if oy is not None:
+                        required_height = max(required_height, max(float(self.options.margin_top), float(oy)) + float(self.options.margin_bottom))
+
+                # Image extents (height is known)
+                for img in getattr(p, "iter_images", lambda: [])() or []:
+                    ix = getattr(img, "x", None)
+                    iw = getattr(img, "width", None)
+                    iy = getattr(img, "y", None)
+                    ih = getattr(img, "height", None)
+                    if ix is not None and iw is not None:
+                        left = max(float(self.options.margin_left), float(ix))
+                        required_width = max(required_width, left + float(iw) + float(self.options.margin_right))
+                    if iy is not None and ih is not None:
+                        top = max(float(self.options.margin_top), float(iy))
+                        required_height = max(required_height, top + float(ih) + float(self.options.margin_bottom))
+        except Exception:
+            pass
+
+        page_width = max(page_width, doc_page_width, required_width)
+        page_height = max(page_height, doc_page_height, required_height)
+        return page_width, page_height
+
+    def export(
+        self,
+        document: "Document",
+        output: str | Path | BinaryIO,
+        *,
+        page_size: tuple[float, float] | None = None,
+    ) -> None:
         """Export document to PDF.
         
         Args:
             document: OneNote document to export.
             output: Output path or file-like object.
+            page_size: PDF page size in points (default: computed from the document).
         """
+        if self.options.backend == "lite":
+            self._export_lite(document, output, page_size=page_size)
+            return
+
         from reportlab.lib.pagesizes import letter
         from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         from reportlab.lib.units import inch
@@ -305,57 +351,7 @@ class PdfExporter:
             should_close = False
         
         try:
-            # Create document
-            page_width = float(self.options.page_width)
-            page_height = float(self.options.page_height)
-
-            # If document provides page dimensions or layout coordinates exceed defaults,
-            # auto-expand the PDF page size so content is not clipped.
-            doc_page_width = 0.0
-            doc_page_height = 0.0
-            try:
-                for p in getattr(document, "pages", []) or []:
-                    w = getattr(p, "width", None)
-                    h = getattr(p, "height", None)
-                    if w is not None:
-                        doc_page_width = max(doc_page_width, float(w))
-                    if h is not None:
-                        doc_page_height = max(doc_page_height, float(h))
-            except Exception:
-                pass
-
-            required_width = 0.0
-            required_height = 0.0
-            try:
-                for p in getattr(document, "pages", []) or []:
-                    # Outline extents
-                    for o in getattr(p, "iter_outlines", lambda: [])() or []:
-                        ox = getattr(o, "x", None)
-                        ow = getattr(o, "width", None)
-                        oy = getattr(o, "y", None)
-                        if ox is not None and ow is not None:
-                            left = max(float(self.options.margin_left), float(ox))
-                            required_width = max(required_width, left + float(ow) + float(self.options.margin_right))
-                        if oy is not None:
-                            required_height = max(required_height, max(float(self.options.margin_top), float(oy)) + float(self.options.margin_bottom))
-
-                    # Image extents (height is known)
-                    for img in getattr(p, "iter_images", lambda: [])() or []:
-                        ix = getattr(img, "x", None)
-                        iw = getattr(img, "width", None)
-                        iy = getattr(img, "y", None)
-                        ih = getattr(img, "height", None)
-                        if ix is not None and iw is not None:
-                            left = max(float(self.options.margin_left), float(ix))
-                            required_width = max(required_width, left + float(iw) + float(self.options.margin_right))
-                        if iy is not None and ih is not None:
-                            top = max(float(self.options.margin_top), float(iy))
-                            required_height = max(required_height, top + float(ih) + float(self.options.margin_bottom))
-            except Exception:
-                pass
-
-            page_width = max(page_width, doc_page_width, required_width)
-            page_height = max(page_height, doc_page_height, required_height)
+            page_width, page_height = page_size or self._page_size(document)
             
             doc = SimpleDocTemplate(
                 output_file,
@@ -366,8 +362,6 @@ class PdfExporter:
                 bottomMargin=self.options.margin_bottom,
             )
             
-            # Build story (list of flowables)
-            story = []
             styles = getSampleStyleSheet()
             
             # Create custom styles
@@ -388,20 +382,36 @@ class PdfExporter:
                 spaceAfter=6,
             )
             
-            # Process each page
-            for i, page in enumerate(document.pages):
-                if i > 0:
-                    story.append(PageBreak())
-                
-                self._render_page(page, story, styles, title_style, body_style)
-            
+            # Flowables are produced one OneNote page at a time while ReportLab lays out the
+            # previous ones, so only about one page of flowables is alive at once.
+            def page_stories():
+                for i, page in enumerate(document.pages):
+                    story: list = [PageBreak()] if i > 0 else []
+                    self._render_page(page, story, styles, title_style, body_style)
+                    yield story
+
             # Build PDF
-            doc.build(story)
+            doc.build(_PageStory(page_stories()))
             
         finally:
             if should_close:
                 output_file.close()
     
+    def _export_lite(
+        self,
+        document: "Document",
+        output: str | Path | BinaryIO,
+        *,
+        page_size: tuple[float, float] | None = None,
+    ) -> None:
+        """Export with the built-in writer (see `PdfExportOptions.backend`)."""
+        page_size = page_size or self._page_size(document)
+        if isinstance(output, (str, Path)):
+            with open(output, "wb") as f:
+                _LiteRenderer(self, f, page_size).write(document.pages)
+        else:
+            _LiteRenderer(self, output, page_size).write(document.pages)
+
     def _render_page(
         self, 
         page: "Page", 
@@ -893,19 +903,7 @@ class PdfExporter:
 
     def _tag_style_for_shape(self, shape: int | None) -> tuple[str, str]:
         """(kind, color_hex) for known tag shapes."""
-        if shape == 13:
-            return ("star", "#f39c12")
-        if shape == 15:
-            return ("question", "#8e44ad")
-        if shape == 3:
-            return ("todo", "#2980b9")
-        if shape == 12:
-            return ("calendar", "#16a085")
-        if shape == 118:
-            return ("contact", "#2980b9")
-        if shape == 121:
-            return ("music", "#7f8c8d")
-        return ("unknown", "#7f8c8d")
+        return _tag_style(shape)
 
     def _estimate_text_width(self, text: str, font_name: str, font_size: float) -> float:
         if not text:
@@ -1070,11 +1068,6 @@ class PdfExporter:
             return Paragraph("[Image]", styles['Normal'])
 
         try:
-            from reportlab.platypus import Image as RLImage
-            import io
-
-            img_buffer = io.BytesIO(img.data)
-
             width = img.width
             height = img.height
 
@@ -1099,10 +1092,36 @@ class PdfExporter:
                 width = None
                 height = None
 
-            return RLImage(img_buffer, width=width, height=height)
+            return _shared_image_flowable(self._image_reader(img.data, width, height), width=width, height=height)
         except Exception:
             return Paragraph(f"[Image: {img.filename or 'unnamed'}]", styles['Normal'])
     
+    def _image_reader(self, data: bytes, width: float | None, height: float | None):
+        """Return the ImageReader for `data` drawn at `width` x `height` points.
+
+        Readers are shared by content hash, so a repeated picture is decoded once and
+        embedded as a single XObject. The least recently used readers are dropped once
+        their decoded pixels exceed `_IMAGE_CACHE_BYTES`; an image larger than that is
+        not kept at all (ReportLab still embeds a redrawn copy once, by content digest).
+        """
+        from reportlab.lib.utils import ImageReader
+
+        target = _target_pixels(width, height, self.options.max_image_dpi)
+        key = (hashlib.sha1(data).digest(), target)
+        cache = self._image_cache
+        entry = cache.pop(key, None)
+        if entry is None:
+            payload = data if target is None else _downsample_image(data, target, self.options.jpeg_quality)
+            reader = ImageReader(io.BytesIO(payload))
+            w, h = reader.getSize()
+            entry = (reader, w * h * 8)
+            self._image_cache_bytes += entry[1]
+        cache[key] = entry
+        while self._image_cache_bytes > _IMAGE_CACHE_BYTES and cache:
+            _, cost = cache.pop(next(iter(cache)))
+            self._image_cache_bytes -= cost
+        return entry[0]
+
     def _render_table(
         self, 
         table: "Table", 
@@ -1341,10 +1360,1108 @@ class PdfExporter:
         return f"#{r:02x}{g:02x}{b:02x}"
 
 
+class _PdfWriter:
+    """Streams PDF objects to a binary file; the cross-reference table is written last.
+
+    Object 1 is reserved for the page tree and object 2 for the catalog, so pages can
+    point at their parent before it is written.
+    """
+
+    def __init__(self, out: BinaryIO) -> None:
+        self.out = out
+        self.pos = 0
+        self.offsets: dict[int, int] = {}
+        self.next_num = 3
+        self._md5 = hashlib.md5()
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write(self, data: bytes) -> None:
+        self.out.write(data)
+        self._md5.update(data)
+        self.pos += len(data)
+
+    def reserve(self) -> int:
+        """Allocate an object number for an object written later with ``add(..., num=)``."""
+        num = self.next_num
+        self.next_num += 1
+        return num
+
+    def add(self, body: bytes, *, num: int | None = None) -> int:
+        if num is None:
+            num = self.reserve()
+        self.offsets[num] = self.pos
+        self._write(b"%d 0 obj\n%s\nendobj\n" % (num, body))
+        return num
+
+    def add_stream(self, entries: bytes, data: bytes, *, compress: bool = True) -> int:
+        if compress:
+            data = zlib.compress(data)
+            entries += b" /Filter /FlateDecode"
+        return self.add(b"<< %s /Length %d >>\nstream\n%s\nendstream" % (entries, len(data), data))
+
+    def close(self, pages: list[int], *, info: int | None = None) -> None:
+        self.add(b"<< /Type /Pages /Count %d /Kids [ %s ] >>" % (len(pages), b" ".join(b"%d 0 R" % p for p in pages)), num=1)
+        self.add(b"<< /Type /Catalog /Pages 1 0 R /PageMode /UseNone >>", num=2)
+        if info is None:
+            info = self.add(b"<< /Producer (aspose-note) >>")
+        size = self.next_num
+        xref = self.pos
+        out = [b"xref\n0 %d\n0000000000 65535 f \n" % size]
+        out.extend(b"%010d 00000 n \n" % self.offsets.get(n, 0) for n in range(1, size))
+        digest = self._md5.hexdigest().encode()
+        out.append(
+            b"trailer\n<< /Size %d /Root 2 0 R /Info %d 0 R /ID [<%s><%s>] >>\nstartxref\n%d\n%%%%EOF\n"
+            % (size, info, digest, digest, xref)
+        )
+        self._write(b"".join(out))
+
+
+# Standard-14 faces per family: (regular, bold, italic, bold italic).
+_LITE_FAMILIES = {
+    "Helvetica": ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Helvetica-BoldOblique"),
+    "Times": ("Times-Roman", "Times-Bold", "Times-Italic", "Times-BoldItalic"),
+    "Courier": ("Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique"),
+}
+
+
+def _lite_face(font_name: str, bold: bool, italic: bool) -> str:
+    """Standard-14 face for a mapped font name plus bold/italic flags."""
+    family = "Times" if font_name.startswith("Times") else "Courier" if font_name.startswith("Courier") else "Helvetica"
+    bold = bold or "Bold" in font_name
+    italic = italic or "Italic" in font_name or "Oblique" in font_name
+    return _LITE_FAMILIES[family][(1 if bold else 0) + (2 if italic else 0)]
+
+
+def _lite_metrics_key(face: str) -> str:
+    return face.replace("-Oblique", "").replace("-BoldOblique", "-Bold") if face.startswith("Helvetica") else face
+
+
+_LITE_WIDTH_TABLES: dict[str, list[int]] = {}
+
+
+def _lite_width_table(face: str) -> list[int]:
+    """Glyph widths (1/1000 em) of a standard-14 face indexed by WinAnsi byte."""
+    table = _LITE_WIDTH_TABLES.get(face)
+    if table is None:
+        first = pdf_fonts.FIRST_CHAR
+        if face.startswith("Courier"):
+            widths: tuple[int, ...] = (600,) * (256 - first)
+        else:
+            widths = pdf_fonts.WIDTHS[_lite_metrics_key(face)]
+        table = _LITE_WIDTH_TABLES[face] = [0] * first + list(widths)
+    return table
+
+
+def _lite_string_width(data: bytes, face: str, size: float) -> float:
+    """Width in points of WinAnsi-encoded `data` set in a standard-14 `face`."""
+    return sum(map(_lite_width_table(face).__getitem__, data)) * size / 1000.0
+
+
+def _lite_ascent_descent(face: str) -> tuple[float, float]:
+    key = "Courier" if face.startswith("Courier") else _lite_metrics_key(face)
+    ascent, descent = pdf_fonts.ASCENT_DESCENT[key]
+    return ascent / 1000.0, descent / 1000.0
+
+
+def _pdf_string(data: bytes) -> bytes:
+    return b"(" + data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)").replace(b"\r", b"\\r") + b")"
+
+
+def _pdf_num(value: float) -> bytes:
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return (text if text not in ("", "-0") else "0").encode()
+
+
+@dataclass
+class _LiteSpan:
+    """A word (or space) of a laid-out line, with its resolved style."""
+
+    text: bytes
+    width: float
+    face: str
+    size: float
+    color: tuple[float, float, float] | None = None
+    underline: bool = False
+    strike: bool = False
+    rise: float = 0.0
+    link: str | None = None
+
+
+@dataclass
+class _LiteLine:
+    spans: list[_LiteSpan]
+    width: float
+    ascent: float
+    height: float
+
+
+@dataclass
+class _LiteBlock:
+    """A laid-out block (paragraph, image, icon row or table row) ready to draw.
+
+    `draw(renderer, x, top)` emits the block with its top-left corner at (x, top);
+    `split(height)`, when set, returns the part that fits in `height` and the rest.
+    """
+
+    height: float
+    draw: Callable[["_LiteRenderer", float, float], None]
+    space_after: float = 0.0
+    width: float = 0.0
+    lines: list[_LiteLine] = field(default_factory=list)
+    split: Callable[[float], "tuple[_LiteBlock, _LiteBlock] | None"] | None = None
+
+
+def _lite_lines_block(lines: list[_LiteLine]) -> _LiteBlock:
+    """Block drawing `lines` top to bottom; it splits between lines."""
+
+    def draw(r: "_LiteRenderer", x: float, top: float) -> None:
+        y = top
+        for line in lines:
+            r._draw_line(line, x, y - line.ascent)
+            y -= line.height
+
+    def split(height: float) -> tuple[_LiteBlock, _LiteBlock] | None:
+        used = 0.0
+        for n, line in enumerate(lines):
+            if used + line.height > height:
+                break
+            used += line.height
+        else:
+            return None
+        if n == 0:
+            return None
+        return _lite_lines_block(lines[:n]), _lite_lines_block(lines[n:])
+
+    return _LiteBlock(height=sum(line.height for line in lines), draw=draw, lines=lines, split=split)
+
+
+def _lite_span_style(span: _LiteSpan) -> tuple:
+    return (span.face, span.size, span.color, span.underline, span.strike, span.rise, span.link)
+
+
+_LINE_BREAKS = re.compile(r"\r\n|[\r\n\x0b]")
+_TOKENS = re.compile(r"\S+|\s+")
+
+
+class _LiteRenderer:
+    """Built-in PDF backend (`PdfExportOptions.backend = "lite"`).
+
+    Lays out pages with the standard-14 fonts and writes each finished PDF page to the
+    output straight away, so only the page being laid out is kept in memory. Covers
+    text with basic styles, hyperlinks, list markers, tag icons, JPEG/PNG images and
+    table grids; ReportLab is not imported.
+    """
+
+    def __init__(self, exporter: "PdfExporter", out: BinaryIO, page_size: tuple[float, float]) -> None:
+        self.exporter = exporter
+        self.options = exporter.options
+        self.writer = _PdfWriter(out)
+        self.page_width, self.page_height = page_size
+        self.frame_left = float(self.options.margin_left)
+        self.frame_width = self.page_width - self.options.margin_left - self.options.margin_right
+        self.available = exporter._available_width()
+        self.bottom = float(self.options.margin_bottom)
+        self.top = self.page_height - self.options.margin_top
+        self.default_face = _lite_face(exporter._map_font_name(self.options.default_font_name), False, False)
+        self.fonts: dict[str, tuple[bytes, int]] = {}
+        self.images: dict[bytes, tuple[bytes, int, int, int] | None] = {}
+        self.pages: list[int] = []
+        self.ops: list[bytes] = []
+        self.page_fonts: dict[bytes, int] = {}
+        self.page_images: dict[bytes, int] = {}
+        self.annots: list[bytes] = []
+        self.y = self.top
+        self.in_page = False
+        self.unencodable: set[str] = set()
+
+    def _encode(self, text: str) -> bytes:
+        """Encode `text` as WinAnsi, remembering the characters that had to be replaced."""
+        try:
+            return text.encode("cp1252")
+        except UnicodeEncodeError:
+            for ch in text:
+                try:
+                    ch.encode("cp1252")
+                except UnicodeEncodeError:
+                    self.unencodable.add(ch)
+            return text.encode("cp1252", errors="replace")
+
+    # -- document and pages ------------------------------------------------------------
+
+    def write(self, pages: list["Page"]) -> None:
+        for page in pages:
+            self._new_page()
+            self._render_page(page)
+        if not self.in_page:
+            self._new_page()
+        self._finish_page()
+        self.writer.close(self.pages)
+        if self.unencodable:
+            sample = "".join(sorted(self.unencodable)[:10])
+            warnings.warn(
+                f"the lite PDF backend only supports Windows-1252 text; {len(self.unencodable)} "
+                f"distinct character(s) were written as '?' ({sample!r}); use the reportlab backend instead",
+                UnicodeWarning,
+                stacklevel=2,
+            )
+
+    def _new_page(self) -> None:
+        if self.in_page:
+            self._finish_page()
+        self.in_page = True
+        self.y = self.top
+
+    def _finish_page(self) -> None:
+        if not self.in_page:
+            return
+        self.in_page = False
+        contents = self.writer.add_stream(b"", b"\n".join(self.ops))
+        annots = [self.writer.add(a) for a in self.annots]
+        resources = b"/ProcSet [ /PDF /Text /ImageB /ImageC /ImageI ]"
+        if self.page_fonts:
+            resources += b" /Font << %s >>" % b" ".join(b"/%s %d 0 R" % kv for kv in self.page_fonts.items())
+        if self.page_images:
+            resources += b" /XObject << %s >>" % b" ".join(b"/%s %d 0 R" % kv for kv in self.page_images.items())
+        body = b"<< /Type /Page /Parent 1 0 R /MediaBox [ 0 0 %s %s ] /Contents %d 0 R /Resources << %s >>" % (
+            _pdf_num(self.page_width),
+            _pdf_num(self.page_height),
+            contents,
+            resources,
+        )
+        if annots:
+            body += b" /Annots [ %s ]" % b" ".join(b"%d 0 R" % a for a in annots)
+        self.pages.append(self.writer.add(body + b" >>"))
+        self.ops = []
+        self.page_fonts = {}
+        self.page_images = {}
+        self.annots = []
+
+    def _place(self, block: _LiteBlock, x: float) -> None:
+        """Draw `block` at the cursor, starting a new page when it does not fit.
+
+        Paragraphs are split between lines; other blocks move to the next page whole.
+        """
+        while self.y - block.height < self.bottom and self.y < self.top:
+            parts = block.split(self.y - self.bottom) if block.split is not None else None
+            if parts is not None:
+                head, rest = parts
+                head.draw(self, x, self.y)
+                rest.space_after = block.space_after
+                block = rest
+            self._new_page()
+        block.draw(self, x, self.y)
+        self.y -= block.height + block.space_after
+
+    def _space(self, height: float) -> None:
+        self.y -= height
+
+    # -- resources -----------------------------------------------------------------------
+
+    def _font(self, face: str) -> bytes:
+        entry = self.fonts.get(face)
+        if entry is None:
+            num = self.writer.add(
+                b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % face.encode()
+            )
+            entry = self.fonts[face] = (b"F%d" % (len(self.fonts) + 1), num)
+        self.page_fonts[entry[0]] = entry[1]
+        return entry[0]
+
+    def _image(self, data: bytes) -> tuple[bytes, int, int] | None:
+        """Resource name and pixel size of an embedded image (written once per content)."""
+        key = hashlib.sha1(data).digest()
+        if key not in self.images:
+            self.images[key] = None
+            embedded = _lite_image_objects(self.writer, data)
+            if embedded is not None:
+                num, w, h = embedded
+                self.images[key] = (b"Im%d" % (len(self.images)), num, w, h)
+        entry = self.images[key]
+        if entry is None:
+            return None
+        self.page_images[entry[0]] = entry[1]
+        return entry[0], entry[2], entry[3]
+
+    # -- content ---------------------------------------------------------------------------
+
+    def _render_page(self, page: "Page") -> None:
+        from .elements import Outline
+
+        if page.title:
+            title_face = _lite_face("Helvetica", True, False)
+            block = self._paragraph(
+                [(page.title, None)],
+                width=self.available,
+                base_size=float(self.options.title_font_size),
+                base_face=title_face,
+            )
+            # The title's own spacing plus the spacer after it, as in the ReportLab layout.
+            block.space_after = 24.0
+            self._place(block, self.frame_left)
+
+        outlines = [ch for ch in page.children if isinstance(ch, Outline)]
+        other = [ch for ch in page.children if not isinstance(ch, Outline)]
+        outlines.sort(key=lambda o: (o.y if o.y is not None else 1e18, o.x if o.x is not None else 1e18))
+        for child in outlines + other:
+            self._render_element(child, indent_level=0, list_state=None, x_offset=0.0, max_width=None)
+
+    def _render_element(self, element, *, indent_level: int, list_state, x_offset: float, max_width: float | None) -> None:
+        from .elements import AttachedFile, Image, Outline, OutlineElement, RichText, Table
+
+        if isinstance(element, Outline):
+            x_frame = max(0.0, float(element.x or 0.0) - float(self.options.margin_left or 0.0))
+            width = element.width
+            if width is not None:
+                width = min(float(width), self.available - x_frame)
+                if width <= 1.0:
+                    width = None
+            state = _ListState()
+            for child in element.children:
+                self._render_outline_element(child, indent_level=0, list_state=state, x_offset=x_frame, max_width=width)
+            self._space(6.0)
+        elif isinstance(element, OutlineElement):
+            self._render_outline_element(
+                element, indent_level=indent_level, list_state=list_state, x_offset=x_offset, max_width=max_width
+            )
+        elif isinstance(element, RichText):
+            self._render_rich_text(
+                element, indent_level=indent_level, x_offset=x_offset, max_width=max_width, tags=getattr(element, "tags", None)
+            )
+        elif isinstance(element, Image):
+            self._render_image(element, max_width=max_width)
+        elif isinstance(element, Table):
+            self._render_table(element, max_width=max_width)
+        elif isinstance(element, AttachedFile):
+            self._render_tag_row(getattr(element, "tags", None))
+            size_kb = element.size / 1024 if element.size else 0
+            block = self._paragraph(
+                [("Attachment:", _BOLD), (f" {element.filename or 'unknown'} ({size_kb:.1f} KB)", None)],
+                width=self.available,
+            )
+            block.space_after = 12.0
+            self._place(block, self.frame_left)
+
+    def _render_outline_element(self, elem, *, indent_level: int, list_state, x_offset: float, max_width: float | None) -> None:
+        from .elements import Image, RichText, Table
+
+        bullet = list_state.next_bullet(elem, indent_level) if list_state is not None else None
+        prefix_tags: list = []
+        if self.options.include_tags and bullet:
+            prefix_tags.extend(getattr(elem, "tags", None) or [])
+            for rt in elem.iter_text():
+                if getattr(rt, "tags", None):
+                    prefix_tags.extend(rt.tags)
+                    break
+
+        prefix_tags = self.exporter._dedupe_tags(prefix_tags)
+        bullet_gap = self._prefix_width(prefix_tags, bullet) + 6.0 if bullet else 0.0
+
+        bullet_used = False
+        for content in elem.contents:
+            if isinstance(content, RichText):
+                if bullet and not bullet_used:
+                    bullet_used = self._render_rich_text(
+                        content,
+                        indent_level=indent_level,
+                        x_offset=x_offset,
+                        max_width=max_width,
+                        tags=prefix_tags,
+                        marker=bullet,
+                        gap=bullet_gap,
+                    )
+                elif bullet:
+                    self._render_rich_text(
+                        content, indent_level=indent_level, x_offset=x_offset, max_width=max_width, gap=bullet_gap
+                    )
+                else:
+                    self._render_rich_text(
+                        content,
+                        indent_level=indent_level,
+                        x_offset=x_offset,
+                        max_width=max_width,
+                        tags=getattr(content, "tags", None),
+                    )
+            elif isinstance(content, Image):
+                self._render_image(content, max_width=max_width)
+            elif isinstance(content, Table):
+                self._render_table(content, max_width=max_width)
+            else:
+                self._render_element(content, indent_level=indent_level, list_state=list_state, x_offset=x_offset, max_width=max_width)
+
+        for child in elem.children:
+            self._render_element(child, indent_level=indent_level + 1, list_state=list_state, x_offset=x_offset, max_width=max_width)
+
+    def _render_rich_text(
+        self,
+        rt: "RichText",
+        *,
+        indent_level: int,
+        x_offset: float,
+        max_width: float | None,
+        tags=None,
+        marker: str | None = None,
+        gap: float | None = None,
+    ) -> bool:
+        """Lay out one paragraph; returns False when it has no visible text.
+
+        `gap` is the room left for the list marker and tag icons (computed from them
+        when not given); `tags` and `marker` are drawn in it before the first line.
+        """
+        if not (rt.text or "").strip():
+            return False
+        tags = self.exporter._dedupe_tags(list(tags or [])) if self.options.include_tags else []
+        if gap is None:
+            gap = self._prefix_width(tags, marker) + 6.0 if (tags or marker) else 0.0
+        left = max(0.0, x_offset) + 20 * indent_level + gap
+        right = self.available if max_width is None else min(self.available, max(0.0, x_offset) + max_width)
+        block = self._paragraph(self._rich_text_pieces(rt), width=max(right - left, 20.0))
+        block.space_after = 6.0
+        if tags or marker:
+            block = self._with_prefix(block, tags, marker, gap)
+        self._place(block, self.frame_left + left)
+        return True
+
+    def _render_image(self, img: "Image", *, max_width: float | None) -> None:
+        if not self.options.include_images:
+            return
+        self._render_tag_row(getattr(img, "tags", None))
+        width = self.available if max_width is None else min(self.available, max_width)
+        block = self._image_block(img, width)
+        block.space_after = 6.0
+        # Images are centred in the frame, as ReportLab's Image flowable does.
+        self._place(block, self.frame_left + max(0.0, (self.frame_width - block.width) / 2.0))
+
+    def _image_block(self, img: "Image", max_width: float) -> _LiteBlock:
+        width, height = img.width, img.height
+        max_height = self.options.image_max_height
+        if width and height:
+            if width > max_width:
+                height, width = height * max_width / width, max_width
+            if max_height and height > max_height:
+                width, height = width * max_height / height, max_height
+            frame_height = self.top - self.bottom
+            if height > frame_height:
+                width, height = width * frame_height / height, frame_height
+
+        data = img.data
+        if data and width and height:
+            target = _target_pixels(width, height, self.options.max_image_dpi)
+            if target is not None:
+                data = _downsample_image(data, target, self.options.jpeg_quality)
+        resource = self._image(data) if data else None
+        if resource is None:
+            label = f"[Image: {img.filename}]" if img.filename else "[Image]"
+            return self._paragraph([(label, None)], width=max_width)
+
+        name, px_w, px_h = resource
+        if not (width and height):
+            width, height = float(px_w), float(px_h)
+            if width > max_width:
+                height, width = height * max_width / width, max_width
+
+        def draw(r: "_LiteRenderer", x: float, top: float) -> None:
+            r.page_images[name] = r.images[hashlib.sha1(data).digest()][1]
+            r.ops.append(
+                b"q %s 0 0 %s %s %s cm /%s Do Q" % (_pdf_num(width), _pdf_num(height), _pdf_num(x), _pdf_num(top - height), name)
+            )
+
+        return _LiteBlock(height=height, draw=draw, width=width)
+
+    def _render_table(self, table: "Table", *, max_width: float | None) -> None:
+        if not table.rows:
+            return
+        self._render_tag_row(table.tags)
+        available = self.available if max_width is None else min(self.available, max_width)
+        widths = [float(w) for w in table.column_widths if w and w > 1.0]
+        if not widths or len(widths) != len(table.column_widths):
+            count = max(1, table.column_count or max(len(row.cells) for row in table.rows))
+            widths = [available / count] * count
+
+        for row in table.rows:
+            cells = []
+            for index, cell in enumerate(row.cells):
+                col_w = widths[index] if index < len(widths) else widths[-1]
+                cells.append((col_w, self._cell_blocks(cell, max(col_w - 8.0, 20.0))))
+            height = max((sum(b.height + b.space_after for b in blocks) for _, blocks in cells), default=0.0) + 8.0
+
+            def draw(r: "_LiteRenderer", x: float, top: float, cells=cells, height=height) -> None:
+                cx = x
+                for col_w, blocks in cells:
+                    y = top - 4.0
+                    for b in blocks:
+                        b.draw(r, cx + 4.0, y)
+                        y -= b.height + b.space_after
+                    if table.borders_visible:
+                        r.ops.append(
+                            b"0 G 0.5 w %s %s %s %s re S"
+                            % (_pdf_num(cx), _pdf_num(top - height), _pdf_num(col_w), _pdf_num(height))
+                        )
+                    cx += col_w
+
+            self._place(_LiteBlock(height=height, draw=draw), self.frame_left)
+        self._space(12.0)
+
+    def _cell_blocks(self, cell, width: float) -> list[_LiteBlock]:
+        from .elements import AttachedFile, Image, OutlineElement, RichText, Table
+
+        blocks: list[_LiteBlock] = []
+
+        def add(elem) -> None:
+            if isinstance(elem, RichText):
+                if (elem.text or "").strip():
+                    tags = self.exporter._dedupe_tags(list(getattr(elem, "tags", None) or [])) if self.options.include_tags else []
+                    prefix = self._prefix_width(tags, None) + 6.0 if tags else 0.0
+                    block = self._paragraph(self._rich_text_pieces(elem), width=max(width - prefix, 20.0))
+                    block.space_after = 6.0
+                    if tags:
+                        block = self._with_prefix(block, tags, None, prefix)
+                    blocks.append(_LiteBlock(block.height, lambda r, x, top, b=block, p=prefix: b.draw(r, x + p, top), 6.0))
+            elif isinstance(elem, Image):
+                if self.options.include_images:
+                    blocks.append(self._image_block(elem, width))
+            elif isinstance(elem, Table):
+                blocks.append(self._paragraph([("[Table]", None)], width=width))
+            elif isinstance(elem, AttachedFile):
+                blocks.append(self._paragraph([(f"[Attachment: {elem.filename or 'unknown'}]", None)], width=width))
+            elif isinstance(elem, OutlineElement):
+                for content in elem.contents:
+                    add(content)
+                for child in elem.children:
+                    add(child)
+
+        for child in cell.children:
+            add(child)
+        if blocks:
+            blocks[-1].space_after = 0.0
+        return blocks
+
+    def _render_tag_row(self, tags) -> None:
+        if not (self.options.include_tags and tags):
+            return
+        tags = self.exporter._dedupe_tags(list(tags))
+        if not tags:
+            return
+        size = float(self.options.tag_icon_size)
+
+        def draw(r: "_LiteRenderer", x: float, top: float) -> None:
+            cx = x
+            for tag in tags:
+                r._draw_tag_icon(tag, cx, top - size - 1.0, size)
+                cx += size + float(self.options.tag_icon_gap)
+
+        self._place(_LiteBlock(height=size + 2.0, draw=draw), self.frame_left)
+
+    # -- text layout -----------------------------------------------------------------------
+
+    def _rich_text_pieces(self, rt: "RichText") -> list[tuple[str, object]]:
+        """(text, TextStyle or None) pieces of a RichText, in order."""
+        text = rt.text or ""
+        pieces: list[tuple[str, object]] = []
+        last = 0
+        for run in rt.runs or []:
+            if run.start > last:
+                pieces.append((text[last : run.start], None))
+            pieces.append((text[run.start : run.end], run.style))
+            last = max(last, run.end)
+        if last < len(text):
+            pieces.append((text[last:], None))
+        return pieces
+
+    def _style(self, style, base_face: str, base_size: float) -> tuple[str, float, tuple[float, float, float] | None, bool, bool, float, str | None]:
+        if style is None:
+            return base_face, base_size, None, False, False, 0.0, None
+        if style is _BOLD:
+            return _lite_face(base_face, True, False), base_size, None, False, False, 0.0, None
+        font = self.exporter._map_font_name(style.font_name) if style.font_name else base_face
+        face = _lite_face(font, bool(style.bold), bool(style.italic))
+        size = float(style.font_size_pt) if style.font_size_pt else base_size
+        rise = 0.0
+        if style.superscript:
+            rise, size = size * 0.33, size * 0.7
+        elif style.subscript:
+            rise, size = -size * 0.15, size * 0.7
+        color = None
+        if style.font_color is not None:
+            c = style.font_color
+            color = ((c & 0xFF) / 255.0, ((c >> 8) & 0xFF) / 255.0, ((c >> 16) & 0xFF) / 255.0)
+        return face, size, color, bool(style.underline), bool(style.strikethrough), rise, style.hyperlink or None
+
+    def _paragraph(
+        self,
+        pieces: list[tuple[str, object]],
+        *,
+        width: float,
+        base_size: float | None = None,
+        base_face: str | None = None,
+    ) -> _LiteBlock:
+        base_size = float(self.options.default_font_size) if base_size is None else base_size
+        base_face = base_face or self.default_face
+        lines: list[_LiteLine] = []
+        current: list[_LiteSpan] = []
+        line_w = 0.0
+
+        def end_line() -> None:
+            nonlocal current, line_w
+            size = max([s.size for s in current] or [base_size])
+            size = max(size, base_size)
+            lines.append(_LiteLine(spans=current, width=line_w, ascent=size, height=size * 1.2))
+            current, line_w = [], 0.0
+
+        def put(data: bytes, w: float, key: tuple) -> None:
+            # Adjacent words in the same style are kept (and drawn) as one string.
+            nonlocal line_w
+            line_w += w
+            if current and _lite_span_style(current[-1]) == key:
+                current[-1].text += data
+                current[-1].width += w
+            else:
+                current.append(_LiteSpan(data, w, *key))
+
+        pending: tuple[bytes, float, tuple] | None = None
+        for text, style in pieces:
+            key = self._style(style, base_face, base_size)
+            face, size = key[0], key[1]
+            table = _lite_width_table(face)
+            scale = size / 1000.0
+            for n, chunk in enumerate(_LINE_BREAKS.split(text)):
+                if n:
+                    end_line()
+                    pending = None
+                for token in _TOKENS.findall(chunk):
+                    data = self._encode(token)
+                    w = sum(map(table.__getitem__, data)) * scale
+                    if token.isspace():
+                        # Spaces are only kept when another word follows on the same line.
+                        if current:
+                            pending = (b" " * len(data), w, key)
+                        continue
+                    space_w = pending[1] if pending is not None else 0.0
+                    if current and line_w + space_w + w > width:
+                        end_line()
+                    elif pending is not None:
+                        put(*pending)
+                    pending = None
+                    while w > width - line_w and len(data) > 1:
+                        # Break words wider than the line by characters.
+                        cut = len(data) - 1
+                        while cut > 1 and _lite_string_width(data[:cut], face, size) > width - line_w:
+                            cut -= 1
+                        put(data[:cut], _lite_string_width(data[:cut], face, size), key)
+                        end_line()
+                        data = data[cut:]
+                        w = _lite_string_width(data, face, size)
+                    put(data, w, key)
+        if current or not lines:
+            end_line()
+
+        return _lite_lines_block(lines)
+
+    def _draw_line(self, line: _LiteLine, x: float, baseline: float) -> None:
+        ops = self.ops
+        cx = x
+        for span in line.spans:
+            y = baseline + span.rise
+            if span.text.strip():
+                font = self._font(span.face)
+                color = span.color or (0.0, 0.0, 0.0)
+                ops.append(
+                    b"BT %s %s %s rg /%s %s Tf %s %s Td %s Tj ET"
+                    % (
+                        _pdf_num(color[0]),
+                        _pdf_num(color[1]),
+                        _pdf_num(color[2]),
+                        font,
+                        _pdf_num(span.size),
+                        _pdf_num(cx),
+                        _pdf_num(y),
+                        _pdf_string(span.text),
+                    )
+                )
+            if span.underline or span.strike:
+                color = span.color or (0.0, 0.0, 0.0)
+                offset = -0.12 * span.size if span.underline else 0.28 * span.size
+                ops.append(
+                    b"%s %s %s RG %s w %s %s m %s %s l S"
+                    % (
+                        _pdf_num(color[0]),
+                        _pdf_num(color[1]),
+                        _pdf_num(color[2]),
+                        _pdf_num(max(0.5, span.size * 0.05)),
+                        _pdf_num(cx),
+                        _pdf_num(y + offset),
+                        _pdf_num(cx + span.width),
+                        _pdf_num(y + offset),
+                    )
+                )
+            if span.link:
+                ascent, descent = _lite_ascent_descent(span.face)
+                self.annots.append(
+                    b"<< /Type /Annot /Subtype /Link /Border [ 0 0 0 ] /Rect [ %s %s %s %s ] /A << /S /URI /URI %s >> >>"
+                    % (
+                        _pdf_num(cx),
+                        _pdf_num(y + descent * span.size),
+                        _pdf_num(cx + span.width),
+                        _pdf_num(y + ascent * span.size),
+                        _pdf_string(span.link.encode("cp1252", errors="replace")),
+                    )
+                )
+            cx += span.width
+
+    # -- list markers and tag icons --------------------------------------------------------
+
+    def _prefix_width(self, tags: list, marker: str | None) -> float:
+        size = float(self.options.tag_icon_size)
+        gap = float(self.options.tag_icon_gap)
+        icon_w = len(tags) * size + max(0, len(tags) - 1) * gap if tags else 0.0
+        marker_w = 0.0
+        if marker:
+            marker_w = _lite_string_width(marker.encode("cp1252", errors="replace"), self.default_face, float(self.options.default_font_size))
+        spacing = 4.0 if (tags and marker) else (3.0 if (tags or marker) else 0.0)
+        return icon_w + spacing + marker_w
+
+    def _with_prefix(self, block: _LiteBlock, tags: list, marker: str | None, gap: float) -> _LiteBlock:
+        """Wrap a paragraph so tag icons and a list marker are drawn `gap` points before its first line."""
+        first = block.lines[0] if block.lines else None
+        font_size = first.ascent if first is not None else float(self.options.default_font_size)
+        marker_size = float(self.options.default_font_size)
+        icon_size = float(self.options.tag_icon_size)
+
+        def draw(r: "_LiteRenderer", x: float, top: float) -> None:
+            block.draw(r, x, top)
+            baseline = top - font_size
+            ascent, descent = _lite_ascent_descent(r.default_face)
+            line_top = baseline + ascent * font_size
+            line_bottom = baseline + descent * font_size
+            icon_y = line_bottom + ((line_top - line_bottom) - icon_size) / 2.0
+            cx = x - gap
+            for tag in tags:
+                r._draw_tag_icon(tag, cx, icon_y, icon_size)
+                cx += icon_size + float(r.options.tag_icon_gap)
+            if marker:
+                if tags:
+                    cx += 4.0
+                data = r._encode(marker)
+                r.ops.append(
+                    b"BT 0 0 0 rg /%s %s Tf %s %s Td %s Tj ET"
+                    % (r._font(r.default_face), _pdf_num(marker_size), _pdf_num(cx), _pdf_num(baseline), _pdf_string(data))
+                )
+
+        def split(height: float) -> tuple[_LiteBlock, _LiteBlock] | None:
+            parts = block.split(height) if block.split is not None else None
+            if parts is None:
+                return None
+            return self._with_prefix(parts[0], tags, marker, gap), parts[1]
+
+        return _LiteBlock(height=block.height, draw=draw, space_after=block.space_after, lines=block.lines, split=split)
+
+    def _draw_tag_icon(self, tag, x: float, y: float, size: float) -> None:
+        """Vector tag icons matching `PdfExporter._draw_tag_icon` (or a custom PNG icon)."""
+        path = self.exporter._resolve_tag_icon_path(tag)
+        if path is not None:
+            try:
+                resource = self._image(path.read_bytes())
+            except OSError:
+                resource = None
+            if resource is not None:
+                self.ops.append(b"q %s 0 0 %s %s %s cm /%s Do Q" % (_pdf_num(size), _pdf_num(size), _pdf_num(x), _pdf_num(y), resource[0]))
+                return
+
+        kind, color_hex = self.exporter._tag_style_for_shape(getattr(tag, "shape", None))
+        rgb = b"%s %s %s" % tuple(_pdf_num(int(color_hex[i : i + 2], 16) / 255.0) for i in (1, 3, 5))
+        n = _pdf_num
+        ops = self.ops
+        ops.append(b"q %s RG %s rg" % (rgb, rgb))
+
+        def box() -> None:
+            ops.append(b"1 g %s %s %s %s re B %s rg" % (n(x + 0.5), n(y + 0.5), n(size - 1.0), n(size - 1.0), rgb))
+
+        if kind == "star":
+            cx, cy = x + size / 2, y + size / 2
+            points = []
+            for i in range(10):
+                a = math.pi / 2 + i * (math.pi / 5)
+                radius = size * (0.48 if i % 2 == 0 else 0.22)
+                points.append((cx + radius * math.cos(a), cy + radius * math.sin(a)))
+            ops.append(
+                b"%s %s m %s h B"
+                % (n(points[0][0]), n(points[0][1]), b" ".join(b"%s %s l" % (n(px), n(py)) for px, py in points[1:]))
+            )
+        elif kind == "todo":
+            box()
+            ops.append(
+                b"%s w %s %s m %s %s l %s %s l S"
+                % (
+                    n(max(1.0, size * 0.12)),
+                    n(x + size * 0.22),
+                    n(y + size * 0.52),
+                    n(x + size * 0.42),
+                    n(y + size * 0.30),
+                    n(x + size * 0.78),
+                    n(y + size * 0.72),
+                )
+            )
+        elif kind == "calendar":
+            box()
+            header = size * 0.26
+            ops.append(b"%s %s %s %s re f" % (n(x + 0.5), n(y + size - header - 0.5), n(size - 1.0), n(header)))
+            ops.append(b"1 g")
+            dot = max(0.8, size * 0.05)
+            ops.append(_pdf_circle(x + size * 0.28, y + size - header / 2, dot) + b" f")
+            ops.append(_pdf_circle(x + size * 0.72, y + size - header / 2, dot) + b" f")
+        elif kind in ("question", "contact"):
+            glyph = b"?" if kind == "question" else b"@"
+            ops.append(b"1 w " + _pdf_circle(x + size / 2, y + size / 2, size * 0.48) + b" S")
+            fsize = max(6.0, size * 0.78)
+            w = _lite_string_width(glyph, "Helvetica-Bold", fsize)
+            ops.append(
+                b"BT /%s %s Tf %s %s Td %s Tj ET"
+                % (self._font("Helvetica-Bold"), n(fsize), n(x + (size - w) / 2), n(y + size * 0.10), _pdf_string(glyph))
+            )
+        elif kind == "music":
+            ops.append(
+                b"%s w %s %s m %s %s l %s %s l S"
+                % (
+                    n(max(1.0, size * 0.10)),
+                    n(x + size * 0.62),
+                    n(y + size * 0.20),
+                    n(x + size * 0.62),
+                    n(y + size * 0.82),
+                    n(x + size * 0.80),
+                    n(y + size * 0.76),
+                )
+            )
+            ops.append(_pdf_circle(x + size * 0.45, y + size * 0.24, size * 0.16) + b" B")
+        else:
+            box()
+        ops.append(b"Q")
+
+
+# Marker style for bold label text in the lite backend.
+_BOLD = object()
+
+
+def _pdf_circle(cx: float, cy: float, r: float) -> bytes:
+    """Path of a circle (four Bezier arcs); the caller appends the paint operator."""
+    k = 0.5523 * r
+    n = _pdf_num
+    return (
+        b"%s %s m %s %s %s %s %s %s c %s %s %s %s %s %s c %s %s %s %s %s %s c %s %s %s %s %s %s c"
+        % (
+            n(cx + r), n(cy),
+            n(cx + r), n(cy + k), n(cx + k), n(cy + r), n(cx), n(cy + r),
+            n(cx - k), n(cy + r), n(cx - r), n(cy + k), n(cx - r), n(cy),
+            n(cx - r), n(cy - k), n(cx - k), n(cy - r), n(cx), n(cy - r),
+            n(cx + k), n(cy - r), n(cx + r), n(cy - k), n(cx + r), n(cy),
+        )
+    )
+
+
+def _lite_image_objects(writer: _PdfWriter, data: bytes) -> tuple[int, int, int] | None:
+    """Write an image XObject for JPEG/PNG `data`; returns (object, width, height) in pixels.
+
+    JPEG data is embedded as-is (DCTDecode). PNG image data is passed through with a PNG
+    predictor when possible; PNGs with alpha get a soft mask (decoded with Pillow when it
+    is installed, by a pure-Python fallback otherwise), and a tRNS chunk becomes a
+    colour-key mask (or a soft mask for partially transparent palette entries). Other
+    formats, and PNGs this writer cannot embed, are converted with Pillow when it is
+    installed, and skipped otherwise.
+    """
+    if data[:2] == b"\xff\xd8":
+        info = _jpeg_info(data)
+        if info is not None:
+            w, h, components = info
+            space = {1: b"/DeviceGray", 4: b"/DeviceCMYK"}.get(components, b"/DeviceRGB")
+            decode = b" /Decode [ 1 0 1 0 1 0 1 0 ]" if components == 4 else b""
+            num = writer.add_stream(
+                b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode%s"
+                % (w, h, space, decode),
+                data,
+                compress=False,
+            )
+            return num, w, h
+    elif data[:8] == b"\x89PNG\r\n\x1a\n":
+        embedded = _png_image_objects(writer, data)
+        if embedded is not None:
+            return embedded
+
+    decoded = _pil_pixels(data)
+    if decoded is None:
+        return None
+    w, h, color, colors, alpha = decoded
+    return _raw_image_objects(writer, w, h, color, colors, alpha), w, h
+
+
+def _pil_pixels(data: bytes) -> tuple[int, int, bytes, int, bytes | None] | None:
+    """(width, height, 8-bit Gray/RGB pixels, colours, alpha) decoded by Pillow; None without it."""
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return None
+    try:
+        im = PILImage.open(io.BytesIO(data))
+        alpha = None
+        if "A" in im.getbands() or "transparency" in im.info:
+            alpha = im.convert("RGBA").getchannel("A").tobytes()
+        colors = 1 if im.mode in ("L", "LA") else 3
+        color = im.convert("L" if colors == 1 else "RGB").tobytes()
+    except Exception:
+        return None
+    return im.width, im.height, color, colors, alpha
+
+
+def _jpeg_info(data: bytes) -> tuple[int, int, int] | None:
+    """(width, height, components) from a JPEG's SOF marker."""
+    i = 2
+    n = len(data)
+    while i + 4 <= n:
+        if data[i] != 0xFF:
+            i += 1
+            continue
+        marker = data[i + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2
+            continue
+        length = int.from_bytes(data[i + 2 : i + 4], "big")
+        if marker in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF) and i + 9 < n:
+            h = int.from_bytes(data[i + 5 : i + 7], "big")
+            w = int.from_bytes(data[i + 7 : i + 9], "big")
+            return w, h, data[i + 9]
+        i += 2 + length
+    return None
+
+
+def _png_image_objects(writer: _PdfWriter, data: bytes) -> tuple[int, int, int] | None:
+    chunks: dict[bytes, list[bytes]] = {}
+    i = 8
+    while i + 8 <= len(data):
+        length = int.from_bytes(data[i : i + 4], "big")
+        kind = data[i + 4 : i + 8]
+        chunks.setdefault(kind, []).append(data[i + 8 : i + 8 + length])
+        i += 12 + length
+        if kind == b"IEND":
+            break
+    if b"IHDR" not in chunks or b"IDAT" not in chunks:
+        return None
+    ihdr = chunks[b"IHDR"][0]
+    w, h = int.from_bytes(ihdr[0:4], "big"), int.from_bytes(ihdr[4:8], "big")
+    depth, color_type, interlace = ihdr[8], ihdr[9], ihdr[12]
+    idat = b"".join(chunks[b"IDAT"])
+    if interlace or depth == 16:
+        return None
+
+    colors = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}.get(color_type)
+    if colors is None:
+        return None
+    header = b"/Type /XObject /Subtype /Image /Width %d /Height %d /BitsPerComponent %d" % (w, h, depth)
+
+    if color_type in (0, 2, 3):
+        trns = chunks.get(b"tRNS", [b""])[0]
+        mask = b""
+        if color_type == 3:
+            palette = chunks.get(b"PLTE", [b""])[0]
+            if len(palette) < 3:
+                return None
+            space = b"[ /Indexed /DeviceRGB %d <%s> ]" % (len(palette) // 3 - 1, palette.hex().encode())
+            if trns.strip(b"\x00\xff"):
+                # Partial transparency needs the per-pixel alpha of each palette index.
+                indices = _png_indices(zlib.decompress(idat), w, h, depth)
+                alpha = indices.translate(trns[:256].ljust(256, b"\xff"))
+                mask = b" /SMask %d 0 R" % writer.add_stream(
+                    b"/Type /XObject /Subtype /Image /Width %d /Height %d /BitsPerComponent 8 /ColorSpace /DeviceGray" % (w, h),
+                    alpha,
+                )
+            elif b"\x00" in trns:
+                mask = b" /Mask [ %s ]" % b" ".join(b"%d %d" % (i, i) for i, a in enumerate(trns) if a == 0)
+        else:
+            space = b"/DeviceGray" if color_type == 0 else b"/DeviceRGB"
+            if len(trns) >= 2 * colors:
+                keys = [int.from_bytes(trns[2 * k : 2 * k + 2], "big") for k in range(colors)]
+                mask = b" /Mask [ %s ]" % b" ".join(b"%d %d" % (v, v) for v in keys)
+        num = writer.add_stream(
+            header
+            + b" /ColorSpace %s /Filter /FlateDecode /DecodeParms << /Predictor 15 /Colors %d /BitsPerComponent %d /Columns %d >>%s"
+            % (space, colors, depth, w, mask),
+            idat,
+            compress=False,
+        )
+        return num, w, h
+
+    # Gray+alpha or RGBA: split colour and alpha, with Pillow's decoder when available.
+    decoded = _pil_pixels(data)
+    if decoded is not None:
+        w, h, color, colors, alpha = decoded
+        return _raw_image_objects(writer, w, h, color, colors, alpha), w, h
+    pixels = _png_unfilter(zlib.decompress(idat), w * colors, h, colors)
+    if colors == 2:
+        color = pixels[0::2]
+    else:
+        color = bytearray(w * h * 3)
+        color[0::3], color[1::3], color[2::3] = pixels[0::4], pixels[1::4], pixels[2::4]
+    return _raw_image_objects(writer, w, h, color, colors - 1, pixels[colors - 1 :: colors]), w, h
+
+
+def _raw_image_objects(
+    writer: _PdfWriter, width: int, height: int, color: bytes | bytearray, colors: int, alpha: bytes | None
+) -> int:
+    """Write 8-bit Gray/RGB pixels (plus an optional alpha soft mask) as an image XObject."""
+    header = b"/Type /XObject /Subtype /Image /Width %d /Height %d /BitsPerComponent 8" % (width, height)
+    entries = header + (b" /ColorSpace /DeviceGray" if colors == 1 else b" /ColorSpace /DeviceRGB")
+    if alpha is not None:
+        entries += b" /SMask %d 0 R" % writer.add_stream(header + b" /ColorSpace /DeviceGray", alpha)
+    return writer.add_stream(entries, color)
+
+
+def _png_indices(raw: bytes, width: int, height: int, depth: int) -> bytes:
+    """One byte per pixel from the decompressed data of a palette PNG."""
+    stride = (width * depth + 7) // 8
+    rows = _png_unfilter(raw, stride, height, 1)
+    if depth == 8:
+        return rows
+    per_byte = 8 // depth
+    low = (1 << depth) - 1
+    table = [bytes((b >> (8 - depth * (k + 1))) & low for k in range(per_byte)) for b in range(256)]
+    return b"".join(b"".join(table[b] for b in rows[r * stride : (r + 1) * stride])[:width] for r in range(height))
+
+
+def _png_unfilter(raw: bytes, stride: int, height: int, bpp: int) -> bytes:
+    """Reverse PNG scanline filters (`stride` bytes per row, `bpp` bytes per pixel, at least 1)."""
+    out = bytearray(stride * height)
+    prev = bytearray(stride)
+    pos = 0
+    for row in range(height):
+        ftype = raw[pos]
+        line = bytearray(raw[pos + 1 : pos + 1 + stride])
+        pos += 1 + stride
+        if ftype == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif ftype == 2:
+            for i in range(stride):
+                line[i] = (line[i] + prev[i]) & 0xFF
+        elif ftype == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif ftype == 4:
+            for i in range(stride):
+                a = line[i - bpp] if i >= bpp else 0
+                b = prev[i]
+                c = prev[i - bpp] if i >= bpp else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                line[i] = (line[i] + pred) & 0xFF
+        out[row * stride : (row + 1) * stride] = line
+        prev = line
+    return bytes(out)
+
+
 def export_pdf(
     document: "Document", 
     output: str | Path | BinaryIO,
-    options: PdfExportOptions | None = None
+    options: PdfExportOptions | None = None,
+    *,
+    workers: int | None = None,
 ) -> None:
     """Export a OneNote document to PDF.
     
@@ -1354,6 +2471,10 @@ def export_pdf(
         document: OneNote document to export.
         output: Output file path or file-like object.
         options: Export options.
+        workers: Number of worker processes. With more than one, each process renders a
+            contiguous range of pages to an intermediate PDF and the parts are merged
+            (see `merge_pdfs`). Pages are laid out independently, so the result matches
+            a single-process export page for page.
         
     Example::
     
@@ -1364,7 +2485,231 @@ def export_pdf(
         export_pdf(doc, "output.pdf")
     """
     exporter = PdfExporter(options)
-    exporter.export(document, output)
+    pages = list(document.pages)
+    if workers is None or workers <= 1 or len(pages) <= 1:
+        exporter.export(document, output)
+        return
+
+    # Every part uses the page size of the whole document. Workers write their parts to
+    # temporary files, which are merged one at a time straight into the output.
+    page_size = exporter._page_size(document)
+    n = min(workers, len(pages))
+    chunk = -(-len(pages) // n)
+    ranges = [pages[i : i + chunk] for i in range(0, len(pages), chunk)]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [str(Path(tmp) / f"part{i}.pdf") for i in range(len(ranges))]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            list(pool.map(_export_page_range, ranges, repeat(exporter.options), repeat(page_size), paths))
+        if isinstance(output, (str, Path)):
+            with open(output, "wb") as f:
+                merge_pdfs(paths, f)
+        else:
+            merge_pdfs(paths, output)
+
+
+def _export_page_range(
+    pages: list["Page"], options: PdfExportOptions, page_size: tuple[float, float], output: str | None = None
+) -> bytes | None:
+    """Worker: render `pages` to an intermediate PDF, written to `output` or returned."""
+    from .document import Document
+
+    if output is not None:
+        PdfExporter(options).export(Document(pages=pages), output, page_size=page_size)
+        return None
+    out = io.BytesIO()
+    PdfExporter(options).export(Document(pages=pages), out, page_size=page_size)
+    return out.getvalue()
+
+
+_OBJ_HEADER_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_REF_RE = re.compile(rb"(\d+)\s+(\d+)\s+R\b")
+_LENGTH_RE = re.compile(rb"/Length\s+(\d+)(\s+\d+\s+R\b)?")
+_STREAM_RE = re.compile(rb"stream\r?\n")
+# Annotations (and anything pointing back at a page through /P) belong to one page.
+_PAGE_OWNED_RE = re.compile(rb"/(?:Type\s*/Annot|P)\b")
+
+# (dictionary, stream data or None) of a PDF object.
+_PdfObject = tuple[bytes, "bytes | None"]
+
+
+def merge_pdfs(parts: Iterable[bytes | str | Path], output: BinaryIO | None = None) -> bytes | None:
+    """Concatenate the pages of several PDFs into one document.
+
+    Made for the intermediate files written by `PdfExporter` (classic cross-reference
+    tables, no object streams). `parts` are PDF bytes or file paths; they are read one
+    at a time and every object is written to `output` as soon as its references are
+    numbered, so only object offsets and content digests are kept across parts. Objects
+    are copied once per distinct content, so fonts and images shared by several parts
+    are stored once; pages, annotations and cycles are never shared. Without `output`
+    the merged PDF is returned.
+    """
+    out = io.BytesIO() if output is None else output
+    writer = _PdfWriter(out)
+    seen: dict[bytes, int] = {}
+    kids: list[int] = []
+    info: int | None = None
+    for index, part in enumerate(parts):
+        data = part if isinstance(part, bytes) else Path(part).read_bytes()
+        part_info = _merge_part(writer, data, seen, kids, with_info=index == 0)
+        if part_info is not None:
+            info = part_info
+    writer.close(kids, info=info)
+    return out.getvalue() if output is None else None
+
+
+def _merge_part(writer: _PdfWriter, data: bytes, seen: dict[bytes, int], kids: list[int], *, with_info: bool) -> int | None:
+    """Copy the pages of one PDF into `writer`; returns the new number of its /Info."""
+    objects, trailer = _parse_pdf(data)
+    tree_nodes: set[int] = set()
+    leaves: list[int] = []
+    _collect_pages(objects, _trailer_ref(trailer, b"Root"), tree_nodes, leaves)
+
+    # Page tree nodes map to the new root; pages get their numbers up front.
+    numbers: dict[int, int] = {num: 1 for num in tree_nodes}
+    pinned = set(leaves)
+    for num in leaves:
+        numbers[num] = writer.reserve()
+    kids.extend(numbers[num] for num in leaves)
+
+    starts = list(leaves)
+    part_info = _trailer_ref(trailer, b"Info") if with_info else None
+    if part_info is not None and part_info in objects:
+        starts.append(part_info)
+
+    # Depth-first, writing each object after everything it references: identical
+    # objects then have identical bodies and collapse to the first copy.
+    visited: set[int] = set(tree_nodes)
+    on_path: set[int] = set()
+    stack = [(num, False) for num in reversed(starts)]
+    while stack:
+        num, done = stack.pop()
+        if done:
+            on_path.discard(num)
+            body, stream = objects[num]
+            body = _sub_refs(body, lambda n: numbers.get(n, 0))
+            if stream is not None:
+                body += b"\nstream\n" + stream + b"\nendstream"
+            if num in pinned or _PAGE_OWNED_RE.search(objects[num][0]):
+                numbers[num] = writer.add(body, num=numbers.get(num))
+                continue
+            key = hashlib.sha256(b"%d %s" % (len(body), body)).digest()
+            if key not in seen:
+                seen[key] = writer.add(body)
+            numbers[num] = seen[key]
+            continue
+        if num not in objects:
+            continue
+        if num in visited:
+            # A back reference: the object cannot wait for its own number.
+            if num in on_path and num not in numbers:
+                numbers[num] = writer.reserve()
+                pinned.add(num)
+            continue
+        visited.add(num)
+        on_path.add(num)
+        stack.append((num, True))
+        refs: list[int] = []
+        _sub_refs(objects[num][0], lambda n: refs.append(n) or n)
+        stack.extend((ref, False) for ref in reversed(refs))
+    return numbers.get(part_info) if part_info is not None else None
+
+
+def _parse_pdf(data: bytes) -> tuple[dict[int, _PdfObject], bytes]:
+    """Objects (by number) and trailer dictionary of a PDF with a classic xref table."""
+    startxref = data.rindex(b"startxref")
+    start = int(data[startxref + len(b"startxref") :].split()[0])
+    trailer_at = data.index(b"trailer", start)
+    tokens = data[start + len(b"xref") : trailer_at].split()
+
+    offsets: dict[int, int] = {}
+    i = 0
+    while i + 1 < len(tokens):
+        first, count = int(tokens[i]), int(tokens[i + 1])
+        i += 2
+        for k in range(count):
+            offset, kind = tokens[i + 3 * k], tokens[i + 3 * k + 2]
+            if kind == b"n":
+                offsets[first + k] = int(offset)
+        i += 3 * count
+
+    objects: dict[int, _PdfObject] = {}
+    for num, offset in offsets.items():
+        m = _OBJ_HEADER_RE.match(data, offset)
+        if m is None:
+            continue
+        body_at = m.end()
+        end = data.index(b"endobj", body_at)
+        stream_m = _STREAM_RE.search(data, body_at, end)
+        if stream_m is None or data[stream_m.start() - 3 : stream_m.start()] == b"end":
+            objects[num] = (data[body_at:end].strip(), None)
+            continue
+        body = data[body_at : stream_m.start()].strip()
+        length_m = _LENGTH_RE.search(body)
+        if length_m is None:
+            raise ValueError(f"PDF stream object {num} has no /Length")
+        length = int(length_m.group(1))
+        if length_m.group(2):
+            # Indirect length: the referenced object holds the integer.
+            ref = offsets[length]
+            length = int(data[_OBJ_HEADER_RE.match(data, ref).end() :].split()[0])
+        objects[num] = (body, data[stream_m.end() : stream_m.end() + length])
+    return objects, data[trailer_at:startxref]
+
+
+def _trailer_ref(trailer: bytes, key: bytes) -> int | None:
+    m = re.search(rb"/" + key + rb"\s+(\d+)\s+\d+\s+R", trailer)
+    return int(m.group(1)) if m else None
+
+
+def _collect_pages(objects: dict[int, _PdfObject], root: int | None, tree_nodes: set[int], leaves: list[int]) -> None:
+    """Collect the page objects of a document in order, and the page tree nodes above them."""
+    if root is None or root not in objects:
+        return
+    m = re.search(rb"/Pages\s+(\d+)\s+\d+\s+R", objects[root][0])
+    stack = [int(m.group(1))] if m else []
+    while stack:
+        num = stack.pop()
+        if num not in objects:
+            continue
+        body = objects[num][0]
+        kids = re.search(rb"/Kids\s*\[([^\]]*)\]", body)
+        if kids is None:
+            leaves.append(num)
+            continue
+        tree_nodes.add(num)
+        stack.extend(reversed([int(k.group(1)) for k in _REF_RE.finditer(kids.group(1))]))
+
+
+def _sub_refs(body: bytes, renumber: Callable[[int], int]) -> bytes:
+    """Rewrite the indirect references of an object dictionary (literal strings are kept)."""
+    out: list[bytes] = []
+    i = 0
+    n = len(body)
+    while i < n:
+        j = body.find(b"(", i)
+        if j < 0:
+            j = n
+        out.append(_REF_RE.sub(lambda m: b"%d %s R" % (renumber(int(m.group(1))), m.group(2)), body[i:j]))
+        if j == n:
+            break
+        # Copy the literal string through its balanced closing parenthesis.
+        depth = 0
+        k = j
+        while k < n:
+            c = body[k]
+            if c == 0x5C:  # backslash escape
+                k += 2
+                continue
+            if c == 0x28:
+                depth += 1
+            elif c == 0x29:
+                depth -= 1
+                if depth == 0:
+                    break
+            k += 1
+        out.append(body[j : k + 1])
+        i = k + 1
+    return b"".join(out)
 
 
 def _prefixed_paragraph_flowable(
@@ -1496,6 +2841,19 @@ def _prefixed_paragraph_flowable(
     return _Impl()
 
 
+def _shared_image_flowable(reader, *, width: float | None, height: float | None):
+    """ReportLab Image flowable drawing an already opened (shared) ImageReader."""
+    from reportlab.platypus import Image as RLImage
+
+    class _Impl(RLImage):
+        def __init__(self) -> None:
+            # Set before RLImage.__init__, which would otherwise open a reader of its own.
+            self._img = reader
+            super().__init__(reader.fp, width=width, height=height)
+
+    return _Impl()
+
+
 def _icon_only_flowable(
     *,
     tags: list["NoteTag"],
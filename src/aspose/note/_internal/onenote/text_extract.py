@@ -0,0 +1,66 @@
+"""Fast plain-text extraction straight from ms_one entities.
+
+Skips everything the public element model carries besides text: no FileDataStore,
+image/attachment payloads, run styles, tags or layout, and no element conversion.
+Pages are parsed one at a time through a PageDirectory, so memory stays bounded by
+the largest page.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+from ..ms_one.entities import structure as ms
+from ..ms_one.entities.parsers import ContentOptions
+from ..ms_one.reader import PageDirectory
+
+_TEXT_ONLY = ContentOptions(
+    load_images=False,
+    load_attachments=False,
+    load_formatting=False,
+    load_tags=False,
+    load_layout=False,
+)
+
+
+def _iter_node_text(node: object) -> Iterator[str]:
+    # Mirrors the reading order of the element model: OutlineElement contents
+    # (stray content under ElementChildNodes first) before nested OutlineElements.
+    if isinstance(node, ms.RichText):
+        if node.text:
+            yield node.text
+    elif isinstance(node, ms.OutlineElement):
+        nested: list[ms.OutlineElement] = []
+        for child in node.children:
+            if isinstance(child, ms.OutlineElement):
+                nested.append(child)
+            else:
+                yield from _iter_node_text(child)
+        for content in node.content_children:
+            yield from _iter_node_text(content)
+        for child in nested:
+            yield from _iter_node_text(child)
+    elif isinstance(node, (ms.Outline, ms.Table, ms.TableRow, ms.TableCell)):
+        for child in node.children:
+            yield from _iter_node_text(child)
+    # Titles are emitted from Page.title; images, files and unknown nodes carry no text.
+
+
+def page_text_lines(page: ms.Page) -> Iterator[str]:
+    """Yield the title and then every non-empty RichText of an ms_one page in reading order."""
+    if page.title:
+        yield page.title
+    for child in page.children:
+        if not isinstance(child, ms.Title):
+            yield from _iter_node_text(child)
+
+
+def iter_page_texts(data: bytes | bytearray | memoryview, *, strict: bool = False) -> Iterator[str]:
+    """Yield the plain text of each page of a .one file, one page at a time.
+
+    Lines within a page (title, paragraphs, table cells) are joined with newlines.
+    """
+    directory = PageDirectory.build(data, strict=strict, options=_TEXT_ONLY)
+    for i in range(len(directory)):
+        for page in directory.load_pages(i):
+            yield "\n".join(page_text_lines(page))
@@ -11,6 +11,7 @@ from .file_node_list import (
     parse_file_node_list_nodes,
     parse_file_node_list_typed_nodes,
     parse_file_node_list_with_raw,
+    scan_file_node_list,
 )
 from .io import BinaryReader
 from .object_space import (
@@ -27,6 +28,7 @@ from .object_space import (
     parse_object_spaces_with_revisions,
 )
 from .object_data import (
+    ColumnarPropertySet,
     DecodedProperty,
     DecodedPropertySet,
     ObjectSpaceObjectPropSet,
@@ -79,8 +81,10 @@ __all__ = [
     "parse_file_node_list_nodes",
     "parse_file_node_list_typed_nodes",
     "parse_file_node_list_with_raw",
+    "scan_file_node_list",
     "parse_transaction_log",
     "ObjectSpaceObjectPropSet",
+    "ColumnarPropertySet",
     "DecodedProperty",
     "DecodedPropertySet",
     "ObjectSpaceObjectStream",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import struct
+from array import array
 from dataclasses import dataclass
 
 from .chunk_refs import FileChunkReference64x32
@@ -218,6 +220,168 @@ class FileNodeListFragment:
         )
 
 
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+
+def _header_from_u32(hdr: int, offset: int) -> FileNodeHeader:
+    # Same bit layout as _parse_file_node_header: [10, 13, 2, 2, 4, 1] from the LSB.
+    return FileNodeHeader(
+        file_node_id=hdr & 0x3FF,
+        size=(hdr >> 10) & 0x1FFF,
+        stp_format=(hdr >> 23) & 0x3,
+        cb_format=(hdr >> 25) & 0x3,
+        base_type=(hdr >> 27) & 0xF,
+        reserved=(hdr >> 31) & 0x1,
+        offset=offset,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FileNodeListFragmentScan:
+    """Fragment-level result of scan_file_node_list (no per-node objects)."""
+
+    fcr: FileChunkReference64x32
+    header: FileNodeListHeader
+    node_count: int
+    found_chunk_terminator: bool
+    next_fragment: FileChunkReference64x32
+
+
+@dataclass(frozen=True, slots=True)
+class FileNodeListScan:
+    """Committed FileNodes of a list as parallel arrays.
+
+    Node i (ChunkTerminatorFND excluded) starts at absolute file offset `offsets[i]`,
+    spans `sizes[i]` bytes (header included) and has FileNodeID `ids[i]`;
+    `headers[i]` is its raw 32-bit FileNode header. No node bytes are copied.
+    """
+
+    list_id: int
+    fragments: tuple[FileNodeListFragmentScan, ...]
+    offsets: array
+    sizes: array
+    ids: array
+    headers: array
+
+    @property
+    def node_count(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def file_nodes(self) -> tuple[FileNodeHeader, ...]:
+        """Materialize FileNodeHeader objects (same values as FileNodeList.file_nodes)."""
+
+        return tuple(_header_from_u32(h, off) for h, off in zip(self.headers, self.offsets))
+
+
+@dataclass(slots=True)
+class _ScanColumns:
+    offsets: array
+    sizes: array
+    ids: array
+    headers: array
+
+    @classmethod
+    def empty(cls) -> "_ScanColumns":
+        return cls(offsets=array("Q"), sizes=array("I"), ids=array("H"), headers=array("I"))
+
+
+def _scan_file_node_list_fragment(
+    buf: memoryview,
+    fcr: FileChunkReference64x32,
+    *,
+    remaining_nodes: int | None,
+    file_size: int,
+    ctx: ParseContext,
+    out: _ScanColumns,
+) -> FileNodeListFragmentScan:
+    """Fast equivalent of FileNodeListFragment.parse: walks node headers in place.
+
+    Applies the same MUST checks and the same zero-header padding heuristic, but only
+    records (offset, size, id, header) of each node into `out`.
+    """
+
+    fcr.validate_in_file(file_size)
+
+    # Minimum: 16 header + 12 nextFragment + 8 footer
+    if fcr.cb < 16 + 12 + 8:
+        raise OneStoreFormatError("FileNodeListFragment too small", offset=fcr.stp)
+    if fcr.stp + fcr.cb > len(buf):
+        raise OneStoreFormatError("FileNodeListFragment out of bounds", offset=fcr.stp)
+
+    start = fcr.stp
+    magic = _U64.unpack_from(buf, start)[0]
+    list_id = _U32.unpack_from(buf, start + 8)[0]
+    fragment_sequence = _U32.unpack_from(buf, start + 12)[0]
+    if magic != FNL_HEADER_MAGIC:
+        raise OneStoreFormatError("Invalid FileNodeListHeader magic", offset=start)
+    if list_id < 0x10:
+        raise OneStoreFormatError("FileNodeListID MUST be >= 0x10", offset=start + 8)
+    header = FileNodeListHeader(magic=magic, list_id=list_id, fragment_sequence=fragment_sequence)
+
+    # Absolute end of the FileNode area (nextFragment follows).
+    nodes_end = start + fcr.cb - (12 + 8)
+
+    offsets, sizes, ids, headers = out.offsets, out.sizes, out.ids, out.headers
+    unpack_u32 = _U32.unpack_from
+    pos = start + 16
+    node_count = 0
+    found_terminator = False
+
+    while pos + 4 <= nodes_end:
+        if remaining_nodes is not None and remaining_nodes <= 0:
+            break
+
+        hdr = unpack_u32(buf, pos)[0]
+        if hdr == 0:
+            # Zero-filled padding before nextFragment (see FileNodeListFragment.parse).
+            break
+
+        fid = hdr & 0x3FF
+        size = (hdr >> 10) & 0x1FFF
+
+        if not hdr >> 31:
+            ctx.warn("FileNode.Reserved bit is not 1", offset=pos)
+        if size < 4:
+            raise OneStoreFormatError("FileNode.Size MUST be >= 4", offset=pos)
+        if pos + size > nodes_end:
+            raise OneStoreFormatError("FileNode exceeds fragment bounds", offset=pos)
+        if (hdr >> 27) & 0xF == 0 and (hdr >> 25) & 0x3 != 0:
+            raise OneStoreFormatError("FileNode.CbFormat MUST be 0 when BaseType==0", offset=pos)
+
+        if fid == CHUNK_TERMINATOR_FND_ID:
+            if size != 4:
+                raise OneStoreFormatError("ChunkTerminatorFND MUST contain no data", offset=pos)
+            found_terminator = True
+            break
+
+        offsets.append(pos)
+        sizes.append(size)
+        ids.append(fid)
+        headers.append(hdr)
+        pos += size
+        node_count += 1
+        if remaining_nodes is not None:
+            remaining_nodes -= 1
+
+    next_fragment = FileChunkReference64x32(
+        stp=_U64.unpack_from(buf, nodes_end)[0],
+        cb=_U32.unpack_from(buf, nodes_end + 8)[0],
+    )
+    footer = _U64.unpack_from(buf, nodes_end + 12)[0]
+    if footer != FNL_FOOTER_MAGIC:
+        raise OneStoreFormatError("Invalid FileNodeListFragment footer", offset=nodes_end + 12)
+
+    return FileNodeListFragmentScan(
+        fcr=fcr,
+        header=header,
+        node_count=node_count,
+        found_chunk_terminator=found_terminator,
+        next_fragment=next_fragment,
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class FileNodeList:
     list_id: int
@@ -234,13 +398,13 @@ class FileNodeListWithRaw:
 
 @dataclass(frozen=True, slots=True)
 class FileNodeListWithNodes:
-    list: FileNodeList
+    list: FileNodeList | FileNodeListScan
     nodes: tuple[FileNode, ...]
 
 
 @dataclass(frozen=True, slots=True)
 class FileNodeListWithTypedNodes:
-    list: FileNodeList
+    list: FileNodeList | FileNodeListScan
     nodes: tuple[TypedFileNode, ...]
 
 
@@ -354,6 +518,118 @@ def parse_file_node_list(
     )
 
 
+def scan_file_node_list(
+    reader: BinaryReader,
+    first_fragment: FileChunkReference64x32,
+    *,
+    last_count_by_list_id: dict[int, int] | None = None,
+    ctx: ParseContext | None = None,
+) -> FileNodeListScan:
+    """Scan a File Node List (2.4) into node (offset, size, id) arrays.
+
+    Same fragment chain walk, committed-count limiting and MUST checks as
+    parse_file_node_list, without building per-node objects or copying node bytes.
+    """
+
+    if ctx is None:
+        ctx = ParseContext(strict=True)
+
+    if reader.bounds.start != 0:
+        raise OneStoreFormatError("FileNodeList must be parsed from file start", offset=reader.bounds.start)
+
+    file_size = reader.bounds.end
+    if ctx.file_size is None:
+        ctx.file_size = file_size
+    else:
+        file_size = ctx.file_size
+
+    first_fragment.validate_in_file(file_size)
+
+    buf = reader.buffer
+    columns = _ScanColumns.empty()
+    fragments: list[FileNodeListFragmentScan] = []
+
+    visited: set[tuple[int, int]] = set()
+
+    current = first_fragment
+    expected_seq = 0
+    list_id: int | None = None
+    remaining_nodes: int | None = None
+
+    for _ in range(4096):
+        key = (current.stp, current.cb)
+        if key in visited:
+            raise OneStoreFormatError("FileNodeList fragment chain contains a loop", offset=current.stp)
+        visited.add(key)
+
+        frag = _scan_file_node_list_fragment(
+            buf,
+            current,
+            remaining_nodes=remaining_nodes,
+            file_size=file_size,
+            ctx=ctx,
+            out=columns,
+        )
+
+        if frag.header.fragment_sequence != expected_seq:
+            raise OneStoreFormatError(
+                "FileNodeListFragment sequence mismatch",
+                offset=frag.fcr.stp,
+            )
+
+        if list_id is None:
+            list_id = frag.header.list_id
+            if last_count_by_list_id is not None and list_id in last_count_by_list_id:
+                remaining_nodes = int(last_count_by_list_id[list_id])
+            else:
+                remaining_nodes = None
+        else:
+            if frag.header.list_id != list_id:
+                raise OneStoreFormatError("FileNodeListID mismatch across fragments", offset=frag.fcr.stp + 8)
+
+        fragments.append(frag)
+
+        if remaining_nodes is not None:
+            remaining_nodes -= frag.node_count
+            if remaining_nodes <= 0:
+                break
+
+        if frag.found_chunk_terminator:
+            if frag.next_fragment.is_nil() or frag.next_fragment.is_zero() or frag.next_fragment.cb == 0:
+                raise OneStoreFormatError(
+                    "ChunkTerminatorFND requires a valid nextFragment",
+                    offset=frag.fcr.stp,
+                )
+            frag.next_fragment.validate_in_file(file_size)
+            current = frag.next_fragment
+            expected_seq += 1
+            continue
+
+        if not frag.next_fragment.is_nil():
+            if frag.next_fragment.is_zero() or frag.next_fragment.cb == 0:
+                break
+            frag.next_fragment.validate_in_file(file_size)
+            current = frag.next_fragment
+            expected_seq += 1
+            continue
+
+        break
+    else:
+        raise OneStoreFormatError("FileNodeList fragment chain is unexpectedly long", offset=first_fragment.stp)
+
+    if list_id is None:
+        raise OneStoreFormatError("FileNodeList has no fragments", offset=first_fragment.stp)
+
+    return FileNodeListScan(
+        list_id=int(list_id),
+        fragments=tuple(fragments),
+        offsets=columns.offsets,
+        sizes=columns.sizes,
+        ids=columns.ids,
+        headers=columns.headers,
+    )
+
+
 def parse_file_node_list_with_raw(
     reader: BinaryReader,
     first_fragment: FileChunkReference64x32,
@@ -486,21 +762,24 @@ def parse_file_node_list_nodes(
     if reader.bounds.start != 0:
         raise OneStoreFormatError("FileNodeList must be parsed from file start", offset=reader.bounds.start)
 
-    # First pass: collect the list structure + node raw bytes.
-    out = parse_file_node_list_with_raw(
+    # First pass: locate committed nodes without copying them.
+    scan = scan_file_node_list(
         reader,
         first_fragment,
         last_count_by_list_id=last_count_by_list_id,
         ctx=ctx,
     )
 
+    # The scan already checked that every node fits its fragment, so one file-wide
+    # reader can be repositioned per node instead of creating a view for each.
+    node_reader = BinaryReader(reader.buffer)
     warn_once: set[int] = set()
     nodes: list[FileNode] = []
-    for rn in out.raw_nodes:
-        node_reader = reader.view(rn.header.offset, rn.header.size)
+    for offset in scan.offsets:
+        node_reader.seek(offset)
         nodes.append(parse_file_node(node_reader, ctx=ctx, warn_unknown_ids=warn_once))
 
-    return FileNodeListWithNodes(list=out.list, nodes=tuple(nodes))
+    return FileNodeListWithNodes(list=scan, nodes=tuple(nodes))
 
 
 def parse_file_node_list_typed_nodes(
@@ -513,7 +792,7 @@ def parse_file_node_list_typed_nodes(
     """Parse a File Node List (2.4) and route FileNodes into known typed structures.
 
     This does not change the existing core parsing behavior; it builds on top of
-    parse_file_node_list_with_raw and parse_file_node.
+    scan_file_node_list and parse_file_node.
 
     Unknown FileNodeIDs produce a warning (once per id) and keep raw bytes.
     """
@@ -524,19 +803,22 @@ def parse_file_node_list_typed_nodes(
     if reader.bounds.start != 0:
         raise OneStoreFormatError("FileNodeList must be parsed from file start", offset=reader.bounds.start)
 
-    out = parse_file_node_list_with_raw(
+    scan = scan_file_node_list(
         reader,
         first_fragment,
         last_count_by_list_id=last_count_by_list_id,
         ctx=ctx,
     )
 
+    buf = reader.buffer
+    node_reader = BinaryReader(buf)
     warn_once: set[int] = set()
     typed_nodes: list[TypedFileNode] = []
-    for rn in out.raw_nodes:
-        node_reader = reader.view(rn.header.offset, rn.header.size)
+    for offset, size in zip(scan.offsets, scan.sizes):
+        node_reader.seek(offset)
         node = parse_file_node(node_reader, ctx=ctx)
         tn = parse_typed_file_node(node, ctx=ctx, warn_unknown_ids=warn_once)
-        typed_nodes.append(TypedFileNode(node=tn.node, typed=tn.typed, raw_bytes=rn.raw_bytes))
+        # raw_bytes is a view into the file buffer; callers copy only if they need to.
+        typed_nodes.append(TypedFileNode(node=tn.node, typed=tn.typed, raw_bytes=buf[offset : offset + size]))
 
-    return FileNodeListWithTypedNodes(list=out.list, nodes=tuple(typed_nodes))
+    return FileNodeListWithTypedNodes(list=scan, nodes=tuple(typed_nodes))
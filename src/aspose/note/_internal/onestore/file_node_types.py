@@ -366,7 +366,7 @@ KnownFileNodeType = (
 class TypedFileNode:
     node: FileNode
     typed: KnownFileNodeType | None
-    raw_bytes: bytes | None = None
+    raw_bytes: bytes | memoryview | None = None
 
 
 FileNodeTypeParser = Callable[[FileNode, ParseContext], KnownFileNodeType]
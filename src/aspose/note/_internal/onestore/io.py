@@ -66,6 +66,12 @@ class BinaryReader:
     def bounds(self) -> Bounds:
         return self._bounds
 
+    @property
+    def buffer(self) -> memoryview:
+        """The whole underlying buffer; offsets into it are absolute."""
+
+        return self._data
+
     def tell(self) -> int:
         return self._pos
 
@@ -95,6 +101,14 @@ class BinaryReader:
         self._pos += n
         return self._data[start : start + n].tobytes()
 
+    def read_view(self, n: int) -> memoryview:
+        """Read n bytes as a zero-copy memoryview into the underlying buffer."""
+
+        self._require(n)
+        start = self._pos
+        self._pos += n
+        return self._data[start : start + n]
+
     def peek_bytes(self, n: int) -> bytes:
         self._require(n)
         return self._data[self._pos : self._pos + n].tobytes()
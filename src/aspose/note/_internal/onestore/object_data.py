@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
 from .common_types import CompactID
 from .errors import OneStoreFormatError
@@ -155,17 +156,144 @@ class DecodedPropertySet:
     rgdata_size: int
     encoded_size: int
 
+    def get(self, property_id_raw: int) -> DecodedProperty | None:
+        """Return the first property with the given raw PropertyID, if any."""
+
+        pid = int(property_id_raw) & 0xFFFFFFFF
+        for p in self.properties:
+            if p.prid.raw == pid:
+                return p
+        return None
+
+
+# Property types whose value is a byte run inside rgData: fixed 1/2/4/8 bytes and
+# prtFourBytesOfLengthFollowedByData (u32 cb prefix, then the data).
+_RGDATA_VALUE_TYPES = frozenset((0x03, 0x04, 0x05, 0x06, 0x07))
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarPropertySet:
+    """Columnar, memory-compact form of a DecodedPropertySet.
+
+    Instead of one DecodedProperty + PropertyID object per property, the set keeps:
+    - `raw_prids`, `rgdata_offsets`, `rgdata_lengths`: parallel array('I') columns
+    - `rg_data`: one buffer holding the byte values at their rgData offsets
+    - `ref_values`: values that do not live in rgData (references, nested sets), by position
+
+    NoData/Bool values are derived from the PropertyID. DecodedProperty objects are
+    materialized on demand (`properties`, `get`), so they are not retained.
+    """
+
+    c_properties: int
+    rgdata_size: int
+    encoded_size: int
+    raw_prids: array = field(repr=False)
+    rgdata_offsets: array = field(repr=False)
+    rgdata_lengths: array = field(repr=False)
+    rg_data: bytes = field(repr=False)
+    ref_values: dict[int, Any] = field(repr=False)
+
+    @classmethod
+    def from_decoded(cls, pset: "DecodedPropertySet | ColumnarPropertySet") -> "ColumnarPropertySet":
+        if isinstance(pset, ColumnarPropertySet):
+            return pset
+
+        raw_prids = array("I")
+        offsets = array("I")
+        lengths = array("I")
+        buf = bytearray(pset.rgdata_size)
+        ref_values: dict[int, Any] = {}
+
+        for i, p in enumerate(pset.properties):
+            raw_prids.append(p.prid.raw)
+            offsets.append(p.rgdata_offset)
+            lengths.append(p.rgdata_length)
+            t = p.prid.prop_type
+            if t in _RGDATA_VALUE_TYPES:
+                # Value bytes go back to where they were in rgData (after cb for 0x07).
+                start = p.rgdata_offset + (4 if t == 0x07 else 0)
+                buf[start : start + len(p.value)] = p.value
+            elif t > 0x02:
+                ref_values[i] = p.value
+
+        return cls(
+            c_properties=pset.c_properties,
+            rgdata_size=pset.rgdata_size,
+            encoded_size=pset.encoded_size,
+            raw_prids=raw_prids,
+            rgdata_offsets=offsets,
+            rgdata_lengths=lengths,
+            rg_data=bytes(buf),
+            ref_values=ref_values,
+        )
+
+    def __len__(self) -> int:
+        return len(self.raw_prids)
+
+    def _value_at(self, i: int, prid: PropertyID) -> Any:
+        t = prid.prop_type
+        if t == 0x01:
+            return None
+        if t == 0x02:
+            return prid.bool_value
+        off = self.rgdata_offsets[i]
+        if t == 0x07:
+            return memoryview(self.rg_data)[off + 4 : off + self.rgdata_lengths[i]]
+        if t in _RGDATA_VALUE_TYPES:
+            return self.rg_data[off : off + self.rgdata_lengths[i]]
+        return self.ref_values.get(i)
+
+    def property_at(self, i: int) -> DecodedProperty:
+        prid = PropertyID.from_u32(self.raw_prids[i])
+        return DecodedProperty(
+            prid=prid,
+            value=self._value_at(i, prid),
+            rgdata_offset=self.rgdata_offsets[i],
+            rgdata_length=self.rgdata_lengths[i],
+        )
+
+    @property
+    def properties(self) -> tuple[DecodedProperty, ...]:
+        """Materialize all properties (in rgPrids order)."""
+
+        return tuple(self.property_at(i) for i in range(len(self.raw_prids)))
+
+    def get(self, property_id_raw: int) -> DecodedProperty | None:
+        """Return the first property with the given raw PropertyID, if any."""
+
+        try:
+            i = self.raw_prids.index(int(property_id_raw) & 0xFFFFFFFF)
+        except ValueError:
+            return None
+        return self.property_at(i)
+
+
+# Maps a CompactID to its resolved form (typically ExtendedGUID via a Global ID Table).
+CompactIdResolver = Callable[[CompactID], Any]
+
 
 @dataclass(slots=True)
 class _RefCursor:
+    """Sequential reader over the OID/OSID/ContextID streams of a prop set.
+
+    When `resolve` is set, values are resolved as they are taken, so decoded
+    reference properties never hold raw CompactIDs.
+    """
+
     oids: tuple[CompactID, ...]
     osids: tuple[CompactID, ...] | None
     context_ids: tuple[CompactID, ...] | None
     i_oid: int = 0
     i_osid: int = 0
     i_ctx: int = 0
+    resolve: CompactIdResolver | None = None
 
-    def take_oid(self, n: int, *, offset: int | None) -> tuple[CompactID, ...]:
+    def _resolved(self, ids: tuple[CompactID, ...]) -> tuple[Any, ...]:
+        if self.resolve is None or not ids:
+            return ids
+        return tuple(map(self.resolve, ids))
+
+    def take_oid(self, n: int, *, offset: int | None) -> tuple[Any, ...]:
         if n < 0:
             raise OneStoreFormatError("Reference count MUST be non-negative", offset=offset)
         end = self.i_oid + n
@@ -173,9 +301,9 @@ class _RefCursor:
             raise OneStoreFormatError("OIDs stream does not contain enough CompactIDs", offset=offset)
         out = self.oids[self.i_oid : end]
         self.i_oid = end
-        return out
+        return self._resolved(out)
 
-    def take_osid(self, n: int, *, offset: int | None) -> tuple[CompactID, ...]:
+    def take_osid(self, n: int, *, offset: int | None) -> tuple[Any, ...]:
         if self.osids is None:
             raise OneStoreFormatError("OSIDs stream is required but not present", offset=offset)
         if n < 0:
@@ -185,9 +313,9 @@ class _RefCursor:
             raise OneStoreFormatError("OSIDs stream does not contain enough CompactIDs", offset=offset)
         out = self.osids[self.i_osid : end]
         self.i_osid = end
-        return out
+        return self._resolved(out)
 
-    def take_context(self, n: int, *, offset: int | None) -> tuple[CompactID, ...]:
+    def take_context(self, n: int, *, offset: int | None) -> tuple[Any, ...]:
         if self.context_ids is None:
             raise OneStoreFormatError("ContextIDs stream is required but not present", offset=offset)
         if n < 0:
@@ -197,7 +325,7 @@ class _RefCursor:
             raise OneStoreFormatError("ContextIDs stream does not contain enough CompactIDs", offset=offset)
         out = self.context_ids[self.i_ctx : end]
         self.i_ctx = end
-        return out
+        return self._resolved(out)
 
 
 def _decode_property_set_from_reader(
@@ -241,107 +369,176 @@ def _decode_property_set_from_reader(
     )
 
 
-def _decode_one_property(
-    prid: PropertyID,
-    reader: BinaryReader,
-    cursor: _RefCursor,
-    *,
-    rgdata_start: int,
-    ctx: ParseContext,
+def _decode_no_data(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
 ) -> DecodedProperty:
-    """Decode a single property value from rgData and/or reference streams."""
-
-    t = int(prid.prop_type)
-    rg_off = int(reader.tell() - rgdata_start)
-
     # 0x1: NoData
-    if t == 0x01:
-        return DecodedProperty(prid=prid, value=None, rgdata_offset=rg_off, rgdata_length=0)
+    return DecodedProperty(prid=prid, value=None, rgdata_offset=rg_off, rgdata_length=0)
+
 
+def _decode_bool(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
     # 0x2: Bool (value in boolValue bit)
-    if t == 0x02:
-        return DecodedProperty(prid=prid, value=bool(prid.bool_value), rgdata_offset=rg_off, rgdata_length=0)
+    return DecodedProperty(prid=prid, value=bool(prid.bool_value), rgdata_offset=rg_off, rgdata_length=0)
+
+
+def _fixed_decoder(n: int):
+    """Build a decoder for fixed-size rgData values (0x3..0x6: 1/2/4/8 bytes).
 
-    # Fixed-size values in rgData
-    fixed_sizes = {0x03: 1, 0x04: 2, 0x05: 4, 0x06: 8}
-    if t in fixed_sizes:
-        n = fixed_sizes[t]
+    Values stay raw little-endian bytes: the same widths carry integers and floats,
+    and only the consumer knows which (see ms_one.property_access.get_u16/get_u32).
+    """
+
+    def _decode_fixed(
+        prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+    ) -> DecodedProperty:
         if reader.remaining() < n:
             raise OneStoreFormatError("PropertySet rgData fixed-size value exceeds available data", offset=reader.tell())
-        raw = reader.read_bytes(n)
-        return DecodedProperty(prid=prid, value=bytes(raw), rgdata_offset=rg_off, rgdata_length=n)
+        return DecodedProperty(prid=prid, value=reader.read_bytes(n), rgdata_offset=rg_off, rgdata_length=n)
+
+    return _decode_fixed
 
-    # Variable-size container
-    if t == 0x07:
-        start = reader.tell()
-        box = PrtFourBytesOfLengthFollowedByData.parse(reader, ctx=ctx)
-        length = int(reader.tell() - start)
-        return DecodedProperty(prid=prid, value=bytes(box.data), rgdata_offset=rg_off, rgdata_length=length)
-
-    # Reference types: value(s) come from the corresponding streams.
-    if t == 0x08:  # OID
-        (oid,) = cursor.take_oid(1, offset=reader.tell())
-        return DecodedProperty(prid=prid, value=oid, rgdata_offset=rg_off, rgdata_length=0)
-    if t == 0x09:  # OID array (count in rgData as u32)
-        if reader.remaining() < 4:
-            raise OneStoreFormatError("PropertySet missing OID array length", offset=reader.tell())
-        count = int(reader.read_u32())
-        oids = cursor.take_oid(count, offset=reader.tell() - 4)
-        return DecodedProperty(prid=prid, value=tuple(oids), rgdata_offset=rg_off, rgdata_length=4)
-
-    if t == 0x0A:  # OSID
-        (osid,) = cursor.take_osid(1, offset=reader.tell())
-        return DecodedProperty(prid=prid, value=osid, rgdata_offset=rg_off, rgdata_length=0)
-    if t == 0x0B:  # OSID array
-        if reader.remaining() < 4:
-            raise OneStoreFormatError("PropertySet missing OSID array length", offset=reader.tell())
-        count = int(reader.read_u32())
-        osids = cursor.take_osid(count, offset=reader.tell() - 4)
-        return DecodedProperty(prid=prid, value=tuple(osids), rgdata_offset=rg_off, rgdata_length=4)
-
-    if t == 0x0C:  # ContextID
-        (cid,) = cursor.take_context(1, offset=reader.tell())
-        return DecodedProperty(prid=prid, value=cid, rgdata_offset=rg_off, rgdata_length=0)
-    if t == 0x0D:  # ContextID array
-        if reader.remaining() < 4:
-            raise OneStoreFormatError("PropertySet missing ContextID array length", offset=reader.tell())
-        count = int(reader.read_u32())
-        cids = cursor.take_context(count, offset=reader.tell() - 4)
-        return DecodedProperty(prid=prid, value=tuple(cids), rgdata_offset=rg_off, rgdata_length=4)
 
+def _decode_four_bytes_of_length(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    # 0x7: prtFourBytesOfLengthFollowedByData. The payload is returned as a memoryview
+    # into the prop set's rgData, so large blobs (pictures, files) are never copied here.
+    start = reader.tell()
+    cb = int(reader.read_u32())
+    if cb >= 0x40000000:
+        msg = "prtFourBytesOfLengthFollowedByData.cb MUST be < 0x40000000"
+        if ctx.strict:
+            raise OneStoreFormatError(msg, offset=start)
+        ctx.warn(msg, offset=start)
+    if reader.remaining() < cb:
+        raise OneStoreFormatError("prtFourBytesOfLengthFollowedByData exceeds available data", offset=start)
+    data = reader.read_view(cb)
+    return DecodedProperty(prid=prid, value=data, rgdata_offset=rg_off, rgdata_length=4 + cb)
+
+
+def _decode_oid(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    (oid,) = cursor.take_oid(1, offset=reader.tell())
+    return DecodedProperty(prid=prid, value=oid, rgdata_offset=rg_off, rgdata_length=0)
+
+
+def _decode_oid_array(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    # Count in rgData as u32.
+    if reader.remaining() < 4:
+        raise OneStoreFormatError("PropertySet missing OID array length", offset=reader.tell())
+    count = int(reader.read_u32())
+    oids = cursor.take_oid(count, offset=reader.tell() - 4)
+    return DecodedProperty(prid=prid, value=oids, rgdata_offset=rg_off, rgdata_length=4)
+
+
+def _decode_osid(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    (osid,) = cursor.take_osid(1, offset=reader.tell())
+    return DecodedProperty(prid=prid, value=osid, rgdata_offset=rg_off, rgdata_length=0)
+
+
+def _decode_osid_array(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    if reader.remaining() < 4:
+        raise OneStoreFormatError("PropertySet missing OSID array length", offset=reader.tell())
+    count = int(reader.read_u32())
+    osids = cursor.take_osid(count, offset=reader.tell() - 4)
+    return DecodedProperty(prid=prid, value=osids, rgdata_offset=rg_off, rgdata_length=4)
+
+
+def _decode_context_id(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    (cid,) = cursor.take_context(1, offset=reader.tell())
+    return DecodedProperty(prid=prid, value=cid, rgdata_offset=rg_off, rgdata_length=0)
+
+
+def _decode_context_id_array(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    if reader.remaining() < 4:
+        raise OneStoreFormatError("PropertySet missing ContextID array length", offset=reader.tell())
+    count = int(reader.read_u32())
+    cids = cursor.take_context(count, offset=reader.tell() - 4)
+    return DecodedProperty(prid=prid, value=cids, rgdata_offset=rg_off, rgdata_length=4)
+
+
+def _decode_array_of_property_values(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
     # prtArrayOfPropertyValues (currently: array of nested PropertySet)
-    if t == 0x10:
-        start = reader.tell()
-        if reader.remaining() < 4:
-            raise OneStoreFormatError("prtArrayOfPropertyValues missing cProperties", offset=reader.tell())
-        c = int(reader.read_u32())
-        if c == 0:
-            return DecodedProperty(prid=prid, value=tuple(), rgdata_offset=rg_off, rgdata_length=4)
+    start = reader.tell()
+    if reader.remaining() < 4:
+        raise OneStoreFormatError("prtArrayOfPropertyValues missing cProperties", offset=reader.tell())
+    c = int(reader.read_u32())
+    if c == 0:
+        return DecodedProperty(prid=prid, value=tuple(), rgdata_offset=rg_off, rgdata_length=4)
 
-        if reader.remaining() < 4:
-            raise OneStoreFormatError("prtArrayOfPropertyValues missing prid", offset=reader.tell())
-        elem_prid = PropertyID.parse(reader)
-        if elem_prid.prop_type != 0x11:
-            msg = "prtArrayOfPropertyValues.prid.type MUST be 0x11 (PropertySet)"
-            if ctx.strict:
-                raise OneStoreFormatError(msg, offset=start)
-            ctx.warn(msg, offset=start)
+    if reader.remaining() < 4:
+        raise OneStoreFormatError("prtArrayOfPropertyValues missing prid", offset=reader.tell())
+    elem_prid = PropertyID.parse(reader)
+    if elem_prid.prop_type != 0x11:
+        msg = "prtArrayOfPropertyValues.prid.type MUST be 0x11 (PropertySet)"
+        if ctx.strict:
+            raise OneStoreFormatError(msg, offset=start)
+        ctx.warn(msg, offset=start)
 
-        items: list[DecodedPropertySet] = []
-        for _ in range(c):
-            items.append(_decode_property_set_from_reader(reader, cursor, ctx=ctx))
+    items = tuple(_decode_property_set_from_reader(reader, cursor, ctx=ctx) for _ in range(c))
 
-        length = int(reader.tell() - start)
-        return DecodedProperty(prid=prid, value=tuple(items), rgdata_offset=rg_off, rgdata_length=length)
+    length = int(reader.tell() - start)
+    return DecodedProperty(prid=prid, value=items, rgdata_offset=rg_off, rgdata_length=length)
 
-    # Nested PropertySet
-    if t == 0x11:
-        start = reader.tell()
-        nested = _decode_property_set_from_reader(reader, cursor, ctx=ctx)
-        length = int(reader.tell() - start)
-        return DecodedProperty(prid=prid, value=nested, rgdata_offset=rg_off, rgdata_length=length)
 
-    raise OneStoreFormatError(f"Unsupported PropertyID.type 0x{t:02X}", offset=reader.tell())
+def _decode_nested_property_set(
+    prid: PropertyID, reader: BinaryReader, cursor: _RefCursor, rg_off: int, ctx: ParseContext
+) -> DecodedProperty:
+    start = reader.tell()
+    nested = _decode_property_set_from_reader(reader, cursor, ctx=ctx)
+    length = int(reader.tell() - start)
+    return DecodedProperty(prid=prid, value=nested, rgdata_offset=rg_off, rgdata_length=length)
+
+
+# PropertyID.type -> value decoder. Built once at import time.
+_PROPERTY_DECODERS = {
+    0x01: _decode_no_data,
+    0x02: _decode_bool,
+    0x03: _fixed_decoder(1),
+    0x04: _fixed_decoder(2),
+    0x05: _fixed_decoder(4),
+    0x06: _fixed_decoder(8),
+    0x07: _decode_four_bytes_of_length,
+    0x08: _decode_oid,
+    0x09: _decode_oid_array,
+    0x0A: _decode_osid,
+    0x0B: _decode_osid_array,
+    0x0C: _decode_context_id,
+    0x0D: _decode_context_id_array,
+    0x10: _decode_array_of_property_values,
+    0x11: _decode_nested_property_set,
+}
+
+
+def _decode_one_property(
+    prid: PropertyID,
+    reader: BinaryReader,
+    cursor: _RefCursor,
+    *,
+    rgdata_start: int,
+    ctx: ParseContext,
+) -> DecodedProperty:
+    """Decode a single property value from rgData and/or reference streams."""
+
+    decoder = _PROPERTY_DECODERS.get(prid.prop_type)
+    if decoder is None:
+        raise OneStoreFormatError(f"Unsupported PropertyID.type 0x{int(prid.prop_type):02X}", offset=reader.tell())
+    return decoder(prid, reader, cursor, reader.tell() - rgdata_start, ctx)
 
 
 def decode_property_set(
@@ -351,15 +548,17 @@ def decode_property_set(
     osids: tuple[CompactID, ...] | None,
     context_ids: tuple[CompactID, ...] | None,
     ctx: ParseContext,
+    resolve: CompactIdResolver | None = None,
 ) -> DecodedPropertySet:
     """Decode a structurally parsed PropertySet (Step 12) into typed values (Step 13).
 
-    Reference values are returned as CompactID(s) extracted from the corresponding streams.
-    No GUID resolution is done at this layer.
+    Reference values are returned as CompactID(s) extracted from the corresponding streams,
+    unless `resolve` is provided: then each OID/OSID/ContextID is passed through it as it is
+    taken from its stream (including references inside nested property sets).
     """
 
     r = BinaryReader(prop_set.rg_data)
-    cursor = _RefCursor(oids=oids, osids=osids, context_ids=context_ids)
+    cursor = _RefCursor(oids=oids, osids=osids, context_ids=context_ids, resolve=resolve)
 
     props: list[DecodedProperty] = []
     rgdata_start = r.tell()
@@ -448,7 +647,12 @@ class ObjectSpaceObjectPropSet:
             padding=b"",
         )
 
-    def decode_property_set(self, *, ctx: ParseContext) -> DecodedPropertySet:
+    def decode_property_set(
+        self,
+        *,
+        ctx: ParseContext,
+        resolve: CompactIdResolver | None = None,
+    ) -> DecodedPropertySet:
         """Decode the embedded PropertySet using this prop set's reference streams."""
 
         return decode_property_set(
@@ -457,6 +661,7 @@ class ObjectSpaceObjectPropSet:
             osids=None if self.osids is None else self.osids.body,
             context_ids=None if self.context_ids is None else self.context_ids.body,
             ctx=ctx,
+            resolve=resolve,
         )
 
 
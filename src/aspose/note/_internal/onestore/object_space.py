@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Collection, Iterable, Mapping
 
 from .common_types import CompactID, ExtendedGUID
 from .chunk_refs import FileChunkReference64x32, FileNodeChunkReference
@@ -109,6 +110,13 @@ class GlobalIdTableSequenceSummary:
     ops: tuple[GlobalIdTableEntryFNDX | GlobalIdTableEntry2FNDX | GlobalIdTableEntry3FNDX, ...]
 
 
+# Global ID Tables are immutable once built, so revisions that do not redefine the
+# table share their dependency's mapping object instead of holding a copy.
+GidTable = Mapping[int, bytes]
+
+_EMPTY_GID_TABLE: GidTable = MappingProxyType({})
+
+
 @dataclass(frozen=True, slots=True)
 class RevisionResolvedIdsSummary:
     """Step 11 output: resolved IDs without changing existing Step 10 models."""
@@ -122,6 +130,9 @@ class RevisionResolvedIdsSummary:
     resolved_root_objects: tuple[tuple[int, ExtendedGUID], ...]
     # All object IDs encountered in changes (group lists + inline) resolved to ExtendedGUID.
     resolved_change_oids: tuple[ExtendedGUID, ...]
+    # Same table as effective_gid_table as a read-only mapping. Shared (not copied) with the
+    # dependency revision when this revision does not define its own table.
+    gid_table: GidTable = field(default_factory=lambda: _EMPTY_GID_TABLE, compare=False, repr=False)
 
 
 @dataclass(frozen=True, slots=True)
@@ -160,6 +171,44 @@ class OneStoreObjectSpacesWithRevisions:
     object_spaces: tuple[ObjectSpaceRevisionsSummary, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class OneStoreFileBootstrap:
+    """File-level structures every object space lookup starts from.
+
+    Parsed once by parse_file_bootstrap() and passed to the Step 10/11 helpers by callers
+    that parse object spaces of the same file repeatedly (e.g. loading pages on demand).
+    """
+
+    header: Header
+    last_count_by_list_id: dict[int, int]
+    manifests: RootFileNodeListManifests
+
+
+def parse_file_bootstrap(
+    data: bytes | bytearray | memoryview,
+    *,
+    ctx: ParseContext | None = None,
+) -> OneStoreFileBootstrap:
+    """Parse the header, the transaction log and the root file node list manifests."""
+
+    if ctx is None:
+        ctx = ParseContext(strict=True)
+
+    header = Header.parse(BinaryReader(data), ctx=ctx)
+    last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
+    root_typed = parse_file_node_list_typed_nodes(
+        BinaryReader(data),
+        header.fcr_file_node_list_root,
+        last_count_by_list_id=last_count_by_list_id,
+        ctx=ctx,
+    )
+    return OneStoreFileBootstrap(
+        header=header,
+        last_count_by_list_id=last_count_by_list_id,
+        manifests=build_root_file_node_list_manifests(root_typed.nodes, ctx=ctx),
+    )
+
+
 def _as_fcr64x32(ref: FileNodeChunkReference, *, offset: int | None = None) -> FileChunkReference64x32:
     # FileNodeChunkReference can be encoded with scaled formats; the parser already
     # expands to absolute stp/cb.
@@ -631,7 +680,7 @@ def _resolve_oids_in_object_group_list(
     data: bytes | bytearray | memoryview,
     ref: FileNodeChunkReference,
     *,
-    initial_table: dict[int, bytes] | None,
+    initial_table: GidTable | None,
     last_count_by_list_id: dict[int, int],
     ctx: ParseContext,
 ) -> tuple[ExtendedGUID, ...]:
@@ -655,7 +704,7 @@ def _resolve_oids_in_object_group_list(
     if not group_list.nodes:
         return ()
 
-    current_table: dict[int, bytes] | None = initial_table
+    current_table: GidTable | None = initial_table
     resolved: list[ExtendedGUID] = []
 
     i = 0
@@ -970,13 +1019,13 @@ def _parse_revision_manifest_content(
     )
 
 
-def _sorted_gid_table_items(table: dict[int, bytes]) -> tuple[tuple[int, bytes], ...]:
+def _sorted_gid_table_items(table: GidTable) -> tuple[tuple[int, bytes], ...]:
     return tuple(sorted(((int(k), bytes(v)) for k, v in table.items()), key=lambda kv: kv[0]))
 
 
 def _resolve_compact_id_to_extended_guid(
     oid: CompactID,
-    table: dict[int, bytes] | None,
+    table: GidTable | None,
     *,
     ctx: ParseContext,
     offset: int | None,
@@ -1002,14 +1051,14 @@ def _resolve_compact_id_to_extended_guid(
 def _build_gid_table_from_sequence(
     seq: GlobalIdTableSequenceSummary,
     *,
-    dependency: dict[int, bytes] | None,
+    dependency: GidTable | None,
     ctx: ParseContext,
     offset: int | None,
 ) -> dict[int, bytes]:
     """Build a new table from a single global id table sequence.
 
     The table is defined by the sequence entries. Operations 0x025/0x026 pull
-    entries from the dependency table.
+    entries from the dependency table (the GUID bytes objects are shared, not copied).
     """
 
     table: dict[int, bytes] = {}
@@ -1125,30 +1174,52 @@ def parse_object_spaces_with_resolved_ids(
     data: bytes | bytearray | memoryview,
     *,
     ctx: ParseContext | None = None,
+    root_only: bool = False,
+    gosids: Collection[ExtendedGUID] | None = None,
+    bootstrap: OneStoreFileBootstrap | None = None,
 ) -> OneStoreObjectSpacesWithResolvedIds:
     """Step 11 helper: builds effective Global ID Tables and resolves CompactIDs.
 
     This does not modify the Step 10 output dataclasses.
+
+    With `root_only` or `gosids`, only the selected object spaces are processed (see
+    parse_object_spaces_with_revisions). `bootstrap` (see parse_file_bootstrap) skips
+    re-parsing the header and transaction log.
     """
 
     if ctx is None:
         ctx = ParseContext(strict=True)
+    if bootstrap is None:
+        bootstrap = parse_file_bootstrap(data, ctx=ctx)
 
-    # We need last_count_by_list_id for re-parsing referenced object group lists.
-    header = Header.parse(BinaryReader(data), ctx=ctx)
-    last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
+    step10 = parse_object_spaces_with_revisions(data, ctx=ctx, root_only=root_only, gosids=gosids, bootstrap=bootstrap)
+    return _resolve_object_space_ids(data, step10, ctx=ctx, bootstrap=bootstrap)
+
+
+def _resolve_object_space_ids(
+    data: bytes | bytearray | memoryview,
+    step10: OneStoreObjectSpacesWithRevisions,
+    *,
+    ctx: ParseContext,
+    bootstrap: OneStoreFileBootstrap,
+) -> OneStoreObjectSpacesWithResolvedIds:
+    # Step 11 over Step 10 output the caller already holds (the reader needs both, and
+    # parsing every revision manifest twice would double the cost of opening a file).
 
-    step10 = parse_object_spaces_with_revisions(data, ctx=ctx)
+    # We need last_count_by_list_id for re-parsing referenced object group lists.
+    last_count_by_list_id = bootstrap.last_count_by_list_id
 
     out_object_spaces: list[ObjectSpaceResolvedIdsSummary] = []
 
     for os in step10.object_spaces:
-        # rid -> effective table at end of the manifest
-        tables_by_rid: dict[ExtendedGUID, dict[int, bytes]] = {}
+        # rid -> effective table at end of the manifest (shared with the dependency when unchanged)
+        tables_by_rid: dict[ExtendedGUID, GidTable] = {}
+        # id(table) -> sorted items, so revisions sharing a table also share its tuple form.
+        items_by_table_id: dict[int, tuple[tuple[int, bytes], ...]] = {}
         resolved_revs: list[RevisionResolvedIdsSummary] = []
 
         for rev in os.revisions:
-            dep_table: dict[int, bytes] | None = None
+            dep_table: GidTable | None = None
             if not rev.rid_dependent.is_zero():
                 dep_table = tables_by_rid.get(rev.rid_dependent)
                 if dep_table is None:
@@ -1163,16 +1234,18 @@ def parse_object_spaces_with_resolved_ids(
 
             table_after = table_before
             if rev.manifest is not None and rev.manifest.global_id_table is not None:
-                table_after = _build_gid_table_from_sequence(
-                    rev.manifest.global_id_table,
-                    dependency=dep_table,
-                    ctx=ctx,
-                    offset=None,
+                table_after = MappingProxyType(
+                    _build_gid_table_from_sequence(
+                        rev.manifest.global_id_table,
+                        dependency=dep_table,
+                        ctx=ctx,
+                        offset=None,
+                    )
                 )
 
             # End-of-manifest effective table: if a sequence exists, it becomes active; otherwise keep dependency.
             effective = table_after
-            tables_by_rid[rev.rid] = {} if effective is None else dict(effective)
+            tables_by_rid[rev.rid] = _EMPTY_GID_TABLE if effective is None else effective
 
             resolved_root_objects: list[tuple[int, ExtendedGUID]] = []
             resolved_change_oids: list[ExtendedGUID] = []
@@ -1221,13 +1294,20 @@ def parse_object_spaces_with_resolved_ids(
                 )
             )
 
+            rev_table = tables_by_rid[rev.rid]
+            items = items_by_table_id.get(id(rev_table))
+            if items is None:
+                items = _sorted_gid_table_items(rev_table)
+                items_by_table_id[id(rev_table)] = items
+
             resolved_revs.append(
                 RevisionResolvedIdsSummary(
                     rid=rev.rid,
                     rid_dependent=rev.rid_dependent,
-                    effective_gid_table=_sorted_gid_table_items(tables_by_rid[rev.rid]),
+                    effective_gid_table=items,
                     resolved_root_objects=resolved_root_objects_sorted,
                     resolved_change_oids=tuple(resolved_change_oids),
+                    gid_table=rev_table,
                 )
             )
 
@@ -1248,6 +1328,9 @@ def parse_object_spaces_with_revisions(
     data: bytes | bytearray | memoryview,
     *,
     ctx: ParseContext | None = None,
+    root_only: bool = False,
+    gosids: Collection[ExtendedGUID] | None = None,
+    bootstrap: OneStoreFileBootstrap | None = None,
 ) -> OneStoreObjectSpacesWithRevisions:
     """End-to-end object space + revision manifest list parsing (Step 10).
 
@@ -1257,27 +1340,30 @@ def parse_object_spaces_with_revisions(
     - presence of encryption marker (0x07C)
 
     Object data inside revision manifests is intentionally ignored at this step.
+
+    With `root_only`, object spaces other than the root one (e.g. page object spaces
+    of a section) are skipped entirely; used by metadata-only scans. With `gosids`,
+    only the listed object spaces are parsed; used to load a single page on demand.
+    `bootstrap` (see parse_file_bootstrap) skips re-parsing the file-level structures.
     """
 
     if ctx is None:
         ctx = ParseContext(strict=True)
 
-    header = Header.parse(BinaryReader(data), ctx=ctx)
-    last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
-
-    root_typed = parse_file_node_list_typed_nodes(
-        BinaryReader(data),
-        header.fcr_file_node_list_root,
-        last_count_by_list_id=last_count_by_list_id,
-        ctx=ctx,
-    )
-    manifests: RootFileNodeListManifests = build_root_file_node_list_manifests(root_typed.nodes, ctx=ctx)
+    if bootstrap is None:
+        bootstrap = parse_file_bootstrap(data, ctx=ctx)
+    last_count_by_list_id = bootstrap.last_count_by_list_id
+    manifests: RootFileNodeListManifests = bootstrap.manifests
 
     out_object_spaces: list[ObjectSpaceRevisionsSummary] = []
 
     for os_ref in manifests.object_space_refs:
         if not isinstance(os_ref, ObjectSpaceManifestListReferenceFND):
             continue
+        if root_only and os_ref.gosid != manifests.root.gosid_root:
+            continue
+        if gosids is not None and os_ref.gosid not in gosids:
+            continue
 
         manifest_list_fcr = _as_fcr64x32(os_ref.ref)
         os_manifest_list = parse_file_node_list_typed_nodes(
@@ -13,6 +13,9 @@ class SaveFormat(enum.Enum):
     Pdf = "pdf"
     Html = "html"
 
+    # Not in Aspose.Note: newline-delimited JSON, one object per page.
+    Json = "json"
+
     # Raster formats (not fully implemented in this repo yet)
     Jpeg = "jpeg"
     Png = "png"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, BinaryIO, Iterable, Iterator, TypeVar
+from typing import Any, BinaryIO, Iterator, TypeVar
 
 from .enums import FileFormat, SaveFormat
 from .exceptions import IncorrectPasswordException, UnsupportedSaveFormatException
@@ -13,7 +13,20 @@ TNode = TypeVar("TNode", bound="Node")
 
 
 class DocumentVisitor:
-    """Visitor base class (subset) compatible with Aspose.Note for .NET patterns."""
+    """Visitor base class (subset) compatible with Aspose.Note for .NET patterns.
+
+    Traversal is iterative, so deep documents cannot hit the recursion limit. Two
+    extensions keep large traversals cheap:
+
+    - returning False from a `Visit*Start` method skips the children of that node (its
+      `Visit*End` is still called);
+    - `NodeTypes` restricts dispatch to the listed node types. When None (default), only
+      the node types whose Start/End methods the visitor overrides (in its class or by
+      assigning them on the instance) are dispatched, so no-op base methods are never
+      called.
+    """
+
+    NodeTypes: "tuple[type[Node], ...] | None" = None
 
     def VisitDocumentStart(self, document: "Document") -> None:  # noqa: N802
         return None
@@ -57,6 +70,30 @@ class DocumentVisitor:
     def VisitImageEnd(self, image: "Image") -> None:  # noqa: N802
         return None
 
+    def VisitTableStart(self, table: "Table") -> None:  # noqa: N802
+        return None
+
+    def VisitTableEnd(self, table: "Table") -> None:  # noqa: N802
+        return None
+
+    def VisitTableRowStart(self, table_row: "TableRow") -> None:  # noqa: N802
+        return None
+
+    def VisitTableRowEnd(self, table_row: "TableRow") -> None:  # noqa: N802
+        return None
+
+    def VisitTableCellStart(self, table_cell: "TableCell") -> None:  # noqa: N802
+        return None
+
+    def VisitTableCellEnd(self, table_cell: "TableCell") -> None:  # noqa: N802
+        return None
+
+    def VisitAttachedFileStart(self, attached_file: "AttachedFile") -> None:  # noqa: N802
+        return None
+
+    def VisitAttachedFileEnd(self, attached_file: "AttachedFile") -> None:  # noqa: N802
+        return None
+
 
 class License:
     """Compatibility stub for Aspose.Note.License."""
@@ -75,87 +112,302 @@ class Metered:
 
 @dataclass
 class LoadOptions:
-    """Load options stub compatible with Aspose.Note.LoadOptions."""
+    """Load options compatible with Aspose.Note.LoadOptions.
+
+    The Load* feature flags are extensions of this implementation: disabling content a
+    caller does not need (e.g. images and formatting for text indexing) skips decoding it.
+    """
 
     DocumentPassword: str | None = None
     LoadHistory: bool = False
+    LoadImages: bool = True
+    LoadAttachments: bool = True
+    LoadFormatting: bool = True
+    LoadTags: bool = True
+    LoadLayout: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """Base node for Aspose.Note-like DOM."""
 
     ParentNode: "Node | None" = field(default=None, repr=False)  # noqa: N815
+    # Owner document, kept in step with ParentNode by the CompositeNode mutators.
+    _owner: "Document | None" = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def Document(self) -> "Document | None":  # noqa: N802
-        cur: Node | None = self
-        while cur is not None and not isinstance(cur, Document):
-            cur = cur.ParentNode
-        return cur if isinstance(cur, Document) else None
+        return self._owner
 
     def Accept(self, visitor: DocumentVisitor) -> None:  # noqa: N802
-        self._accept(visitor)
-
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        # Default leaf node: nothing to traverse.
-        return None
+        _traverse(self, visitor)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositeNode(Node):
-    """A node that can contain other nodes (subset of .NET CompositeNode<T>)."""
+    """A node that can contain other nodes (subset of .NET CompositeNode<T>).
+
+    Nodes loaded from a file are built straight from the parsed ms_one entities (see
+    `_builder`): `_pending` holds the deferred children of a node, and `_nodes()` builds
+    them on first access. Untouched subtrees are never materialized.
 
-    _children: list[Node] = field(default_factory=list, repr=False)
+    Childless nodes (most RichText, Image, AttachedFile) share one empty tuple instead of
+    holding an empty list; `_mutable_nodes()` swaps in a list on the first insertion.
+    """
+
+    _children: list[Node] | tuple[()] = field(default=(), repr=False)
+    _pending: Any = field(default=None, repr=False, compare=False)
+
+    def _nodes(self) -> list[Node] | tuple[()]:
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            built = pending.build()
+            owner = self._owner
+            for child in built:
+                child.ParentNode = self
+                if owner is not None:
+                    _set_owner(child, owner)
+            if built:
+                if self._children:
+                    self._children.extend(built)
+                else:
+                    self._children = built
+        return self._children
+
+    def _mutable_nodes(self) -> list[Node]:
+        children = self._nodes()
+        if type(children) is tuple:
+            children = self._children = []
+        return children
 
     @property
     def FirstChild(self) -> Node | None:  # noqa: N802
-        return self._children[0] if self._children else None
+        children = self._nodes()
+        return children[0] if children else None
 
     @property
     def LastChild(self) -> Node | None:  # noqa: N802
-        return self._children[-1] if self._children else None
+        children = self._nodes()
+        return children[-1] if children else None
 
     def AppendChildLast(self, node: TNode) -> TNode:  # noqa: N802
         node.ParentNode = self
-        self._children.append(node)
+        self._mutable_nodes().append(node)
+        _set_owner(node, self._owner)
+        self._index_inserted(node)
         return node
 
     def AppendChildFirst(self, node: TNode) -> TNode:  # noqa: N802
         node.ParentNode = self
-        self._children.insert(0, node)
+        self._mutable_nodes().insert(0, node)
+        _set_owner(node, self._owner)
+        self._index_inserted(node)
         return node
 
     def InsertChild(self, index: int, node: TNode) -> TNode:  # noqa: N802
         node.ParentNode = self
-        self._children.insert(index, node)
+        self._mutable_nodes().insert(index, node)
+        _set_owner(node, self._owner)
+        self._index_inserted(node)
         return node
 
     def RemoveChild(self, node: Node) -> None:  # noqa: N802
-        self._children.remove(node)
+        # By identity: nodes are dataclasses, so list.remove() would match an equal sibling.
+        nodes = self._mutable_nodes()
+        i = next((i for i, n in enumerate(nodes) if n is node), None)
+        if i is None:
+            raise ValueError("node is not a child of this node")
+        del nodes[i]
+        index = _document_index(self)
+        if index is not None:
+            index.remove(node)
         node.ParentNode = None
+        _set_owner(node, None)
+
+    def _index_inserted(self, node: Node) -> None:
+        index = _document_index(self)
+        if index is not None:
+            index.insert(node)
 
     def GetEnumerator(self) -> Iterator[Node]:  # noqa: N802
-        return iter(self._children)
+        return iter(self._nodes())
 
     def __iter__(self) -> Iterator[Node]:
-        return iter(self._children)
+        return iter(self._nodes())
 
     def GetChildNodes(self, node_type: type[TNode]) -> list[TNode]:  # noqa: N802
-        out: list[TNode] = []
+        return [n for n in _walk(self) if isinstance(n, node_type)]
 
-        def walk(n: Node) -> None:
-            if isinstance(n, node_type):
-                out.append(n)
-            if isinstance(n, CompositeNode):
-                for c in n._children:
-                    walk(c)
 
-        walk(self)
-        return out
+def _set_owner(node: Node, owner: "Document | None") -> None:
+    """Point `node` and its built descendants at `owner`.
 
+    Deferred children pick the owner up from their parent when they are built; a nested
+    Document stays the owner of its own subtree.
+    """
 
-@dataclass
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if isinstance(n, Document):
+            continue
+        n._owner = owner
+        if isinstance(n, CompositeNode) and n._children:
+            stack.extend(n._children)
+
+
+def _walk(root: Node) -> Iterator[Node]:
+    """Pre-order walk over `root` and its descendants (iterative: deep trees are fine)."""
+
+    stack: list[Node] = [root]
+    while stack:
+        n = stack.pop()
+        yield n
+        if isinstance(n, CompositeNode):
+            _push_children(stack, n)
+
+
+def _traverse(root: Node, visitor: DocumentVisitor) -> None:
+    """Dispatch `visitor` over `root` and its descendants in pre-order (explicit stack)."""
+
+    handled = _visitor_methods(visitor)
+    resolved: dict[type, tuple[Any, Any]] = {}
+    none = (None, None)
+
+    # Nodes to enter, interleaved with (End method, node) pairs for nodes whose children
+    # have been scheduled.
+    stack: list[Any] = [root]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node = pop()
+        cls = type(node)
+        if cls is tuple:
+            node[0](node[1])
+            continue
+
+        methods = resolved.get(cls)
+        if methods is None:
+            methods = none
+            for base in cls.__mro__:
+                if base in _VISIT_METHODS:
+                    methods = handled.get(base, none)
+                    break
+            resolved[cls] = methods
+
+        start, end = methods
+        if end is not None:
+            push((end, node))
+        if start is not None and start(node) is False:
+            continue
+        if isinstance(node, CompositeNode):
+            _push_children(stack, node)
+
+
+def _push_children(stack: list[Any], node: CompositeNode) -> None:
+    # Schedule children so that they pop in document order.
+    children = node._children if node._pending is None else node._nodes()
+    if len(children) == 1:
+        stack.append(children[0])
+    elif children:
+        stack.extend(children[::-1])
+
+
+def _visitor_methods(visitor: DocumentVisitor) -> dict[type, tuple[Any, Any]]:
+    # Bound Start/End methods per node type, leaving out those the visitor does not handle.
+    wanted = visitor.NodeTypes
+    out: dict[type, tuple[Any, Any]] = {}
+    for node_type, (start_name, end_name) in _VISIT_METHODS.items():
+        start, end = getattr(visitor, start_name), getattr(visitor, end_name)
+        if wanted is not None:
+            if issubclass(node_type, tuple(wanted)):
+                out[node_type] = (start, end)
+            continue
+        # Looked up on the instance, so methods assigned to the visitor object count too.
+        overrides_start = getattr(start, "__func__", start) is not getattr(DocumentVisitor, start_name)
+        overrides_end = getattr(end, "__func__", end) is not getattr(DocumentVisitor, end_name)
+        if overrides_start or overrides_end:
+            out[node_type] = (start if overrides_start else None, end if overrides_end else None)
+    return out
+
+
+def _document_index(node: Node) -> "_NodeTypeIndex | None":
+    doc = node.Document
+    return doc._type_index if doc is not None else None
+
+
+def _is_last_in_document(node: Node) -> bool:
+    # True when `node` is the last child at every level, i.e. its subtree follows every
+    # other node of the document in pre-order.
+    cur = node
+    parent = cur.ParentNode
+    while parent is not None:
+        if not isinstance(parent, CompositeNode) or parent._children[-1] is not cur:
+            return False
+        cur, parent = parent, parent.ParentNode
+    return True
+
+
+class _NodeTypeIndex:
+    """Descendants of a Document grouped by exact node type, in document order.
+
+    Built on the first `Document.GetChildNodes` call and kept current by the
+    CompositeNode mutators: subtrees appended at the very end of the document and
+    removed subtrees are applied in place; any other insertion marks the affected
+    types stale, and they are recollected by the next query that needs them.
+    """
+
+    __slots__ = ("root", "by_type", "stale")
+
+    def __init__(self, root: CompositeNode) -> None:
+        self.root = root
+        self.by_type: dict[type, dict[int, Node]] = {}
+        self.stale: set[type] = set()
+        self._collect(None)
+
+    def _collect(self, types: set[type] | None) -> None:
+        for n in _walk(self.root):
+            if n is self.root:
+                continue
+            t = type(n)
+            if types is None or t in types:
+                self.by_type.setdefault(t, {})[id(n)] = n
+
+    def insert(self, node: Node) -> None:
+        if _is_last_in_document(node):
+            for n in _walk(node):
+                t = type(n)
+                if t not in self.stale:
+                    self.by_type.setdefault(t, {})[id(n)] = n
+            return
+        for n in _walk(node):
+            t = type(n)
+            self.by_type.pop(t, None)
+            self.stale.add(t)
+
+    def remove(self, node: Node) -> None:
+        for n in _walk(node):
+            bucket = self.by_type.get(type(n))
+            if bucket is not None:
+                bucket.pop(id(n), None)
+
+    def query(self, node_type: type[TNode]) -> list[TNode] | None:
+        """Return the indexed nodes of `node_type`, or None when they span several types."""
+
+        if self.stale and any(issubclass(t, node_type) for t in self.stale):
+            stale, self.stale = self.stale, set()
+            self._collect(stale)
+
+        buckets = [bucket for t, bucket in self.by_type.items() if issubclass(t, node_type) and bucket]
+        if not buckets:
+            return []
+        if len(buckets) > 1:
+            # Merging several per-type lists would lose document order.
+            return None
+        return list(buckets[0].values())
+
+
+@dataclass(slots=True)
 class NoteTag(Node):
     shape: int | None = None
     label: str | None = None
@@ -170,7 +422,7 @@ class NoteTag(Node):
         return NoteTag(shape=None, label="Yellow Star")
 
 
-@dataclass
+@dataclass(slots=True)
 class TextStyle(Node):
     IsHyperlink: bool = False  # noqa: N815
     HyperlinkAddress: str | None = None  # noqa: N815
@@ -189,7 +441,7 @@ class TextStyle(Node):
     Subscript: bool = False  # noqa: N815
 
 
-@dataclass
+@dataclass(slots=True)
 class TextRun(Node):
     Text: str = ""  # noqa: N815
     Style: TextStyle = field(default_factory=TextStyle)  # noqa: N815
@@ -197,7 +449,7 @@ class TextRun(Node):
     End: int | None = None  # noqa: N815
 
 
-@dataclass
+@dataclass(slots=True)
 class RichText(CompositeNode):
     Text: str = ""  # noqa: N815
     Runs: list[TextRun] = field(default_factory=list)  # noqa: N815
@@ -213,51 +465,29 @@ class RichText(CompositeNode):
     def Replace(self, old_value: str, new_value: str) -> None:  # noqa: N802
         self.Text = self.Text.replace(old_value, new_value)
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitRichTextStart(self)
-        visitor.VisitRichTextEnd(self)
 
-
-@dataclass
+@dataclass(slots=True)
 class Title(CompositeNode):
     TitleText: RichText | None = None  # noqa: N815
     TitleDate: RichText | None = None  # noqa: N815
     TitleTime: RichText | None = None  # noqa: N815
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitTitleStart(self)
-        for child in self._children:
-            child._accept(visitor)
-        visitor.VisitTitleEnd(self)
-
 
-@dataclass
+@dataclass(slots=True)
 class OutlineElement(CompositeNode):
     Tags: list[NoteTag] = field(default_factory=list)  # noqa: N815
     IndentLevel: int = 0  # noqa: N815
     NumberList: "NumberList | None" = None  # noqa: N815
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitOutlineElementStart(self)
-        for child in self._children:
-            child._accept(visitor)
-        visitor.VisitOutlineElementEnd(self)
-
 
-@dataclass
+@dataclass(slots=True)
 class Outline(CompositeNode):
     X: float | None = None  # noqa: N815
     Y: float | None = None  # noqa: N815
     Width: float | None = None  # noqa: N815
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitOutlineStart(self)
-        for child in self._children:
-            child._accept(visitor)
-        visitor.VisitOutlineEnd(self)
-
 
-@dataclass
+@dataclass(slots=True)
 class Image(CompositeNode):
     FileName: str | None = None  # noqa: N815
     Bytes: bytes = b""  # noqa: N815
@@ -274,19 +504,15 @@ class Image(CompositeNode):
         self.Bytes = image.Bytes
         self.FileName = image.FileName
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitImageStart(self)
-        visitor.VisitImageEnd(self)
 
-
-@dataclass
+@dataclass(slots=True)
 class AttachedFile(CompositeNode):
     FileName: str | None = None  # noqa: N815
     Bytes: bytes = b""  # noqa: N815
     Tags: list[NoteTag] = field(default_factory=list)  # noqa: N815
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberList(Node):
     """Compatibility representation of list formatting.
 
@@ -299,24 +525,24 @@ class NumberList(Node):
     IsNumbered: bool = False  # noqa: N815
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell(CompositeNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow(CompositeNode):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(CompositeNode):
     Tags: list[NoteTag] = field(default_factory=list)  # noqa: N815
     ColumnWidths: list[float] = field(default_factory=list)  # noqa: N815
     BordersVisible: bool = True  # noqa: N815
 
 
-@dataclass
+@dataclass(slots=True)
 class Page(CompositeNode):
     Title: Title | None = None  # noqa: N815
 
@@ -335,18 +561,12 @@ class Page(CompositeNode):
             Level=self.Level,
         )
         if deep:
-            for child in self._children:
+            for child in list(self._nodes()):
                 cloned.AppendChildLast(child)
         return cloned
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitPageStart(self)
-        for child in self._children:
-            child._accept(visitor)
-        visitor.VisitPageEnd(self)
-
 
-@dataclass
+@dataclass(slots=True)
 class Document(CompositeNode):
     """Aspose.Note-like Document.
 
@@ -356,45 +576,83 @@ class Document(CompositeNode):
     DisplayName: str | None = None  # noqa: N815
     CreationTime: datetime | None = None  # noqa: N815
 
+    _source: Any | None = field(default=None, repr=False)
     _onenote_doc: Any | None = field(default=None, repr=False)
+    _type_index: "_NodeTypeIndex | None" = field(default=None, repr=False, compare=False)
 
     def __init__(self, source: str | Path | BinaryIO | None = None, load_options: LoadOptions | None = None):
-        super().__init__()
+        CompositeNode.__init__(self)
+        self._owner = self
         self.DisplayName = None
         self.CreationTime = None
+        self._source = None
         self._onenote_doc = None
+        self._type_index = None
 
         if source is None:
             return
 
-        # Load from file or stream using the existing parser.
-        from ._internal import onenote  # local import to avoid dependency at import time
-
-        strict = False
         if load_options is not None and getattr(load_options, "DocumentPassword", None):
             # Password-protected docs are not implemented in this repository.
             # Keep surface compatible but fail explicitly.
             raise IncorrectPasswordException("Encrypted documents are not supported in this Python implementation")
 
+        self._load(source, load_options=load_options)
+
+    def _load(
+        self,
+        source: str | Path | BinaryIO,
+        *,
+        metadata_only: bool = False,
+        load_options: LoadOptions | None = None,
+    ) -> None:
+        # Build the DOM straight from the ms_one entities of the section.
+        from ._builder import SectionSource, build_document_pages  # local import to avoid a cycle
+        from ._internal.ms_one import ContentOptions
+
+        options = None
+        if load_options is not None:
+            options = ContentOptions(
+                load_images=bool(load_options.LoadImages),
+                load_attachments=bool(load_options.LoadAttachments),
+                load_formatting=bool(load_options.LoadFormatting),
+                load_tags=bool(load_options.LoadTags),
+                load_layout=bool(load_options.LoadLayout),
+            )
+
         if isinstance(source, (str, Path)):
-            o = onenote.Document.open(source, strict=strict)
+            data = Path(source).read_bytes()
         else:
-            o = onenote.Document.from_stream(source, strict=strict)
-
-        self._onenote_doc = o
-        self.DisplayName = getattr(o, "display_name", None)
+            data = source.read()
 
-        for p in getattr(o, "pages", []):
-            self.AppendChildLast(_convert_page(p))
+        self._source = SectionSource.load(data, strict=False, metadata_only=metadata_only, options=options)
+        self._onenote_doc = None
+        self.DisplayName = self._source.display_name
+        # Pages are built on first access (see CompositeNode._nodes).
+        self._pending = build_document_pages(self._source)
+
+    def _onenote_document(self, page_range: range | None = None) -> Any | None:
+        # The PDF exporter renders the onenote element model; convert the section on demand.
+        # A page range converts just those pages and is not cached.
+        if self._source is None:
+            return None
+        if page_range is not None:
+            return self._source.onenote_document(page_range)
+        if self._onenote_doc is None:
+            self._onenote_doc = self._source.onenote_document()
+        return self._onenote_doc
 
     def Count(self) -> int:  # noqa: N802
-        return len(self._children)
+        return len(self._nodes())
 
-    def _accept(self, visitor: DocumentVisitor) -> None:
-        visitor.VisitDocumentStart(self)
-        for child in self._children:
-            child._accept(visitor)
-        visitor.VisitDocumentEnd(self)
+    def GetChildNodes(self, node_type: type[TNode]) -> list[TNode]:  # noqa: N802
+        # Answered from the per-document node type index, so repeated queries cost O(results).
+        if self._type_index is None:
+            self._type_index = _NodeTypeIndex(self)
+        found = self._type_index.query(node_type)
+        if found is None:
+            return CompositeNode.GetChildNodes(self, node_type)
+        return [self, *found] if isinstance(self, node_type) else found
 
     @property
     def FileFormat(self) -> FileFormat:  # noqa: N802
@@ -413,12 +671,17 @@ class Document(CompositeNode):
         """Save document to a file/stream.
 
         Supported in this Python implementation:
-        - `SaveFormat.Pdf` via the existing PDF exporter.
+        - `SaveFormat.Pdf` via the existing PDF exporter. `PdfSaveOptions.PageIndex` and
+          `PageCount` select a range of pages; only those pages are converted and rendered.
+        - `SaveFormat.Html` via the HTML exporter. Pages are converted and written one at
+          a time; `HtmlSaveOptions` selects pages and where images/attachments go.
+        - `SaveFormat.Json`: newline-delimited JSON, one object per page, also written
+          one page at a time (see `onenote.json_export`); `JsonSaveOptions` selects pages.
 
         Everything else raises UnsupportedSaveFormatException for now.
         """
 
-        from .saving import PdfSaveOptions, SaveOptions
+        from .saving import HtmlSaveOptions, JsonSaveOptions, PdfSaveOptions, SaveOptions
 
         fmt: SaveFormat | None
         opts: SaveOptions | None = None
@@ -434,7 +697,11 @@ class Document(CompositeNode):
             raise UnsupportedSaveFormatException("Unsupported format/options argument")
 
         if fmt == SaveFormat.Pdf:
-            if self._onenote_doc is None:
+            page_range = None
+            if isinstance(opts, PdfSaveOptions) and self._source is not None:
+                page_range = _selected_pages(self._source.page_count, opts.PageIndex, opts.PageCount)
+            onenote_doc = self._onenote_document(page_range)
+            if onenote_doc is None:
                 raise UnsupportedSaveFormatException("Cannot export empty Document to PDF")
 
             # PdfSaveOptions is a compatibility stub; pass through a small subset of exporter options.
@@ -449,220 +716,112 @@ class Document(CompositeNode):
                 if getattr(opts, "TagIconGap", None) is not None:
                     pdf_opts.tag_icon_gap = float(opts.TagIconGap)
 
-                self._onenote_doc.export_pdf(target, options=pdf_opts)
+                onenote_doc.export_pdf(target, options=pdf_opts)
             else:
-                self._onenote_doc.export_pdf(target)
+                onenote_doc.export_pdf(target)
+            return
+
+        if fmt == SaveFormat.Html:
+            if self._source is None:
+                raise UnsupportedSaveFormatException("Cannot export empty Document to HTML")
+            from ._internal.onenote.html_export import HtmlExporter, HtmlExportOptions
+
+            html_opts = HtmlExportOptions()
+            page_range = None
+            if isinstance(opts, HtmlSaveOptions):
+                page_range = _selected_pages(self._source.page_count, opts.PageIndex, opts.PageCount)
+                html_opts.embed_resources = opts.EmbedResources
+                html_opts.resource_dir = opts.ResourceDir
+                html_opts.resource_url = opts.ResourceUrl
+            if page_range is None and self._onenote_doc is not None:
+                pages = iter(self._onenote_doc.pages)
+            else:
+                pages = self._source.iter_onenote_pages(page_range)
+            HtmlExporter(html_opts).export_pages(pages, target, title=self._source.display_name)
+            return
+
+        if fmt == SaveFormat.Json:
+            if self._source is None:
+                raise UnsupportedSaveFormatException("Cannot export empty Document to JSON")
+            from ._internal.onenote.json_export import JsonExporter
+
+            page_range = None
+            if isinstance(opts, JsonSaveOptions):
+                page_range = _selected_pages(self._source.page_count, opts.PageIndex, opts.PageCount)
+            if page_range is None and self._onenote_doc is not None:
+                pages = iter(self._onenote_doc.pages)
+            else:
+                pages = self._source.iter_onenote_pages(page_range)
+            JsonExporter().export_pages(pages, target)
             return
 
         raise UnsupportedSaveFormatException(f"SaveFormat '{fmt.name}' is not supported in this Python implementation")
 
 
-def _convert_page(p: Any) -> Page:
-    # Convert from onenote.elements.Page
-    title_text = getattr(p, "title", "") or ""
-    title = Title()
-    title_rich = RichText(Text=title_text)
-    title.TitleText = title_rich
-    title.AppendChildLast(title_rich)
-
-    page = Page(
-        Title=title,
-        Author=getattr(p, "author", None),
-        CreationTime=getattr(p, "created", None),
-        LastModifiedTime=getattr(p, "modified", None),
-        Level=getattr(p, "level", None),
+def _selected_pages(total: int, page_index: int, page_count: int | None) -> range | None:
+    """Pages selected by PageIndex/PageCount, or None when that is the whole document."""
+
+    if page_count is not None and page_count < 1:
+        raise ValueError("PageCount must be positive")
+    if page_index == 0 and (page_count is None or page_count >= total):
+        return None
+    if not 0 <= page_index < total:
+        raise IndexError(f"PageIndex {page_index} is out of range for {total} pages")
+    end = total if page_count is None else min(total, page_index + page_count)
+    return range(page_index, end)
+
+
+# DocumentVisitor Start/End method names per node type.
+_VISIT_METHODS: dict[type, tuple[str, str]] = {
+    cls: (f"Visit{name}Start", f"Visit{name}End")
+    for cls, name in (
+        (Document, "Document"),
+        (Page, "Page"),
+        (Title, "Title"),
+        (Outline, "Outline"),
+        (OutlineElement, "OutlineElement"),
+        (RichText, "RichText"),
+        (Image, "Image"),
+        (Table, "Table"),
+        (TableRow, "TableRow"),
+        (TableCell, "TableCell"),
+        (AttachedFile, "AttachedFile"),
     )
+}
 
-    # In Aspose.Note for .NET, Title is a real node in the Page subtree.
-    # Keep it accessible both as a property and via traversal/GetChildNodes().
-    page.AppendChildFirst(title)
-
-    for child in getattr(p, "children", []) or []:
-        converted = _convert_element(child)
-        if converted is not None:
-            page.AppendChildLast(converted)
-
-    return page
-
-
-def _convert_element(elem: Any) -> Node | None:
-    # Convert from onenote.elements.* to Aspose-like node types.
-    from ._internal.onenote import elements as oe
-
-    if isinstance(elem, oe.Outline):
-        o = Outline()
-        o.X = getattr(elem, "x", None)
-        o.Y = getattr(elem, "y", None)
-        o.Width = getattr(elem, "width", None)
-        for ch in getattr(elem, "children", []) or []:
-            ce = _convert_element(ch)
-            if ce is not None:
-                o.AppendChildLast(ce)
-        return o
-
-    if isinstance(elem, oe.OutlineElement):
-        oe_node = OutlineElement()
-        for content in getattr(elem, "contents", []) or []:
-            ce = _convert_element(content)
-            if ce is not None:
-                oe_node.AppendChildLast(ce)
-        for child in getattr(elem, "children", []) or []:
-            ce = _convert_element(child)
-            if ce is not None:
-                oe_node.AppendChildLast(ce)
-        oe_node.IndentLevel = int(getattr(elem, "indent_level", 0) or 0)
-
-        list_format = getattr(elem, "list_format", None)
-        list_restart = getattr(elem, "list_restart", None)
-        is_numbered = bool(getattr(elem, "is_numbered", False))
-        if list_format is not None or list_restart is not None or is_numbered:
-            oe_node.NumberList = NumberList(Format=list_format, Restart=list_restart, IsNumbered=is_numbered)
-
-        # tags
-        tags: list[NoteTag] = []
-        for t in getattr(elem, "tags", []) or []:
-            tags.append(
-                NoteTag(
-                    shape=getattr(t, "shape", None),
-                    label=getattr(t, "label", None),
-                    text_color=getattr(t, "text_color", None),
-                    highlight_color=getattr(t, "highlight_color", None),
-                    created=getattr(t, "created", None),
-                    completed=getattr(t, "completed", None),
-                )
-            )
-        oe_node.Tags = tags
-        return oe_node
 
-    if isinstance(elem, oe.RichText):
-        rt = RichText(
-            Text=getattr(elem, "text", "") or "",
-            FontSize=getattr(elem, "font_size_pt", None),
-        )
+def scan_metadata(source: str | Path | BinaryIO) -> Document:
+    """Quickly read section and page metadata without loading page content.
 
-        # tags
-        rt_tags: list[NoteTag] = []
-        for t in getattr(elem, "tags", []) or []:
-            rt_tags.append(
-                NoteTag(
-                    shape=getattr(t, "shape", None),
-                    label=getattr(t, "label", None),
-                    text_color=getattr(t, "text_color", None),
-                    highlight_color=getattr(t, "highlight_color", None),
-                    created=getattr(t, "created", None),
-                    completed=getattr(t, "completed", None),
-                )
-            )
-        rt.Tags = rt_tags
-
-        # runs/styles (preserve formatting extracted by the parser)
-        full_text = rt.Text
-        for run in getattr(elem, "runs", []) or []:
-            start = int(getattr(run, "start", 0) or 0)
-            end = int(getattr(run, "end", 0) or 0)
-            seg = full_text[start:end] if 0 <= start <= end <= len(full_text) else ""
-
-            s = getattr(run, "style", None)
-            style = TextStyle(
-                Bold=bool(getattr(s, "bold", False)) if s is not None else False,
-                Italic=bool(getattr(s, "italic", False)) if s is not None else False,
-                Underline=bool(getattr(s, "underline", False)) if s is not None else False,
-                Strikethrough=bool(getattr(s, "strikethrough", False)) if s is not None else False,
-                Superscript=bool(getattr(s, "superscript", False)) if s is not None else False,
-                Subscript=bool(getattr(s, "subscript", False)) if s is not None else False,
-                FontName=getattr(s, "font_name", None) if s is not None else None,
-                FontSize=getattr(s, "font_size_pt", None) if s is not None else None,
-                FontColor=getattr(s, "font_color", None) if s is not None else None,
-                HighlightColor=getattr(s, "highlight_color", None) if s is not None else None,
-                LanguageId=getattr(s, "language_id", None) if s is not None else None,
-                HyperlinkAddress=getattr(s, "hyperlink", None) if s is not None else None,
-                IsHyperlink=bool(getattr(s, "hyperlink", None)) if s is not None else False,
-            )
+    Returns a Document whose pages carry only Title, Level and CreationTime (no outlines,
+    images or tables). Page object spaces and embedded file data are not parsed, which
+    makes this much cheaper than `Document(source)` for listing large sections.
+    """
 
-            rt.Runs.append(TextRun(Text=seg, Style=style, Start=start, End=end))
-        return rt
-
-    if isinstance(elem, oe.Image):
-        img = Image(
-            FileName=getattr(elem, "filename", None),
-            Bytes=bytes(getattr(elem, "data", b"") or b""),
-            Width=getattr(elem, "width", None),
-            Height=getattr(elem, "height", None),
-            AlternativeTextDescription=getattr(elem, "alt_text", None),
-            HyperlinkUrl=getattr(elem, "hyperlink", None),
-        )
-        # tags
-        tags: list[NoteTag] = []
-        for t in getattr(elem, "tags", []) or []:
-            tags.append(
-                NoteTag(
-                    shape=getattr(t, "shape", None),
-                    label=getattr(t, "label", None),
-                    text_color=getattr(t, "text_color", None),
-                    highlight_color=getattr(t, "highlight_color", None),
-                    created=getattr(t, "created", None),
-                    completed=getattr(t, "completed", None),
-                )
-            )
-        img.Tags = tags
-        return img
+    doc = Document()
+    doc._load(source, metadata_only=True)
+    return doc
 
-    if isinstance(elem, oe.AttachedFile):
-        af = AttachedFile(
-            FileName=getattr(elem, "filename", None),
-            Bytes=bytes(getattr(elem, "data", b"") or b""),
-        )
-        tags: list[NoteTag] = []
-        for t in getattr(elem, "tags", []) or []:
-            tags.append(
-                NoteTag(
-                    shape=getattr(t, "shape", None),
-                    label=getattr(t, "label", None),
-                    text_color=getattr(t, "text_color", None),
-                    highlight_color=getattr(t, "highlight_color", None),
-                    created=getattr(t, "created", None),
-                    completed=getattr(t, "completed", None),
-                )
-            )
-        af.Tags = tags
-        return af
-
-    if isinstance(elem, oe.Table):
-        table = Table()
-
-        # Table metadata
-        table.ColumnWidths = list(getattr(elem, "column_widths", []) or [])
-        table.BordersVisible = bool(getattr(elem, "borders_visible", True))
-
-        # tags
-        tags: list[NoteTag] = []
-        for t in getattr(elem, "tags", []) or []:
-            tags.append(
-                NoteTag(
-                    shape=getattr(t, "shape", None),
-                    label=getattr(t, "label", None),
-                    text_color=getattr(t, "text_color", None),
-                    highlight_color=getattr(t, "highlight_color", None),
-                    created=getattr(t, "created", None),
-                    completed=getattr(t, "completed", None),
-                )
-            )
-        table.Tags = tags
-
-        for row in getattr(elem, "rows", []) or []:
-            r = TableRow()
-            for cell in getattr(row, "cells", []) or []:
-                c = TableCell()
-                for cc in getattr(cell, "children", []) or []:
-                    ce = _convert_element(cc)
-                    if ce is not None:
-                        c.AppendChildLast(ce)
-                r.AppendChildLast(c)
-            table.AppendChildLast(r)
-        return table
-
-    if isinstance(elem, oe.Title):
-        # Title nodes usually belong to Page.Title; keep as RichText fallback.
-        return None
 
-    return None
+def extract_text(source: str | Path | BinaryIO, *, page_separator: str = "\n\n") -> Iterator[str]:
+    """Stream the plain text of a section without building the document model.
+
+    Yields each page's text as soon as that page is parsed, with `page_separator`
+    yielded between pages, so ``"".join(extract_text(path))`` is the whole text and
+    nothing larger than one page is held. A page's text is its title followed by its
+    RichText paragraphs (including table cells) in reading order, one per line.
+    Images, attachments, formatting, tags and layout are never decoded, which makes
+    this much faster than walking `Document(source).GetChildNodes(RichText)`.
+    """
+
+    from ._internal.onenote import iter_page_texts  # local import to avoid dependency at import time
+
+    if isinstance(source, (str, Path)):
+        data = Path(source).read_bytes()
+    else:
+        data = source.read()
+    for i, text in enumerate(iter_page_texts(data)):
+        if i:
+            yield page_separator
+        yield text
+
@@ -42,7 +42,27 @@ class PdfSaveOptions(SaveOptions):
 
 @dataclass
 class HtmlSaveOptions(SaveOptions):
-    """Options for saving to HTML (not implemented)."""
+    """Options for saving to HTML (subset)."""
+
+    PageIndex: int = 0  # noqa: N815
+    PageCount: int | None = None  # noqa: N815
+
+    EmbedResources: bool | None = None  # noqa: N815
+    """Inline images and attachments as `data:` URIs instead of writing separate files.
+
+    None (default) embeds only when saving to a stream without `ResourceDir`.
+    """
+
+    ResourceDir: str | None = None  # noqa: N815
+    """Directory for image/attachment files (default: `<output stem>_files` next to the output)."""
+
+    ResourceUrl: str | None = None  # noqa: N815
+    """URL prefix used for resources in the HTML (default: the resource directory's name)."""
+
+
+@dataclass
+class JsonSaveOptions(SaveOptions):
+    """Options for saving to newline-delimited JSON (subset)."""
 
     PageIndex: int = 0  # noqa: N815
     PageCount: int | None = None  # noqa: N815
@@ -63,5 +83,6 @@ __all__ = [
     "OneSaveOptions",
     "PdfSaveOptions",
     "HtmlSaveOptions",
+    "JsonSaveOptions",
     "ImageSaveOptions",
 ]
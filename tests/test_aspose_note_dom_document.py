@@ -64,6 +64,207 @@ class TestAsposeNoteDocumentBasics(unittest.TestCase):
         self.assertIs(page0.FirstChild, page0.Title)
 
 
+    def test_pages_and_content_are_converted_on_first_access(self) -> None:
+        from aspose.note import Document, Page, RichText
+
+        doc = Document(self.path)
+        # Nothing is converted until the tree is accessed.
+        self.assertFalse(doc._children)
+
+        page = doc.FirstChild
+        self.assertIsInstance(page, Page)
+        self.assertIs(page.ParentNode, doc)
+        # Only the Title is eager; page content converts on demand.
+        self.assertEqual(page._children, [page.Title])
+        self.assertGreater(len(page.GetChildNodes(RichText)), 1)
+        self.assertGreater(len(page._children), 1)
+
+        # Edits before the first access still see the converted pages.
+        other = Document(self.path)
+        extra = Page()
+        other.AppendChildFirst(extra)
+        self.assertIs(other.FirstChild, extra)
+        self.assertEqual(other.Count(), doc.Count() + 1)
+
+    def test_scan_metadata_lists_pages_without_content(self) -> None:
+        from aspose.note import Document, Page, scan_metadata
+
+        full = Document(self.path)
+        meta = scan_metadata(io.BytesIO(self.data))
+        full_pages = full.GetChildNodes(Page)
+        meta_pages = meta.GetChildNodes(Page)
+
+        self.assertEqual(len(meta_pages), len(full_pages))
+        for page, full_page in zip(meta_pages, full_pages):
+            # Only the Title node (from the cached title string) remains.
+            self.assertEqual(len(list(page)), 1)
+            self.assertTrue(page.Title.TitleText.Text)
+            self.assertIsNotNone(page.CreationTime)
+            self.assertEqual(page.CreationTime, full_page.CreationTime)
+            self.assertEqual(page.Level, 0)
+
+
+    def test_extract_text_matches_dom_rich_text(self) -> None:
+        from aspose.note import Document, Page, RichText, extract_text
+
+        doc = Document(self.path)
+        expected = "\n\n".join(
+            "\n".join(rt.Text for rt in page.GetChildNodes(RichText) if rt.Text) for page in doc.GetChildNodes(Page)
+        )
+        self.assertEqual("".join(extract_text(self.path)), expected)
+        self.assertEqual("".join(extract_text(io.BytesIO(self.data))), expected)
+
+    def test_extract_text_streams_pages(self) -> None:
+        from aspose.note import Document, Page, extract_text
+
+        pages = Document(self.path).GetChildNodes(Page)
+        parts = list(extract_text(self.path, page_separator="<sep>"))
+        self.assertEqual(len(parts), 2 * len(pages) - 1)
+        self.assertEqual(parts[1::2], ["<sep>"] * (len(pages) - 1))
+
+    def test_get_child_nodes_index_tracks_mutations(self) -> None:
+        from aspose.note import Document, Outline, OutlineElement, Page, RichText
+        from aspose.note.model import CompositeNode
+
+        doc = Document(self.path)
+
+        def walked(node_type):
+            return CompositeNode.GetChildNodes(doc, node_type)
+
+        before = doc.GetChildNodes(RichText)
+        self.assertEqual(before, walked(RichText))
+
+        # Appended at the end of the document: applied to the index in place.
+        page = doc.AppendChildLast(Page())
+        outline = page.AppendChildLast(Outline())
+        last = outline.AppendChildLast(OutlineElement()).AppendChildLast(RichText(Text="last"))
+        self.assertIs(doc.GetChildNodes(RichText)[-1], last)
+
+        # Inserted in the middle: recollected on the next query, order preserved.
+        first = doc.FirstChild.InsertChild(1, RichText(Text="first"))
+        result = doc.GetChildNodes(RichText)
+        self.assertEqual([id(n) for n in result], [id(n) for n in walked(RichText)])
+        self.assertIn(first, result)
+
+        doc.RemoveChild(page)
+        result = doc.GetChildNodes(RichText)
+        self.assertNotIn(id(last), [id(n) for n in result])
+        self.assertEqual(len(result), len(before) + 1)
+
+        # Queries spanning several node types fall back to the walk.
+        self.assertEqual(doc.GetChildNodes(CompositeNode), walked(CompositeNode))
+
+    def test_get_child_nodes_handles_deep_trees(self) -> None:
+        from aspose.note import OutlineElement, RichText
+
+        root = OutlineElement()
+        cur = root
+        for _ in range(2000):
+            cur = cur.AppendChildLast(OutlineElement())
+        cur.AppendChildLast(RichText(Text="deep"))
+
+        self.assertEqual([rt.Text for rt in root.GetChildNodes(RichText)], ["deep"])
+        self.assertEqual(len(root.GetChildNodes(OutlineElement)), 2001)
+
+    def test_document_property_follows_reparenting(self) -> None:
+        from aspose.note import Document, Outline, OutlineElement, Page, RichText
+
+        doc = Document(self.path)
+        self.assertIs(doc.Document, doc)
+        for node in doc.GetChildNodes(RichText):
+            self.assertIs(node.Document, doc)
+
+        # A subtree built off-document picks up the owner when it is attached.
+        outline = Outline()
+        rt = outline.AppendChildLast(OutlineElement()).AppendChildLast(RichText(Text="x"))
+        self.assertIsNone(rt.Document)
+        page = doc.AppendChildFirst(Page())
+        page.InsertChild(0, outline)
+        self.assertIs(rt.Document, doc)
+
+        page.RemoveChild(outline)
+        self.assertIsNone(rt.Document)
+        self.assertIsNone(outline.Document)
+
+        other = Document()
+        other.AppendChildLast(outline)
+        self.assertIs(rt.Document, other)
+
+    def test_remove_child_matches_by_identity(self) -> None:
+        from aspose.note import Document, Outline, Page, RichText
+
+        doc = Document(self.path)
+        page = doc.AppendChildLast(Page())
+        first = page.AppendChildLast(Outline())
+        second = page.AppendChildLast(Outline())
+        self.assertEqual(first, second)
+        count = len(doc.GetChildNodes(Outline))
+
+        page.RemoveChild(second)
+        self.assertEqual(list(page), [first])
+        self.assertIs(list(page)[0], first)
+        self.assertIs(first.ParentNode, page)
+        self.assertIs(first.Document, doc)
+        self.assertIsNone(second.ParentNode)
+        self.assertEqual(len(doc.GetChildNodes(Outline)), count - 1)
+        self.assertTrue(any(n is first for n in doc.GetChildNodes(Outline)))
+        with self.assertRaises(ValueError):
+            page.RemoveChild(RichText())
+
+    def test_nodes_are_slotted_and_share_empty_children(self) -> None:
+        from aspose.note import Document, RichText
+        from aspose.note._internal import onenote
+
+        doc = Document(self.path)
+        rts = doc.GetChildNodes(RichText)
+        self.assertFalse(hasattr(rts[0], "__dict__"))
+        self.assertFalse(hasattr(onenote.RichText(), "__dict__"))
+        self.assertIs(rts[0]._children, RichText()._children)
+
+        # The first insertion swaps in a private list.
+        child = rts[0].AppendChildLast(RichText(Text="x"))
+        self.assertEqual(list(rts[0]), [child])
+        self.assertEqual(RichText()._children, ())
+
+    def test_dom_built_from_entities_matches_onenote_elements(self) -> None:
+        from aspose.note import Document, Image, OutlineElement, Page, RichText, Table, Title
+        from aspose.note._internal import onenote
+
+        for name in ("NumberedListWithTags.one", "SimpleTable.one", "3ImagesWithDifferentAlignment.one"):
+            p = _fixture_path(name)
+            if p is None:
+                continue
+            with self.subTest(name=name):
+                doc = Document(p)
+                ref = onenote.Document.open(p)
+
+                pages = doc.GetChildNodes(Page)
+                self.assertEqual([pg.Title.TitleText.Text for pg in pages], [pg.title for pg in ref.pages])
+                self.assertEqual([pg.Level for pg in pages], [pg.level for pg in ref.pages])
+
+                ref_rts = [rt for pg in ref.pages for rt in pg.iter_all_elements() if isinstance(rt, onenote.RichText)]
+                rts = [rt for rt in doc.GetChildNodes(RichText) if not isinstance(rt.ParentNode, Title)]
+                self.assertEqual(sorted(rt.Text for rt in rts), sorted(rt.text for rt in ref_rts))
+                self.assertEqual(
+                    sorted((r.Start, r.End, r.Style.Bold, r.Style.FontSize) for rt in rts for r in rt.Runs),
+                    sorted((r.start, r.end, bool(r.style.bold), r.style.font_size_pt) for rt in ref_rts for r in rt.runs),
+                )
+
+                ref_oes = [e for pg in ref.pages for e in pg.iter_all_elements() if isinstance(e, onenote.OutlineElement)]
+                self.assertEqual(
+                    sorted(str(oe.NumberList.Format) for oe in doc.GetChildNodes(OutlineElement) if oe.NumberList),
+                    sorted(str(e.list_format) for e in ref_oes if e.list_format is not None or e.is_numbered),
+                )
+                self.assertEqual(
+                    [(img.Bytes, img.Width, img.Height) for img in doc.GetChildNodes(Image)],
+                    [(img.data, img.width, img.height) for pg in ref.pages for img in pg.iter_images()],
+                )
+                self.assertEqual(
+                    [t.ColumnWidths for t in doc.GetChildNodes(Table)],
+                    [t.column_widths for pg in ref.pages for t in pg.iter_tables()],
+                )
+
+
 class TestAsposeNoteRichTextOperations(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -123,3 +324,83 @@ class TestAsposeNoteVisitor(unittest.TestCase):
 
         self.assertEqual(v.doc_start, 1)
         self.assertGreaterEqual(v.pages, 1)
+
+    def test_accept_visits_tables_and_can_skip_subtrees(self) -> None:
+        from aspose.note import Document, DocumentVisitor, RichText, Table, TableCell
+
+        class TableVisitor(DocumentVisitor):
+            def __init__(self, skip_tables: bool) -> None:
+                self.skip_tables = skip_tables
+                self.events: list[str] = []
+
+            def VisitTableStart(self, table):  # noqa: N802
+                self.events.append("table")
+                return False if self.skip_tables else None
+
+            def VisitTableEnd(self, table):  # noqa: N802
+                self.events.append("/table")
+
+            def VisitTableCellStart(self, cell):  # noqa: N802
+                self.events.append("cell")
+
+            def VisitRichTextStart(self, rich_text):  # noqa: N802
+                parent = rich_text.ParentNode
+                while parent is not None and not isinstance(parent, TableCell):
+                    parent = parent.ParentNode
+                if parent is not None:
+                    self.events.append("text")
+
+        doc = Document(self.path)
+        full = TableVisitor(skip_tables=False)
+        doc.Accept(full)
+        tables = doc.GetChildNodes(Table)
+        self.assertEqual(full.events.count("table"), len(tables))
+        self.assertEqual(full.events.count("cell"), len(doc.GetChildNodes(TableCell)))
+        self.assertGreater(full.events.count("text"), 0)
+        self.assertLess(full.events.index("cell"), full.events.index("/table"))
+
+        skipped = TableVisitor(skip_tables=True)
+        doc.Accept(skipped)
+        self.assertEqual(skipped.events, ["table", "/table"] * len(tables))
+
+        class RichTextOnly(TableVisitor):
+            NodeTypes = (RichText,)
+
+        restricted = RichTextOnly(skip_tables=True)
+        doc.Accept(restricted)
+        self.assertEqual(restricted.events, ["text"] * full.events.count("text"))
+
+    def test_accept_dispatches_methods_assigned_on_the_instance(self) -> None:
+        from aspose.note import Document, DocumentVisitor, Page
+
+        pages: list[Page] = []
+        v = DocumentVisitor()
+        v.VisitPageStart = pages.append  # type: ignore[method-assign]
+
+        doc = Document(self.path)
+        doc.Accept(v)
+        self.assertEqual(pages, doc.GetChildNodes(Page))
+
+    def test_accept_handles_deep_trees(self) -> None:
+        from aspose.note import DocumentVisitor, OutlineElement, RichText
+
+        class Counter(DocumentVisitor):
+            def __init__(self) -> None:
+                self.elements = 0
+                self.texts = 0
+
+            def VisitOutlineElementEnd(self, outline_element):  # noqa: N802
+                self.elements += 1
+
+            def VisitRichTextStart(self, rich_text):  # noqa: N802
+                self.texts += 1
+
+        root = OutlineElement()
+        cur = root
+        for _ in range(2000):
+            cur = cur.AppendChildLast(OutlineElement())
+        cur.AppendChildLast(RichText(Text="deep"))
+
+        v = Counter()
+        root.Accept(v)
+        self.assertEqual((v.elements, v.texts), (2001, 1))
@@ -30,6 +30,57 @@ class TestAsposeNoteSaveOptions(unittest.TestCase):
         opts = PdfSaveOptions(SaveFormat.Pdf)
         self.assertEqual(opts.SaveFormat, SaveFormat.Pdf)
 
+    def test_page_range_selection(self) -> None:
+        from aspose.note.model import _selected_pages
+
+        self.assertIsNone(_selected_pages(5, 0, None))
+        self.assertIsNone(_selected_pages(5, 0, 10))
+        self.assertEqual(_selected_pages(5, 1, 2), range(1, 3))
+        self.assertEqual(_selected_pages(5, 3, None), range(3, 5))
+        self.assertEqual(_selected_pages(5, 4, 10), range(4, 5))
+        with self.assertRaises(IndexError):
+            _selected_pages(5, 5, 1)
+        with self.assertRaises(ValueError):
+            _selected_pages(5, 0, 0)
+
+    def test_page_range_converts_only_selected_pages(self) -> None:
+        from aspose.note import Document
+
+        p = _fixture_path("3ImagesWithDifferentAlignment.one")
+        if p is None:
+            self.skipTest("3ImagesWithDifferentAlignment.one not found")
+
+        doc = Document(p)
+        full = doc._source.onenote_document()
+        partial = doc._onenote_document(range(0, 1))
+        self.assertEqual(len(partial.pages), 1)
+        self.assertIsNot(partial, doc._onenote_document())
+        self.assertEqual(
+            [img.data for img in partial.pages[0].iter_images()],
+            [img.data for img in full.pages[0].iter_images()],
+        )
+
+    def test_page_range_parses_only_selected_pages(self) -> None:
+        from unittest import mock
+
+        from aspose.note import Document, HtmlSaveOptions, SaveFormat
+        from aspose.note._internal.ms_one.reader import PageDirectory
+
+        p = _fixture_path("FormattedRichText.one")
+        if p is None:
+            self.skipTest("FormattedRichText.one not found")
+
+        with mock.patch.object(PageDirectory, "load_pages", autospec=True, side_effect=PageDirectory.load_pages) as load:
+            doc = Document(p)
+            self.assertEqual(load.call_count, 0)
+            # Three directory entries sharing one page object space stand in for a larger section.
+            directory = doc._source.directory
+            directory.entries = directory.entries * 3
+            buf = io.BytesIO()
+            doc.Save(buf, HtmlSaveOptions(SaveFormat.Html, PageIndex=1, PageCount=1))
+        self.assertEqual([call.args[1] for call in load.call_args_list], [1])
+        self.assertEqual(buf.getvalue().count(b'class="page"'), 1)
+
 
 @unittest.skipUnless(HAS_REPORTLAB, "reportlab not installed")
 class TestAsposeNoteSaveWithOptions(unittest.TestCase):
@@ -48,6 +99,96 @@ class TestAsposeNoteSaveWithOptions(unittest.TestCase):
         doc.Save(buf, PdfSaveOptions(SaveFormat.Pdf))
         self.assertTrue(buf.getvalue().startswith(b"%PDF"))
 
+    def test_save_pdf_page_range(self) -> None:
+        from aspose.note import Document, PdfSaveOptions, SaveFormat
+
+        doc = Document(self.path)
+        buf = io.BytesIO()
+        doc.Save(buf, PdfSaveOptions(SaveFormat.Pdf, PageIndex=0, PageCount=1))
+        self.assertTrue(buf.getvalue().startswith(b"%PDF"))
+
+        with self.assertRaises(IndexError):
+            doc.Save(io.BytesIO(), PdfSaveOptions(SaveFormat.Pdf, PageIndex=1))
+
+
+
+class TestAsposeNoteSaveHtml(unittest.TestCase):
+    def test_save_html(self) -> None:
+        from aspose.note import Document, SaveFormat
+
+        p = _fixture_path("FormattedRichText.one")
+        if p is None:
+            self.skipTest("FormattedRichText.one not found")
+        buf = io.BytesIO()
+        Document(p).Save(buf, SaveFormat.Html)
+        html = buf.getvalue().decode("utf-8")
+        self.assertTrue(html.startswith("<!DOCTYPE html>"))
+        self.assertIn("yperlink.", html)
+
+    def test_save_html_resources_and_page_range(self) -> None:
+        import tempfile
+
+        from aspose.note import Document, HtmlSaveOptions, SaveFormat
+
+        p = _fixture_path("3ImagesWithDifferentAlignment.one")
+        if p is None:
+            self.skipTest("3ImagesWithDifferentAlignment.one not found")
+        doc = Document(p)
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "images.html"
+            doc.Save(out, HtmlSaveOptions(SaveFormat.Html, PageIndex=0, PageCount=1))
+            html = out.read_text(encoding="utf-8")
+            files = list((Path(tmp) / "images_files").iterdir())
+            self.assertEqual(html.count('class="page"'), 1)
+            self.assertEqual(len(files), len(set(f.read_bytes() for f in files)))
+            self.assertEqual(html.count("<img"), 3)
+
+        buf = io.BytesIO()
+        doc.Save(buf, HtmlSaveOptions(SaveFormat.Html, EmbedResources=True))
+        self.assertEqual(buf.getvalue().count(b'src="data:image/'), 3)
+
+
+class TestAsposeNoteSaveJson(unittest.TestCase):
+    def test_save_json(self) -> None:
+        import json
+
+        from aspose.note import Document, SaveFormat
+
+        p = _fixture_path("FormattedRichText.one")
+        if p is None:
+            self.skipTest("FormattedRichText.one not found")
+        doc = Document(p)
+        buf = io.BytesIO()
+        doc.Save(buf, SaveFormat.Json)
+        records = [json.loads(line) for line in buf.getvalue().decode("utf-8").splitlines()]
+        self.assertEqual(len(records), doc.Count())
+        self.assertIn("yperlink.", records[0]["text"])
+
+    def test_save_json_page_range(self) -> None:
+        import json
+        from unittest import mock
+
+        from aspose.note import Document, JsonSaveOptions, SaveFormat
+        from aspose.note._internal.ms_one.reader import PageDirectory
+
+        p = _fixture_path("FormattedRichText.one")
+        if p is None:
+            self.skipTest("FormattedRichText.one not found")
+
+        with mock.patch.object(PageDirectory, "load_pages", autospec=True, side_effect=PageDirectory.load_pages) as load:
+            doc = Document(p)
+            directory = doc._source.directory
+            directory.entries = directory.entries * 3
+            buf = io.BytesIO()
+            doc.Save(buf, JsonSaveOptions(SaveFormat.Json, PageIndex=1, PageCount=1))
+        self.assertEqual([call.args[1] for call in load.call_args_list], [1])
+        records = [json.loads(line) for line in buf.getvalue().decode("utf-8").splitlines()]
+        self.assertEqual(len(records), 1)
+        self.assertIn("yperlink.", records[0]["text"])
+
+        with self.assertRaises(IndexError):
+            doc.Save(io.BytesIO(), JsonSaveOptions(SaveFormat.Json, PageIndex=3))
+
 
 class TestAsposeNoteSaveUnsupportedFormats(unittest.TestCase):
     @classmethod
@@ -53,6 +53,19 @@ def _rt_text_and_labels(node) -> tuple[str, set[str]]:
 
 
 class TestAsposeNoteTags(unittest.TestCase):
+    def test_load_tags_false_skips_tags(self) -> None:
+        p = _fixture_path("ImageWithTag.one")
+        if p is None:
+            raise unittest.SkipTest("ImageWithTag.one not found")
+
+        from aspose.note import Document, LoadOptions
+
+        self.assertTrue(any(_tag_is_meaningful(t) for t in _collect_all_tags(Document(p))))
+
+        opts = LoadOptions()
+        opts.LoadTags = False
+        self.assertEqual(_collect_all_tags(Document(p, opts)), [])
+
     def test_image_with_tag_exposes_tags(self) -> None:
         p = _fixture_path("ImageWithTag.one")
         if p is None:
@@ -9,11 +9,13 @@ if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
 from aspose.note._internal.onestore.chunk_refs import FileChunkReference64x32  # noqa: E402
+from aspose.note._internal.onestore.errors import OneStoreFormatError  # noqa: E402
 from aspose.note._internal.onestore.file_node_list import (  # noqa: E402
     CHUNK_TERMINATOR_FND_ID,
     FNL_FOOTER_MAGIC,
     FNL_HEADER_MAGIC,
     parse_file_node_list,
+    scan_file_node_list,
 )
 from aspose.note._internal.onestore.io import BinaryReader  # noqa: E402
 from aspose.note._internal.onestore.parse_context import ParseContext  # noqa: E402
@@ -158,3 +160,31 @@ class TestFileNodeList(unittest.TestCase):
         self.assertEqual(out.node_count, 3)
         self.assertEqual([n.file_node_id for n in out.file_nodes], [1, 2, 3])
         self.assertEqual(len(out.fragments), 2)
+
+    def test_scan_file_node_list_matches_parse(self) -> None:
+        data, first, list_id = _build_synthetic_file()
+
+        for limit in (None, {list_id: 3}, {list_id: 1}):
+            parsed = parse_file_node_list(
+                BinaryReader(data), first, last_count_by_list_id=limit, ctx=ParseContext(strict=True)
+            )
+            scan = scan_file_node_list(BinaryReader(data), first, last_count_by_list_id=limit, ctx=ParseContext(strict=True))
+
+            self.assertEqual(scan.list_id, parsed.list_id)
+            self.assertEqual(scan.node_count, parsed.node_count)
+            self.assertEqual(scan.file_nodes, parsed.file_nodes)
+            self.assertEqual(list(scan.offsets), [n.offset for n in parsed.file_nodes])
+            self.assertEqual(list(scan.sizes), [n.size for n in parsed.file_nodes])
+            self.assertEqual(list(scan.ids), [n.file_node_id for n in parsed.file_nodes])
+            self.assertEqual(
+                [(f.header, f.fcr, f.node_count, f.found_chunk_terminator, f.next_fragment) for f in scan.fragments],
+                [(f.header, f.fcr, f.node_count, f.found_chunk_terminator, f.next_fragment) for f in parsed.fragments],
+            )
+
+    def test_scan_file_node_list_rejects_bad_footer(self) -> None:
+        data, first, _ = _build_synthetic_file()
+        broken = bytearray(data)
+        footer_at = first.stp + first.cb - 8
+        broken[footer_at : footer_at + 8] = b"\x00" * 8
+        with self.assertRaises(OneStoreFormatError):
+            scan_file_node_list(BinaryReader(bytes(broken)), first, ctx=ParseContext(strict=True))
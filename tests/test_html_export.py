@@ -0,0 +1,176 @@
+"""Tests for HTML export functionality."""
+
+from __future__ import annotations
+
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note._internal.onenote import Document, HtmlExporter, HtmlExportOptions, elements  # noqa: E402
+
+
+def _fixture_path(name: str) -> Path | None:
+    """Get path to test fixture file."""
+    p = ROOT / "testfiles" / name
+    return p if p.exists() else None
+
+
+def _image_page(data: bytes, copies: int) -> elements.Page:
+    return elements.Page(
+        title="Images",
+        children=[elements.Image(data=data, format="png", width=20, height=10) for _ in range(copies)],
+    )
+
+
+class TestHtmlExport(unittest.TestCase):
+    """Test HTML export of text, lists, tags and tables."""
+
+    def _export(self, doc: Document, options: HtmlExportOptions | None = None) -> str:
+        buf = io.BytesIO()
+        HtmlExporter(options).export(doc, buf)
+        return buf.getvalue().decode("utf-8")
+
+    def test_fixtures_export(self) -> None:
+        for name in ("FormattedRichText.one", "NumberedListWithTags.one", "TableWithTag.one", "AttachedFileWithTag.one"):
+            p = _fixture_path(name)
+            if p is None:
+                continue
+            with self.subTest(name=name):
+                html = self._export(Document.open(p))
+                self.assertTrue(html.startswith("<!DOCTYPE html>"))
+                self.assertTrue(html.endswith("</html>\n"))
+
+    def test_run_styles_and_hyperlinks(self) -> None:
+        text = "Plain bold <link>"
+        rt = elements.RichText(
+            text=text,
+            runs=[
+                elements.TextRun(start=6, end=10, style=elements.TextStyle(bold=True, font_color=0x0000FF)),
+                elements.TextRun(start=11, end=17, style=elements.TextStyle(hyperlink="https://example.com/?a=1&b=2")),
+            ],
+        )
+        doc = Document(pages=[elements.Page(title="Styles", children=[elements.Outline(children=[elements.OutlineElement(contents=[rt])])])])
+        html = self._export(doc)
+
+        self.assertIn('<span style="font-weight: bold; color: #ff0000">bold</span>', html)
+        self.assertIn('<a href="https://example.com/?a=1&amp;b=2">&lt;link&gt;</a>', html)
+
+    def test_explicit_black_is_kept(self) -> None:
+        style = elements.TextStyle(font_color=0x000000, highlight_color=0x000000)
+        rt = elements.RichText(text="black", runs=[elements.TextRun(start=0, end=5, style=style)])
+        doc = Document(pages=[elements.Page(title="Black", children=[elements.Outline(children=[elements.OutlineElement(contents=[rt])])])])
+        self.assertIn('<span style="color: #000000; background-color: #000000">black</span>', self._export(doc))
+
+    def test_unsafe_hyperlink_schemes_are_dropped(self) -> None:
+        links = {
+            "javascript:alert(1)": None,
+            " JavaScript:alert(1)": None,
+            "java\tscript:alert(1)": None,
+            "data:text/html,<script>alert(1)</script>": None,
+            "vbscript:msgbox(1)": None,
+            "https://example.com/": "https://example.com/",
+            "mailto:someone@example.com": "mailto:someone@example.com",
+            "onenote:#Page&section-id={1}": "onenote:#Page&amp;section-id={1}",
+            "file:///C:/notes/a.txt": "file:///C:/notes/a.txt",
+            "notes/page.html#top": "notes/page.html#top",
+        }
+        for link, expected in links.items():
+            with self.subTest(link=link):
+                rt = elements.RichText(text="link", runs=[elements.TextRun(start=0, end=4, style=elements.TextStyle(hyperlink=link))])
+                image = elements.Image(data=b"\x89PNG\r\n\x1a\n", format="png", hyperlink=link)
+                outline = elements.Outline(children=[elements.OutlineElement(contents=[rt])])
+                html = self._export(Document(pages=[elements.Page(title="Links", children=[outline, image])]))
+                if expected is None:
+                    self.assertNotIn("<a ", html)
+                    self.assertIn(">link</p>", html)
+                else:
+                    self.assertEqual(html.count(f'<a href="{expected}">'), 2)
+
+    def test_font_name_cannot_escape_the_style(self) -> None:
+        font = "Arial'; background: url(https://evil.example/x); x: '\"><script>"
+        rt = elements.RichText(text="text", runs=[elements.TextRun(start=0, end=4, style=elements.TextStyle(font_name=font))])
+        doc = Document(pages=[elements.Page(title="Fonts", children=[elements.Outline(children=[elements.OutlineElement(contents=[rt])])])])
+        html = self._export(doc)
+        self.assertIn("<span style=\"font-family: 'Arial background: url(https://evil.example/x) x: script'\">text</span>", html)
+        self.assertNotIn("<script>", html)
+
+    def test_list_markers_and_tags(self) -> None:
+        p = _fixture_path("NumberedListWithTags.one")
+        if p is None:
+            self.skipTest("Fixture not found")
+        html = self._export(Document.open(p))
+        self.assertIn('<span class="marker">1.</span>', html)
+        self.assertIn('<span class="marker">b.</span>', html)
+        self.assertIn('class="tag tag-star"', html)
+        self.assertNotIn('class="tag', self._export(Document.open(p), HtmlExportOptions(include_tags=False)))
+
+    def test_table_grid(self) -> None:
+        p = _fixture_path("SimpleTable.one")
+        if p is None:
+            self.skipTest("Fixture not found")
+        html = self._export(Document.open(p))
+        self.assertEqual(html.count("<tr>"), 4)
+        self.assertIn('<table class="grid">', html)
+
+    def test_pages_are_written_incrementally(self) -> None:
+        buf = io.BytesIO()
+        written: list[int] = []
+
+        def pages():
+            for i in range(3):
+                written.append(len(buf.getvalue()))
+                yield elements.Page(title=f"Page {i}")
+
+        HtmlExporter().export_pages(pages(), buf)
+        # Each page was written out before the next one was requested.
+        self.assertEqual(len(written), 3)
+        self.assertLess(written[0], written[1])
+        self.assertLess(written[1], written[2])
+
+
+class TestHtmlExportResources(unittest.TestCase):
+    """Test how images and attachments are written."""
+
+    PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+    def test_resources_written_once_next_to_output(self) -> None:
+        doc = Document(pages=[_image_page(self.PNG, 2), _image_page(self.PNG + b"x", 1)])
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "section.html"
+            HtmlExporter().export(doc, out)
+
+            files = sorted((Path(tmp) / "section_files").iterdir())
+            self.assertEqual(len(files), 2)
+            self.assertEqual(files[0].suffix, ".png")
+            html = out.read_text(encoding="utf-8")
+            self.assertEqual(html.count(f'src="section_files/{files[0].name}"') + html.count(f'src="section_files/{files[1].name}"'), 3)
+
+    def test_data_uris_for_streams(self) -> None:
+        buf = io.BytesIO()
+        HtmlExporter().export(Document(pages=[_image_page(self.PNG, 1)]), buf)
+        self.assertIn('src="data:image/png;base64,', buf.getvalue().decode("utf-8"))
+
+    def test_attachment_file_and_url_prefix(self) -> None:
+        attachment = elements.AttachedFile(filename="report 1.pdf", data=b"%PDF-1.4 data")
+        doc = Document(pages=[elements.Page(title="Files", children=[attachment, attachment])])
+        with tempfile.TemporaryDirectory() as tmp:
+            buf = io.StringIO()
+            options = HtmlExportOptions(resource_dir=Path(tmp) / "res", resource_url="/static/")
+            HtmlExporter(options).export(doc, buf)
+
+            files = list((Path(tmp) / "res").iterdir())
+            self.assertEqual(len(files), 1)
+            self.assertTrue(files[0].name.endswith("_report_1.pdf"))
+            self.assertEqual(files[0].read_bytes(), b"%PDF-1.4 data")
+            self.assertEqual(buf.getvalue().count(f'href="/static/{files[0].name}" download="report 1.pdf"'), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
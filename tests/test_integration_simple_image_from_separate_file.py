@@ -63,14 +63,14 @@ def _iter_property_bytes(pset: DecodedPropertySet) -> "list[bytes]":
         cur = stack.pop()
         for prop in cur.properties:
             v = prop.value
-            if isinstance(v, bytes):
-                out.append(v)
+            if isinstance(v, (bytes, memoryview)):
+                out.append(bytes(v))
             elif isinstance(v, DecodedPropertySet):
                 stack.append(v)
             elif isinstance(v, tuple):
                 for item in v:
-                    if isinstance(item, bytes):
-                        out.append(item)
+                    if isinstance(item, (bytes, memoryview)):
+                        out.append(bytes(item))
                     elif isinstance(item, DecodedPropertySet):
                         stack.append(item)
     return out
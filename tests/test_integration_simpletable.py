@@ -469,6 +469,29 @@ class TestIntegrationSimpleTable(unittest.TestCase):
                     self.assertIsInstance(oid, ExtendedGUID)
                     self.assertNotEqual(oid.guid, b"\x00" * 16)
 
+    def test_step11_gid_tables_are_shared_with_dependency(self) -> None:
+        data = self.data
+        step10 = parse_object_spaces_with_revisions(data, ctx=ParseContext(strict=True, file_size=len(data)))
+        step11 = parse_object_spaces_with_resolved_ids(data, ctx=ParseContext(strict=True, file_size=len(data)))
+
+        shared = 0
+        for os10, os11 in zip(step10.object_spaces, step11.object_spaces):
+            by_rid = {rev.rid: rev for rev in os11.revisions}
+            for rev10, rev11 in zip(os10.revisions, os11.revisions):
+                # The mapping view always matches the sorted tuple form.
+                self.assertEqual(tuple(sorted(rev11.gid_table.items())), rev11.effective_gid_table)
+                with self.assertRaises(TypeError):
+                    rev11.gid_table[0] = b"\x00" * 16  # type: ignore[index]
+
+                dep = by_rid.get(rev11.rid_dependent)
+                has_own_table = rev10.manifest is not None and rev10.manifest.global_id_table is not None
+                if dep is not None and not has_own_table:
+                    self.assertIs(rev11.gid_table, dep.gid_table)
+                    self.assertIs(rev11.effective_gid_table, dep.effective_gid_table)
+                    shared += 1
+
+        self.assertGreater(shared, 0)
+
     def test_step13_can_decode_some_object_prop_set_deterministically(self) -> None:
         data = self.data
         file_size = len(data)
@@ -62,3 +62,15 @@ class TestBinaryReader(unittest.TestCase):
         with self.assertRaises(OneStoreFormatError) as ex:
             r.read_u8()
         self.assertEqual(ex.exception.offset, 2)
+
+    def test_read_view_is_zero_copy_and_advances(self) -> None:
+        data = b"abcdef"
+        r = BinaryReader(data)
+        r.read_u8()
+        v = r.read_view(3)
+        self.assertIsInstance(v, memoryview)
+        self.assertEqual(v, b"bcd")
+        self.assertIs(v.obj, data)
+        self.assertEqual(r.tell(), 4)
+        with self.assertRaises(OneStoreFormatError):
+            r.read_view(3)
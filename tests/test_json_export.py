@@ -0,0 +1,152 @@
+"""Tests for NDJSON export functionality."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note._internal.onenote import Document, JsonExporter, JsonExportOptions, elements  # noqa: E402
+
+
+def _fixture_path(name: str) -> Path | None:
+    """Get path to test fixture file."""
+    p = ROOT / "testfiles" / name
+    return p if p.exists() else None
+
+
+def _records(doc: Document, options: JsonExportOptions | None = None) -> list[dict]:
+    buf = io.BytesIO()
+    JsonExporter(options).export(doc, buf)
+    data = buf.getvalue().decode("utf-8")
+    assert data.endswith("\n")
+    return [json.loads(line) for line in data.splitlines()]
+
+
+class TestJsonExport(unittest.TestCase):
+    """Test NDJSON records for text, lists, tags, tables and images."""
+
+    def test_fixtures_one_line_per_page(self) -> None:
+        for name in ("FormattedRichText.one", "NumberedListWithTags.one", "SimpleTable.one", "ImageWithTag.one"):
+            p = _fixture_path(name)
+            if p is None:
+                continue
+            with self.subTest(name=name):
+                doc = Document.open(p)
+                records = _records(doc)
+                self.assertEqual(len(records), len(doc.pages))
+                self.assertEqual([r["type"] for r in records], ["page"] * len(doc.pages))
+                self.assertEqual([r["title"] for r in records], [page.title for page in doc.pages])
+
+    def test_runs_and_colors(self) -> None:
+        rt = elements.RichText(
+            text="Plain bold",
+            runs=[
+                elements.TextRun(start=0, end=6, style=elements.TextStyle()),
+                elements.TextRun(start=6, end=10, style=elements.TextStyle(bold=True, font_color=0x0000FF)),
+            ],
+        )
+        doc = Document(pages=[elements.Page(title="Styles", children=[elements.Outline(children=[elements.OutlineElement(contents=[rt])])])])
+        (page,) = _records(doc)
+        (elem,) = page["elements"]
+        self.assertEqual(elem["type"], "outline_element")
+        self.assertEqual(elem["text"], "Plain bold")
+        runs = elem["contents"][0]["runs"]
+        self.assertEqual(runs[0], {"start": 0, "end": 6})
+        self.assertEqual(runs[1]["bold"], True)
+        self.assertRegex(runs[1]["font_color"], r"^#[0-9a-f]{6}$")
+
+        black = elements.RichText(text="black", runs=[elements.TextRun(start=0, end=5, style=elements.TextStyle(font_color=0, highlight_color=0))])
+        (page,) = _records(Document(pages=[elements.Page(title="Black", children=[elements.Outline(children=[elements.OutlineElement(contents=[black])])])]))
+        self.assertEqual(page["elements"][0]["contents"][0]["runs"][0], {"start": 0, "end": 5, "font_color": "#000000", "highlight_color": "#000000"})
+
+        (page,) = _records(doc, JsonExportOptions(include_runs=False))
+        self.assertNotIn("runs", page["elements"][0]["contents"][0])
+
+    def test_list_markers_and_tags(self) -> None:
+        p = _fixture_path("NumberedListWithTags.one")
+        if p is None:
+            self.skipTest("NumberedListWithTags.one not found")
+        (page,) = _records(Document.open(p))[:1]
+        items = [e for e in page["elements"] if e["type"] == "outline_element" and e["list"]]
+        self.assertTrue(items)
+        self.assertTrue(any(e["list"]["numbered"] for e in items))
+        tags = [t for e in items for r in (e, *e["contents"]) for t in r["tags"]]
+        self.assertTrue(tags)
+        for tag in tags:
+            self.assertEqual(set(tag), {"shape", "kind", "label", "completed"})
+            self.assertIsInstance(tag["completed"], bool)
+
+    def test_table_rows(self) -> None:
+        p = _fixture_path("SimpleTable.one")
+        if p is None:
+            self.skipTest("SimpleTable.one not found")
+        doc = Document.open(p)
+        table = next(doc.pages[0].iter_tables())
+        (page,) = _records(doc)[:1]
+
+        def tables(records):
+            for r in records:
+                if r["type"] == "table":
+                    yield r
+                yield from tables(r.get("contents", ()))
+
+        (record,) = list(tables(page["elements"]))
+        self.assertEqual(record["column_count"], table.column_count)
+        self.assertEqual(len(record["rows"]), len(table.rows))
+        self.assertEqual(
+            [[cell["text"] for cell in row] for row in record["rows"]],
+            [[cell.text for cell in row.cells] for row in table.rows],
+        )
+
+    def test_image_digest(self) -> None:
+        data = b"\x89PNG\r\n\x1a\n" + bytes(range(64))
+        doc = Document(pages=[elements.Page(title="Image", children=[elements.Image(data=data, format="png", width=20, height=10)])])
+        (page,) = _records(doc)
+        (image,) = page["elements"]
+        self.assertEqual(image["type"], "image")
+        self.assertEqual(image["size"], len(data))
+        self.assertEqual(image["sha256"], hashlib.sha256(data).hexdigest())
+
+        (page,) = _records(doc, JsonExportOptions(include_digests=False))
+        self.assertIsNone(page["elements"][0]["sha256"])
+
+    def test_per_element(self) -> None:
+        p = _fixture_path("FormattedRichText.one")
+        if p is None:
+            self.skipTest("FormattedRichText.one not found")
+        doc = Document.open(p)
+        records = _records(doc, JsonExportOptions(per_element=True))
+        self.assertEqual(records[0]["type"], "page")
+        self.assertNotIn("elements", records[0])
+        self.assertGreater(len(records), len(doc.pages))
+        for record in records[1:]:
+            if record["type"] != "page":
+                self.assertEqual(record["page"], 0)
+                self.assertEqual(record["page_title"], doc.pages[0].title)
+
+    def test_pages_written_incrementally(self) -> None:
+        buf = io.StringIO()
+        seen: list[int] = []
+
+        def pages():
+            for i in range(3):
+                # Every earlier page is already on the stream when the next is produced.
+                seen.append(buf.getvalue().count("\n"))
+                yield elements.Page(title=f"Page {i}")
+
+        JsonExporter().export_pages(pages(), buf)
+        self.assertEqual(seen, [0, 1, 2])
+        self.assertEqual([json.loads(line)["page"] for line in buf.getvalue().splitlines()], [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
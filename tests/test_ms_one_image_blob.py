@@ -0,0 +1,43 @@
+import struct
+import unittest
+import zlib
+
+from aspose.note._internal.ms_one.entities.parsers import _extract_image_bytes_from_blob
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+_PNG = b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", b"\x00" * 13) + _png_chunk(b"IEND", b"")
+
+# SOI, APP0 (len=4), SOS (len=2) with stuffed 0xFF00 and RST0 in scan data, EOI.
+_JPEG = b"\xff\xd8\xff\xe0\x00\x04ab\xff\xda\x00\x02\x12\xff\x00\x34\xff\xd0\x56\xff\xd9"
+
+
+class TestExtractImageBytesFromBlob(unittest.TestCase):
+    def test_returns_memoryview(self) -> None:
+        out = _extract_image_bytes_from_blob(b"hdr" + _PNG)
+        self.assertIsInstance(out, memoryview)
+
+    def test_png_trims_trailing_container_bytes(self) -> None:
+        out = _extract_image_bytes_from_blob(b"hdr" + _PNG + b"trailing")
+        self.assertEqual(bytes(out), _PNG)
+
+    def test_jpeg_trims_at_eoi(self) -> None:
+        out = _extract_image_bytes_from_blob(b"\x00\x01" + _JPEG + b"\xff\xd9junk")
+        self.assertEqual(bytes(out), _JPEG)
+
+    def test_truncated_png_keeps_remainder(self) -> None:
+        truncated = _PNG[:-6]
+        out = _extract_image_bytes_from_blob(b"x" + truncated)
+        self.assertEqual(bytes(out), truncated)
+
+    def test_earliest_signature_wins(self) -> None:
+        blob = b"GIF89a...." + _PNG
+        out = _extract_image_bytes_from_blob(blob)
+        self.assertEqual(bytes(out), blob)
+
+    def test_no_signature(self) -> None:
+        self.assertEqual(len(_extract_image_bytes_from_blob(b"nothing here")), 0)
+        self.assertEqual(len(_extract_image_bytes_from_blob(b"")), 0)
@@ -0,0 +1,74 @@
+import unittest
+from pathlib import Path
+
+from aspose.note._internal.ms_one.object_index import ObjectIndex, _has_note_tag_states
+from aspose.note._internal.ms_one.reader import _build_effective_object_index_for_object_space
+from aspose.note._internal.onestore.header import Header
+from aspose.note._internal.onestore.io import BinaryReader
+from aspose.note._internal.onestore.object_space import (
+    parse_object_spaces_with_resolved_ids,
+    parse_object_spaces_with_revisions,
+)
+from aspose.note._internal.onestore.parse_context import ParseContext
+from aspose.note._internal.onestore.txn_log import parse_transaction_log
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _build_indexes(data: bytes) -> list[ObjectIndex]:
+    ctx = ParseContext(strict=True, file_size=len(data))
+    step10 = parse_object_spaces_with_revisions(data, ctx=ctx)
+    step11 = parse_object_spaces_with_resolved_ids(data, ctx=ctx)
+    header = Header.parse(BinaryReader(data), ctx=ctx)
+    last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
+
+    out: list[ObjectIndex] = []
+    for s10, s11 in zip(step10.object_spaces, step11.object_spaces):
+        idx, _, _ = _build_effective_object_index_for_object_space(
+            data,
+            step10_os=s10,
+            step11_os=s11,
+            last_count_by_list_id=last_count_by_list_id,
+            ctx=ctx,
+        )
+        out.append(idx)
+    return out
+
+
+class TestObjectIndexSecondaryIndexes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        p = ROOT / "testfiles" / "TagSizes.one"
+        if not p.exists():
+            raise unittest.SkipTest("TagSizes.one not found")
+        cls.indexes = _build_indexes(p.read_bytes())
+
+    def test_oids_by_jcid_matches_full_scan(self) -> None:
+        for idx in self.indexes:
+            expected: dict[int, list] = {}
+            for oid, rec in idx.objects_by_oid.items():
+                if rec.jcid is not None:
+                    expected.setdefault(int(rec.jcid.index), []).append(oid)
+            self.assertEqual(set(idx.oids_by_jcid), set(expected))
+            for jidx, oids in expected.items():
+                self.assertEqual(list(idx.oids_with_jcid(jidx)), oids)
+                for oid in oids:
+                    self.assertTrue(idx.has_jcid(oid, jidx))
+
+    def test_tagged_oids_matches_full_scan(self) -> None:
+        total = 0
+        for idx in self.indexes:
+            expected = [oid for oid, rec in idx.objects_by_oid.items() if _has_note_tag_states(rec.properties)]
+            self.assertEqual(list(idx.tagged_oids), expected)
+            total += len(expected)
+        self.assertGreater(total, 0)
+
+    def test_from_objects_rebuilds_secondary_indexes(self) -> None:
+        for idx in self.indexes:
+            rebuilt = ObjectIndex.from_objects(dict(idx.objects_by_oid))
+            self.assertEqual(rebuilt.oids_by_jcid, idx.oids_by_jcid)
+            self.assertEqual(rebuilt.tagged_oids, idx.tagged_oids)
+
+    def test_unknown_jcid_returns_empty(self) -> None:
+        self.assertEqual(self.indexes[0].oids_with_jcid(0xFFFF), ())
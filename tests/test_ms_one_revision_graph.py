@@ -0,0 +1,84 @@
+import unittest
+from types import SimpleNamespace
+
+from aspose.note._internal.ms_one.revision_graph import RevisionGraph
+from aspose.note._internal.onestore.common_types import ExtendedGUID
+from aspose.note._internal.onestore.file_node_types import DEFAULT_CONTEXT_GCTXID
+from aspose.note._internal.onestore.object_space import RevisionRoleContextPair, RevisionSummary
+
+
+_ZERO = ExtendedGUID(guid=b"\x00" * 16, n=0)
+
+
+def _rid(n: int) -> ExtendedGUID:
+    return ExtendedGUID(guid=b"\x11" * 16, n=n)
+
+
+def _rev(n: int, dep: int | None, *, role: int = 1) -> RevisionSummary:
+    return RevisionSummary(
+        rid=_rid(n),
+        rid_dependent=_ZERO if dep is None else _rid(dep),
+        gctxid=DEFAULT_CONTEXT_GCTXID,
+        revision_role=role,
+        odcs_default=0,
+        has_encryption_marker=False,
+        assigned_pairs=(),
+    )
+
+
+def _space(revisions, role_assignments=()):
+    return SimpleNamespace(revisions=tuple(revisions), role_assignments=tuple(role_assignments))
+
+
+class TestRevisionGraph(unittest.TestCase):
+    def test_rid_lookup_and_parents(self) -> None:
+        g = RevisionGraph.from_object_space(_space([_rev(1, None), _rev(2, 1), _rev(3, 99)]))
+        self.assertEqual(g.index_of(_rid(2)), 1)
+        self.assertIsNone(g.index_of(_rid(42)))
+        self.assertEqual(g.parent_index, (None, 0, None))
+
+    def test_chain_is_oldest_to_newest(self) -> None:
+        g = RevisionGraph.from_object_space(_space([_rev(1, None), _rev(2, 1), _rev(3, 2), _rev(4, 2)]))
+        self.assertEqual(g.chain(2), (0, 1, 2))
+        self.assertEqual(g.chain(3), (0, 1, 3))
+        self.assertEqual(g.chain(10), ())
+
+    def test_long_chain(self) -> None:
+        n = 5000
+        g = RevisionGraph.from_object_space(_space([_rev(1, None)] + [_rev(i, i - 1) for i in range(2, n + 1)]))
+        self.assertEqual(g.chain(n - 1), tuple(range(n)))
+
+    def test_chain_stops_on_cycle(self) -> None:
+        g = RevisionGraph.from_object_space(_space([_rev(1, 2), _rev(2, 1)]))
+        self.assertEqual(g.chain(0), (1, 0))
+        self.assertEqual(g.chain(1), (0, 1))
+
+    def test_default_revision_prefers_highest_role_assignment(self) -> None:
+        pairs = [
+            (RevisionRoleContextPair(gctxid=DEFAULT_CONTEXT_GCTXID, revision_role=1), _rid(1)),
+            (RevisionRoleContextPair(gctxid=DEFAULT_CONTEXT_GCTXID, revision_role=2), _rid(2)),
+        ]
+        g = RevisionGraph.from_object_space(_space([_rev(1, None), _rev(2, 1, role=2), _rev(3, 2)], pairs))
+        self.assertEqual(g.assigned_index(DEFAULT_CONTEXT_GCTXID, 2), 1)
+        self.assertEqual(g.default_revision_index(), 1)
+
+    def test_repeated_assignment_resolves_to_newest_revision(self) -> None:
+        pair = RevisionRoleContextPair(gctxid=DEFAULT_CONTEXT_GCTXID, revision_role=1)
+        g = RevisionGraph.from_object_space(_space([_rev(1, None), _rev(2, 1), _rev(3, 2)], [(pair, _rid(3)), (pair, _rid(2))]))
+        self.assertEqual(g.assigned_index(DEFAULT_CONTEXT_GCTXID, 1), 2)
+        self.assertEqual(g.default_revision_index(), 2)
+
+    def test_default_revision_without_assignments_is_last(self) -> None:
+        g = RevisionGraph.from_object_space(_space([_rev(1, None), _rev(2, 1)]))
+        self.assertEqual(g.default_revision_index(), 1)
+
+    def test_effective_root_objects_inherits_from_dependency(self) -> None:
+        g = RevisionGraph.from_object_space(_space([_rev(1, None), _rev(2, 1)]))
+        roots = ((1, _rid(7)),)
+        step11 = SimpleNamespace(
+            revisions=(
+                SimpleNamespace(resolved_root_objects=roots),
+                SimpleNamespace(resolved_root_objects=()),
+            )
+        )
+        self.assertEqual(g.effective_root_objects(step11, 1), roots)
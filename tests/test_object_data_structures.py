@@ -1,9 +1,11 @@
 import unittest
 
+from aspose.note._internal.ms_one.property_access import get_bytes, get_u16, get_u32
 from aspose.note._internal.onestore.common_types import CompactID
 from aspose.note._internal.onestore.errors import OneStoreFormatError
 from aspose.note._internal.onestore.io import BinaryReader
 from aspose.note._internal.onestore.object_data import (
+    ColumnarPropertySet,
     DecodedPropertySet,
     ObjectSpaceObjectStreamHeader,
     ObjectSpaceObjectStream,
@@ -171,6 +173,110 @@ class TestObjectDataStructures(unittest.TestCase):
         self.assertEqual(out.properties[7].rgdata_offset, 14 + len(nested_bytes))
         self.assertEqual(out.properties[7].rgdata_length, 8 + len(nested_bytes))
 
+    def test_decode_property_set_resolves_references_while_decoding(self) -> None:
+        def _prid(prop_id: int, prop_type: int) -> PropertyID:
+            return PropertyID.from_u32((prop_id & 0x03FFFFFF) | ((prop_type & 0x1F) << 26))
+
+        # OID, OID array (2), OSID, nested PropertySet holding a ContextID.
+        nested = (1).to_bytes(2, "little") + _prid(9, 0x0C).raw.to_bytes(4, "little")
+        rg_prids = (_prid(1, 0x08), _prid(2, 0x09), _prid(3, 0x0A), _prid(4, 0x11))
+        rg_data = (2).to_bytes(4, "little") + nested
+        ps = PropertySet(c_properties=len(rg_prids), rg_prids=rg_prids, rg_data=rg_data)
+
+        oids = tuple(CompactID.from_u32(v) for v in (0x00000101, 0x00000102, 0x00000103))
+        osids = (CompactID.from_u32(0x00000201),)
+        context_ids = (CompactID.from_u32(0x00000301),)
+
+        seen: list[CompactID] = []
+
+        def _resolve(cid: CompactID) -> tuple[str, int, int]:
+            seen.append(cid)
+            return ("resolved", int(cid.guid_index), int(cid.n))
+
+        out = decode_property_set(
+            ps,
+            oids=oids,
+            osids=osids,
+            context_ids=context_ids,
+            ctx=ParseContext(strict=True),
+            resolve=_resolve,
+        )
+
+        self.assertEqual(out.properties[0].value, ("resolved", 1, 1))
+        self.assertEqual(out.properties[1].value, (("resolved", 1, 2), ("resolved", 1, 3)))
+        self.assertEqual(out.properties[2].value, ("resolved", 2, 1))
+        self.assertEqual(out.properties[3].value.properties[0].value, ("resolved", 3, 1))
+        self.assertEqual(len(seen), 5)
+
+        # Without a resolver, raw CompactIDs are returned.
+        raw = decode_property_set(ps, oids=oids, osids=osids, context_ids=context_ids, ctx=ParseContext(strict=True))
+        self.assertIsInstance(raw.properties[0].value, CompactID)
+
+    def test_decode_property_set_blob_is_view_into_rgdata(self) -> None:
+        prids = (
+            PropertyID.from_u32((1) | (0x07 << 26)),
+            PropertyID.from_u32((2) | (0x04 << 26)),
+            PropertyID.from_u32((3) | (0x05 << 26)),
+        )
+        rg_data = (3).to_bytes(4, "little") + b"xyz" + b"\x18\x00" + b"\x78\x56\x34\x12"
+        ps = PropertySet(c_properties=len(prids), rg_prids=prids, rg_data=rg_data)
+        out = decode_property_set(ps, oids=(), osids=None, context_ids=None, ctx=ParseContext(strict=True))
+
+        blob = out.properties[0].value
+        self.assertIsInstance(blob, memoryview)
+        self.assertIs(blob.obj, rg_data)
+        self.assertEqual(blob, b"xyz")
+        self.assertEqual(out.properties[1].value, b"\x18\x00")
+
+        self.assertEqual(get_u16(out, prids[1].raw), 0x18)
+        self.assertEqual(get_u32(out, prids[2].raw), 0x12345678)
+        self.assertIsNone(get_u32(out, prids[1].raw))
+        self.assertEqual(get_bytes(out, prids[0].raw), b"xyz")
+
+    def test_columnar_property_set_round_trips_values(self) -> None:
+        def _prid(prop_id: int, prop_type: int, bool_value: int = 0) -> PropertyID:
+            return PropertyID.from_u32((prop_id & 0x03FFFFFF) | ((prop_type & 0x1F) << 26) | ((bool_value & 1) << 31))
+
+        nested = (1).to_bytes(2, "little") + _prid(9, 0x05).raw.to_bytes(4, "little") + b"\x10\x20\x30\x40"
+        rg_prids = (
+            _prid(1, 0x01),
+            _prid(2, 0x02, 1),
+            _prid(3, 0x04),
+            _prid(4, 0x07),
+            _prid(5, 0x09),
+            _prid(6, 0x11),
+            _prid(7, 0x06),
+        )
+        rg_data = (
+            b"\x01\x02"
+            + (3).to_bytes(4, "little")
+            + b"xyz"
+            + (2).to_bytes(4, "little")
+            + nested
+            + b"\x01\x02\x03\x04\x05\x06\x07\x08"
+        )
+        ps = PropertySet(c_properties=len(rg_prids), rg_prids=rg_prids, rg_data=rg_data)
+        oids = (CompactID.from_u32(0x00000101), CompactID.from_u32(0x00000102))
+        decoded = decode_property_set(ps, oids=oids, osids=None, context_ids=None, ctx=ParseContext(strict=True))
+
+        col = ColumnarPropertySet.from_decoded(decoded)
+        self.assertEqual(len(col), len(rg_prids))
+        self.assertEqual(list(col.raw_prids), [p.raw for p in rg_prids])
+        self.assertEqual(col.rgdata_size, decoded.rgdata_size)
+        self.assertEqual(col.encoded_size, decoded.encoded_size)
+        self.assertEqual(col.properties, decoded.properties)
+        self.assertIsInstance(col.properties[3].value, memoryview)
+
+        self.assertEqual(col.get(rg_prids[2].raw), decoded.get(rg_prids[2].raw))
+        self.assertIsNone(col.get(_prid(42, 0x01).raw))
+        self.assertIs(ColumnarPropertySet.from_decoded(col), col)
+
+    def test_decode_property_set_unknown_type_fails(self) -> None:
+        prid = PropertyID.from_u32((1) | (0x0E << 26))
+        ps = PropertySet(c_properties=1, rg_prids=(prid,), rg_data=b"")
+        with self.assertRaises(OneStoreFormatError):
+            decode_property_set(ps, oids=(), osids=None, context_ids=None, ctx=ParseContext(strict=True))
+
     def test_decode_property_set_oob_fails(self) -> None:
         # One fixed8 property but only 4 bytes in rgData
         prid = PropertyID.from_u32((1) | (0x06 << 26))
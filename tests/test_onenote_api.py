@@ -47,6 +47,234 @@ class TestDocumentOpen(unittest.TestCase):
         self.assertIsInstance(doc, Document)
 
 
+class TestMetadataOnly(unittest.TestCase):
+    """Test Document.open(..., metadata_only=True)."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = _simpletable_path()
+        if path is None:
+            raise unittest.SkipTest("SimpleTable.one not found")
+        cls.full = Document.open(path)
+        cls.meta = Document.open(path, metadata_only=True)
+
+    def test_titles_match_full_load(self) -> None:
+        """Metadata-only load should list the same pages as a full load."""
+        self.assertEqual([p.title for p in self.meta.pages], [p.title for p in self.full.pages])
+        self.assertEqual(self.meta.display_name, self.full.display_name)
+
+    def test_pages_have_no_content(self) -> None:
+        """Metadata-only pages should carry no content elements."""
+        for page in self.meta.pages:
+            self.assertEqual(page.children, [])
+
+    def test_level_and_created(self) -> None:
+        """Metadata-only pages should carry level and creation time."""
+        for meta_page, full_page in zip(self.meta.pages, self.full.pages):
+            self.assertEqual(meta_page.level, full_page.level)
+            self.assertEqual(meta_page.created, full_page.created)
+            self.assertIsNotNone(meta_page.created)
+
+
+class TestLoadPage(unittest.TestCase):
+    """Test Document.load_page() random access."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = _simpletable_path()
+        if path is None:
+            raise unittest.SkipTest("SimpleTable.one not found")
+        cls.path = path
+        cls.full = Document.open(path)
+
+    def test_load_page_by_index_matches_full_load(self) -> None:
+        """A page loaded on demand should equal the fully parsed page."""
+        doc = Document.open(self.path, metadata_only=True)
+        page = doc.load_page(0)
+        expected = self.full.pages[0]
+        self.assertEqual(page.title, expected.title)
+        self.assertEqual(page.level, expected.level)
+        self.assertEqual(page.created, expected.created)
+        self.assertEqual(repr(page.children), repr(expected.children))
+
+    def test_load_page_is_cached(self) -> None:
+        """Repeated load_page() calls should return the cached page."""
+        doc = Document.open(self.path, metadata_only=True)
+        self.assertIs(doc.load_page(0), doc.load_page(0))
+        self.assertIs(doc.load_page(title=doc.pages[0].title), doc.load_page(0))
+
+    def test_load_page_parses_file_structures_once(self) -> None:
+        """Pages loaded on demand should reuse the directory's header and transaction log."""
+        from unittest import mock
+
+        from aspose.note._internal.onestore import object_space
+
+        doc = Document.open(self.path, metadata_only=True)
+        with mock.patch.object(object_space, "parse_transaction_log", wraps=object_space.parse_transaction_log) as log:
+            doc.load_page(0)
+        self.assertEqual(log.call_count, 0)
+
+    def test_load_page_by_title(self) -> None:
+        """load_page(title=...) should look up the page by exact title."""
+        doc = Document.open(self.path, metadata_only=True)
+        title = doc.pages[0].title
+        self.assertEqual(doc.load_page(title=title.upper()).title, title)
+        with self.assertRaises(KeyError):
+            doc.load_page(title="ZZZZNONEXISTENT")
+
+    def test_load_page_errors(self) -> None:
+        """Invalid arguments should raise."""
+        doc = Document.open(self.path, metadata_only=True)
+        with self.assertRaises(IndexError):
+            doc.load_page(len(doc.pages))
+        with self.assertRaises(TypeError):
+            doc.load_page()
+
+    def test_load_page_on_full_document(self) -> None:
+        """On a fully loaded document, load_page() returns the parsed page."""
+        self.assertIs(self.full.load_page(0), self.full.pages[0])
+
+
+class TestPageDirectory(unittest.TestCase):
+    """Test that the page directory lists the same pages as a full parse."""
+
+    @staticmethod
+    def _gosid(n: int):
+        from aspose.note._internal.onestore.common_types import ExtendedGUID
+
+        return ExtendedGUID(guid=bytes([n]) * 16, n=0)
+
+    def _directory(self):
+        from types import SimpleNamespace
+        from unittest import mock
+
+        from aspose.note._internal.ms_one import reader
+        from aspose.note._internal.ms_one.entities.structure import Page as MsPage, PageSeries, Section
+
+        def leaf(n: int, title: str):
+            return MsPage(oid=self._gosid(100 + n), jcid_index=0x30, raw_properties=None, title=title, children=(), level=n)
+
+        # Three page spaces but two metadata leaves; the second space is not in the file.
+        # A second series references no spaces, so its leaf is the page.
+        spaces = PageSeries(oid=self._gosid(50), jcid_index=0, raw_properties=None, children=(leaf(1, "a"), leaf(2, "b")))
+        leaves = PageSeries(oid=self._gosid(51), jcid_index=0, raw_properties=None, children=(leaf(3, "c"),))
+        section = Section(oid=self._gosid(52), jcid_index=0, raw_properties=None, display_name="S", children=(spaces, leaves))
+        gosids = {spaces.oid: (self._gosid(1), self._gosid(2), self._gosid(3)), leaves.oid: ()}
+        refs = [SimpleNamespace(gosid=self._gosid(n)) for n in (1, 3)]
+        bootstrap = SimpleNamespace(manifests=SimpleNamespace(object_space_refs=refs), last_count_by_list_id={})
+
+        with (
+            mock.patch.object(reader, "_parse_section_root", return_value=(section, None, None, None, bootstrap)),
+            mock.patch.object(reader, "_page_series_gosids", side_effect=lambda series, *_: gosids[series.oid]),
+        ):
+            return reader.PageDirectory.build(b"", strict=False)
+
+    def test_entries_follow_page_spaces(self) -> None:
+        directory = self._directory()
+        self.assertEqual([e.gosid for e in directory.entries], [self._gosid(1), self._gosid(3), None])
+        self.assertEqual([e.metadata.title if e.metadata else None for e in directory.entries], ["a", None, "c"])
+        self.assertIsNone(directory.metadata_page(1).title)
+        self.assertEqual(directory.metadata_page(2).title, "c")
+
+    def test_load_pages_returns_every_page_of_a_space(self) -> None:
+        from types import SimpleNamespace
+        from unittest import mock
+
+        from aspose.note._builder import SectionSource
+        from aspose.note._internal.ms_one import reader
+        from aspose.note._internal.ms_one.entities.parsers import ContentOptions
+        from aspose.note._internal.ms_one.entities.structure import Page as MsPage
+
+        directory = self._directory()
+        directory.options = ContentOptions(load_images=False, load_attachments=False)
+        roots = [
+            MsPage(oid=self._gosid(200 + i), jcid_index=0, raw_properties=None, title=f"root {i}", children=())
+            for i in range(2)
+        ]
+        spaces = SimpleNamespace(object_spaces=[object()])
+        with (
+            mock.patch.object(reader, "parse_object_spaces_with_revisions", return_value=spaces),
+            mock.patch.object(reader, "_resolve_object_space_ids", return_value=spaces),
+            mock.patch.object(reader.RevisionGraph, "from_object_space"),
+            mock.patch.object(reader, "_extract_pages_from_page_object_space", return_value=roots),
+        ):
+            pages = directory.load_pages(0)
+            self.assertEqual([p.title for p in pages], ["root 0", "root 1"])
+            self.assertEqual([p.level for p in pages], [1, 1])
+
+            source = SectionSource(data=b"", directory=directory, options=directory.options)
+            # Unparsed entries count as one page until their space has been read.
+            self.assertEqual(source.page_count, 3)
+            self.assertEqual([p.title for p in source._iter_pages_in_range(range(0, 2))], ["root 0", "root 1"])
+            self.assertEqual(source.page_count, 4)
+            self.assertEqual([p.title for p in source._iter_pages_in_range(range(1, 3))], ["root 1", "root 0"])
+            self.assertEqual([p.title for p in source.iter_pages()], ["root 0", "root 1", "root 0", "root 1", "c"])
+
+        # A space that cannot be parsed yields no page rather than an empty one.
+        missing = SimpleNamespace(object_spaces=[])
+        with (
+            mock.patch.object(reader, "parse_object_spaces_with_revisions", return_value=missing),
+            mock.patch.object(reader, "_resolve_object_space_ids", return_value=missing),
+        ):
+            self.assertEqual(directory.load_pages(0), [])
+
+
+class TestContentOptions(unittest.TestCase):
+    """Test selective content decoding via ContentOptions."""
+
+    def _open_pair(self, name: str):
+        from aspose.note._internal.onenote import ContentOptions
+
+        path = ROOT / "testfiles" / name
+        if not path.exists():
+            raise unittest.SkipTest(f"{name} not found")
+        off = ContentOptions(
+            load_images=False,
+            load_attachments=False,
+            load_formatting=False,
+            load_tags=False,
+            load_layout=False,
+        )
+        return Document.open(path), Document.open(path, options=off)
+
+    def test_text_is_unchanged(self) -> None:
+        """Disabled features must not affect the extracted text."""
+        full, lean = self._open_pair("FormattedRichText.one")
+        self.assertEqual([p.text for p in lean.pages], [p.text for p in full.pages])
+        self.assertTrue(any(rt.runs for rt in full.pages[0].iter_text()))
+        self.assertFalse(any(rt.runs for rt in lean.pages[0].iter_text()))
+
+    def test_images_tags_and_layout_are_skipped(self) -> None:
+        """Images keep their place in the tree but carry no data, tags or layout."""
+        full, lean = self._open_pair("ImageWithTag.one")
+        full_images = list(full.pages[0].iter_images())
+        lean_images = list(lean.pages[0].iter_images())
+        self.assertEqual(len(lean_images), len(full_images))
+        self.assertTrue(any(img.data for img in full_images))
+        self.assertTrue(any(img.tags for img in full_images))
+        for img in lean_images:
+            self.assertEqual(img.data, b"")
+            self.assertEqual(img.tags, [])
+            self.assertIsNone(img.x)
+        self.assertIsNone(lean.pages[0].width)
+
+    def test_orphan_tag_scan_is_skipped_without_tags(self) -> None:
+        """The scan for unreachable tagged objects only runs when tags are loaded."""
+        from unittest import mock
+
+        from aspose.note._internal.ms_one import reader
+        from aspose.note._internal.onenote import ContentOptions
+
+        path = ROOT / "testfiles" / "ImageWithTag.one"
+        if not path.exists():
+            self.skipTest("ImageWithTag.one not found")
+        with mock.patch.object(reader, "_iter_entity_nodes", wraps=reader._iter_entity_nodes) as scan:
+            Document.open(path, options=ContentOptions(load_tags=False))
+            self.assertEqual(scan.call_count, 0)
+            Document.open(path)
+            self.assertGreater(scan.call_count, 0)
+
+
 class TestDocumentStructure(unittest.TestCase):
     """Test Document structure and navigation."""
 
@@ -6,8 +6,12 @@ Requires reportlab to be installed.
 
 from __future__ import annotations
 
+import os
+import re
+import struct
 import sys
 import unittest
+import zlib
 from pathlib import Path
 import io
 
@@ -39,6 +43,28 @@ def _output_dir() -> Path:
     return out_dir
 
 
+def _page_contents(pdf: bytes, *, decompress: bool = False) -> list[bytes]:
+    """Content streams of the pages in order; every reference must resolve."""
+    from aspose.note._internal.onenote.pdf_export import _collect_pages, _parse_pdf, _trailer_ref
+
+    objects, trailer = _parse_pdf(pdf)
+    for body, _ in objects.values():
+        for ref in re.finditer(rb"(\d+) 0 R", body):
+            assert int(ref.group(1)) in objects, body
+    leaves: list[int] = []
+    _collect_pages(objects, _trailer_ref(trailer, b"Root"), set(), leaves)
+    contents = []
+    for num in leaves:
+        stream = objects[int(re.search(rb"/Contents (\d+) 0 R", objects[num][0]).group(1))][1]
+        contents.append(zlib.decompress(stream) if decompress else stream)
+    return contents
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """A PNG chunk with its length and CRC."""
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
 @unittest.skipUnless(HAS_REPORTLAB, "reportlab not installed")
 class TestPdfExportFormattedRichText(unittest.TestCase):
     """Test PDF export of FormattedRichText.one"""
@@ -104,6 +130,45 @@ class TestPdfExport3Images(unittest.TestCase):
         pdf = buffer.getvalue()
         self.assertIn(b"/Subtype /Image", pdf)
 
+    def test_repeated_image_is_embedded_once(self) -> None:
+        """The fixture shows one picture three times: one shared reader, one XObject."""
+        from aspose.note._internal.onenote.pdf_export import PdfExporter
+
+        exporter = PdfExporter()
+        buffer = io.BytesIO()
+        exporter.export(self.doc, buffer)
+        self.assertEqual(len(exporter._image_cache), 1)
+        self.assertEqual(buffer.getvalue().count(b"/Subtype /Image"), 1)
+
+    def test_image_cache_is_bounded_by_decoded_size(self) -> None:
+        """Open image readers are evicted by decoded bytes, not by count."""
+        from unittest import mock
+
+        from aspose.note._internal.onenote import pdf_export
+
+        try:
+            from PIL import Image as PILImage
+        except ImportError:
+            self.skipTest("Pillow not installed")
+
+        def png(color: tuple[int, int, int]) -> bytes:
+            out = io.BytesIO()
+            PILImage.new("RGB", (100, 100), color).save(out, format="PNG")
+            return out.getvalue()
+
+        exporter = pdf_export.PdfExporter()
+        with mock.patch.object(pdf_export, "_IMAGE_CACHE_BYTES", 2 * 100 * 100 * 8):
+            for i in range(5):
+                exporter._image_reader(png((i, 0, 0)), None, None)
+            self.assertEqual(len(exporter._image_cache), 2)
+            self.assertEqual(exporter._image_cache_bytes, 2 * 100 * 100 * 8)
+
+        # An image larger than the whole budget is not kept.
+        exporter = pdf_export.PdfExporter()
+        with mock.patch.object(pdf_export, "_IMAGE_CACHE_BYTES", 100 * 100 * 8 - 1):
+            exporter._image_reader(png((1, 2, 3)), None, None)
+        self.assertEqual((len(exporter._image_cache), exporter._image_cache_bytes), (0, 0))
+
 
 @unittest.skipUnless(HAS_REPORTLAB, "reportlab not installed")
 class TestPdfExportSimpleTable(unittest.TestCase):
@@ -163,7 +228,7 @@ class TestPdfExportNumberedListWithTags(unittest.TestCase):
 
     def test_list_marker_formatting_is_sanitized(self) -> None:
         """Ensure list markers don't include MS-ONE control bytes and use real numbering."""
-        from aspose.note._internal.onenote.pdf_export import _compute_list_marker, _ListState
+        from aspose.note._internal.onenote._export_common import _compute_list_marker, _ListState
 
         page = self.doc.pages[0]
         outlines = list(page.iter_outlines())
@@ -360,6 +425,24 @@ class TestPdfExportOptions(unittest.TestCase):
         self.doc.export_pdf(output_path, options=options)
         self.assertTrue(output_path.exists())
     
+    def test_max_image_dpi_downsamples_images(self) -> None:
+        """Oversized images shrink to the rendered size; JPEG stays JPEG."""
+        from aspose.note._internal.onenote.pdf_export import PdfExportOptions
+
+        for name, jpeg in (("ImageWithTag.one", False), ("SimpleImageFromSeparateFile.one", True)):
+            p = _fixture_path(name)
+            if p is None:
+                continue
+            doc = Document.open(p)
+            with self.subTest(name=name):
+                full = io.BytesIO()
+                doc.export_pdf(full)
+                capped = io.BytesIO()
+                doc.export_pdf(capped, options=PdfExportOptions(max_image_dpi=72))
+                self.assertLess(len(capped.getvalue()), len(full.getvalue()) // 2)
+                self.assertEqual(b"/DCTDecode" in full.getvalue(), jpeg)
+                self.assertEqual(b"/DCTDecode" in capped.getvalue(), jpeg)
+
     def test_custom_font_size(self) -> None:
         """Test export with custom font size."""
         from aspose.note._internal.onenote.pdf_export import PdfExportOptions
@@ -373,6 +456,309 @@ class TestPdfExportOptions(unittest.TestCase):
         self.assertTrue(output_path.exists())
 
 
+@unittest.skipUnless(HAS_REPORTLAB, "reportlab not installed")
+class TestPdfExportStreaming(unittest.TestCase):
+    """Test that flowables are produced one page at a time."""
+
+    def test_pages_rendered_during_layout(self) -> None:
+        """Each page is rendered only after the previous pages were laid out."""
+        import weakref
+
+        from aspose.note._internal.onenote import elements
+        from aspose.note._internal.onenote.pdf_export import PdfExporter
+
+        doc = Document(
+            pages=[
+                elements.Page(
+                    title=f"Page {i}",
+                    children=[elements.Outline(children=[elements.OutlineElement(contents=[elements.RichText(text="x")])])],
+                )
+                for i in range(5)
+            ]
+        )
+        refs: list[weakref.ref] = []
+        alive: list[int] = []
+
+        class RecordingExporter(PdfExporter):
+            def _render_page(self, page, story, *args) -> None:
+                alive.append(sum(1 for ref in refs if ref() is not None))
+                super()._render_page(page, story, *args)
+                refs.extend(weakref.ref(f) for f in story)
+
+        buf = io.BytesIO()
+        RecordingExporter().export(doc, buf)
+
+        self.assertTrue(buf.getvalue().startswith(b"%PDF"))
+        self.assertEqual(len(alive), 5)
+        # Earlier pages' flowables were released before the next page was rendered
+        # (ReportLab may still hold the last one it laid out).
+        self.assertLessEqual(max(alive), 1)
+
+
+class TestPdfExportLite(unittest.TestCase):
+    """Test the built-in PDF writer (no ReportLab needed)."""
+
+    @staticmethod
+    def _export(doc: Document) -> bytes:
+        from aspose.note._internal.onenote.pdf_export import PdfExporter, PdfExportOptions
+
+        buf = io.BytesIO()
+        PdfExporter(PdfExportOptions(backend="lite")).export(doc, buf)
+        return buf.getvalue()
+
+    @staticmethod
+    def _text_doc(*paragraphs) -> Document:
+        from aspose.note._internal.onenote import elements
+
+        return Document(
+            pages=[
+                elements.Page(
+                    title="Lite",
+                    children=[elements.Outline(children=[elements.OutlineElement(contents=[rt]) for rt in paragraphs])],
+                )
+            ]
+        )
+
+    def test_fixtures_export(self) -> None:
+        for name in (
+            "FormattedRichText.one",
+            "NumberedListWithTags.one",
+            "TableWithTag.one",
+            "AttachedFileWithTag.one",
+            "3ImagesWithDifferentAlignment.one",
+        ):
+            p = _fixture_path(name)
+            if p is None:
+                continue
+            with self.subTest(name=name):
+                doc = Document.open(p)
+                pdf = self._export(doc)
+                self.assertTrue(pdf.startswith(b"%PDF-"))
+                self.assertEqual(len(_page_contents(pdf, decompress=True)), len(doc.pages))
+
+    def test_styles_and_hyperlinks(self) -> None:
+        from aspose.note._internal.onenote import elements
+
+        text = "Plain bold link"
+        doc = self._text_doc(
+            elements.RichText(
+                text=text,
+                runs=[
+                    elements.TextRun(start=6, end=10, style=elements.TextStyle(bold=True, font_color=0x0000FF)),
+                    elements.TextRun(start=11, end=15, style=elements.TextStyle(underline=True, hyperlink="https://example.com/")),
+                ],
+            )
+        )
+        pdf = self._export(doc)
+        content = _page_contents(pdf, decompress=True)[0]
+
+        self.assertIn(b"/BaseFont /Helvetica-Bold", pdf)
+        self.assertIn(b"(Plain ) Tj", content)
+        self.assertIn(b"1 0 0 rg", content)
+        self.assertIn(b"/URI (https://example.com/)", pdf)
+
+    def test_list_markers_and_tags(self) -> None:
+        p = _fixture_path("NumberedListWithTags.one")
+        if p is None:
+            self.skipTest("Fixture not found")
+        content = b"".join(_page_contents(self._export(Document.open(p)), decompress=True))
+        self.assertIn(b"(1.) Tj", content)
+        self.assertIn(b"(4.) Tj", content)
+        # Star tag icons are drawn as filled paths.
+        self.assertIn(b"h B", content)
+
+    def test_long_paragraph_flows_across_pages(self) -> None:
+        from aspose.note._internal.onenote import elements
+
+        doc = self._text_doc(elements.RichText(text=" ".join(["word"] * 6000)))
+        pages = _page_contents(self._export(doc), decompress=True)
+        self.assertGreater(len(pages), 1)
+        words = sum(page.count(b"word") for page in pages)
+        self.assertEqual(words, 6000)
+
+    def test_png_with_alpha_gets_soft_mask(self) -> None:
+        from aspose.note._internal.onenote import elements
+
+        rows = b"".join(b"\x00" + bytes([255, 0, 0, 128]) * 2 for _ in range(2))
+        png = (
+            b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 2, 2, 8, 6, 0, 0, 0))
+            + _png_chunk(b"IDAT", zlib.compress(rows))
+            + _png_chunk(b"IEND", b"")
+        )
+        doc = Document(pages=[elements.Page(title="Image", children=[elements.Image(data=png, width=20, height=20)] * 2)])
+        pdf = self._export(doc)
+
+        self.assertEqual(pdf.count(b"/Subtype /Image"), 2)  # colour + mask, stored once
+        self.assertIn(b"/SMask", pdf)
+        self.assertEqual(_page_contents(pdf, decompress=True)[0].count(b" Do "), 2)
+
+        # The pure-Python decoder used without Pillow writes the same objects.
+        from unittest import mock
+
+        from aspose.note._internal.onenote import pdf_export
+
+        with mock.patch.object(pdf_export, "_pil_pixels", return_value=None):
+            self.assertEqual(self._export(doc), pdf)
+
+    def test_png_transparency_chunk(self) -> None:
+        from aspose.note._internal.onenote import elements
+        from aspose.note._internal.onenote.pdf_export import _parse_pdf
+
+        def png(color_type: int, depth: int, rows: bytes, *extra: bytes) -> bytes:
+            ihdr = _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 2, 2, depth, color_type, 0, 0, 0))
+            return b"\x89PNG\r\n\x1a\n" + ihdr + b"".join(extra) + _png_chunk(b"IDAT", zlib.compress(rows)) + _png_chunk(b"IEND", b"")
+
+        def export(data: bytes) -> bytes:
+            return self._export(Document(pages=[elements.Page(title="Image", children=[elements.Image(data=data, width=20, height=20)])]))
+
+        plte = _png_chunk(b"PLTE", bytes([255, 0, 0, 0, 0, 255]))
+        # 2-bit palette rows: indices 0 1 / 1 0.
+        indexed = b"\x00\x10\x00\x40"
+
+        pdf = export(png(3, 2, indexed, plte, _png_chunk(b"tRNS", b"\x00")))
+        self.assertIn(b"/Mask [ 0 0 ]", pdf)
+
+        pdf = export(png(3, 2, indexed, plte, _png_chunk(b"tRNS", b"\x40")))
+        smask = int(re.search(rb"/SMask (\d+) 0 R", pdf).group(1))
+        self.assertEqual(zlib.decompress(_parse_pdf(pdf)[0][smask][1]), bytes([0x40, 255, 255, 0x40]))
+
+        rgb = b"".join(b"\x00" + bytes([1, 2, 3, 4, 5, 6]) for _ in range(2))
+        pdf = export(png(2, 8, rgb, _png_chunk(b"tRNS", struct.pack(">HHH", 1, 2, 3))))
+        self.assertIn(b"/Mask [ 1 1 2 2 3 3 ]", pdf)
+
+        # A palette image without PLTE is not embedded with an empty palette.
+        pdf = export(png(3, 2, indexed))
+        self.assertNotIn(b"/Indexed", pdf)
+
+    def test_fractional_font_size_is_kept(self) -> None:
+        from aspose.note._internal.onenote import elements
+
+        doc = self._text_doc(
+            elements.RichText(text="Small", runs=[elements.TextRun(start=0, end=5, style=elements.TextStyle(font_size_pt=10.5))])
+        )
+        self.assertIn(b" 10.5 Tf ", _page_contents(self._export(doc), decompress=True)[0])
+
+    def test_unencodable_text_warns(self) -> None:
+        import warnings
+
+        from aspose.note._internal.onenote import elements
+
+        with self.assertWarns(UnicodeWarning) as cm:
+            content = _page_contents(self._export(self._text_doc(elements.RichText(text="Привет café"))), decompress=True)[0]
+        self.assertIn("reportlab", str(cm.warning))
+        self.assertIn(b"(?????? caf\xe9) Tj", content)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self._export(self._text_doc(elements.RichText(text="Naïve café – €5")))
+
+    def test_parts_can_be_merged(self) -> None:
+        from aspose.note._internal.onenote.pdf_export import PdfExportOptions, PdfExporter, _export_page_range, merge_pdfs
+
+        p = _fixture_path("TableWithTag.one")
+        if p is None:
+            self.skipTest("Fixture not found")
+        pages = Document.open(p).pages * 3
+        options = PdfExportOptions(backend="lite")
+        size = PdfExporter(options)._page_size(Document(pages=pages))
+        merged = merge_pdfs([_export_page_range(pages[i : i + 1], options, size) for i in range(len(pages))])
+        single = _export_page_range(pages, options, size)
+        self.assertEqual(_page_contents(merged, decompress=True), _page_contents(single, decompress=True))
+
+    def test_merge_streams_parts_from_files(self) -> None:
+        import tempfile
+
+        from aspose.note._internal.onenote.pdf_export import _PdfWriter, _collect_pages, _parse_pdf, _trailer_ref, merge_pdfs
+
+        def part() -> bytes:
+            out = io.BytesIO()
+            writer = _PdfWriter(out)
+            font = writer.add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+            annot = writer.add(b"<< /Type /Annot /Subtype /Link /Rect [ 0 0 10 10 ] /Border [ 0 0 0 ] >>")
+            writer.close([writer.add(b"<< /Type /Page /Parent 1 0 R /Resources << /Font << /F1 %d 0 R >> >> /Annots [ %d 0 R ] >>" % (font, annot))])
+            return out.getvalue()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"part{i}.pdf" for i in range(3)]
+            for path in paths:
+                path.write_bytes(part())
+            out = io.BytesIO()
+            self.assertIsNone(merge_pdfs(paths, out))
+
+        objects, trailer = _parse_pdf(out.getvalue())
+        leaves: list[int] = []
+        _collect_pages(objects, _trailer_ref(trailer, b"Root"), set(), leaves)
+        self.assertEqual(len(leaves), 3)
+        annots = {re.search(rb"/Annots \[ (\d+) 0 R", objects[num][0]).group(1) for num in leaves}
+        fonts = {re.search(rb"/F1 (\d+) 0 R", objects[num][0]).group(1) for num in leaves}
+        # Each page keeps its own annotation; the identical font is stored once.
+        self.assertEqual(len(annots), 3)
+        self.assertEqual(len(fonts), 1)
+
+    def test_reportlab_not_imported(self) -> None:
+        import subprocess
+
+        code = (
+            "import io, sys\n"
+            "from aspose.note._internal.onenote import Document, elements\n"
+            "from aspose.note._internal.onenote.pdf_export import PdfExporter, PdfExportOptions\n"
+            "doc = Document(pages=[elements.Page(title='t')])\n"
+            "PdfExporter(PdfExportOptions(backend='lite')).export(doc, io.BytesIO())\n"
+            "print('reportlab' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env={**os.environ, "PYTHONPATH": str(SRC)})
+        self.assertEqual(out.stdout.strip(), "False", out.stderr)
+
+    def test_unknown_backend(self) -> None:
+        from aspose.note._internal.onenote.pdf_export import PdfExporter, PdfExportOptions
+
+        with self.assertRaises(ValueError):
+            PdfExporter(PdfExportOptions(backend="nope"))
+
+
+@unittest.skipUnless(HAS_REPORTLAB, "reportlab not installed")
+class TestPdfExportParallel(unittest.TestCase):
+    """Test multi-process export and the PDF merge step."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        from aspose.note._internal.onenote import elements
+
+        pages = [
+            elements.Page(
+                title=f"Page {i}",
+                children=[elements.Outline(children=[elements.OutlineElement(contents=[elements.RichText(text=f"Text {i}")])])],
+            )
+            for i in range(6)
+        ]
+        p = _fixture_path("3ImagesWithDifferentAlignment.one")
+        if p is not None:
+            pages[2:2] = Document.open(p).pages * 2
+        cls.doc = Document(pages=pages)
+
+    def test_merge_matches_single_export(self) -> None:
+        from aspose.note._internal.onenote.pdf_export import PdfExporter, _export_page_range, merge_pdfs
+
+        exporter = PdfExporter()
+        size = exporter._page_size(self.doc)
+        pages = self.doc.pages
+        single = _export_page_range(pages, exporter.options, size)
+        parts = [_export_page_range(pages[i : i + 3], exporter.options, size) for i in range(0, len(pages), 3)]
+        merged = merge_pdfs(parts)
+
+        self.assertTrue(merged.startswith(b"%PDF"))
+        self.assertEqual(_page_contents(merged), _page_contents(single))
+        # Fonts and the repeated picture are stored once across parts.
+        self.assertEqual(merged.count(b"/Subtype /Image"), single.count(b"/Subtype /Image"))
+        self.assertEqual(merged.count(b"/Type /Font"), single.count(b"/Type /Font"))
+
+    def test_export_with_workers(self) -> None:
+        buf = io.BytesIO()
+        self.doc.export_pdf(buf, workers=2)
+        self.assertEqual(len(_page_contents(buf.getvalue())), len(self.doc.pages))
+
+
 @unittest.skipUnless(HAS_REPORTLAB, "reportlab not installed")
 class TestPdfExportAllTestFiles(unittest.TestCase):
     """Test PDF export of all available test files."""
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note import model
+from aspose.note._internal.onenote import elements
+
+
+def _build_elements(texts: list[str]) -> elements.Page:
+    paragraphs = [
+        elements.OutlineElement(
+            contents=[
+                elements.RichText(
+                    text=text,
+                    runs=[elements.TextRun(start=0, end=len(text), style=elements.TextStyle(bold=True))],
+                )
+            ]
+        )
+        for text in texts
+    ]
+    return elements.Page(title="Synthetic", children=[elements.Outline(children=paragraphs)])
+
+
+def _build_model(texts: list[str]) -> model.Document:
+    doc = model.Document()
+    page = doc.AppendChildLast(model.Page())
+    outline = page.AppendChildLast(model.Outline())
+    for text in texts:
+        oe = outline.AppendChildLast(model.OutlineElement())
+        oe.AppendChildLast(
+            model.RichText(
+                Text=text,
+                Runs=[model.TextRun(Text=text, Style=model.TextStyle(Bold=True), Start=0, End=len(text))],
+            )
+        )
+    return doc
+
+
+def _measure(build, texts: list[str]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tree = build(texts)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del tree
+    return used
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Measure memory held by a synthetic page of N paragraphs")
+    p.add_argument("--paragraphs", type=int, default=10_000, help="Paragraphs on the synthetic page")
+    args = p.parse_args()
+
+    n = max(1, args.paragraphs)
+    # Texts are allocated up front so only node overhead is measured.
+    texts = [f"Paragraph {i}" for i in range(n)]
+
+    print(f"paragraphs:         {n} (OutlineElement + RichText + one formatted run each)")
+    for label, build in (("onenote.elements:", _build_elements), ("aspose.note.model:", _build_model)):
+        used = _measure(build, texts)
+        print(f"{label:<19} {used / 1024:,.0f} KiB ({used / n:,.0f} B/paragraph)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
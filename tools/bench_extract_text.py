@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note import Document, Page, RichText, extract_text
+
+
+def _text_via_dom(path: Path) -> str:
+    doc = Document(path)
+    return "\n\n".join(
+        "\n".join(rt.Text for rt in page.GetChildNodes(RichText) if rt.Text) for page in doc.GetChildNodes(Page)
+    )
+
+
+def _extract_text(path: Path) -> str:
+    return "".join(extract_text(path))
+
+
+def _time(fn, paths: list[Path], repeat: int) -> tuple[float, int]:
+    chars = 0
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            chars += len(fn(path))
+    return time.perf_counter() - t0, chars
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Compare extract_text() with Document(...).GetChildNodes(RichText)")
+    p.add_argument("paths", nargs="*", help="Input .one files (default: testfiles/*.one)")
+    p.add_argument("--repeat", type=int, default=5, help="Passes over all files")
+    args = p.parse_args()
+
+    paths = [Path(x) for x in args.paths] or sorted((ROOT / "testfiles").glob("*.one"))
+    if not paths:
+        print("No input files")
+        return 1
+    repeat = max(1, args.repeat)
+
+    mismatched = [path.name for path in paths if _extract_text(path) != _text_via_dom(path)]
+
+    dom_elapsed, dom_chars = _time(_text_via_dom, paths, repeat)
+    fast_elapsed, fast_chars = _time(_extract_text, paths, repeat)
+
+    print(f"files:        {len(paths)} x {repeat} passes")
+    print(f"dom:          {dom_elapsed:.3f}s ({dom_chars} chars)")
+    print(f"extract_text: {fast_elapsed:.3f}s ({fast_chars} chars)")
+    print(f"speedup:      {dom_elapsed / fast_elapsed:.2f}x")
+    if mismatched:
+        print(f"text differs: {', '.join(mismatched)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import io
+import time
+from pathlib import Path
+
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note._internal.onenote import Document, elements
+from aspose.note._internal.onenote.json_export import JsonExporter, JsonExportOptions
+
+
+def _build_document(pages: int, paragraphs: int) -> Document:
+    tag = elements.NoteTag(shape=13, label="Important")
+    text = "lorem ipsum dolor sit amet " * 4
+    runs = [
+        elements.TextRun(start=0, end=11, style=elements.TextStyle(bold=True, font_size_pt=14.0)),
+        elements.TextRun(start=11, end=len(text), style=elements.TextStyle(font_name="Calibri", font_color=0x0000C0)),
+    ]
+    return Document(
+        pages=[
+            elements.Page(
+                title=f"Page {p}",
+                children=[
+                    elements.Outline(
+                        children=[
+                            elements.OutlineElement(
+                                contents=[elements.RichText(text=text, runs=runs, tags=[tag] if i % 5 == 0 else [])],
+                                list_format="\x03\x00\x00．" if i % 2 else None,
+                                is_numbered=bool(i % 2),
+                            )
+                            for i in range(paragraphs)
+                        ]
+                    )
+                ],
+            )
+            for p in range(pages)
+        ]
+    )
+
+
+def _measure(doc: Document, options: JsonExportOptions, repeat: int) -> tuple[float, int]:
+    exporter = JsonExporter(options)
+    size = 0
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = io.BytesIO()
+        exporter.export(doc, out)
+        size += out.tell()
+    return time.perf_counter() - t0, size
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Measure NDJSON export throughput (MB/s of JSON written)")
+    p.add_argument("paths", nargs="*", help="Input .one files (default: a synthetic document)")
+    p.add_argument("--pages", type=int, default=200, help="Pages of the synthetic document")
+    p.add_argument("--paragraphs", type=int, default=30, help="Paragraphs per synthetic page")
+    p.add_argument("--repeat", type=int, default=3, help="Exports per measurement")
+    args = p.parse_args()
+
+    if args.paths:
+        pages = [page for path in args.paths for page in Document.open(path).pages]
+        doc = Document(pages=pages)
+        print(f"input:        {len(args.paths)} files, {len(pages)} pages")
+    else:
+        doc = _build_document(max(1, args.pages), max(1, args.paragraphs))
+        print(f"input:        synthetic, {args.pages} pages x {args.paragraphs} paragraphs")
+    repeat = max(1, args.repeat)
+
+    for label, options in (("per page:", JsonExportOptions()), ("per element:", JsonExportOptions(per_element=True))):
+        _measure(doc, options, 1)  # warm up
+        elapsed, size = _measure(doc, options, repeat)
+        pages_per_s = len(doc.pages) * repeat / elapsed
+        print(f"{label:<13} {size / repeat / 1e6:,.2f} MB  {size / elapsed / 1e6:,.1f} MB/s  {pages_per_s:,.0f} pages/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import time
+import tracemalloc
+from pathlib import Path
+
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note._internal.onenote import elements
+from aspose.note._internal.onenote.document import Document
+from aspose.note._internal.onenote.pdf_export import PdfExporter, PdfExportOptions
+
+
+def _build_document(pages: int, paragraphs: int) -> Document:
+    return Document(
+        pages=[
+            elements.Page(
+                title=f"Page {p}",
+                children=[
+                    elements.Outline(
+                        children=[
+                            elements.OutlineElement(
+                                contents=[elements.RichText(text=f"Page {p}, paragraph {i}: " + "lorem ipsum " * 8)]
+                            )
+                            for i in range(paragraphs)
+                        ]
+                    )
+                ],
+            )
+            for p in range(pages)
+        ]
+    )
+
+
+def _measure(doc: Document, backend: str) -> tuple[int, float]:
+    exporter = PdfExporter(PdfExportOptions(backend=backend))
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    out = io.BytesIO()
+    exporter.export(doc, out)
+    elapsed = time.perf_counter() - t0
+    # The PDF bytes themselves are not part of the layout working set.
+    peak = tracemalloc.get_traced_memory()[1] - out.getbuffer().nbytes
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Measure peak memory of PDF export as the page count grows")
+    p.add_argument("--pages", type=int, nargs="+", default=[10, 40, 160], help="Page counts to export")
+    p.add_argument("--paragraphs", type=int, default=30, help="Paragraphs per page")
+    p.add_argument("--backend", choices=("reportlab", "lite"), default="reportlab", help="PDF backend")
+    args = p.parse_args()
+
+    # Warm up: ReportLab loads fonts and caches on the first export.
+    _measure(_build_document(1, 1), args.backend)
+
+    print(f"backend: {args.backend}  paragraphs/page: {args.paragraphs}")
+    for pages in args.pages:
+        doc = _build_document(max(1, pages), max(1, args.paragraphs))
+        peak, elapsed = _measure(doc, args.backend)
+        print(f"pages: {pages:>6}  peak: {peak / 1024:>9,.0f} KiB  elapsed: {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from aspose.note._internal.ms_one.reader import _build_effective_object_index_for_object_space
+from aspose.note._internal.onestore.errors import OneStoreFormatError
+from aspose.note._internal.onestore.header import Header
+from aspose.note._internal.onestore.io import BinaryReader
+from aspose.note._internal.onestore.object_data import parse_object_space_object_prop_set_from_ref
+from aspose.note._internal.onestore.object_space import (
+    parse_object_spaces_with_resolved_ids,
+    parse_object_spaces_with_revisions,
+)
+from aspose.note._internal.onestore.parse_context import ParseContext
+from aspose.note._internal.onestore.txn_log import parse_transaction_log
+
+
+def _collect_prop_sets(path: Path) -> list:
+    """Return the parsed (not yet decoded) ObjectSpaceObjectPropSets of the current revisions."""
+
+    data = path.read_bytes()
+    ctx = ParseContext(strict=False, file_size=len(data), path=str(path))
+    step10 = parse_object_spaces_with_revisions(data, ctx=ctx)
+    step11 = parse_object_spaces_with_resolved_ids(data, ctx=ctx)
+    header = Header.parse(BinaryReader(data), ctx=ctx)
+    last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
+
+    out = []
+    for s10, s11 in zip(step10.object_spaces, step11.object_spaces):
+        idx, _, _ = _build_effective_object_index_for_object_space(
+            data,
+            step10_os=s10,
+            step11_os=s11,
+            last_count_by_list_id=last_count_by_list_id,
+            ctx=ctx,
+        )
+        for rec in idx.objects_by_oid.values():
+            if rec.properties is None or rec.ref_stp is None or not rec.ref_cb:
+                continue
+            try:
+                out.append(parse_object_space_object_prop_set_from_ref(data, stp=rec.ref_stp, cb=rec.ref_cb, ctx=ctx))
+            except OneStoreFormatError:
+                continue
+    return out
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Measure ObjectSpaceObjectPropSet decoding throughput (prop sets/sec)")
+    p.add_argument("paths", nargs="*", help="Input .one files (default: testfiles/*.one)")
+    p.add_argument("--repeat", type=int, default=20, help="Decode passes over all prop sets")
+    args = p.parse_args()
+
+    paths = [Path(x) for x in args.paths] or sorted((ROOT / "testfiles").glob("*.one"))
+
+    prop_sets = []
+    for path in paths:
+        prop_sets.extend(_collect_prop_sets(path))
+    if not prop_sets:
+        print("No property sets found")
+        return 1
+
+    ctx = ParseContext(strict=False)
+    props = 0
+    t0 = time.perf_counter()
+    for _ in range(max(1, args.repeat)):
+        for ps in prop_sets:
+            props += len(ps.decode_property_set(ctx=ctx).properties)
+    elapsed = time.perf_counter() - t0
+
+    decoded = len(prop_sets) * max(1, args.repeat)
+    print(f"files:      {len(paths)}")
+    print(f"prop sets:  {len(prop_sets)} x {max(1, args.repeat)} passes")
+    print(f"properties: {props}")
+    print(f"elapsed:    {elapsed:.3f}s")
+    print(f"throughput: {decoded / elapsed:,.0f} prop sets/s ({props / elapsed:,.0f} props/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,7 @@ if str(SRC) not in sys.path:
 from aspose.note._internal.ms_one.reader import parse_section_file  # noqa: E402
 from aspose.note._internal.ms_one.object_index import ObjectIndex, ObjectRecord, apply_object_groups  # noqa: E402
 from aspose.note._internal.ms_one.compact_id import EffectiveGidTable  # noqa: E402
+from aspose.note._internal.ms_one.revision_graph import RevisionGraph  # noqa: E402
 
 from aspose.note._internal.onestore.header import Header  # noqa: E402
 from aspose.note._internal.onestore.io import BinaryReader  # noqa: E402
@@ -35,31 +36,15 @@ def main() -> None:
     last_count_by_list_id = parse_transaction_log(BinaryReader(data), header, ctx=ctx)
 
     objects: dict[object, ObjectRecord] = {}
-    chain: list[int] = []
-    cur = rev_index
-    seen: set[int] = set()
-    while 0 <= cur < len(step10_os.revisions) and cur not in seen:
-        seen.add(cur)
-        chain.append(cur)
-        dep = step10_os.revisions[cur].rid_dependent
-        if dep.is_zero():
-            break
-        dep_index = None
-        for j, r in enumerate(step10_os.revisions):
-            if r.rid == dep:
-                dep_index = j
-                break
-        if dep_index is None:
-            break
-        cur = dep_index
-    chain.reverse()
+    graph = RevisionGraph.from_object_space(step10_os)
+    chain = graph.chain(rev_index)
 
     for i in chain:
         r10 = step10_os.revisions[i]
         r11 = step11_os.revisions[i]
         if r10.manifest is None:
             continue
-        table_i = EffectiveGidTable.from_sorted_items(r11.effective_gid_table)
+        table_i = EffectiveGidTable.from_revision(r11)
         apply_object_groups(
             objects,  # type: ignore[arg-type]
             data,
@@ -68,7 +53,7 @@ def main() -> None:
             last_count_by_list_id=last_count_by_list_id,
             ctx=ctx,
         )
-    idx = ObjectIndex(objects_by_oid=objects)  # type: ignore[arg-type]
+    idx = ObjectIndex.from_objects(objects)  # type: ignore[arg-type]
     print("ObjectIndex size:", len(idx.objects_by_oid))
     for oid, rec in list(idx.objects_by_oid.items()):
         print(" idx", oid, "jcid=", None if rec.jcid is None else int(rec.jcid.index), "props=", None if rec.properties is None else rec.properties.c_properties)
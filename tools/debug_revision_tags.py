@@ -25,6 +25,7 @@ def main() -> None:
         parse_object_spaces_with_resolved_ids,
         parse_object_spaces_with_revisions,
     )
+    from aspose.note._internal.onestore.common_types import CompactID  # noqa: WPS433
     from aspose.note._internal.onestore.header import Header  # noqa: WPS433
     from aspose.note._internal.onestore.io import BinaryReader  # noqa: WPS433
     from aspose.note._internal.onestore.parse_context import ParseContext  # noqa: WPS433
@@ -39,6 +40,7 @@ def main() -> None:
         _extract_pages_from_page_object_space,
         _pick_root_object_space,
     )
+    from aspose.note._internal.ms_one.revision_graph import RevisionGraph  # noqa: WPS433
     from aspose.note._internal.ms_one.spec_ids import PID_CHILD_GRAPH_SPACE_ELEMENT_NODES  # noqa: WPS433
 
     if len(sys.argv) < 2:
@@ -89,7 +91,10 @@ def main() -> None:
 
     ps = page_series[0]
     graph_ids = get_oid_array(ps.raw_properties, PID_CHILD_GRAPH_SPACE_ELEMENT_NODES)
-    resolved_gosids = resolve_compact_id_array(graph_ids, gid_table, ctx=ctx) if graph_ids else ()
+    if graph_ids and isinstance(graph_ids[0], CompactID):
+        resolved_gosids = resolve_compact_id_array(graph_ids, gid_table, ctx=ctx)
+    else:
+        resolved_gosids = tuple(graph_ids or ())
     print("Page object spaces:", len(resolved_gosids))
 
     gosid_to_os_index = {os.gosid: i for i, os in enumerate(step10.object_spaces)}
@@ -99,10 +104,12 @@ def main() -> None:
         print("\n== Page OS", gosid, "index", os_i)
         s10 = step10.object_spaces[os_i]
         s11 = step11.object_spaces[os_i]
+        graph = RevisionGraph.from_object_space(s10)
         print(" revisions:", len(s10.revisions))
-        print(" role_assignments:", len(getattr(s10, "role_assignments", ())))
-        for pair, rid in getattr(s10, "role_assignments", ()):
-            print("  pair", pair, "->", rid)
+        print(" role_assignments:", len(graph.index_by_pair))
+        for pair, ri in graph.index_by_pair.items():
+            print("  pair", pair, "-> rev", ri)
+        print(" default revision:", graph.default_revision_index())
 
         for ri in range(len(s10.revisions)):
             pages = _extract_pages_from_page_object_space(
@@ -113,6 +120,7 @@ def main() -> None:
                 ctx=ctx,
                 file_data_store_index={},
                 rev_index=ri,
+                graph=graph,
             )
             labels = set()
             for pg in pages: